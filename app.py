@@ -17,13 +17,32 @@ from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 from decimal import Decimal, InvalidOperation
 from board_services import CodeService, ItemService
+from code_catalog import board_catalog, bump_code_version, get_dropdown_options
+from layout_cache import bump_layout_version, cached_layout
 from repositories.common.column_config_repository import ColumnConfigRepository
 from column_service import ColumnConfigService
 from table_mappings import get_table_mappings
 from search_popup_service import SearchPopupService
+from export_engine import (
+    EXPORT_MIMETYPES,
+    DropdownLookup,
+    ExportFormatError,
+    ExportSheet,
+    apply_row_limit,
+    expand_scoring_columns,
+    get_export_settings,
+    load_json_object,
+    order_columns_by_section,
+    resolve_export_format,
+    send_export,
+)
+from export_jobs import ExportJobLimitError, enqueue_export_job, get_export_job, register_export_builder
 from column_sync_service import ColumnSyncService
-from db_connection import get_db_connection
-from db.schema import column_exists, table_exists
+from db_connection import get_db_connection, init_app as init_db_connection
+from db.counting import invalidate_counts
+from db.keyset import KeysetOrder, keyset_clause, keyset_page
+from db.streaming import iter_chunks, iter_rows
+from db.schema import cached_column_exists, cached_table_exists, refresh_schema_cache
 from database_config import execute_SQL
 from db.upsert import safe_upsert
 from column_utils import normalize_column_types, determine_linked_type
@@ -63,8 +82,6 @@ from controllers.boards.safety_instruction_controller import (
 )
 from repositories.boards.safety_instruction_repository import SafetyInstructionRepository
 from utils.sql_filters import sql_is_active_true, sql_is_deleted_false
-import threading
-import time
 # SSO 관련 imports 추가
 import jwt
 import json
@@ -111,6 +128,7 @@ def generate_manual_accident_number(cursor):
     return f'ACC{date_part}{seq:02d}'
 
 app = Flask(__name__, static_folder='static')
+init_db_connection(app)
 app.register_blueprint(follow_sop_bp)
 app.register_blueprint(full_process_bp)
 app.register_blueprint(safety_instruction_bp)
@@ -146,15 +164,6 @@ def normalize_date_value(value):
     return value
 
 
-def _get_export_row_limit() -> int:
-    """Return max rows for export (config.ini [EXPORT] MAX_ROWS)."""
-    try:
-        limit = db_config.config.getint('EXPORT', 'MAX_ROWS', fallback=5000)
-    except Exception:
-        limit = 5000
-    return limit if limit > 0 else 5000
-
-
 def _build_board_user_context():
     """Return a dictionary with the current user's identity info for templates/JS."""
     try:
@@ -597,71 +606,25 @@ def sync_all_master_data():
             logging.info("외부 DB가 비활성화되어 있어 동기화를 건너뜁니다.")
             return
         
-        # 각 데이터 동기화
-        sync_results = {
-            '협력사': False,
-            '사고': False,
-            '임직원': False,
-            '부서': False,
-            '건물': False,
-            '협력사 근로자': False
-        }
-        
-        # 1. 협력사 데이터 동기화
-        try:
-            logging.info("협력사 데이터 동기화 중...")
-            sync_results['협력사'] = partner_manager.sync_partners_from_external_db()
-        except Exception as e:
-            logging.error(f"협력사 동기화 오류: {e}")
-        
-        # 2. 사고 데이터 동기화
-        try:
-            if partner_manager.config.has_option('SQL_QUERIES', 'ACCIDENTS_QUERY'):
-                logging.info("사고 데이터 동기화 중...")
-                sync_results['사고'] = partner_manager.sync_accidents_from_external_db()
-        except Exception as e:
-            logging.error(f"사고 동기화 오류: {e}")
-        
-        # 3. 임직원 데이터 동기화
-        try:
-            if partner_manager.config.has_option('LOCAL_DATA_QUERIES', 'EMPLOYEE_QUERY'):
-                logging.info("임직원 데이터 동기화 중...")
-                sync_results['임직원'] = partner_manager.sync_employees_from_external_db()
-            else:
-                logging.info("LOCAL_DATA_QUERIES.EMPLOYEE_QUERY 없음 - 임직원 동기화 건너뜀")
-        except Exception as e:
-            logging.error(f"임직원 동기화 오류: {e}")
-        
-        # 4. 부서 데이터 동기화
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'DEPARTMENT_QUERY'):
-                logging.info("부서 데이터 동기화 중...")
-                sync_results['부서'] = partner_manager.sync_departments_from_external_db()
-        except Exception as e:
-            logging.error(f"부서 동기화 오류: {e}")
-        
-        # 5. 건물 데이터 동기화
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'BUILDING_QUERY'):
-                logging.info("건물 데이터 동기화 중...")
-                sync_results['건물'] = partner_manager.sync_buildings_from_external_db()
-        except Exception as e:
-            logging.error(f"건물 동기화 오류: {e}")
-        
-        # 6. 협력사 근로자 데이터 동기화
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'CONTRACTOR_QUERY'):
-                logging.info("협력사 근로자 데이터 동기화 중...")
-                sync_results['협력사 근로자'] = partner_manager.sync_contractors_from_external_db()
-        except Exception as e:
-            logging.error(f"협력사 근로자 동기화 오류: {e}")
+        # 각 데이터 동기화 - 독립 소스는 스레드 풀에서 동시에 실행 ([DATABASE] master_sync_max_workers)
+        from database_config import MASTER_SYNC_JOB, master_sync_sources
+        from job_scheduler import record_run
+        from sync_orchestrator import run_sync_sources
+
+        sources = master_sync_sources()
+        with record_run(MASTER_SYNC_JOB, 'manual') as run:
+            outcomes = run_sync_sources(sources)
+            run.record_outcomes(outcomes)
+            if not any(outcome.ok for outcome in outcomes.values()):
+                run.fail("모든 마스터 동기화 소스 실패")
+        sync_results = {source.display_name: outcomes[source.name] for source in sources}
         
         # 결과 로깅
         logging.info("=" * 50)
         logging.info("동기화 결과:")
-        for name, result in sync_results.items():
-            status = "✅ 성공" if result else "❌ 실패"
-            logging.info(f"  {name}: {status}")
+        for name, outcome in sync_results.items():
+            status = "✅ 성공" if outcome.ok else f"❌ {outcome.status}"
+            logging.info(f"  {name}: {status} ({outcome.elapsed:.1f}s) {outcome.detail}".rstrip())
         logging.info("=" * 50)
         logging.info(f"스케줄 동기화 완료: {get_korean_time_str()}")
         logging.info("=" * 50)
@@ -812,13 +775,7 @@ def init_sample_data():
 from flask import current_app
 
 boot_sync_done = False
-_master_sync_lock = threading.Lock()
-_background_master_sync_started = False
-_background_master_sync_thread = None
-_permission_master_sync_lock = threading.Lock()
-_background_permission_master_sync_started = False
-_background_permission_master_sync_thread = None
-_permission_master_last_sync_date = None
+_background_job_scheduler = None
 
 def boot_sync_once():
     """
@@ -888,77 +845,19 @@ def _get_master_sync_schedule_config():
     daily_on = db_config.config.getboolean('DATABASE', 'MASTER_DATA_DAILY', fallback=False)
     hour = db_config.config.getint('DATABASE', 'MASTER_DATA_SYNC_HOUR', fallback=3)
     minute = db_config.config.getint('DATABASE', 'MASTER_DATA_SYNC_MINUTE', fallback=0)
-    check_minutes = db_config.config.getint('DATABASE', 'MASTER_DATA_SYNC_CHECK_MINUTES', fallback=10)
 
     hour = max(0, min(23, hour))
     minute = max(0, min(59, minute))
-    check_minutes = max(1, check_minutes)
-
-    return external_on, daily_on, hour, minute, check_minutes
-
-
-def _is_master_sync_time(now_kst, hour, minute):
-    target = now_kst.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    return now_kst >= target
-
-
-def _run_background_master_sync_loop():
-    logging.info("[MASTER SYNC] Background scheduler thread started.")
-
-    while True:
-        try:
-            external_on, daily_on, hour, minute, check_minutes = _get_master_sync_schedule_config()
-            if not external_on or not daily_on:
-                time.sleep(max(60, check_minutes * 60))
-                continue
-
-            now_kst = get_korean_time()
-            if not _is_master_sync_time(now_kst, hour, minute):
-                time.sleep(max(60, check_minutes * 60))
-                continue
-
-            with _master_sync_lock:
-                logging.info("[MASTER SYNC] Scheduled daily sync check started.")
-                from database_config import maybe_daily_sync_master
-                maybe_daily_sync_master(force=False)
-                logging.info("[MASTER SYNC] Scheduled daily sync check finished.")
-
-            time.sleep(max(60, check_minutes * 60))
-        except Exception as exc:
-            logging.error("[MASTER SYNC] Background scheduler error: %s", exc, exc_info=True)
-            time.sleep(300)
-
 
-def start_background_master_sync_scheduler():
-    global _background_master_sync_started, _background_master_sync_thread
+    return external_on, daily_on, hour, minute
 
-    if _background_master_sync_started:
-        return
 
-    external_on, daily_on, hour, minute, check_minutes = _get_master_sync_schedule_config()
-    if not external_on or not daily_on:
-        logging.info(
-            "[MASTER SYNC] Background scheduler disabled "
-            "(EXTERNAL_DB_ENABLED=%s, MASTER_DATA_DAILY=%s).",
-            external_on,
-            daily_on,
-        )
-        return
+def _scheduler_lease(name):
+    """워커 프로세스 간 스케줄러 리더 선출 (PostgreSQL advisory lock). 끄면 모든 프로세스가 실행한다."""
+    from db.leader import LeaderLease
 
-    _background_master_sync_started = True
-    _background_master_sync_thread = threading.Thread(
-        target=_run_background_master_sync_loop,
-        name="master-data-sync",
-        daemon=True,
-    )
-    _background_master_sync_thread.start()
-    logging.info(
-        "[MASTER SYNC] Background scheduler enabled at %02d:%02d KST "
-        "(check every %d minute(s)).",
-        hour,
-        minute,
-        check_minutes,
-    )
+    enabled = db_config.config.getboolean('DATABASE', 'SCHEDULER_LEADER_ELECTION', fallback=True)
+    return LeaderLease(name, enabled=enabled)
 
 
 def _get_permission_master_sync_schedule_config():
@@ -966,13 +865,11 @@ def _get_permission_master_sync_schedule_config():
     daily_on = db_config.config.getboolean('PERMISSION', 'MASTER_SYNC_DAILY', fallback=True)
     hour = db_config.config.getint('PERMISSION', 'MASTER_SYNC_HOUR', fallback=3)
     minute = db_config.config.getint('PERMISSION', 'MASTER_SYNC_MINUTE', fallback=20)
-    check_minutes = db_config.config.getint('PERMISSION', 'MASTER_SYNC_CHECK_MINUTES', fallback=10)
 
     hour = max(0, min(23, hour))
     minute = max(0, min(59, minute))
-    check_minutes = max(1, check_minutes)
 
-    return permission_on, daily_on, hour, minute, check_minutes
+    return permission_on, daily_on, hour, minute
 
 
 def _run_permission_master_sync():
@@ -982,76 +879,119 @@ def _run_permission_master_sync():
     sync_module.main()
 
 
-def _run_background_permission_master_sync_loop():
-    global _permission_master_last_sync_date
+def _master_sync_job_enabled():
+    external_on, daily_on, _, _ = _get_master_sync_schedule_config()
+    return external_on and daily_on
 
-    logging.info("[PERMISSION MASTER SYNC] Background scheduler thread started.")
 
-    while True:
-        try:
-            permission_on, daily_on, hour, minute, check_minutes = _get_permission_master_sync_schedule_config()
-            sleep_seconds = max(60, check_minutes * 60)
-            if not permission_on or not daily_on:
-                time.sleep(sleep_seconds)
-                continue
+def _permission_master_sync_job_enabled():
+    from database_config import permission_sync_with_master_data
 
-            now_kst = get_korean_time()
-            if not _is_master_sync_time(now_kst, hour, minute):
-                time.sleep(sleep_seconds)
-                continue
+    permission_on, daily_on, _, _ = _get_permission_master_sync_schedule_config()
+    # 마스터 동기화 안에서(임직원/부서 이후) 실행하도록 설정되어 있으면 단독 작업은 돌지 않는다
+    return permission_on and daily_on and not permission_sync_with_master_data()
 
-            today = now_kst.date()
-            if _permission_master_last_sync_date == today:
-                time.sleep(sleep_seconds)
-                continue
 
-            with _permission_master_sync_lock:
-                if _permission_master_last_sync_date == today:
-                    time.sleep(sleep_seconds)
-                    continue
+def register_scheduled_jobs():
+    """job_scheduler 에 예약 작업 등록 (일정은 [SCHEDULER] <작업명>_schedule, 비우면 기존 시/분 설정)"""
+    from audit_partitions import get_partition_settings
+    from database_config import MASTER_SYNC_JOB, maybe_daily_sync_master
+    from export_jobs import get_job_settings
+    from job_scheduler import job_schedule, register_job
+
+    _, _, hour, minute = _get_master_sync_schedule_config()
+    register_job(
+        MASTER_SYNC_JOB,
+        lambda run: maybe_daily_sync_master(force=False, run=run),
+        schedule=job_schedule(MASTER_SYNC_JOB, f"{minute} {hour} * * *"),
+        description='일반 마스터 데이터 동기화 (협력사/사고/임직원/부서/건물/협력사 근로자/사업부)',
+        enabled=_master_sync_job_enabled,
+    )
 
-                logging.info("[PERMISSION MASTER SYNC] Scheduled daily sync started.")
-                _run_permission_master_sync()
-                _permission_master_last_sync_date = today
-                logging.info("[PERMISSION MASTER SYNC] Scheduled daily sync finished.")
+    _, _, hour, minute = _get_permission_master_sync_schedule_config()
+    register_job(
+        'permission-master-sync',
+        lambda run: _run_permission_master_sync(),
+        schedule=job_schedule('permission-master-sync', f"{minute} {hour} * * *"),
+        description='권한 사용자/부서 마스터 동기화',
+        enabled=_permission_master_sync_job_enabled,
+    )
 
-            time.sleep(sleep_seconds)
-        except Exception as exc:
-            logging.error("[PERMISSION MASTER SYNC] Background scheduler error: %s", exc, exc_info=True)
-            time.sleep(300)
+    check_hours = get_partition_settings()['check_hours']
+    register_job(
+        'audit-partition-maintenance',
+        _run_audit_partition_maintenance,
+        schedule=job_schedule(
+            'audit-partition-maintenance',
+            f"0 */{check_hours} * * *" if check_hours < 24 else "0 0 * * *",
+        ),
+        description='access_audit_log 월 파티션 생성/보존 정리',
+        enabled=lambda: get_partition_settings()['enabled'],
+    )
+
+    register_job(
+        'export-jobs',
+        _run_export_jobs,
+        schedule=job_schedule('export-jobs', '* * * * *'),
+        description='대기 중인 내보내기 작업 처리 (EXPORT.job_worker_enabled=true 일 때)',
+        enabled=lambda: get_job_settings()['enabled'],
+    )
+    register_job(
+        'export-job-cleanup',
+        _run_export_job_cleanup,
+        schedule=job_schedule('export-job-cleanup', '*/5 * * * *'),
+        description='만료된 내보내기 파일 삭제, 시간 초과 작업 failed 처리',
+    )
+
+
+def _run_audit_partition_maintenance(run):
+    from audit_partitions import maintain_audit_partitions
+
+    result = maintain_audit_partitions() or {}
+    changed = {key: names for key, names in result.items() if names}
+    if changed:
+        run.message = ', '.join(f"{key}: {', '.join(names)}" for key, names in changed.items())
+
+
+def _run_export_jobs(run):
+    from export_jobs import drain_export_jobs
 
+    processed = drain_export_jobs()
+    run.add_rows(written=processed)
 
-def start_background_permission_master_sync_scheduler():
-    global _background_permission_master_sync_started, _background_permission_master_sync_thread
 
-    if _background_permission_master_sync_started:
+def _run_export_job_cleanup(run):
+    from export_jobs import cleanup_export_jobs
+
+    result = cleanup_export_jobs()
+    if result['expired'] or result['timed_out']:
+        run.message = f"expired={result['expired']} timed_out={result['timed_out']}"
+
+
+def start_background_job_scheduler():
+    global _background_job_scheduler
+
+    if _background_job_scheduler is not None:
         return
 
-    permission_on, daily_on, hour, minute, check_minutes = _get_permission_master_sync_schedule_config()
-    if not permission_on or not daily_on:
-        logging.info(
-            "[PERMISSION MASTER SYNC] Background scheduler disabled "
-            "(PERMISSION.ENABLED=%s, MASTER_SYNC_DAILY=%s).",
-            permission_on,
-            daily_on,
-        )
+    from job_scheduler import JobScheduler, get_scheduler_settings, registered_jobs
+
+    settings = get_scheduler_settings()
+    if not settings['enabled']:
+        logging.info("[SCHEDULER] Background job scheduler disabled (SCHEDULER.enabled=false).")
         return
 
-    _background_permission_master_sync_started = True
-    _background_permission_master_sync_thread = threading.Thread(
-        target=_run_background_permission_master_sync_loop,
-        name="permission-master-sync",
-        daemon=True,
-    )
-    _background_permission_master_sync_thread.start()
+    register_scheduled_jobs()
+    # 클러스터에서 한 프로세스만 예약 작업을 실행 (리더가 죽으면 다음 확인 주기에 다른 프로세스가 이어받음)
+    _background_job_scheduler = JobScheduler(settings, lease=_scheduler_lease('job-scheduler'))
+    _background_job_scheduler.start()
     logging.info(
-        "[PERMISSION MASTER SYNC] Background scheduler enabled at %02d:%02d KST "
-        "(check every %d minute(s)).",
-        hour,
-        minute,
-        check_minutes,
+        "[SCHEDULER] Background job scheduler enabled (%s; poll every %d second(s)).",
+        ', '.join(f"{job.name}={job.schedule.expr}" for job in registered_jobs() if job.schedule),
+        settings['poll_seconds'],
     )
 
+
 # Flask 2.3+ 호환 방식으로 첫 요청 훅 등록
 @app.before_request
 def check_first_request():
@@ -1060,8 +1000,19 @@ def check_first_request():
         boot_sync_once()
 
 
-start_background_master_sync_scheduler()
-start_background_permission_master_sync_scheduler()
+def init_background_services():
+    """
+    작업 스케줄러를 시작한다 (여러 번 불러도 한 번만 시작).
+    동기화, 감사 로그 파티션 점검, 내보내기 작업 처리/정리는 모두 스케줄러 작업으로 등록돼
+    리더 프로세스 한 곳에서만 돈다.
+    """
+    start_background_job_scheduler()
+
+
+# 웹 프로세스는 import 시점에 시작한다. app 의 함수만 빌려 쓰는 별도 프로세스
+# (scripts/run_export_worker.py)는 BACKGROUND_SERVICES=false 로 건너뛴다.
+if os.environ.get('BACKGROUND_SERVICES', 'true').lower() == 'true':
+    init_background_services()
 
 WRITE_PERMISSION_BY_PATH = {
     '/register-change-request': 'REFERENCE_CHANGE',
@@ -1151,6 +1102,28 @@ def enforce_mutation_permissions():
 
     return None
 
+
+def _layout_board_from_path(path: str) -> Optional[str]:
+    """컬럼/섹션 설정 변경 API 경로에서 보드 타입 추출 (/api/<board>/columns, /api/<board>-sections 등)"""
+    match = re.match(r'^/api/([^/]+?)(?:-columns|-sections|/columns|/sections)(?:/|$)', path)
+    if match:
+        return match.group(1).replace('-', '_')
+    return None
+
+
+@app.after_request
+def invalidate_board_layout_cache(response):
+    """컬럼/섹션 설정이 바뀌는 요청이 성공하면 보드 레이아웃 캐시 버전을 올린다 (4xx/5xx 는 그대로 둔다)"""
+    if not _is_mutating_method() or response.status_code >= 400:
+        return response
+    board_type = _layout_board_from_path(request.path.rstrip('/') or '/')
+    if board_type:
+        try:
+            bump_layout_version(board_type, DB_PATH)
+        except Exception as exc:
+            logging.warning("board layout cache invalidation failed for %s: %s", board_type, exc)
+    return response
+
 @app.route("/api/test-simple")
 def test_simple():
     return jsonify({"status": "ok"})
@@ -1199,9 +1172,10 @@ def api_search_popup():
             limit,
             page,
             filters,
+            cursor_token=request.args.get('cursor'),
         )
 
-        return jsonify({
+        payload = {
             'success': True,
             'results': result['results'],
             'total': result.get('total', len(result['results'])),
@@ -1209,7 +1183,12 @@ def api_search_popup():
             'page': result.get('page', page),
             'has_more': result.get('has_more', False),
             'total_pages': result.get('total_pages', 0),
-        })
+        }
+        if 'next_cursor' in result:
+            payload['next_cursor'] = result['next_cursor']
+            payload['prev_cursor'] = result.get('prev_cursor')
+            payload['has_prev'] = result.get('has_prev', False)
+        return jsonify(payload)
     except Exception as e:
         logging.error(f"Search popup API error: {e}")
         return jsonify({
@@ -1416,13 +1395,13 @@ def accident_route():
 
 
 def _table_has_column(conn, table_name: str, column_name: str) -> bool:
-    """Return True if the given column exists on the table for the active backend."""
-    return column_exists(conn, table_name, column_name)
+    """Return True if the given column exists on the table (schema cache)."""
+    return cached_column_exists(table_name, column_name, DB_PATH)
 
 
 def _table_exists(conn, table_name: str) -> bool:
-    """Return True if the given table exists."""
-    return table_exists(conn, table_name)
+    """Return True if the given table exists (schema cache)."""
+    return cached_table_exists(table_name, DB_PATH)
 
 
 def _extract_request_number_value(row: Any) -> Optional[str]:
@@ -1534,14 +1513,19 @@ def partner_standards():
     try:
         conn = get_db_connection(DB_PATH)
         cursor = conn.cursor()
-        config_rows = cursor.execute(
-            """
-            SELECT column_key, column_name, column_type, column_order, COALESCE(is_active, 1) AS is_active
-            FROM partner_standards_column_config
-            WHERE COALESCE(is_active, 1) = 1
-            ORDER BY column_order, column_name
-            """
-        ).fetchall()
+        config_rows = cached_layout(
+            'partner_standards',
+            'page_columns',
+            lambda: [dict(row) for row in cursor.execute(
+                """
+                SELECT column_key, column_name, column_type, column_order, COALESCE(is_active, 1) AS is_active
+                FROM partner_standards_column_config
+                WHERE COALESCE(is_active, 1) = 1
+                ORDER BY column_order, column_name
+                """
+            ).fetchall()],
+            DB_PATH,
+        )
         dynamic_columns = [
             {
                 'key': row['column_key'],
@@ -1765,23 +1749,12 @@ def partner_change_request():
 
 
 def get_dropdown_options_for_display(board_type: str, column_key: str) -> List[Dict[str, Any]]:
-    """Return dropdown options for a board/column using v2 option codes."""
+    """Return dropdown options for a board/column from the cached v2 code catalog."""
     if not board_type or not column_key:
         return []
 
     try:
-        conn = get_db_connection(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT option_code, option_value
-            FROM dropdown_option_codes_v2
-            WHERE board_type = %s AND column_key = %s AND COALESCE(is_active, 1) = 1
-            ORDER BY display_order, option_value
-            """,
-            (board_type, column_key),
-        )
-        rows = cursor.fetchall()
+        return get_dropdown_options(board_type, column_key, DB_PATH)
     except Exception as exc:
         logging.debug(
             "get_dropdown_options_for_display: lookup failed for %s.%s: %s",
@@ -1790,46 +1763,6 @@ def get_dropdown_options_for_display(board_type: str, column_key: str) -> List[D
             exc,
         )
         return []
-    finally:
-        try:
-            cursor.close()
-            conn.close()
-        except Exception:
-            pass
-
-    if not rows:
-        return []
-
-    if len(rows) == 1:
-        value = rows[0]['option_value']
-        if isinstance(value, str):
-            stripped = value.strip()
-            if stripped.startswith('[') and stripped.endswith(']'):
-                try:
-                    parsed = pyjson.loads(stripped)
-                    if isinstance(parsed, list):
-                        return [
-                            {
-                                'code': f"{column_key.upper()}_{index + 1:03d}",
-                                'value': str(item),
-                            }
-                            for index, item in enumerate(parsed)
-                        ]
-                except Exception:
-                    logging.debug(
-                        "get_dropdown_options_for_display: array parse failed for %s.%s",
-                        board_type,
-                        column_key,
-                    )
-
-    options = []
-    for row in rows:
-        code = row['option_code']
-        value = row['option_value']
-        if code is None and value is None:
-            continue
-        options.append({'code': code, 'value': value})
-    return options
 
 
 @app.route("/partner/<business_number>")
@@ -1952,15 +1885,20 @@ def change_request_detail(request_id: int):
     try:
         conn = get_db_connection(DB_PATH)
         cursor = conn.cursor()
-        rows = cursor.execute(
-            """
-            SELECT column_key, column_name, column_type, column_order,
-                   dropdown_options, tab, column_span, linked_columns,
-                   is_active, is_deleted
-            FROM change_request_column_config
-            ORDER BY column_order
-            """
-        ).fetchall()
+        rows = cached_layout(
+            'change_request',
+            'detail_columns',
+            lambda: [dict(row) for row in cursor.execute(
+                """
+                SELECT column_key, column_name, column_type, column_order,
+                       dropdown_options, tab, column_span, linked_columns,
+                       is_active, is_deleted
+                FROM change_request_column_config
+                ORDER BY column_order
+                """
+            ).fetchall()],
+            DB_PATH,
+        )
         for row in rows:
             is_active_val = str(row['is_active'] if 'is_active' in row else '1').lower()
             is_deleted_val = str(row['is_deleted'] if 'is_deleted' in row else '0').lower()
@@ -2104,7 +2042,8 @@ def register_change_request():
             """
         )
 
-        # 기존 테이블에 컬럼이 없으면 추가 (SQLite/Postgres 호환)
+        # 기존 테이블에 컬럼이 없으면 추가 (스키마 캐시 기준, 방금 만든 테이블이면 IF NOT EXISTS 로 통과)
+        schema_changed = False
         for col_name, col_type in (
             ('created_by_name', 'TEXT'),
             ('created_by_login', 'TEXT'),
@@ -2112,7 +2051,10 @@ def register_change_request():
         ):
             try:
                 if not _table_has_column(conn, 'partner_change_requests', col_name):
-                    cursor.execute(f"ALTER TABLE partner_change_requests ADD COLUMN {col_name} {col_type}")
+                    cursor.execute(
+                        f"ALTER TABLE partner_change_requests ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                    )
+                    schema_changed = True
             except Exception as exc:
                 logging.debug("partner_change_requests add column %s skipped: %s", col_name, exc)
 
@@ -2200,6 +2142,8 @@ def register_change_request():
             )
 
         conn.commit()
+        if schema_changed:
+            refresh_schema_cache(DB_PATH)
         return jsonify(
             {
                 'success': True,
@@ -2319,15 +2263,7 @@ def update_change_request():
                 'created_by_dept',
             ):
                 continue
-            cursor.execute(
-                """
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = 'partner_change_requests' AND column_name = %s
-                """,
-                (key,),
-            )
-            if cursor.fetchone():
+            if _table_has_column(conn, 'partner_change_requests', key):
                 update_sql.append(f"{key} = %s")
                 if key in CHANGE_REQUEST_DATE_COLUMNS:
                     params.append(normalize_date_value(value))
@@ -2486,21 +2422,30 @@ def partner_accident():
     # 동적 컬럼 설정 가져오기 (활성화되고 삭제되지 않은 것만)
     _wa3 = sql_is_active_true('is_active', conn)
     _wd3 = sql_is_deleted_false('is_deleted', conn)
-    dynamic_columns_rows = conn.execute(
-        f"""
-        SELECT * FROM accident_column_config 
-        WHERE {_wa3} AND {_wd3}
-        ORDER BY column_order
-        """
-    ).fetchall()
-    dynamic_columns = [dict(row) for row in dynamic_columns_rows]
+    dynamic_columns = cached_layout(
+        'accident',
+        'page_columns',
+        lambda: [dict(row) for row in conn.execute(
+            f"""
+            SELECT * FROM accident_column_config 
+            WHERE {_wa3} AND {_wd3}
+            ORDER BY column_order
+            """
+        ).fetchall()],
+        DB_PATH,
+    )
 
     # 전역 키(활성/비활성 포함) 수집 - 상세 화면 팝업 타입 보정에 사용
     try:
         _wd4 = sql_is_deleted_false('is_deleted', conn)
-        _all_keys_rows = conn.execute(
-            f"SELECT column_key FROM accident_column_config WHERE {_wd4}"
-        ).fetchall()
+        _all_keys_rows = cached_layout(
+            'accident',
+            'page_column_keys',
+            lambda: [dict(row) for row in conn.execute(
+                f"SELECT column_key FROM accident_column_config WHERE {_wd4}"
+            ).fetchall()],
+            DB_PATH,
+        )
         all_keys = set()
         for r in _all_keys_rows:
             try:
@@ -3986,6 +3931,23 @@ def admin_cache_counts():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@app.route('/admin/scheduler-runs', methods=['GET'])
+@require_admin_auth
+def admin_scheduler_runs():
+    """작업 스케줄러 상태와 최근 실행 이력(소스별 소요 시간/행 수 포함) 조회 엔드포인트"""
+    try:
+        from job_scheduler import list_jobs, recent_job_runs
+
+        job_name = request.args.get('job') or None
+        limit = max(1, min(500, request.args.get('limit', 50, type=int)))
+        return jsonify({
+            'success': True,
+            'jobs': list_jobs(),
+            'runs': recent_job_runs(job_name, limit),
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 # 이 라우트는 아래에 더 완전한 버전이 있으므로 제거됨
 
 @app.route("/admin/accident-columns")
@@ -5073,21 +5035,20 @@ def get_change_request_dropdown_codes():
         return jsonify({"success": False, "message": "column_key is required"}), 400
     """특정 컬럼의 드롭다운 코드 조회 (v2 통일)"""
     try:
-        conn = get_db_connection()
-        
-        # v2 테이블 사용
-        codes = conn.execute("""
-            SELECT option_code as code, option_value as value, display_order, is_active
-            FROM dropdown_option_codes_v2
-            WHERE board_type = 'change_request' AND column_key = %s AND is_active = 1
-            ORDER BY display_order, id
-        """, (column_key,)).fetchall()
-        
-        conn.close()
+        # v2 코드 카탈로그 캐시 사용
+        codes = [
+            {
+                "code": code.get('option_code'),
+                "value": code.get('option_value'),
+                "display_order": code.get('display_order'),
+                "is_active": code.get('is_active'),
+            }
+            for code in (board_catalog('change_request', DB_PATH).codes.get(column_key) or [])
+        ]
         
         return jsonify({
             "success": True,
-            "codes": [dict(code) for code in codes],
+            "codes": codes,
             "column_key": column_key
         })
     except Exception as e:
@@ -5132,6 +5093,7 @@ def save_change_request_dropdown_codes():
         
         conn.commit()
         conn.close()
+        bump_code_version('change_request', DB_PATH)
         
         return jsonify({"success": True, "message": "코드가 저장되었습니다."})
     except Exception as e:
@@ -5149,10 +5111,13 @@ def delete_change_request_dropdown_code(code_id):
             UPDATE dropdown_option_codes_v2
             SET is_active = 0, updated_at = CURRENT_TIMESTAMP 
             WHERE id = %s
+            RETURNING board_type
         """, (code_id,))
+        row = cursor.fetchone()
         
         conn.commit()
         conn.close()
+        bump_code_version(row[0] if row else 'change_request', DB_PATH)
         
         return jsonify({"success": True, "message": "코드가 삭제되었습니다."})
     except Exception as e:
@@ -5625,6 +5590,7 @@ def restore_follow_sop():
             # Cache table is no longer used for display, only update main table
         
         conn.commit()
+        invalidate_counts('follow_sop', DB_PATH)
         conn.close()
         
         return jsonify({"success": True, "message": f"복구 완료: {len(ids)}개 항목"})
@@ -5648,6 +5614,7 @@ def restore_safe_workplace():
             cursor.execute("UPDATE safe_workplace SET is_deleted = 0 WHERE safeplace_no = %s", (item_id,))
 
         conn.commit()
+        invalidate_counts('safe_workplace', DB_PATH)
         conn.close()
 
         return jsonify({"success": True, "message": f"복구 완료: {len(ids)}개 항목"})
@@ -5671,6 +5638,7 @@ def restore_full_process():
             cursor.execute("UPDATE full_process SET is_deleted = 0 WHERE fullprocess_number = %s", (item_id,))
         
         conn.commit()
+        invalidate_counts('full_process', DB_PATH)
         conn.close()
         
         return jsonify({"success": True, "message": f"복구 완료: {len(ids)}개 항목"})
@@ -5717,6 +5685,7 @@ def delete_items(board_type):
         
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts(table_name, DB_PATH)
         conn.close()
         
         return jsonify({
@@ -5753,6 +5722,7 @@ def delete_accidents():
         
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('accidents_cache', DB_PATH)
         conn.close()
         
         return jsonify({
@@ -5821,6 +5791,7 @@ def delete_follow_sop():
         
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('follow_sop', DB_PATH)
         conn.close()
         
         return jsonify({
@@ -5854,6 +5825,7 @@ def delete_safe_workplace():
 
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('safe_workplace', DB_PATH)
         conn.close()
 
         return jsonify({
@@ -5888,6 +5860,7 @@ def delete_full_process():
 
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('full_process', DB_PATH)
         conn.close()
 
         return jsonify({
@@ -5917,18 +5890,7 @@ def _update_final_check_bulk(conn, *, board_type: str, id_field: str, ids: List[
             return getattr(row, key, None)
 
     try:
-        cursor.execute(
-            """
-            SELECT option_code, option_value
-            FROM dropdown_option_codes_v2
-            WHERE board_type = %s
-              AND column_key = %s
-              AND COALESCE(is_active, 1) = 1
-            ORDER BY display_order
-            """,
-            (board_type, 'final_check_yn'),
-        )
-        option_rows = cursor.fetchall()
+        option_rows = board_catalog(board_type, DB_PATH).codes.get('final_check_yn') or []
     except Exception:
         option_rows = []
 
@@ -6024,6 +5986,7 @@ def mark_full_process_final_check():
         )
 
         conn.commit()
+        invalidate_counts('full_process', DB_PATH)
 
         message_suffix = f" '{status_label}'" if status_label else ''
         return jsonify({
@@ -6077,6 +6040,7 @@ def mark_follow_sop_final_check():
         )
 
         conn.commit()
+        invalidate_counts('follow_sop', DB_PATH)
 
         message_suffix = f" '{status_label}'" if status_label else ''
         return jsonify({
@@ -6130,6 +6094,7 @@ def mark_safe_workplace_final_check():
         )
 
         conn.commit()
+        invalidate_counts('safe_workplace', DB_PATH)
 
         message_suffix = f" '{status_label}'" if status_label else ''
         return jsonify({
@@ -6178,6 +6143,7 @@ def restore_accidents():
         
         restored_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('accidents_cache', DB_PATH)
         conn.close()
         
         return jsonify({
@@ -6212,6 +6178,7 @@ def restore_partners():
         
         restored_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('partners_cache', DB_PATH)
         conn.close()
         
         return jsonify({
@@ -6583,6 +6550,7 @@ def permanent_delete_accidents():
         
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('accidents_cache', DB_PATH)
         conn.close()
         
         return jsonify({
@@ -6663,6 +6631,8 @@ def admin_force_delete_si_columns():
         affected = cursor.rowcount
         conn.commit()
         conn.close()
+        # /api/ 경로가 아니라 after_request 훅이 잡지 못하므로 직접 올린다
+        bump_layout_version('safety_instruction', DB_PATH)
         return jsonify({"success": True, "deleted": affected})
     except Exception as e:
         logging.error(f"force delete si columns error: {e}")
@@ -6792,130 +6762,88 @@ def reorder_accident_sections():
         return jsonify({"success": False, "message": str(e)}), 500
 
 
-@app.route("/api/accident-export")
-def export_accidents_excel():
-    """사고 데이터 엑셀 다운로드"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-
-        max_rows = _get_export_row_limit()
-
-        company_name = request.args.get('company_name', '')
-        business_number = request.args.get('business_number', '')
-        accident_date_start = request.args.get('accident_date_start', '')
-        accident_date_end = request.args.get('accident_date_end', '')
-
-        conn = get_db_connection()
+def _export_layout(conn, board_type, section_sqls, column_sql):
+    """엑셀 내보내기용 (섹션, 섹션 순서로 정렬한 동적 컬럼) - 보드 레이아웃 캐시 사용"""
 
-        section_sql = f"""
-            SELECT section_key, section_name, section_order
-            FROM section_config
-            WHERE board_type = 'accident'
-              AND {sql_is_active_true('is_active', conn)}
-              AND {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY section_order
-        """
-        try:
-            sections = [dict(row) for row in conn.execute(section_sql).fetchall()]
-        except Exception:
-            sections = []
-
-        where_c_active = sql_is_active_true('is_active', conn)
-        where_c_notdel = sql_is_deleted_false('is_deleted', conn)
-        dyn_sql = f"""
-            SELECT * FROM accident_column_config
-            WHERE {where_c_active}
-              AND {where_c_notdel}
-            ORDER BY column_order
-        """
-        dynamic_columns_rows = conn.execute(dyn_sql).fetchall()
-        dynamic_columns_all = [dict(row) for row in dynamic_columns_rows]
+    def _load_sections():
+        error = None
+        for sql in section_sqls:
+            try:
+                return [dict(row) for row in conn.execute(sql).fetchall()]
+            except Exception as exc:
+                conn.rollback()
+                error = exc
+        raise error
 
-        dynamic_columns = []
-        if sections:
-            for section in sections:
-                section_columns = [col for col in dynamic_columns_all if col.get('tab') == section['section_key']]
-                dynamic_columns.extend(section_columns)
-            no_section_columns = [
-                col for col in dynamic_columns_all
-                if not col.get('tab') or not any(s['section_key'] == col.get('tab') for s in sections)
-            ]
-            dynamic_columns.extend(no_section_columns)
-        else:
-            dynamic_columns = dynamic_columns_all
+    try:
+        sections = cached_layout(board_type, 'export_sections', _load_sections)
+    except Exception:
+        sections = []
 
-        query = f"""
-            SELECT * FROM accidents_cache
-            WHERE {sql_is_deleted_false('is_deleted', conn)}
-        """
-        params = []
+    dynamic_columns_all = cached_layout(
+        board_type, 'export_columns', lambda: [dict(row) for row in conn.execute(column_sql).fetchall()]
+    )
+    return sections, order_columns_by_section(sections, dynamic_columns_all)
 
-        if accident_date_start:
-            query += " AND accident_date >= %s"
-            params.append(accident_date_start)
-        if accident_date_end:
-            query += " AND accident_date <= %s"
-            params.append(accident_date_end)
 
-        query += " ORDER BY created_at DESC, accident_number DESC LIMIT %s"
-        params.append(max_rows)
+def _build_accident_export(conn, args, settings) -> ExportSheet:
+    """사고 엑셀 내보내기 시트 구성 (행은 서버 사이드 커서로 순차 조회)"""
+    accident_date_start = args.get('accident_date_start', '')
+    accident_date_end = args.get('accident_date_end', '')
 
-        accidents = conn.execute(query, params).fetchall()
+    section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM section_config
+        WHERE board_type = 'accident'
+          AND {sql_is_active_true('is_active', conn)}
+          AND {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY section_order
+    """
+    where_c_active = sql_is_active_true('is_active', conn)
+    where_c_notdel = sql_is_deleted_false('is_deleted', conn)
+    dyn_sql = f"""
+        SELECT * FROM accident_column_config
+        WHERE {where_c_active}
+          AND {where_c_notdel}
+        ORDER BY column_order
+    """
+    sections, dynamic_columns = _export_layout(conn, 'accident', (section_sql,), dyn_sql)
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "사고 현황"
+    query = f"""
+        SELECT * FROM accidents_cache
+        WHERE {sql_is_deleted_false('is_deleted', conn)}
+    """
+    params = []
 
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
+    if accident_date_start:
+        query += " AND accident_date >= %s"
+        params.append(accident_date_start)
+    if accident_date_end:
+        query += " AND accident_date <= %s"
+        params.append(accident_date_end)
 
-        headers = ['사고번호', '등록일', '사고명']
-        skip_keys = {'accident_number', 'created_at', 'accident_name'}
-        custom_columns = [col for col in dynamic_columns if col.get('column_key') not in skip_keys]
-        headers.extend([col['column_name'] for col in custom_columns])
+    query += " ORDER BY created_at DESC, accident_number DESC"
+    query = apply_row_limit(query, params, settings['max_rows'])
 
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
+    headers = ['사고번호', '등록일', '사고명']
+    skip_keys = {'accident_number', 'created_at', 'accident_name'}
+    custom_columns = [col for col in dynamic_columns if col.get('column_key') not in skip_keys]
+    headers.extend([col['column_name'] for col in custom_columns])
 
-        def get_display_value(column_key, code_value):
-            if not code_value or code_value == '':
-                return ''
-            try:
-                options = get_dropdown_options_for_display('accident', column_key)
-                if options:
-                    for option in options:
-                        if option['code'] == code_value:
-                            return option['value']
-                return code_value
-            except Exception:
-                return code_value
+    dropdowns = DropdownLookup(lambda key: get_dropdown_options_for_display('accident', key))
 
-        def format_date(date_value):
-            if not date_value:
-                return ''
-            date_str = str(date_value)
-            if ' ' in date_str:
-                return date_str.split(' ')[0]
-            return date_str
+    def format_date(date_value):
+        if not date_value:
+            return ''
+        date_str = str(date_value)
+        if ' ' in date_str:
+            return date_str.split(' ')[0]
+        return date_str
 
-        for row_idx, accident_row in enumerate(accidents, 2):
+    def _rows():
+        for accident_row in iter_rows(conn, query, params, settings['chunk_size']):
             rec = dict(accident_row)
-            custom = {}
-            try:
-                raw = rec.get('custom_data')
-                if isinstance(raw, dict):
-                    custom = raw
-                elif isinstance(raw, str) and raw:
-                    custom = pyjson.loads(raw)
-            except Exception:
-                custom = {}
+            custom = load_json_object(rec.get('custom_data'))
 
             if not rec.get('accident_name'):
                 nm = custom.get('accident_name')
@@ -6928,12 +6856,12 @@ def export_accidents_excel():
             else:
                 display_created = rec.get('created_at')
 
-            ws.cell(row=row_idx, column=1, value=rec.get('accident_number', ''))
-            ws.cell(row=row_idx, column=2, value=format_date(display_created))
-            ws.cell(row=row_idx, column=3, value=rec.get('accident_name', ''))
-
-            start_col = 4
-            for offset, col in enumerate(custom_columns):
+            values = [
+                rec.get('accident_number', ''),
+                format_date(display_created),
+                rec.get('accident_name', ''),
+            ]
+            for col in custom_columns:
                 key = col['column_key']
                 value = custom.get(key, rec.get(key, ''))
 
@@ -6948,46 +6876,40 @@ def export_accidents_excel():
                 elif isinstance(value, dict):
                     value = value.get('name') or str(value)
                 elif col.get('column_type') == 'dropdown' and value:
-                    value = get_display_value(key, value)
+                    value = dropdowns.display(key, value)
                 elif col.get('column_type') in ['date', 'datetime'] and value:
                     value = format_date(value)
 
                 if value is None or value == [] or value == {}:
                     value = ''
+                values.append(value)
+            yield values
 
-                ws.cell(row=row_idx, column=start_col + offset, value=value)
-
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+    return ExportSheet(title="사고 현황", headers=headers, rows=_rows(), filename_prefix='accident_list')
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
 
-        conn.close()
+@app.route("/api/accident-export")
+def export_accidents_excel():
+    """사고 데이터 엑셀 다운로드"""
+    if _wants_async_export():
+        return _enqueue_export_response('accident')
 
-        filename = f"accident_list_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+    conn = None
+    try:
+        conn = get_db_connection()
+        sheet = _build_accident_export(conn, request.args, get_export_settings())
+        return send_export(sheet, conn, fmt)
 
     except Exception as e:
         logging.error(f"엑셀 다운로드 중 오류: {e}")
         import traceback
         logging.error(traceback.format_exc())
+        if conn:
+            conn.close()
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== 엑셀 임포트 API =====
@@ -7023,7 +6945,7 @@ def import_accidents():
         cursor = conn.cursor()
         
         # accident_column_config 테이블 확인
-        if not table_exists(conn, 'accident_column_config'):
+        if not _table_exists(conn, 'accident_column_config'):
             # 테이블이 없으면 빈 리스트로 처리
             dynamic_columns = []
             logging.info("accident_columns 테이블이 없어서 동적 컬럼 없이 처리합니다.")
@@ -7276,6 +7198,7 @@ def import_accidents():
                 continue
         
         conn.commit()
+        invalidate_counts('accidents_cache', DB_PATH)
         conn.close()
         
         result = {
@@ -7296,251 +7219,150 @@ def import_accidents():
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== Follow SOP 엑셀 다운로드 API =====
-@app.route('/api/follow-sop-export')
-def export_follow_sop_excel():
-    """Follow SOP 데이터 엑셀 다운로드"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-
-        max_rows = _get_export_row_limit()
+def _load_scoring_conf(conf):
+    """scoring_config(dict 또는 JSON 문자열)를 dict 로 변환"""
+    if conf and isinstance(conf, str):
+        try:
+            return pyjson.loads(conf) or {}
+        except Exception:
+            return {}
+    return conf or {}
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
 
-        section_sql = f"""
-            SELECT section_key, section_name, section_order
-            FROM follow_sop_sections
-            WHERE {sql_is_active_true('is_active', conn)}
-              AND {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY section_order
-        """
+def _scoring_delta_total(conf, group_obj):
+    """채점 항목별 count × per_unit_delta 합계"""
+    if isinstance(group_obj, str):
         try:
-            cursor.execute(section_sql)
-            sections = [dict(row) for row in cursor.fetchall()]
+            group_obj = pyjson.loads(group_obj)
         except Exception:
-            sections = []
+            group_obj = {}
+    total = 0
+    for it in conf.get('items') or []:
+        iid = it.get('id')
+        delta = float(it.get('per_unit_delta') or 0)
+        cnt = 0
+        if isinstance(group_obj, dict) and iid in group_obj:
+            try:
+                cnt = int(group_obj.get(iid) or 0)
+            except Exception:
+                cnt = 0
+        total += cnt * delta
+    return total
 
-        where_c_active = sql_is_active_true('is_active', conn)
-        where_c_notdel = sql_is_deleted_false('is_deleted', conn)
-        cursor.execute(f"""
-            SELECT * FROM follow_sop_column_config
-            WHERE {where_c_active}
-              AND {where_c_notdel}
-            ORDER BY column_order
-        """)
-        dynamic_columns_all = [dict(row) for row in cursor.fetchall()]
 
-        dynamic_columns = []
-        if sections:
-            for section in sections:
-                section_columns = [col for col in dynamic_columns_all if col.get('tab') == section['section_key']]
-                dynamic_columns.extend(section_columns)
-            no_section_columns = [
-                col for col in dynamic_columns_all
-                if not col.get('tab') or not any(s['section_key'] == col.get('tab') for s in sections)
-            ]
-            dynamic_columns.extend(no_section_columns)
-        else:
-            dynamic_columns = dynamic_columns_all
+def _scoring_item_value(col, custom_data):
+    """펼쳐진 채점 가상 컬럼(<key>__<item_id>)의 값"""
+    group_obj = custom_data.get(col.get('_source_scoring_key'), {})
+    if isinstance(group_obj, str):
+        try:
+            group_obj = pyjson.loads(group_obj)
+        except Exception:
+            group_obj = {}
+    if isinstance(group_obj, dict):
+        return group_obj.get(col.get('_source_item_id'), 0)
+    return 0
+
+
+def _build_follow_sop_export(conn, args, settings) -> ExportSheet:
+    """Follow SOP 엑셀 내보내기 시트 구성"""
+    section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM follow_sop_sections
+        WHERE {sql_is_active_true('is_active', conn)}
+          AND {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY section_order
+    """
+    where_c_active = sql_is_active_true('is_active', conn)
+    where_c_notdel = sql_is_deleted_false('is_deleted', conn)
+    dyn_sql = f"""
+        SELECT * FROM follow_sop_column_config
+        WHERE {where_c_active}
+          AND {where_c_notdel}
+        ORDER BY column_order
+    """
+    sections, dynamic_columns = _export_layout(conn, 'follow_sop', (section_sql,), dyn_sql)
 
-        data_sql = f"""
-            SELECT * FROM follow_sop
-            WHERE {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY created_at DESC
-            LIMIT %s
-        """
-        cursor.execute(data_sql, [max_rows])
-        data = [dict(row) for row in cursor.fetchall()]
+    params = []
+    data_sql = apply_row_limit(f"""
+        SELECT * FROM follow_sop
+        WHERE {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY created_at DESC
+    """, params, settings['max_rows'])
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Follow SOP"
-
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
-
-        col_idx = 1
-        basic_headers = ['점검번호', '등록일', '작성자']
-        for header in basic_headers:
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
-            col_idx += 1
-
-        def _expand_scoring_columns(_cols):
-            out = []
-            import json as _json
-            for c in _cols:
-                if c.get('column_type') == 'scoring':
-                    sc = c.get('scoring_config')
-                    if sc and isinstance(sc, str):
-                        try:
-                            sc = _json.loads(sc)
-                        except Exception:
-                            sc = {}
-                    items = (sc or {}).get('items') or []
-                    for it in items:
-                        iid = it.get('id')
-                        label = it.get('label') or iid
-                        if not iid:
-                            continue
-                        out.append({
-                            'column_key': f"{c['column_key']}__{iid}",
-                            'column_name': f"{c.get('column_name', c.get('column_key'))} - {label}",
-                            'column_type': 'number',
-                            '_virtual': 1,
-                            '_source_scoring_key': c['column_key'],
-                            '_source_item_id': iid
-                        })
-                else:
-                    out.append(dict(c))
-            return out
-
-        dyn_cols_list = [dict(x) for x in dynamic_columns]
-        expanded_columns = _expand_scoring_columns(dyn_cols_list)
-
-        import json as _json
-        scoring_cols = [dict(c) for c in dyn_cols_list if dict(c).get('column_type') == 'scoring']
-
-        for col in expanded_columns:
-            cell = ws.cell(row=1, column=col_idx, value=col['column_name'])
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
-            col_idx += 1
-
-        def _map_value(col, value):
-            if isinstance(value, dict):
-                return value.get('name') or str(value)
-            if col.get('column_type') == 'list' and isinstance(value, list):
-                if not value:
-                    return ''
-                try:
-                    return json.dumps(value, ensure_ascii=False)
-                except Exception:
-                    return str(value)
-            if col.get('column_type') == 'dropdown' and value:
-                opts = get_dropdown_options_for_display('follow_sop', col['column_key'])
-                if opts:
-                    for opt in opts:
-                        if opt['code'] == value:
-                            return opt['value']
-            return value
-
-        for row_idx, row in enumerate(data, 2):
-            row_dict = dict(row)
-            col_idx = 1
+    expanded_columns = expand_scoring_columns(dynamic_columns)
+    scoring_cols = [c for c in dynamic_columns if c.get('column_type') == 'scoring']
+    headers = ['점검번호', '등록일', '작성자'] + [col['column_name'] for col in expanded_columns]
 
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('work_req_no', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('created_at', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('created_by', ''))
-            col_idx += 1
+    dropdowns = DropdownLookup(lambda key: get_dropdown_options_for_display('follow_sop', key))
 
-            custom_data = row_dict.get('custom_data', {})
-            if not isinstance(custom_data, dict):
-                try:
-                    custom_data = _json.loads(custom_data) if custom_data else {}
-                except Exception:
-                    custom_data = {}
+    def _map_value(col, value):
+        if isinstance(value, dict):
+            return value.get('name') or str(value)
+        if col.get('column_type') == 'list' and isinstance(value, list):
+            if not value:
+                return ''
+            try:
+                return json.dumps(value, ensure_ascii=False)
+            except Exception:
+                return str(value)
+        if col.get('column_type') == 'dropdown' and value:
+            return dropdowns.display(col['column_key'], value)
+        return value
+
+    def _score_total(col, custom_data):
+        conf = _load_scoring_conf(col.get('scoring_config'))
+        total = conf.get('base_score', 100)
+        total_key = conf.get('total_key') or 'default'
+        for key in conf.get('include_keys') or []:
+            sc_col = next((c for c in scoring_cols if c.get('column_key') == key), None)
+            if not sc_col:
+                continue
+            sconf = _load_scoring_conf(sc_col.get('scoring_config'))
+            if (sconf.get('total_key') or 'default') != total_key:
+                continue
+            total += _scoring_delta_total(sconf, custom_data.get(sc_col.get('column_key'), {}))
+        return total
 
+    def _rows():
+        for row in iter_rows(conn, data_sql, params, settings['chunk_size']):
+            row_dict = dict(row)
+            custom_data = load_json_object(row_dict.get('custom_data'))
+            values = [
+                row_dict.get('work_req_no', ''),
+                row_dict.get('created_at', ''),
+                row_dict.get('created_by', ''),
+            ]
             for col in expanded_columns:
                 if col.get('_virtual') == 1:
-                    src = col.get('_source_scoring_key')
-                    iid = col.get('_source_item_id')
-                    group_obj = custom_data.get(src, {})
-                    if isinstance(group_obj, str):
-                        try:
-                            group_obj = _json.loads(group_obj)
-                        except Exception:
-                            group_obj = {}
-                    v = 0
-                    if isinstance(group_obj, dict):
-                        v = group_obj.get(iid, 0)
-                    ws.cell(row=row_idx, column=col_idx, value=v)
+                    values.append(_scoring_item_value(col, custom_data))
+                elif col.get('column_type') == 'score_total':
+                    try:
+                        values.append(_score_total(col, custom_data))
+                    except Exception:
+                        values.append('')
                 else:
-                    if col.get('column_type') == 'score_total':
-                        try:
-                            conf = col.get('scoring_config')
-                            if conf and isinstance(conf, str):
-                                try:
-                                    conf = _json.loads(conf)
-                                except Exception:
-                                    conf = {}
-                            base = (conf or {}).get('base_score', 100)
-                            include_keys = (conf or {}).get('include_keys') or []
-                            total_key = (conf or {}).get('total_key') or 'default'
-                            total = base
-                            if include_keys:
-                                for key in include_keys:
-                                    sc_col = next((c for c in scoring_cols if c.get('column_key') == key), None)
-                                    if not sc_col:
-                                        continue
-                                    sconf = sc_col.get('scoring_config')
-                                    if sconf and isinstance(sconf, str):
-                                        try:
-                                            sconf = _json.loads(sconf)
-                                        except Exception:
-                                            sconf = {}
-                                    if ((sconf or {}).get('total_key') or 'default') != total_key:
-                                        continue
-                                    items_cfg = (sconf or {}).get('items') or []
-                                    group_obj = custom_data.get(sc_col.get('column_key'), {})
-                                    if isinstance(group_obj, str):
-                                        try:
-                                            group_obj = _json.loads(group_obj)
-                                        except Exception:
-                                            group_obj = {}
-                                    for it in items_cfg:
-                                        iid = it.get('id')
-                                        delta = float(it.get('per_unit_delta') or 0)
-                                        cnt = 0
-                                        if isinstance(group_obj, dict) and iid in group_obj:
-                                            try:
-                                                cnt = int(group_obj.get(iid) or 0)
-                                            except Exception:
-                                                cnt = 0
-                                        total += cnt * delta
-                            ws.cell(row=row_idx, column=col_idx, value=total)
-                        except Exception:
-                            ws.cell(row=row_idx, column=col_idx, value='')
-                    else:
-                        v = custom_data.get(col['column_key'], '')
-                        ws.cell(row=row_idx, column=col_idx, value=_map_value(col, v))
-                col_idx += 1
-
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min((max_length + 2) * 1.2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+                    values.append(_map_value(col, custom_data.get(col['column_key'], '')))
+            yield values
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
+    return ExportSheet(title="Follow SOP", headers=headers, rows=_rows(),
+                       filename_prefix='follow_sop', width_factor=1.2)
 
-        filename = f"follow_sop_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
-        conn.close()
+@app.route('/api/follow-sop-export')
+def export_follow_sop_excel():
+    """Follow SOP 데이터 엑셀 다운로드"""
+    if _wants_async_export():
+        return _enqueue_export_response('follow_sop')
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        sheet = _build_follow_sop_export(conn, request.args, get_export_settings())
+        return send_export(sheet, conn, fmt)
 
     except Exception as e:
         import traceback
@@ -7551,247 +7373,112 @@ def export_follow_sop_excel():
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== Safe Workplace 엑셀 다운로드 API =====
-@app.route('/api/safe-workplace-export')
-def export_safe_workplace_excel():
-    """Safe Workplace 데이터 엑셀 다운로드"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-
-        max_rows = _get_export_row_limit()
-
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        section_sql = f"""
-            SELECT section_key, section_name, section_order
-            FROM safe_workplace_sections
-            WHERE {sql_is_active_true('is_active', conn)}
-              AND {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY section_order
-        """
-        try:
-            cursor.execute(section_sql)
-            sections = [dict(row) for row in cursor.fetchall()]
-        except Exception:
-            sections = []
-
-        where_c_active = sql_is_active_true('is_active', conn)
-        where_c_notdel = sql_is_deleted_false('is_deleted', conn)
-        cursor.execute(f"""
-            SELECT * FROM safe_workplace_column_config
-            WHERE {where_c_active}
-              AND {where_c_notdel}
-            ORDER BY column_order
-        """)
-        dynamic_columns_all = [dict(row) for row in cursor.fetchall()]
-
-        dynamic_columns = []
-        if sections:
-            for section in sections:
-                section_columns = [col for col in dynamic_columns_all if col.get('tab') == section['section_key']]
-                dynamic_columns.extend(section_columns)
-            no_section_columns = [
-                col for col in dynamic_columns_all
-                if not col.get('tab') or not any(s['section_key'] == col.get('tab') for s in sections)
-            ]
-            dynamic_columns.extend(no_section_columns)
-        else:
-            dynamic_columns = dynamic_columns_all
-
-        import json as _json
-
-        def _expand_scoring_columns(_cols):
-            expanded = []
-            for c in _cols:
-                if c.get('column_type') == 'scoring':
-                    sc = c.get('scoring_config')
-                    if sc and isinstance(sc, str):
-                        try:
-                            sc = _json.loads(sc)
-                        except Exception:
-                            sc = {}
-                    items = (sc or {}).get('items') or []
-                    for it in items:
-                        iid = it.get('id')
-                        label = it.get('label') or iid
-                        if not iid:
-                            continue
-                        expanded.append({
-                            'column_key': f"{c['column_key']}__{iid}",
-                            'column_name': f"{c.get('column_name', c.get('column_key'))} - {label}",
-                            'column_type': 'number',
-                            '_virtual': 1,
-                            '_source_scoring_key': c['column_key'],
-                            '_source_item_id': iid,
-                        })
-                else:
-                    expanded.append(dict(c))
-            return expanded
-
-        dyn_cols_list = [dict(x) for x in dynamic_columns]
-        expanded_columns = _expand_scoring_columns(dyn_cols_list)
-        scoring_cols = [dict(c) for c in dyn_cols_list if dict(c).get('column_type') == 'scoring']
+def _build_safe_workplace_export(conn, args, settings) -> ExportSheet:
+    """Safe Workplace 엑셀 내보내기 시트 구성"""
+    section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM safe_workplace_sections
+        WHERE {sql_is_active_true('is_active', conn)}
+          AND {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY section_order
+    """
+    where_c_active = sql_is_active_true('is_active', conn)
+    where_c_notdel = sql_is_deleted_false('is_deleted', conn)
+    dyn_sql = f"""
+        SELECT * FROM safe_workplace_column_config
+        WHERE {where_c_active}
+          AND {where_c_notdel}
+        ORDER BY column_order
+    """
+    sections, dynamic_columns = _export_layout(conn, 'safe_workplace', (section_sql,), dyn_sql)
 
-        data_sql = f"""
-            SELECT * FROM safe_workplace
-            WHERE {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY created_at DESC
-            LIMIT %s
-        """
-        cursor.execute(data_sql, [max_rows])
-        data = [dict(row) for row in cursor.fetchall()]
+    expanded_columns = expand_scoring_columns(dynamic_columns)
+    scoring_cols = [c for c in dynamic_columns if c.get('column_type') == 'scoring']
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Safe Workplace"
+    params = []
+    data_sql = apply_row_limit(f"""
+        SELECT * FROM safe_workplace
+        WHERE {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY created_at DESC
+    """, params, settings['max_rows'])
 
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
+    headers = ['점검번호', '등록일', '작성자'] + [col['column_name'] for col in expanded_columns]
 
-        headers = ['점검번호', '등록일', '작성자'] + [col['column_name'] for col in expanded_columns]
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
+    dropdowns = DropdownLookup(lambda key: get_dropdown_options_for_display('safe_workplace', key))
 
-        dropdown_cache: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    def _map_dropdown_value(column_key: str, raw_value: Any) -> Any:
+        if raw_value in (None, ''):
+            return ''
+        return dropdowns.display(column_key, raw_value)
 
-        def _map_dropdown_value(column_key: str, raw_value: Any) -> Any:
-            if raw_value in (None, ''):
+    def _map_value(col: Dict[str, Any], value: Any) -> Any:
+        if isinstance(value, dict):
+            return value.get('name') or str(value)
+        if isinstance(value, list):
+            if not value:
                 return ''
-            opts = dropdown_cache.get(column_key)
-            if opts is None:
-                opts = get_dropdown_options_for_display('safe_workplace', column_key)
-                dropdown_cache[column_key] = opts
-            if opts:
-                for opt in opts:
-                    if opt.get('code') == raw_value:
-                        return opt.get('value', raw_value)
-            return raw_value
-
-        def _map_value(col: Dict[str, Any], value: Any) -> Any:
-            if isinstance(value, dict):
-                return value.get('name') or str(value)
-            if isinstance(value, list):
-                if not value:
-                    return ''
-                if col.get('column_type') == 'dropdown':
-                    mapped_list = [_map_dropdown_value(col['column_key'], item) for item in value]
-                    return ', '.join(str(item) for item in mapped_list if item not in (None, ''))
-                try:
-                    return json.dumps(value, ensure_ascii=False)
-                except Exception:
-                    return str(value)
-            if col.get('column_type') == 'dropdown' and value not in (None, ''):
-                return _map_dropdown_value(col['column_key'], value)
-            return value if value is not None else ''
+            if col.get('column_type') == 'dropdown':
+                mapped_list = [_map_dropdown_value(col['column_key'], item) for item in value]
+                return ', '.join(str(item) for item in mapped_list if item not in (None, ''))
+            try:
+                return json.dumps(value, ensure_ascii=False)
+            except Exception:
+                return str(value)
+        if col.get('column_type') == 'dropdown' and value not in (None, ''):
+            return _map_dropdown_value(col['column_key'], value)
+        return value if value is not None else ''
+
+    def _score_total(col, custom_data):
+        conf = _load_scoring_conf(col.get('scoring_config'))
+        total = conf.get('base_score', 100)
+        for key in conf.get('include_keys') or []:
+            sc_col = next((c for c in scoring_cols if c.get('column_key') == key), None)
+            if not sc_col:
+                continue
+            sconf = _load_scoring_conf(sc_col.get('scoring_config'))
+            total += _scoring_delta_total(sconf, custom_data.get(key, {}))
+        return total
 
-        for row_idx, row in enumerate(data, 2):
+    def _rows():
+        for row in iter_rows(conn, data_sql, params, settings['chunk_size']):
             row_dict = dict(row)
-
-            ws.cell(row=row_idx, column=1, value=row_dict.get('safeplace_no', ''))
-            ws.cell(row=row_idx, column=2, value=row_dict.get('created_at', ''))
-            ws.cell(row=row_idx, column=3, value=row_dict.get('created_by', ''))
-
-            custom_data = row_dict.get('custom_data', {})
-            if not isinstance(custom_data, dict):
-                try:
-                    custom_data = _json.loads(custom_data) if custom_data else {}
-                except Exception:
-                    custom_data = {}
-
-            start_col = 4
-            for offset, col in enumerate(expanded_columns):
+            custom_data = load_json_object(row_dict.get('custom_data'))
+            values = [
+                row_dict.get('safeplace_no', ''),
+                row_dict.get('created_at', ''),
+                row_dict.get('created_by', ''),
+            ]
+            for col in expanded_columns:
                 if col.get('_virtual') == 1:
-                    src = col.get('_source_scoring_key')
-                    iid = col.get('_source_item_id')
-                    group_obj = custom_data.get(src, {})
-                    if isinstance(group_obj, str):
-                        try:
-                            group_obj = _json.loads(group_obj)
-                        except Exception:
-                            group_obj = {}
-                    value = 0
-                    if isinstance(group_obj, dict):
-                        value = group_obj.get(iid, 0)
-                    ws.cell(row=row_idx, column=start_col + offset, value=value)
+                    values.append(_scoring_item_value(col, custom_data))
                 elif col.get('column_type') == 'score_total':
                     try:
-                        conf = col.get('scoring_config')
-                        if conf and isinstance(conf, str):
-                            conf = _json.loads(conf)
-                        base = (conf or {}).get('base_score', 100)
-                        include_keys = (conf or {}).get('include_keys') or []
-                        total = base
-                        if include_keys:
-                            for key in include_keys:
-                                sc_col = next((c for c in scoring_cols if c.get('column_key') == key), None)
-                                if not sc_col:
-                                    continue
-                                sconf = sc_col.get('scoring_config')
-                                if sconf and isinstance(sconf, str):
-                                    try:
-                                        sconf = _json.loads(sconf)
-                                    except Exception:
-                                        sconf = {}
-                                items_cfg = (sconf or {}).get('items') or []
-                                group_obj = custom_data.get(key, {})
-                                if isinstance(group_obj, str):
-                                    try:
-                                        group_obj = _json.loads(group_obj)
-                                    except Exception:
-                                        group_obj = {}
-                                for it in items_cfg:
-                                    iid = it.get('id')
-                                    delta = float(it.get('per_unit_delta') or 0)
-                                    cnt = 0
-                                    if isinstance(group_obj, dict) and iid in group_obj:
-                                        try:
-                                            cnt = int(group_obj.get(iid) or 0)
-                                        except Exception:
-                                            cnt = 0
-                                    total += cnt * delta
-                        ws.cell(row=row_idx, column=start_col + offset, value=total)
+                        values.append(_score_total(col, custom_data))
                     except Exception:
-                        ws.cell(row=row_idx, column=start_col + offset, value='')
+                        values.append('')
                 else:
-                    ws.cell(
-                        row=row_idx,
-                        column=start_col + offset,
-                        value=_map_value(col, custom_data.get(col['column_key'], ''))
-                    )
+                    values.append(_map_value(col, custom_data.get(col['column_key'], '')))
+            yield values
 
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min((max_length + 2) * 1.2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+    return ExportSheet(title="Safe Workplace", headers=headers, rows=_rows(),
+                       filename_prefix='safe_workplace', width_factor=1.2)
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
 
-        filename = f"safe_workplace_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
+@app.route('/api/safe-workplace-export')
+def export_safe_workplace_excel():
+    """Safe Workplace 데이터 엑셀 다운로드"""
+    if _wants_async_export():
+        return _enqueue_export_response('safe_workplace')
 
-        conn.close()
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+    conn = None
+    try:
+        conn = get_db_connection()
+        sheet = _build_safe_workplace_export(conn, request.args, get_export_settings())
+        return send_export(sheet, conn, fmt)
 
     except Exception as e:
         import traceback
@@ -7802,276 +7489,112 @@ def export_safe_workplace_excel():
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== Full Process 엑셀 다운로드 API =====
-@app.route('/api/full-process-export')
-def export_full_process_excel():
-    """Full Process 데이터 엑셀 다운로드"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
+def _build_full_process_export(conn, args, settings) -> ExportSheet:
+    """Full Process 엑셀 내보내기 시트 구성"""
+    section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM full_process_sections
+        WHERE {sql_is_active_true('is_active', conn)}
+          AND {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY section_order
+    """
+    where_c_active = sql_is_active_true('is_active', conn)
+    where_c_notdel = sql_is_deleted_false('is_deleted', conn)
+    dyn_sql = f"""
+        SELECT * FROM full_process_column_config
+        WHERE {where_c_active}
+          AND {where_c_notdel}
+        ORDER BY column_order
+    """
+    sections, dynamic_columns = _export_layout(conn, 'full_process', (section_sql,), dyn_sql)
 
-        max_rows = _get_export_row_limit()
+    params = []
+    data_sql = apply_row_limit(f"""
+        SELECT * FROM full_process
+        WHERE {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY created_at DESC
+    """, params, settings['max_rows'])
 
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    expanded_columns = expand_scoring_columns(dynamic_columns)
+    scoring_cols = [c for c in dynamic_columns if c.get('column_type') == 'scoring']
+    headers = ['프로세스 번호', '작성일', '작성자'] + [col['column_name'] for col in expanded_columns]
 
-        section_sql = f"""
-            SELECT section_key, section_name, section_order
-            FROM full_process_sections
-            WHERE {sql_is_active_true('is_active', conn)}
-              AND {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY section_order
-        """
-        try:
-            cursor.execute(section_sql)
-            sections = [dict(row) for row in cursor.fetchall()]
-        except Exception:
-            sections = []
-
-        where_c_active = sql_is_active_true('is_active', conn)
-        where_c_notdel = sql_is_deleted_false('is_deleted', conn)
-        dyn_sql = f"""
-            SELECT * FROM full_process_column_config
-            WHERE {where_c_active}
-              AND {where_c_notdel}
-            ORDER BY column_order
-        """
-        cursor.execute(dyn_sql)
-        dynamic_columns_all = [dict(row) for row in cursor.fetchall()]
+    dropdowns = DropdownLookup(lambda key: get_dropdown_options_for_display('full_process', key))
 
-        dynamic_columns = []
-        if sections:
-            for section in sections:
-                section_columns = [col for col in dynamic_columns_all if col.get('tab') == section['section_key']]
-                dynamic_columns.extend(section_columns)
-            no_section_columns = [
-                col for col in dynamic_columns_all
-                if not col.get('tab') or not any(s['section_key'] == col.get('tab') for s in sections)
-            ]
-            dynamic_columns.extend(no_section_columns)
-        else:
-            dynamic_columns = dynamic_columns_all
+    def _map_value(col, value):
+        if isinstance(value, dict):
+            return value.get('name', str(value))
+        if col.get('column_type') == 'list' and isinstance(value, list):
+            if not value:
+                return ''
+            try:
+                return json.dumps(value, ensure_ascii=False)
+            except Exception:
+                return str(value)
+        if col.get('column_type') == 'dropdown' and value:
+            return dropdowns.display(col['column_key'], value)
+        return value
 
-        data_sql = f"""
-            SELECT * FROM full_process
-            WHERE {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY created_at DESC
-            LIMIT %s
-        """
-        cursor.execute(data_sql, [max_rows])
-        data = [dict(row) for row in cursor.fetchall()]
+    def _score_total(col, custom_data):
+        conf = _load_scoring_conf(col.get('scoring_config'))
+        total = conf.get('base_score', 100)
+        include_keys = conf.get('include_keys') or []
+        total_key = conf.get('total_key') or 'default'
+        if include_keys:
+            for key in include_keys:
+                sc_col = next((c for c in scoring_cols if c.get('column_key') == key), None)
+                if not sc_col:
+                    continue
+                sconf = _load_scoring_conf(sc_col.get('scoring_config'))
+                total += _scoring_delta_total(sconf, custom_data.get(key, {}))
+        else:
+            for sc_col in scoring_cols:
+                sconf = _load_scoring_conf(sc_col.get('scoring_config'))
+                if (sconf.get('total_key') or 'default') != total_key:
+                    continue
+                total += _scoring_delta_total(sconf, custom_data.get(sc_col.get('column_key'), {}))
+        return total
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Full Process"
-
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
-
-        col_idx = 1
-        basic_headers = ['프로세스 번호', '작성일', '작성자']
-        for header in basic_headers:
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
-            col_idx += 1
-
-        import json as _json
-
-        def _expand_scoring_columns(_cols):
-            out = []
-            for c in _cols:
-                if c.get('column_type') == 'scoring':
-                    sc = c.get('scoring_config')
-                    if sc and isinstance(sc, str):
-                        try:
-                            sc = _json.loads(sc)
-                        except Exception:
-                            sc = {}
-                    items = (sc or {}).get('items') or []
-                    for it in items:
-                        iid = it.get('id')
-                        label = it.get('label') or iid
-                        if not iid:
-                            continue
-                        out.append({
-                            'column_key': f"{c['column_key']}__{iid}",
-                            'column_name': f"{c.get('column_name', c.get('column_key'))} - {label}",
-                            'column_type': 'number',
-                            '_virtual': 1,
-                            '_source_scoring_key': c['column_key'],
-                            '_source_item_id': iid
-                        })
-                else:
-                    out.append(dict(c))
-            return out
-
-        dyn_cols_list = [dict(x) for x in dynamic_columns]
-        expanded_columns = _expand_scoring_columns(dyn_cols_list)
-        scoring_cols = [dict(c) for c in dyn_cols_list if dict(c).get('column_type') == 'scoring']
-
-        for col in expanded_columns:
-            cell = ws.cell(row=1, column=col_idx, value=col['column_name'])
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
-            col_idx += 1
-
-        def _map_value(col, value):
-            if isinstance(value, dict):
-                return value.get('name', str(value))
-            if col.get('column_type') == 'list' and isinstance(value, list):
-                if not value:
-                    return ''
-                try:
-                    return json.dumps(value, ensure_ascii=False)
-                except Exception:
-                    return str(value)
-            if col.get('column_type') == 'dropdown' and value:
-                opts = get_dropdown_options_for_display('full_process', col['column_key'])
-                if opts:
-                    for opt in opts:
-                        if opt['code'] == value:
-                            return opt['value']
-            return value
-
-        for row_idx, row in enumerate(data, 2):
+    def _rows():
+        for row in iter_rows(conn, data_sql, params, settings['chunk_size']):
             row_dict = dict(row)
-            col_idx = 1
-
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('fullprocess_number', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('created_at', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('created_by', ''))
-            col_idx += 1
-
-            custom_data = row_dict.get('custom_data', {})
-            if not isinstance(custom_data, dict):
-                try:
-                    custom_data = _json.loads(custom_data) if custom_data else {}
-                except Exception:
-                    custom_data = {}
-
+            custom_data = load_json_object(row_dict.get('custom_data'))
+            values = [
+                row_dict.get('fullprocess_number', ''),
+                row_dict.get('created_at', ''),
+                row_dict.get('created_by', ''),
+            ]
             for col in expanded_columns:
                 if col.get('_virtual') == 1:
-                    src = col.get('_source_scoring_key')
-                    iid = col.get('_source_item_id')
-                    group_obj = custom_data.get(src, {})
-                    if isinstance(group_obj, str):
-                        try:
-                            group_obj = _json.loads(group_obj)
-                        except Exception:
-                            group_obj = {}
-                    v = 0
-                    if isinstance(group_obj, dict):
-                        v = group_obj.get(iid, 0)
-                    ws.cell(row=row_idx, column=col_idx, value=v)
+                    values.append(_scoring_item_value(col, custom_data))
+                elif col.get('column_type') == 'score_total':
+                    try:
+                        values.append(_score_total(col, custom_data))
+                    except Exception:
+                        values.append('')
                 else:
-                    if col.get('column_type') == 'score_total':
-                        try:
-                            conf = col.get('scoring_config')
-                            if conf and isinstance(conf, str):
-                                try:
-                                    conf = _json.loads(conf)
-                                except Exception:
-                                    conf = {}
-                            base = (conf or {}).get('base_score', 100)
-                            include_keys = (conf or {}).get('include_keys') or []
-                            total_key = (conf or {}).get('total_key') or 'default'
-                            total = base
-                            if include_keys:
-                                for key in include_keys:
-                                    sc_col = next((c for c in scoring_cols if c.get('column_key') == key), None)
-                                    if not sc_col:
-                                        continue
-                                    sconf = sc_col.get('scoring_config')
-                                    if sconf and isinstance(sconf, str):
-                                        try:
-                                            sconf = _json.loads(sconf)
-                                        except Exception:
-                                            sconf = {}
-                                    items_cfg = (sconf or {}).get('items') or []
-                                    group_obj = custom_data.get(key, {})
-                                    if isinstance(group_obj, str):
-                                        try:
-                                            group_obj = _json.loads(group_obj)
-                                        except Exception:
-                                            group_obj = {}
-                                    for it in items_cfg:
-                                        iid = it.get('id')
-                                        delta = float(it.get('per_unit_delta') or 0)
-                                        cnt = 0
-                                        if isinstance(group_obj, dict) and iid in group_obj:
-                                            try:
-                                                cnt = int(group_obj.get(iid) or 0)
-                                            except Exception:
-                                                cnt = 0
-                                        total += cnt * delta
-                            else:
-                                for sc_col in scoring_cols:
-                                    sconf = sc_col.get('scoring_config')
-                                    if sconf and isinstance(sconf, str):
-                                        try:
-                                            sconf = _json.loads(sconf)
-                                        except Exception:
-                                            sconf = {}
-                                    if ((sconf or {}).get('total_key') or 'default') != total_key:
-                                        continue
-                                    items_cfg = (sconf or {}).get('items') or []
-                                    group_obj = custom_data.get(sc_col.get('column_key'), {})
-                                    if isinstance(group_obj, str):
-                                        try:
-                                            group_obj = _json.loads(group_obj)
-                                        except Exception:
-                                            group_obj = {}
-                                    for it in items_cfg:
-                                        iid = it.get('id')
-                                        delta = float(it.get('per_unit_delta') or 0)
-                                        cnt = 0
-                                        if isinstance(group_obj, dict) and iid in group_obj:
-                                            try:
-                                                cnt = int(group_obj.get(iid) or 0)
-                                            except Exception:
-                                                cnt = 0
-                                        total += cnt * delta
-                            ws.cell(row=row_idx, column=col_idx, value=total)
-                        except Exception:
-                            ws.cell(row=row_idx, column=col_idx, value='')
-                    else:
-                        v = custom_data.get(col['column_key'], '')
-                        ws.cell(row=row_idx, column=col_idx, value=_map_value(col, v))
-                col_idx += 1
-
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min((max_length + 2) * 1.2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+                    values.append(_map_value(col, custom_data.get(col['column_key'], '')))
+            yield values
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
+    return ExportSheet(title="Full Process", headers=headers, rows=_rows(),
+                       filename_prefix='full_process', width_factor=1.2)
 
-        filename = f"full_process_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
-        conn.close()
+@app.route('/api/full-process-export')
+def export_full_process_excel():
+    """Full Process 데이터 엑셀 다운로드"""
+    if _wants_async_export():
+        return _enqueue_export_response('full_process')
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        sheet = _build_full_process_export(conn, request.args, get_export_settings())
+        return send_export(sheet, conn, fmt)
 
     except Exception as e:
         import traceback
@@ -8082,106 +7605,49 @@ def export_full_process_excel():
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== Safety Instruction 엑셀 다운로드 API =====
-@app.route('/api/safety-instruction-export')
-def export_safety_instruction_excel():
-    """Safety Instruction 데이터 엑셀 다운로드"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-
-        max_rows = _get_export_row_limit()
-
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        section_sql = f"""
-            SELECT section_key, section_name, section_order
-            FROM safety_instruction_sections
-            WHERE {sql_is_active_true('is_active', conn)}
-              AND {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY section_order
-        """
-        try:
-            cursor.execute(section_sql)
-            sections = [dict(row) for row in cursor.fetchall()]
-        except Exception:
-            try:
-                section_sql = f"""
-                    SELECT section_key, section_name, section_order
-                    FROM section_config
-                    WHERE board_type = 'safety_instruction'
-                      AND {sql_is_active_true('is_active', conn)}
-                      AND {sql_is_deleted_false('is_deleted', conn)}
-                    ORDER BY section_order
-                """
-                cursor.execute(section_sql)
-                sections = [dict(row) for row in cursor.fetchall()]
-            except Exception:
-                sections = []
-
-        where_c_active = sql_is_active_true('is_active', conn)
-        where_c_notdel = sql_is_deleted_false('is_deleted', conn)
-        dyn_sql = f"""
-            SELECT * FROM safety_instruction_column_config
-            WHERE {where_c_active}
-              AND {where_c_notdel}
-            ORDER BY column_order
-        """
-        cursor.execute(dyn_sql)
-        dynamic_columns_all = [dict(row) for row in cursor.fetchall()]
+def _build_safety_instruction_export(conn, args, settings) -> ExportSheet:
+    """Safety Instruction 엑셀 내보내기 시트 구성 (코드 매핑은 청크 단위로 적용)"""
+    section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM safety_instruction_sections
+        WHERE {sql_is_active_true('is_active', conn)}
+          AND {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY section_order
+    """
+    fallback_section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM section_config
+        WHERE board_type = 'safety_instruction'
+          AND {sql_is_active_true('is_active', conn)}
+          AND {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY section_order
+    """
+    where_c_active = sql_is_active_true('is_active', conn)
+    where_c_notdel = sql_is_deleted_false('is_deleted', conn)
+    dyn_sql = f"""
+        SELECT * FROM safety_instruction_column_config
+        WHERE {where_c_active}
+          AND {where_c_notdel}
+        ORDER BY column_order
+    """
+    sections, dynamic_columns = _export_layout(conn, 'safety_instruction', (section_sql, fallback_section_sql), dyn_sql)
 
-        dynamic_columns = []
-        if sections:
-            for section in sections:
-                section_columns = [col for col in dynamic_columns_all if col.get('tab') == section['section_key']]
-                dynamic_columns.extend(section_columns)
-            no_section_columns = [
-                col for col in dynamic_columns_all
-                if not col.get('tab') or not any(s['section_key'] == col.get('tab') for s in sections)
-            ]
-            dynamic_columns.extend(no_section_columns)
-        else:
-            dynamic_columns = dynamic_columns_all
+    params = []
+    data_sql = apply_row_limit(f"""
+        SELECT * FROM safety_instructions
+        WHERE {sql_is_deleted_false('is_deleted', conn)}
+        ORDER BY created_at DESC, issue_number DESC
+    """, params, settings['max_rows'])
 
-        data_sql = f"""
-            SELECT * FROM safety_instructions
-            WHERE {sql_is_deleted_false('is_deleted', conn)}
-            ORDER BY created_at DESC, issue_number DESC
-            LIMIT %s
-        """
-        cursor.execute(data_sql, [max_rows])
-        data = [dict(row) for row in cursor.fetchall()]
+    basic_column_keys = ['issue_number', 'issuer', 'violation_date', 'discipline_date', 'disciplined_person']
+    extra_columns = [col for col in dynamic_columns if col['column_key'] not in basic_column_keys]
+    headers = ['발부번호', '발부자', '위반일자', '징계일자', '피징계자'] + [col['column_name'] for col in extra_columns]
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Safety Instructions"
-
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
-
-        col_idx = 1
-        basic_headers = ['발부번호', '발부자', '위반일자', '징계일자', '피징계자']
-        for header in basic_headers:
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
-            col_idx += 1
-
-        basic_column_keys = ['issue_number', 'issuer', 'violation_date', 'discipline_date', 'disciplined_person']
-        for col in dynamic_columns:
-            if col['column_key'] not in basic_column_keys:
-                cell = ws.cell(row=1, column=col_idx, value=col['column_name'])
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_align
-                col_idx += 1
+    base_fields = {'issue_number', 'created_at', 'updated_at', 'is_deleted', 'synced_at'}
 
+    def _prepare_chunk(rows):
         data_list = []
-        for row in data:
+        for row in rows:
             row_dict = dict(row)
             if row_dict.get('custom_data'):
                 try:
@@ -8193,7 +7659,6 @@ def export_safety_instruction_excel():
                     else:
                         custom_data = {}
 
-                    base_fields = {'issue_number', 'created_at', 'updated_at', 'is_deleted', 'synced_at'}
                     for k, v in custom_data.items():
                         if k not in base_fields:
                             row_dict[k] = v
@@ -8202,31 +7667,14 @@ def export_safety_instruction_excel():
             data_list.append(row_dict)
 
         from common_mapping import smart_apply_mappings
-        if data_list:
-            data_list = smart_apply_mappings(
-                data_list,
-                'safety_instruction',
-                [dict(col) for col in dynamic_columns],
-                DB_PATH
-            )
-
-        for row_idx, row_dict in enumerate(data_list, 2):
-            col_idx = 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('issue_number', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('issuer', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('violation_date', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('discipline_date', ''))
-            col_idx += 1
-            ws.cell(row=row_idx, column=col_idx, value=row_dict.get('disciplined_person', ''))
-            col_idx += 1
+        return smart_apply_mappings(data_list, 'safety_instruction', dynamic_columns, DB_PATH)
 
-            for col in dynamic_columns:
-                if col['column_key'] not in basic_column_keys:
-                    col_key = col['column_key']
-                    value = row_dict.get(col_key, '')
+    def _rows():
+        for chunk in iter_chunks(conn, data_sql, params, settings['chunk_size']):
+            for row_dict in _prepare_chunk(chunk):
+                values = [row_dict.get(key, '') for key in basic_column_keys]
+                for col in extra_columns:
+                    value = row_dict.get(col['column_key'], '')
 
                     if isinstance(value, list):
                         if not value:
@@ -8243,36 +7691,28 @@ def export_safety_instruction_excel():
                             value = value.get('name', str(value))
                     elif value is None:
                         value = ''
+                    values.append(value)
+                yield values
 
-                    ws.cell(row=row_idx, column=col_idx, value=value)
-                    col_idx += 1
+    return ExportSheet(title="Safety Instructions", headers=headers, rows=_rows(),
+                       filename_prefix='safety_instruction', width_factor=1.2)
 
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min((max_length + 2) * 1.2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-
-        filename = f"safety_instruction_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
+@app.route('/api/safety-instruction-export')
+def export_safety_instruction_excel():
+    """Safety Instruction 데이터 엑셀 다운로드"""
+    if _wants_async_export():
+        return _enqueue_export_response('safety_instruction')
 
-        conn.close()
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+    conn = None
+    try:
+        conn = get_db_connection()
+        sheet = _build_safety_instruction_export(conn, request.args, get_export_settings())
+        return send_export(sheet, conn, fmt)
 
     except Exception as e:
         logging.error(f"Safety Instruction 엑셀 다운로드 중 오류: {e}")
@@ -8283,139 +7723,86 @@ def export_safety_instruction_excel():
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== 기준정보 변경요청 엑셀 다운로드 API =====
-@app.route('/api/change-requests/export')
-def export_change_requests_excel():
-    """기준정보 변경요청 데이터 엑셀 다운로드"""
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-
-        max_rows = _get_export_row_limit()
-
-        company_name = request.args.get('company_name', '')
-        business_number = request.args.get('business_number', '')
-        status = request.args.get('status', '')
-        created_date_start = request.args.get('created_date_start', '')
-        created_date_end = request.args.get('created_date_end', '')
-
-        conn = get_db_connection()
-
-        section_sql = f"""
-            SELECT section_key, section_name, section_order
-            FROM section_config
-            WHERE board_type = 'change_request'
-              AND {sql_is_active_true('is_active', conn)}
-            ORDER BY section_order
-        """
-        sections = conn.execute(section_sql).fetchall()
-
-        where_c_active = sql_is_active_true('is_active', conn)
-        where_c_notdel = sql_is_deleted_false('is_deleted', conn)
-        dyn_sql = f"""
-            SELECT * FROM change_request_column_config
-            WHERE {where_c_active}
-              AND {where_c_notdel}
-            ORDER BY column_order
-        """
-        dynamic_columns_rows = conn.execute(dyn_sql).fetchall()
-        dynamic_columns_all = [dict(row) for row in dynamic_columns_rows]
-
-        dynamic_columns = []
-        if sections:
-            for section in sections:
-                section_columns = [col for col in dynamic_columns_all if col.get('tab') == section['section_key']]
-                section_columns.sort(key=lambda x: x.get('column_order', 0))
-                dynamic_columns.extend(section_columns)
-            no_section_columns = [
-                col for col in dynamic_columns_all
-                if not col.get('tab') or not any(section['section_key'] == col.get('tab') for section in sections)
-            ]
-            no_section_columns.sort(key=lambda x: x.get('column_order', 0))
-            dynamic_columns.extend(no_section_columns)
-        else:
-            dynamic_columns = dynamic_columns_all
-
-        query = f"""
-            SELECT * FROM partner_change_requests
-            WHERE {sql_is_deleted_false('is_deleted', conn)}
-        """
-        params = []
-
-        if company_name:
-            query += " AND company_name LIKE %s"
-            params.append(f"%{company_name}%")
-        if business_number:
-            query += " AND business_number LIKE %s"
-            params.append(f"%{business_number}%")
-        if status:
-            query += " AND status = %s"
-            params.append(status)
-        if created_date_start:
-            query += " AND DATE(created_at) >= %s"
-            params.append(created_date_start)
-        if created_date_end:
-            query += " AND DATE(created_at) <= %s"
-            params.append(created_date_end)
-
-        query += " ORDER BY created_at DESC, id DESC LIMIT %s"
-        params.append(max_rows)
-
-        change_requests = conn.execute(query, params).fetchall()
-
-        def get_display_value(column_key, code_value):
-            if not code_value or code_value == '':
-                return ''
-            try:
-                options = get_dropdown_options_for_display('change_request', column_key)
-                if options:
-                    for option in options:
-                        if option['code'] == code_value:
-                            return option['value']
-                return code_value
-            except Exception:
-                return code_value
-
-        def format_date(date_value):
-            if not date_value:
-                return ''
-            date_str = str(date_value)
-            if ' ' in date_str:
-                return date_str.split(' ')[0]
-            return date_str
+def _build_change_requests_export(conn, args, settings) -> ExportSheet:
+    """기준정보 변경요청 엑셀 내보내기 시트 구성"""
+    company_name = args.get('company_name', '')
+    business_number = args.get('business_number', '')
+    status = args.get('status', '')
+    created_date_start = args.get('created_date_start', '')
+    created_date_end = args.get('created_date_end', '')
+
+    section_sql = f"""
+        SELECT section_key, section_name, section_order
+        FROM section_config
+        WHERE board_type = 'change_request'
+          AND {sql_is_active_true('is_active', conn)}
+        ORDER BY section_order
+    """
+    where_c_active = sql_is_active_true('is_active', conn)
+    where_c_notdel = sql_is_deleted_false('is_deleted', conn)
+    dyn_sql = f"""
+        SELECT * FROM change_request_column_config
+        WHERE {where_c_active}
+          AND {where_c_notdel}
+        ORDER BY column_order
+    """
+    sections, dynamic_columns = _export_layout(conn, 'change_request', (section_sql,), dyn_sql)
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "기준정보 변경요청"
+    query = f"""
+        SELECT * FROM partner_change_requests
+        WHERE {sql_is_deleted_false('is_deleted', conn)}
+    """
+    params = []
 
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
+    if company_name:
+        query += " AND company_name LIKE %s"
+        params.append(f"%{company_name}%")
+    if business_number:
+        query += " AND business_number LIKE %s"
+        params.append(f"%{business_number}%")
+    if status:
+        query += " AND status = %s"
+        params.append(status)
+    if created_date_start:
+        query += " AND DATE(created_at) >= %s"
+        params.append(created_date_start)
+    if created_date_end:
+        query += " AND DATE(created_at) <= %s"
+        params.append(created_date_end)
+
+    query += " ORDER BY created_at DESC, id DESC"
+    query = apply_row_limit(query, params, settings['max_rows'])
+
+    dropdowns = DropdownLookup(lambda key: get_dropdown_options_for_display('change_request', key))
+
+    def get_display_value(column_key, code_value):
+        if not code_value or code_value == '':
+            return ''
+        return dropdowns.display(column_key, code_value)
 
-        headers = ['요청번호', '회사명', '사업자번호', '상태', '등록일', '수정일']
-        for col in dynamic_columns:
-            headers.append(col['column_name'])
+    def format_date(date_value):
+        if not date_value:
+            return ''
+        date_str = str(date_value)
+        if ' ' in date_str:
+            return date_str.split(' ')[0]
+        return date_str
 
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
+    headers = ['요청번호', '회사명', '사업자번호', '상태', '등록일', '수정일']
+    headers.extend(col['column_name'] for col in dynamic_columns)
 
-        for row_idx, request_row in enumerate(change_requests, 2):
+    def _rows():
+        for request_row in iter_rows(conn, query, params, settings['chunk_size']):
             request_data = dict(request_row)
-
-            ws.cell(row=row_idx, column=1, value=request_data.get('request_number', ''))
-            ws.cell(row=row_idx, column=2, value=request_data.get('company_name', ''))
-            ws.cell(row=row_idx, column=3, value=request_data.get('business_number', ''))
-
             status_value = request_data.get('status', '')
-            status_display = get_display_value('status', status_value) if status_value else ''
-            ws.cell(row=row_idx, column=4, value=status_display)
-
-            ws.cell(row=row_idx, column=5, value=format_date(request_data.get('created_at', '')))
-            ws.cell(row=row_idx, column=6, value=format_date(request_data.get('updated_at', '')))
+            values = [
+                request_data.get('request_number', ''),
+                request_data.get('company_name', ''),
+                request_data.get('business_number', ''),
+                get_display_value('status', status_value) if status_value else '',
+                format_date(request_data.get('created_at', '')),
+                format_date(request_data.get('updated_at', '')),
+            ]
 
             custom_data = {}
             if request_data.get('custom_data'):
@@ -8427,7 +7814,7 @@ def export_change_requests_excel():
                 except Exception:
                     custom_data = {}
 
-            for col_idx, col in enumerate(dynamic_columns, 7):
+            for col in dynamic_columns:
                 value = custom_data.get(col['column_key'], '')
 
                 if isinstance(value, dict):
@@ -8447,233 +7834,286 @@ def export_change_requests_excel():
                     value = get_display_value(col['column_key'], value)
                 elif col['column_type'] in ['date', 'datetime'] and value:
                     value = format_date(value)
+                values.append(value)
+            yield values
 
-                ws.cell(row=row_idx, column=col_idx, value=value)
-
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+    return ExportSheet(title="기준정보 변경요청", headers=headers, rows=_rows(),
+                       filename_prefix='기준정보_변경요청')
 
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
 
-        korean_time = get_korean_time()
-        filename = f"기준정보_변경요청_{korean_time.strftime('%Y%m%d_%H%M%S')}.xlsx"
+@app.route('/api/change-requests/export')
+def export_change_requests_excel():
+    """기준정보 변경요청 데이터 엑셀 다운로드"""
+    if _wants_async_export():
+        return _enqueue_export_response('change_request')
 
-        conn.close()
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
 
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=filename
-        )
+    conn = None
+    try:
+        conn = get_db_connection()
+        sheet = _build_change_requests_export(conn, request.args, get_export_settings())
+        return send_export(sheet, conn, fmt)
 
     except Exception as e:
         logging.error(f"변경요청 엑셀 다운로드 중 오류: {e}")
+        if conn:
+            conn.close()
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== 협력사 엑셀 다운로드 API =====
-@app.route('/api/partners/export')
-def export_partners_to_excel():
-    try:
-        import openpyxl
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-
-        max_rows = _get_export_row_limit()
-
-        company_name = request.args.get('company_name', '')
-        business_number = request.args.get('business_number', '')
-        business_type_major = request.args.get('business_type_major', '')
-        business_type_minor = request.args.get('business_type_minor', '')
-        workers_min = request.args.get('workers_min', '')
-        workers_max = request.args.get('workers_max', '')
+PARTNER_EXPORT_HEADERS = [
+    '협력사명', '사업자번호', 'Class', '업종(대분류)', '업종(소분류)',
+    '위험작업여부', '대표자성명', '주소', '평균연령', '매출액',
+    '거래차수', '상시근로자'
+]
+
+
+def _build_partners_export(conn, args, settings) -> ExportSheet:
+    """협력사 기준정보 엑셀 내보내기 시트 구성"""
+    company_name = args.get('company_name', '')
+    business_number = args.get('business_number', '')
+    business_type_major = args.get('business_type_major', '')
+    business_type_minor = args.get('business_type_minor', '')
+    workers_min = args.get('workers_min', '')
+    workers_max = args.get('workers_max', '')
+
+    query = f"SELECT * FROM partners_cache WHERE {sql_is_deleted_false('is_deleted', conn)}"
+    params = []
 
+    if company_name:
+        query += " AND company_name LIKE %s"
+        params.append(f'%{company_name}%')
+    if business_number:
+        query += " AND business_number LIKE %s"
+        params.append(f'%{business_number}%')
+    if business_type_major:
+        query += " AND business_type_major = %s"
+        params.append(business_type_major)
+    if business_type_minor:
+        query += " AND business_type_minor = %s"
+        params.append(business_type_minor)
+    if workers_min:
         try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-
-            query = f"SELECT * FROM partners_cache WHERE {sql_is_deleted_false('is_deleted', conn)}"
-            params = []
-
-            if company_name:
-                query += " AND company_name LIKE %s"
-                params.append(f'%{company_name}%')
-            if business_number:
-                query += " AND business_number LIKE %s"
-                params.append(f'%{business_number}%')
-            if business_type_major:
-                query += " AND business_type_major = %s"
-                params.append(business_type_major)
-            if business_type_minor:
-                query += " AND business_type_minor = %s"
-                params.append(business_type_minor)
-            if workers_min:
-                try:
-                    min_val = int(workers_min)
-                    query += " AND permanent_workers >= %s"
-                    params.append(min_val)
-                except ValueError:
-                    pass
-            if workers_max:
-                try:
-                    max_val = int(workers_max)
-                    query += " AND permanent_workers <= %s"
-                    params.append(max_val)
-                except ValueError:
-                    pass
-
-            query += " ORDER BY company_name LIMIT %s"
-            params.append(max_rows)
+            min_val = int(workers_min)
+            query += " AND permanent_workers >= %s"
+            params.append(min_val)
+        except ValueError:
+            pass
+    if workers_max:
+        try:
+            max_val = int(workers_max)
+            query += " AND permanent_workers <= %s"
+            params.append(max_val)
+        except ValueError:
+            pass
 
-            partners = cursor.execute(query, params).fetchall()
+    query += " ORDER BY company_name"
+    query = apply_row_limit(query, params, settings['max_rows'])
 
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "협력사 기준정보"
+    def _rows():
+        for partner_row in iter_rows(conn, query, params, settings['chunk_size']):
+            partner = dict(partner_row)
 
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_align = Alignment(horizontal="center", vertical="center")
+            hazard_work = partner.get('hazard_work_flag', '')
+            hazard_text = '예' if hazard_work == 'O' else '아니오' if hazard_work == 'X' else ''
 
-            headers = [
-                '협력사명', '사업자번호', 'Class', '업종(대분류)', '업종(소분류)',
-                '위험작업여부', '대표자성명', '주소', '평균연령', '매출액',
-                '거래차수', '상시근로자'
+            revenue = partner.get('annual_revenue')
+            if revenue:
+                revenue_text = f"{revenue // 100000000}억원"
+            else:
+                revenue_text = ''
+
+            workers = partner.get('permanent_workers')
+            workers_text = f"{workers}명" if workers else ''
+
+            yield [
+                partner.get('company_name', ''),
+                partner.get('business_number', ''),
+                partner.get('partner_class', ''),
+                partner.get('business_type_major', ''),
+                partner.get('business_type_minor', ''),
+                hazard_text,
+                partner.get('representative', ''),
+                partner.get('address', ''),
+                partner.get('average_age', ''),
+                revenue_text,
+                partner.get('transaction_count', ''),
+                workers_text,
             ]
 
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_align
-
-            for row_idx, partner_row in enumerate(partners, 2):
-                partner = dict(partner_row)
-
-                ws.cell(row=row_idx, column=1, value=partner.get('company_name', ''))
-                ws.cell(row=row_idx, column=2, value=partner.get('business_number', ''))
-                ws.cell(row=row_idx, column=3, value=partner.get('partner_class', ''))
-                ws.cell(row=row_idx, column=4, value=partner.get('business_type_major', ''))
-                ws.cell(row=row_idx, column=5, value=partner.get('business_type_minor', ''))
+    return ExportSheet(title="협력사 기준정보", headers=list(PARTNER_EXPORT_HEADERS), rows=_rows(),
+                       filename_prefix='partners_list')
 
-                hazard_work = partner.get('hazard_work_flag', '')
-                hazard_text = '예' if hazard_work == 'O' else '아니오' if hazard_work == 'X' else ''
-                ws.cell(row=row_idx, column=6, value=hazard_text)
 
-                ws.cell(row=row_idx, column=7, value=partner.get('representative', ''))
-                ws.cell(row=row_idx, column=8, value=partner.get('address', ''))
-                ws.cell(row=row_idx, column=9, value=partner.get('average_age', ''))
+@app.route('/api/partners/export')
+def export_partners_to_excel():
+    if _wants_async_export():
+        return _enqueue_export_response('partners')
 
-                revenue = partner.get('annual_revenue')
-                if revenue:
-                    revenue_text = f"{revenue // 100000000}억원"
-                else:
-                    revenue_text = ''
-                ws.cell(row=row_idx, column=10, value=revenue_text)
+    fmt, format_error = _requested_export_format()
+    if format_error:
+        return format_error
 
-                ws.cell(row=row_idx, column=11, value=partner.get('transaction_count', ''))
+    try:
+        conn = None
+        try:
+            conn = get_db_connection()
+            sheet = _build_partners_export(conn, request.args, get_export_settings())
+            return send_export(sheet, conn, fmt)
 
-                workers = partner.get('permanent_workers')
-                workers_text = f"{workers}명" if workers else ''
-                ws.cell(row=row_idx, column=12, value=workers_text)
+        except Exception as db_error:
+            logging.error(f"협력사 데이터 조회 중 오류: {db_error}")
+            if conn:
+                conn.close()
+            sample_data = [
+                '샘플 협력사', '123-45-67890', 'A', '제조업', '전자제품',
+                '예', '김대표', '서울시 강남구', '35', '100억원', '5', '50명'
+            ]
+            return send_export(ExportSheet(
+                title="협력사 기준정보",
+                headers=list(PARTNER_EXPORT_HEADERS),
+                rows=[sample_data],
+                filename_prefix='partners_list',
+                max_width=30,
+            ), fmt=fmt)
 
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except Exception:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+    except Exception as e:
+        logging.error(f"협력사 엑셀 다운로드 중 오류: {e}")
+        import traceback
+        logging.error(traceback.format_exc())
+        return jsonify({"success": False, "message": str(e)}), 500
 
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
+# ===== 백그라운드 내보내기 작업 API =====
+for _export_board, _export_builder in (
+    ('accident', _build_accident_export),
+    ('follow_sop', _build_follow_sop_export),
+    ('safe_workplace', _build_safe_workplace_export),
+    ('full_process', _build_full_process_export),
+    ('safety_instruction', _build_safety_instruction_export),
+    ('change_request', _build_change_requests_export),
+    ('partners', _build_partners_export),
+):
+    register_export_builder(_export_board, _export_builder)
 
-            conn.close()
 
-            filename = f"partners_list_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
+def _export_job_user() -> str:
+    return session.get('user_id') or session.get('emp_id') or ''
 
-            return send_file(
-                output,
-                mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                as_attachment=True,
-                download_name=filename
-            )
 
-        except Exception as db_error:
-            logging.error(f"협력사 데이터 조회 중 오류: {db_error}")
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "협력사 기준정보"
-
-            headers = [
-                '협력사명', '사업자번호', 'Class', '업종(대분류)', '업종(소분류)',
-                '위험작업여부', '대표자성명', '주소', '평균연령', '매출액',
-                '거래차수', '상시근로자'
-            ]
+def _wants_async_export() -> bool:
+    """?async=1 이면 내보내기를 백그라운드 작업으로 등록한다"""
+    return str(request.args.get('async', '')).lower() in ('1', 'true', 'yes')
 
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_align = Alignment(horizontal="center", vertical="center")
 
-            for col_idx, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_idx, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_align
+def _requested_export_format():
+    """?format=xlsx|csv|parquet 검증 - (format, error_response)"""
+    try:
+        return resolve_export_format(request.args.get('format')), None
+    except ExportFormatError as e:
+        return None, (jsonify({"success": False, "message": str(e)}), 400)
 
-            sample_data = [
-                '샘플 협력사', '123-45-67890', 'A', '제조업', '전자제품',
-                '예', '김대표', '서울시 강남구', '35', '100억원', '5', '50명'
-            ]
-            for col_idx, value in enumerate(sample_data, 1):
-                ws.cell(row=2, column=col_idx, value=value)
 
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except Exception:
-                        pass
-                adjusted_width = min(max_length + 2, 30)
-                ws.column_dimensions[column_letter].width = adjusted_width
+def _enqueue_export_response(board, params=None, fmt=None):
+    """내보내기 작업 등록 후 job id 와 조회/다운로드 URL 을 202 로 반환"""
+    requested_by = _export_job_user()
+    if not requested_by:
+        return jsonify({"success": False, "message": "인증이 필요합니다."}), 401
 
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
+    if params is None:
+        params = {key: value for key, value in request.args.items() if key not in ('async', 'format')}
+    try:
+        fmt = resolve_export_format(fmt if fmt is not None else request.args.get('format'))
+        job_id = enqueue_export_job(board, params, requested_by, fmt)
+    except ExportJobLimitError as e:
+        return jsonify({"success": False, "message": str(e)}), 429
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+
+    return jsonify({
+        "success": True,
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": url_for('api_export_job_status', job_id=job_id),
+        "download_url": url_for('api_export_job_download', job_id=job_id),
+    }), 202
+
+
+def _load_owned_export_job(job_id):
+    """본인 작업(관리자는 전체)만 조회 - (job, error_response)"""
+    job = get_export_job(job_id)
+    if not job:
+        return None, (jsonify({"success": False, "message": "내보내기 작업을 찾을 수 없습니다."}), 404)
+    is_admin = session.get('admin_authenticated') or is_super_admin()
+    if not is_admin and job.get('requested_by') != _export_job_user():
+        return None, _json_forbidden()
+    return job, None
+
+
+@app.route('/api/export-jobs', methods=['POST'])
+def api_create_export_job():
+    """내보내기 작업 등록 - body: {"board": "...", "format": "xlsx|csv|parquet", "params": {...필터}}"""
+    payload = request.get_json(silent=True) or {}
+    board = payload.get('board') or request.args.get('board', '')
+    params = payload.get('params')
+    if not isinstance(params, dict):
+        params = {}
+    return _enqueue_export_response(board, params, payload.get('format') or request.args.get('format'))
+
+
+@app.route('/api/export-jobs/<job_id>')
+def api_export_job_status(job_id):
+    """내보내기 작업 상태 조회 (폴링용)"""
+    try:
+        job, error = _load_owned_export_job(job_id)
+        if error:
+            return error
+
+        def _iso(value):
+            return value.isoformat() if value else None
 
-            filename = f"partners_list_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        return jsonify({
+            "success": True,
+            "job": {
+                "id": job['id'],
+                "board": job['board'],
+                "format": job.get('format') or 'xlsx',
+                "status": job['status'],
+                "row_count": job.get('row_count'),
+                "error_message": job.get('error_message'),
+                "created_at": _iso(job.get('created_at')),
+                "started_at": _iso(job.get('started_at')),
+                "finished_at": _iso(job.get('finished_at')),
+                "expires_at": _iso(job.get('expires_at')),
+                "download_url": url_for('api_export_job_download', job_id=job['id']) if job['status'] == 'done' else None,
+            },
+        })
+    except Exception as e:
+        logging.error(f"내보내기 작업 조회 중 오류: {e}")
+        return jsonify({"success": False, "message": str(e)}), 500
 
-            return send_file(
-                output,
-                mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                as_attachment=True,
-                download_name=filename
-            )
 
+@app.route('/api/export-jobs/<job_id>/download')
+def api_export_job_download(job_id):
+    """완료된 내보내기 파일 다운로드"""
+    try:
+        job, error = _load_owned_export_job(job_id)
+        if error:
+            return error
+        if job['status'] != 'done':
+            return jsonify({"success": False, "status": job['status'], "message": "아직 다운로드할 수 없는 작업입니다."}), 409
+        if not job.get('file_path') or not os.path.exists(job['file_path']):
+            return jsonify({"success": False, "message": "내보내기 파일이 만료되었거나 없습니다."}), 410
+        return send_file(
+            job['file_path'],
+            mimetype=EXPORT_MIMETYPES.get(job.get('format') or 'xlsx'),
+            as_attachment=True,
+            download_name=job.get('file_name') or os.path.basename(job['file_path']),
+        )
     except Exception as e:
-        logging.error(f"협력사 엑셀 다운로드 중 오류: {e}")
-        import traceback
-        logging.error(traceback.format_exc())
+        logging.error(f"내보내기 파일 다운로드 중 오류: {e}")
         return jsonify({"success": False, "message": str(e)}), 500
 
 # ===== 협력사 삭제 API =====
@@ -8700,6 +8140,7 @@ def delete_partners():
         
         deleted_count = cursor.rowcount
         conn.commit()
+        invalidate_counts('partners_cache', DB_PATH)
         conn.close()
         
         return jsonify({
@@ -8933,20 +8374,13 @@ def delete_change_requests():
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        # PostgreSQL: information_schema를 통해 컬럼 정보 조회
-        cursor.execute("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_name = 'partner_change_requests'
-        """)
-        columns = [col[0] for col in cursor.fetchall()]
-        
-        if 'is_deleted' not in columns:
+        if not _table_has_column(conn, 'partner_change_requests', 'is_deleted'):
             cursor.execute("""
                 ALTER TABLE partner_change_requests 
                 ADD COLUMN is_deleted INTEGER DEFAULT 0
             """)
             conn.commit()
+            refresh_schema_cache(DB_PATH)
         
         # 소프트 삭제 실행
         placeholders = ','.join(['%s'] * len(ids))
@@ -9302,16 +8736,8 @@ def board_dropdown_history(board):
         return jsonify({"error": "column_key is required"}), 400
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
-        # board_type 컬럼 존재 여부 확인
-        # PostgreSQL: information_schema를 통해 컬럼 정보 조회
-        cur.execute("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_name = 'dropdown_code_audit'
-        """)
-        cols = [r[0] for r in cur.fetchall()]
-        if 'board_type' in cols:
+        # board_type 컬럼 존재 여부 확인 (스키마 캐시)
+        if _table_has_column(conn, 'dropdown_code_audit', 'board_type'):
             history = conn.execute(
                 """
                 SELECT * FROM dropdown_code_audit
@@ -9341,15 +8767,7 @@ def board_dropdown_audit_summary(board):
     board_type = board.replace('-', '_')
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
-        # PostgreSQL: information_schema를 통해 컬럼 정보 조회
-        cur.execute("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_name = 'dropdown_code_audit'
-        """)
-        cols = [r[0] for r in cur.fetchall()]
-        if 'board_type' in cols:
+        if _table_has_column(conn, 'dropdown_code_audit', 'board_type'):
             recent = conn.execute(
                 """
                 SELECT DATE(changed_at) as date,
@@ -9649,6 +9067,8 @@ def api_admin_audit_logs():
     result_param = request.args.get('result', '')
     success_param = request.args.get('success', '')
     user_param = request.args.get('user', '')
+    # ?cursor= 를 넘기면 OFFSET/COUNT 대신 keyset 페이지네이션 (빈 값이면 첫 페이지)
+    cursor_token = request.args.get('cursor')
 
     normalized_action = normalize_action(action_type_param) if action_type_param else ''
     normalized_scope = normalize_scope(scope_param) if scope_param else ''
@@ -9662,6 +9082,19 @@ def api_admin_audit_logs():
         elif lowered in ('false', '0', 'no', 'n'):
             success_filter = False
 
+    # access_audit_log 는 created_at 월 파티션이므로 날짜 범위를 [시작일, 종료일+1) 로 넘겨
+    # 해당 월 파티션만 스캔하도록 한다.
+    def _parse_filter_date(value):
+        try:
+            return datetime.strptime(value.strip()[:10], '%Y-%m-%d').date()
+        except (AttributeError, ValueError):
+            return None
+
+    start_bound = _parse_filter_date(start_date) if start_date else None
+    end_bound = _parse_filter_date(end_date) if end_date else None
+    if end_bound:
+        end_bound += timedelta(days=1)
+
     conn = None
     cursor = None
     try:
@@ -9688,7 +9121,8 @@ def api_admin_audit_logs():
                 al.permission_result,
                 al.details,
                 al.ip_address,
-                al.error_message
+                al.error_message,
+                al.id
             FROM access_audit_log al
             LEFT JOIN system_users u_login ON al.login_id = u_login.login_id
             LEFT JOIN system_users u_emp ON al.emp_id = u_emp.emp_id
@@ -9697,12 +9131,12 @@ def api_admin_audit_logs():
         """
         params = []
 
-        if start_date:
+        if start_bound:
             query += " AND al.created_at >= %s"
-            params.append(start_date)
-        if end_date:
-            query += " AND al.created_at <= %s"
-            params.append(f"{end_date} 23:59:59")
+            params.append(start_bound)
+        if end_bound:
+            query += " AND al.created_at < %s"
+            params.append(end_bound)
         if normalized_scope:
             query += " AND al.action_scope = %s"
             params.append(normalized_scope)
@@ -9723,10 +9157,21 @@ def api_admin_audit_logs():
             like_value = f"%{user_param}%"
             params.extend([like_value, like_value, like_value, like_value])
 
-        query += " ORDER BY al.created_at DESC LIMIT %s OFFSET %s"
-        params.extend([per_page, (page - 1) * per_page])
-        cursor.execute(query, params)
-        logs = cursor.fetchall()
+        keyset = None
+        if cursor_token is not None:
+            # keyset 모드: (created_at, id) 기준으로 이어서 조회하고 COUNT 는 생략
+            order = KeysetOrder('al.created_at', 'al.id', sort_key='created_at', tie_key='id')
+            clause, clause_params, order_by = keyset_clause(order, cursor_token)
+            query += f"{clause} ORDER BY {order_by} LIMIT %s"
+            params.extend([*clause_params, per_page + 1])
+            cursor.execute(query, params)
+            keyset = keyset_page(cursor.fetchall(), order, per_page, cursor_token)
+            logs = keyset['items']
+        else:
+            query += " ORDER BY al.created_at DESC LIMIT %s OFFSET %s"
+            params.extend([per_page, (page - 1) * per_page])
+            cursor.execute(query, params)
+            logs = cursor.fetchall()
 
         def _cursor_description(cur):
             desc = getattr(cur, 'description', None)
@@ -9738,12 +9183,12 @@ def api_admin_audit_logs():
 
         count_query = "SELECT COUNT(*) FROM access_audit_log al WHERE 1=1"
         count_params = []
-        if start_date:
+        if start_bound:
             count_query += " AND al.created_at >= %s"
-            count_params.append(start_date)
-        if end_date:
-            count_query += " AND al.created_at <= %s"
-            count_params.append(f"{end_date} 23:59:59")
+            count_params.append(start_bound)
+        if end_bound:
+            count_query += " AND al.created_at < %s"
+            count_params.append(end_bound)
         if normalized_scope:
             count_query += " AND al.action_scope = %s"
             count_params.append(normalized_scope)
@@ -9763,8 +9208,10 @@ def api_admin_audit_logs():
             count_query += " AND (al.login_id ILIKE %s OR al.emp_id ILIKE %s OR EXISTS (SELECT 1 FROM system_users su WHERE su.login_id = al.login_id AND su.user_name ILIKE %s) OR EXISTS (SELECT 1 FROM system_users su WHERE su.emp_id = al.emp_id AND su.user_name ILIKE %s))"
             like_value = f"%{user_param}%"
             count_params.extend([like_value, like_value, like_value, like_value])
-        cursor.execute(count_query, count_params)
-        total_count = cursor.fetchone()[0] if cursor.rowcount != -1 else 0
+        total_count = None
+        if keyset is None:
+            cursor.execute(count_query, count_params)
+            total_count = cursor.fetchone()[0] if cursor.rowcount != -1 else 0
 
         def _safe_detail(value):
             if value is None:
@@ -9835,6 +9282,16 @@ def api_admin_audit_logs():
                 'error_message': _field('error_message', 18),
             })
 
+        if keyset is not None:
+            return jsonify({
+                'logs': log_payload,
+                'per_page': per_page,
+                'next_cursor': keyset['next_cursor'],
+                'prev_cursor': keyset['prev_cursor'],
+                'has_next': keyset['has_next'],
+                'has_prev': keyset['has_prev'],
+            })
+
         return jsonify({
             'logs': log_payload,
             'total': total_count,
@@ -10705,8 +10162,7 @@ if __name__ == "__main__":
         print("JSON 동기화 건너뜀 (config: SYNC_ON_STARTUP=false)", flush=True)
         print("DB의 컬럼 설정을 그대로 사용합니다.", flush=True)
     
-    start_background_master_sync_scheduler()
-    start_background_permission_master_sync_scheduler()
+    init_background_services()
     
     print(f"partner-accident 라우트 등록됨: {'/partner-accident' in [rule.rule for rule in app.url_map.iter_rules()]}", flush=True)
 
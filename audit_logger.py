@@ -4,17 +4,44 @@ access_audit_log 테이블에 한국어 레이블로 주요 활동을 기록한
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
+import queue
+import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Optional, Dict
+from datetime import datetime, timezone
+from typing import Any, Optional, Dict, List, Tuple
 
 from flask import Request, request, session
 
-from db_connection import get_db_connection
+from db_connection import get_config, get_db_connection
 
 logger = logging.getLogger(__name__)
 
+_AUDIT_COLUMNS = (
+    "emp_id",
+    "login_id",
+    "action_scope",
+    "action_type",
+    "action",
+    "menu_code",
+    "request_path",
+    "object_type",
+    "object_id",
+    "object_name",
+    "resource_id",
+    "permission_result",
+    "success",
+    "ip_address",
+    "user_agent",
+    "details",
+    "error_message",
+    "created_at",
+)
+
 # 한국어 레이블 매핑
 def _normalize_key(value: Any) -> Optional[str]:
     if value is None:
@@ -130,6 +157,164 @@ def _coerce_details(details: Any) -> Optional[str]:
         return str(details)
 
 
+def _insert_audit_rows(rows: List[Tuple[Any, ...]]) -> None:
+    """감사 로그 여러 건을 multi-row INSERT 한 번으로 적재한다."""
+    if not rows:
+        return
+    row_placeholder = "(" + ", ".join(["%s"] * len(_AUDIT_COLUMNS)) + ")"
+    params: List[Any] = []
+    for row in rows:
+        params.extend(row)
+    with _db_cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO access_audit_log ({', '.join(_AUDIT_COLUMNS)}) VALUES "
+            + ", ".join([row_placeholder] * len(rows)),
+            params,
+        )
+
+
+class AuditLogWriter:
+    """감사 로그 비동기 배치 적재기.
+
+    요청 스레드는 bounded 큐에 행만 넣고, 백그라운드 스레드가 batch_size 건 또는
+    flush_interval_ms 마다 모아서 INSERT 한다. 큐가 가득 차면 enqueue_timeout_ms 만큼
+    기다린 뒤 버리고 dropped 카운터를 올린다 (DB 가 느려도 응답이 막히지 않는다).
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval_ms: int = 1000,
+        enqueue_timeout_ms: int = 5,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(10, flush_interval_ms) / 1000.0
+        self.enqueue_timeout = max(0, enqueue_timeout_ms) / 1000.0
+        self._queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._stopping = threading.Event()
+        self._stats = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+    def submit(self, row: Tuple[Any, ...]) -> bool:
+        self._ensure_started()
+        try:
+            if self.enqueue_timeout:
+                self._queue.put(row, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+                dropped = self._stats["dropped"]
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("Audit log queue full; dropped %s rows so far", dropped)
+            return False
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def _ensure_started(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None:
+                return
+            # fork 된 워커는 부모의 스레드를 물려받지 못하므로 새로 시작한다.
+            if self._pid is not None and self._pid != pid:
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._pid = pid
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+
+    def _drain(self, first: Optional[Tuple[Any, ...]] = None) -> List[Tuple[Any, ...]]:
+        batch = [first] if first is not None else []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stopping.is_set():
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Tuple[Any, ...]]) -> None:
+        if not batch:
+            return
+        try:
+            _insert_audit_rows(batch)
+        except Exception as exc:
+            with self._lock:
+                self._stats["failed"] += len(batch)
+            logger.warning("Failed to write %s audit log rows: %s", len(batch), exc)
+            return
+        with self._lock:
+            self._stats["written"] += len(batch)
+            self._stats["batches"] += 1
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            self._write(self._drain(first))
+        self._flush_remaining()
+
+    def _flush_remaining(self) -> None:
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """남은 행을 적재하고 스레드를 멈춘다 (프로세스 종료 시 호출)."""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid():
+            return
+        self._stopping.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Audit log writer did not stop in %.1fs; %s rows left", timeout, self._queue.qsize())
+        self._thread = None
+
+
+def _build_audit_writer() -> Optional[AuditLogWriter]:
+    config = get_config()
+    if not config.getboolean('AUDIT', 'async_enabled', fallback=True):
+        return None
+    return AuditLogWriter(
+        queue_size=config.getint('AUDIT', 'queue_size', fallback=10000),
+        batch_size=config.getint('AUDIT', 'batch_size', fallback=200),
+        flush_interval_ms=config.getint('AUDIT', 'flush_interval_ms', fallback=1000),
+        enqueue_timeout_ms=config.getint('AUDIT', 'enqueue_timeout_ms', fallback=5),
+    )
+
+
+audit_writer = _build_audit_writer()
+if audit_writer is not None:
+    atexit.register(audit_writer.shutdown)
+
+
 def record_audit_log(
     action_scope: str,
     action_type: str,
@@ -175,49 +360,31 @@ def record_audit_log(
 
         details_payload = _coerce_details(details)
 
-        with _db_cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO access_audit_log (
-                    emp_id,
-                    login_id,
-                    action_scope,
-                    action_type,
-                    action,
-                    menu_code,
-                    request_path,
-                    object_type,
-                    object_id,
-                    object_name,
-                    resource_id,
-                    permission_result,
-                    success,
-                    ip_address,
-                    user_agent,
-                    details,
-                    error_message
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                (
-                    emp_id,
-                    login_id,
-                    scope_value,
-                    action_label,
-                    action_display,
-                    menu_code,
-                    path,
-                    _localized(_ACTION_LABELS, object_type) if object_type else object_type,
-                    object_id,
-                    object_name,
-                    res_id,
-                    result_value,
-                    success,
-                    ip_address,
-                    user_agent,
-                    details_payload,
-                    error_message,
-                ),
-            )
+        row = (
+            emp_id,
+            login_id,
+            scope_value,
+            action_label,
+            action_display,
+            menu_code,
+            path,
+            _localized(_ACTION_LABELS, object_type) if object_type else object_type,
+            object_id,
+            object_name,
+            res_id,
+            result_value,
+            success,
+            ip_address,
+            user_agent,
+            details_payload,
+            error_message,
+            # 비동기 적재 지연과 무관하게 발생 시각을 남긴다.
+            datetime.now(timezone.utc),
+        )
+        if audit_writer is not None:
+            audit_writer.submit(row)
+        else:
+            _insert_audit_rows([row])
     except Exception as exc:
         logger.warning("Failed to record audit log: %s", exc)
 
@@ -0,0 +1,317 @@
+"""
+access_audit_log 월 단위 파티션 관리
+access_audit_log 를 created_at 기준 RANGE 파티션(월 1개)으로 운영한다.
+
+- convert_to_partitioned(): 기존 일반 테이블을 파티션 테이블로 1회 전환
+  (scripts/manage_audit_partitions.py --convert)
+- ensure_audit_partitions(): 앞으로 쓸 월 파티션을 미리 만들고 보존 기간이 지난
+  파티션을 분리(detach) 또는 삭제(drop)한다. app.py 백그라운드 스케줄러가 주기적으로 호출한다.
+
+DEFAULT 파티션은 두지 않는다. 미리 만들어 둔 범위를 벗어나는 로그는 INSERT 가 실패하므로
+[AUDIT] partition_months_ahead 를 점검 주기보다 넉넉하게 잡아야 한다.
+"""
+import logging
+from datetime import date, datetime
+
+from db_connection import get_config, get_db_connection
+
+logger = logging.getLogger(__name__)
+
+AUDIT_TABLE = 'access_audit_log'
+LEGACY_TABLE = f'{AUDIT_TABLE}_legacy'
+PARTITION_PREFIX = f'{AUDIT_TABLE}_p'
+
+# 여러 워커가 동시에 같은 파티션을 만들지 않도록 트랜잭션 단위 advisory lock 사용
+_MAINTENANCE_LOCK_SQL = "SELECT pg_try_advisory_xact_lock(hashtext('access_audit_log_partitions'))"
+
+_PARENT_DDL = f"""
+    CREATE TABLE {AUDIT_TABLE} (
+        id BIGINT NOT NULL DEFAULT nextval('{AUDIT_TABLE}_id_seq'),
+        emp_id VARCHAR(100),
+        login_id VARCHAR(100),
+        action_scope VARCHAR(50),
+        action_type VARCHAR(50),
+        action VARCHAR(50),
+        menu_code VARCHAR(50),
+        request_path TEXT,
+        object_type VARCHAR(50),
+        object_id VARCHAR(100),
+        object_name VARCHAR(255),
+        resource_id VARCHAR(100),
+        permission_result VARCHAR(50),
+        success BOOLEAN DEFAULT TRUE,
+        ip_address VARCHAR(45),
+        user_agent TEXT,
+        details JSONB,
+        error_message TEXT,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+"""
+
+# (인덱스명, 컬럼) - 부모에 만들면 모든 파티션에 자동 생성된다.
+_PARENT_INDEXES = (
+    ('idx_audit_created', 'created_at DESC'),
+    ('idx_audit_uid_created', 'emp_id, created_at DESC'),
+    ('idx_audit_login_created', 'login_id, created_at DESC'),
+    ('idx_audit_scope_created', 'action_scope, created_at DESC'),
+    ('idx_audit_menu_created', 'menu_code, created_at DESC'),
+)
+
+
+def _month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def _add_months(value, months):
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _parse_partition_month(name):
+    suffix = name[len(PARTITION_PREFIX):]
+    try:
+        return datetime.strptime(suffix, '%Y%m').date()
+    except ValueError:
+        return None
+
+
+def is_partitioned(cursor):
+    """access_audit_log 가 파티션 테이블인지 확인"""
+    cursor.execute(
+        "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+        (AUDIT_TABLE,),
+    )
+    row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def _create_partition(cursor, month):
+    name = partition_name(month)
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {name}
+        PARTITION OF {AUDIT_TABLE}
+        FOR VALUES FROM (%s) TO (%s)
+        """,
+        (month, _add_months(month, 1)),
+    )
+    return name
+
+
+def _list_partitions(cursor):
+    cursor.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        ORDER BY c.relname
+        """,
+        (AUDIT_TABLE,),
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def create_partitioned_table(cursor, months_ahead=2):
+    """access_audit_log 가 없을 때 파티션 테이블로 새로 만든다 (신규 설치용)."""
+    cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {AUDIT_TABLE}_id_seq AS BIGINT")
+    cursor.execute(_PARENT_DDL)
+    cursor.execute(f"ALTER SEQUENCE {AUDIT_TABLE}_id_seq OWNED BY {AUDIT_TABLE}.id")
+    for index_name, columns in _PARENT_INDEXES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {AUDIT_TABLE} ({columns})")
+    current = _month_start(date.today())
+    for offset in range(0, max(0, months_ahead) + 1):
+        _create_partition(cursor, _add_months(current, offset))
+
+
+def convert_to_partitioned(conn, months_ahead=2):
+    """
+    기존 access_audit_log 를 월 파티션 테이블로 전환한다.
+    기존 테이블은 access_audit_log_legacy 로 이름만 바꿔 남겨 두므로 확인 후 직접 삭제한다.
+    한 트랜잭션에서 복사하므로 전환이 끝날 때까지 감사 로그 INSERT 는 대기한다.
+
+    Returns:
+        int: 복사한 행 수 (이미 파티션 테이블이면 0)
+    """
+    cursor = conn.cursor()
+    try:
+        if is_partitioned(cursor):
+            logger.info("%s is already partitioned", AUDIT_TABLE)
+            return 0
+
+        cursor.execute(f"LOCK TABLE {AUDIT_TABLE} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"ALTER TABLE {AUDIT_TABLE} RENAME TO {LEGACY_TABLE}")
+        # 기존 PK/인덱스 이름과 겹치지 않도록 legacy 쪽 제약 이름을 비켜 둔다.
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+            (LEGACY_TABLE,),
+        )
+        row = cursor.fetchone()
+        if row:
+            cursor.execute(f"ALTER TABLE {LEGACY_TABLE} RENAME CONSTRAINT {row[0]} TO {LEGACY_TABLE}_pkey")
+        cursor.execute(
+            """
+            SELECT indexname FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = %s
+              AND indexname LIKE 'idx\\_audit\\_%%'
+            """,
+            (LEGACY_TABLE,),
+        )
+        for row in cursor.fetchall():
+            cursor.execute(f"ALTER INDEX {row[0]} RENAME TO {row[0]}_legacy")
+
+        # id 시퀀스는 그대로 이어 쓴다 (SERIAL -> BIGINT).
+        cursor.execute(f"ALTER TABLE {LEGACY_TABLE} ALTER COLUMN id DROP DEFAULT")
+        cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {AUDIT_TABLE}_id_seq AS BIGINT")
+        cursor.execute(f"ALTER SEQUENCE {AUDIT_TABLE}_id_seq AS BIGINT")
+        cursor.execute(_PARENT_DDL)
+        cursor.execute(f"ALTER SEQUENCE {AUDIT_TABLE}_id_seq OWNED BY {AUDIT_TABLE}.id")
+        for index_name, columns in _PARENT_INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {AUDIT_TABLE} ({columns})")
+
+        cursor.execute(
+            f"SELECT MIN(created_at), MAX(created_at) FROM {LEGACY_TABLE}"
+        )
+        row = cursor.fetchone()
+        oldest, newest = (row[0], row[1]) if row else (None, None)
+        current = _month_start(date.today())
+        first = _month_start(oldest) if oldest else current
+        last = max(_add_months(current, months_ahead), _month_start(newest) if newest else current)
+        month = first
+        while month <= last:
+            _create_partition(cursor, month)
+            month = _add_months(month, 1)
+
+        # 두 테이블에 모두 있는 컬럼만 복사 (오래된 테이블은 일부 컬럼이 없을 수 있음)
+        cursor.execute(
+            """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s
+              AND column_name IN (
+                  SELECT column_name FROM information_schema.columns
+                  WHERE table_schema = current_schema() AND table_name = %s
+              )
+            ORDER BY ordinal_position
+            """,
+            (AUDIT_TABLE, LEGACY_TABLE),
+        )
+        columns = [row[0] for row in cursor.fetchall()]
+        column_list = ', '.join(columns)
+        select_list = ', '.join(
+            'COALESCE(created_at, CURRENT_TIMESTAMP)' if col == 'created_at' else col
+            for col in columns
+        )
+        cursor.execute(
+            f"INSERT INTO {AUDIT_TABLE} ({column_list}) SELECT {select_list} FROM {LEGACY_TABLE}"
+        )
+        copied = cursor.rowcount or 0
+        cursor.execute(
+            f"SELECT setval('{AUDIT_TABLE}_id_seq', GREATEST((SELECT MAX(id) FROM {AUDIT_TABLE}), 1))"
+        )
+        cursor.execute(f"ANALYZE {AUDIT_TABLE}")
+        conn.commit()
+        logger.info("%s converted to monthly partitions: %s rows copied", AUDIT_TABLE, copied)
+        return copied
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def ensure_audit_partitions(conn, months_ahead=2, retention_months=24, retention_action='detach'):
+    """
+    이번 달부터 months_ahead 개월 뒤까지 파티션을 만들고,
+    retention_months 보다 오래된 파티션을 분리하거나 삭제한다.
+
+    Args:
+        retention_months: 0 이하이면 보존 정리를 하지 않는다.
+        retention_action: 'detach' (독립 테이블로 남김) 또는 'drop'
+
+    Returns:
+        dict: created / detached / dropped 파티션 이름 목록
+    """
+    result = {'created': [], 'detached': [], 'dropped': []}
+    cursor = conn.cursor()
+    try:
+        if not is_partitioned(cursor):
+            return result
+
+        cursor.execute(_MAINTENANCE_LOCK_SQL)
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            # 다른 워커가 점검 중
+            conn.rollback()
+            return result
+
+        existing = set(_list_partitions(cursor))
+        current = _month_start(date.today())
+        for offset in range(0, max(0, months_ahead) + 1):
+            month = _add_months(current, offset)
+            if partition_name(month) not in existing:
+                result['created'].append(_create_partition(cursor, month))
+
+        if retention_months > 0:
+            cutoff = _add_months(current, -retention_months)
+            for name in sorted(existing):
+                month = _parse_partition_month(name)
+                if month is None or month >= cutoff:
+                    continue
+                if retention_action == 'drop':
+                    cursor.execute(f"DROP TABLE {name}")
+                    result['dropped'].append(name)
+                else:
+                    cursor.execute(f"ALTER TABLE {AUDIT_TABLE} DETACH PARTITION {name}")
+                    result['detached'].append(name)
+
+        conn.commit()
+        if any(result.values()):
+            logger.info("audit partitions maintained: %s", result)
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def get_partition_settings():
+    """config.ini [AUDIT] 파티션 설정"""
+    config = get_config()
+    enabled = config.getboolean('AUDIT', 'partition_enabled', fallback=True)
+    months_ahead = config.getint('AUDIT', 'partition_months_ahead', fallback=2)
+    retention_months = config.getint('AUDIT', 'partition_retention_months', fallback=24)
+    retention_action = config.get('AUDIT', 'partition_retention_action', fallback='detach').strip().lower()
+    check_hours = config.getint('AUDIT', 'partition_check_hours', fallback=6)
+    if retention_action not in ('detach', 'drop'):
+        retention_action = 'detach'
+    return {
+        'enabled': enabled,
+        'months_ahead': max(1, months_ahead),
+        'retention_months': retention_months,
+        'retention_action': retention_action,
+        'check_hours': max(1, check_hours),
+    }
+
+
+def maintain_audit_partitions():
+    """설정값으로 ensure_audit_partitions 를 한 번 실행한다."""
+    settings = get_partition_settings()
+    if not settings['enabled']:
+        return None
+    conn = get_db_connection()
+    try:
+        return ensure_audit_partitions(
+            conn,
+            months_ahead=settings['months_ahead'],
+            retention_months=settings['retention_months'],
+            retention_action=settings['retention_action'],
+        )
+    finally:
+        conn.close()
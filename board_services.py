@@ -7,7 +7,9 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from code_catalog import bump_code_version, get_codes
 from db_connection import get_db_connection
+from db.schema import cached_column_names, cached_index_exists, invalidate_schema_cache, refresh_schema_cache
 from db.upsert import safe_upsert
 from list_schema_utils import resolve_child_schema, dump_child_schema
 from upload_utils import sanitize_filename, validate_uploaded_files
@@ -113,13 +115,8 @@ class ColumnService:
             values.append(None)
 
         # table_name과 table_type이 테이블에 있는지 확인
-        # PostgreSQL: information_schema를 통해 컬럼 정보 조회
-        cursor.execute("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_name = %s
-        """, (self.config['column_table'],))
-        existing_columns = [row[0] for row in cursor.fetchall()]
+        # 스키마 캐시로 컬럼 정보 조회
+        existing_columns = cached_column_names(self.config['column_table'], self.db_path)
 
         child_schema_json = dump_child_schema(data.get('child_schema'))
         if 'child_schema' in existing_columns:
@@ -271,27 +268,8 @@ class CodeService:
         self.db_path = db_path
     
     def list(self, column_key: str) -> List[Dict]:
-        """드롭다운 코드 목록 조회"""
-        conn = get_db_connection(self.db_path)
-        
-        # v2 테이블 우선 조회
-        codes = conn.execute("""
-            SELECT * FROM dropdown_option_codes_v2
-            WHERE board_type = %s AND column_key = %s AND is_active = 1
-            ORDER BY display_order
-        """, (self.board_type, column_key)).fetchall()
-        
-        # v2에 없으면 레거시 테이블 조회 (임시 호환)
-        if not codes:
-            codes = conn.execute("""
-                SELECT * FROM dropdown_option_codes
-                WHERE column_key = %s AND is_active = 1
-                ORDER BY display_order
-            """, (column_key,)).fetchall()
-        
-        conn.close()
-        
-        return [dict(code) for code in codes]
+        """드롭다운 코드 목록 조회 (v2 우선, 없으면 레거시 테이블 - 보드 단위 카탈로그 캐시 사용)"""
+        return get_codes(self.board_type, column_key, self.db_path)
     
     def save(self, column_key: str, codes: List[Dict]) -> bool:
         """드롭다운 코드 일괄 저장"""
@@ -335,6 +313,7 @@ class CodeService:
         
         conn.commit()
         conn.close()
+        bump_code_version(self.board_type, self.db_path)
         return True
     
     def delete(self, code_id: int) -> bool:
@@ -346,10 +325,13 @@ class CodeService:
             UPDATE dropdown_option_codes_v2
             SET is_active = 0
             WHERE id = %s
+            RETURNING board_type
         """, (code_id,))
+        row = cursor.fetchone()
         
         conn.commit()
         conn.close()
+        bump_code_version(row[0] if row else self.board_type, self.db_path)
         return True
 
 
@@ -568,8 +550,29 @@ class AttachmentService:
         # 테이블 생성 (없으면)
         self._ensure_table_exists()
     
-    def _ensure_table_exists(self):
-        """첨부파일 테이블 생성 (없으면)"""
+    # 예전 스키마의 첨부파일 테이블에 없을 수 있는 컬럼 (컬럼명, 추가 정의)
+    _COMPAT_COLUMNS = (
+        ('is_deleted', 'is_deleted INTEGER DEFAULT 0'),  # list()에서 동적 WHERE 처리로 회피 가능
+        ('uploaded_at', 'uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),  # 없으면 list()가 id로 정렬
+        ('mime_type', 'mime_type TEXT'),
+        ('uploaded_by', "uploaded_by TEXT DEFAULT 'system'"),
+    )
+
+    def _ensure_table_exists(self, force: bool = False):
+        """
+        첨부파일 테이블 생성/보강 (없으면)
+        스키마 캐시상 테이블, 보강 컬럼, 인덱스가 모두 있으면 DB 작업 없이 돌아간다.
+        force=True 는 캐시를 버리고 다시 확인한다 (스키마 불일치로 INSERT 가 실패했을 때).
+        """
+        index_name = f"idx_{self.attachment_table}_{self.id_column}"
+        if force:
+            invalidate_schema_cache()
+        else:
+            existing = set(cached_column_names(self.attachment_table, self.db_path))
+            required = {self.id_column, *(col for col, _ in self._COMPAT_COLUMNS)}
+            if required <= existing and cached_index_exists(index_name, db_path=self.db_path):
+                return
+
         # 기존 연결이 있으면 재사용, 없으면 새로 생성
         if self.conn:
             conn = self.conn
@@ -599,49 +602,20 @@ class AttachmentService:
             """
         )
 
-        # 호환성: 기존 테이블에 is_deleted 컬럼이 없을 수도 있으므로 보강
-        def _col_exists(table: str, col: str) -> bool:
-            cursor.execute(
-                "SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
-                (table.lower(), col.lower())
-            )
-            return cursor.fetchone() is not None
-
-        try:
-            if not _col_exists(self.attachment_table, 'is_deleted'):
-                cursor.execute(f"ALTER TABLE {self.attachment_table} ADD COLUMN is_deleted INTEGER DEFAULT 0")
-        except Exception:
-            # 이미 추가되어 있거나 권한 문제 등은 무시 (list()에서 동적 WHERE 처리로 회피)
-            pass
-
-        # uploaded_at 누락 테이블 보강 (정렬 안정성)
-        try:
-            if not _col_exists(self.attachment_table, 'uploaded_at'):
-                cursor.execute(
-                    f"ALTER TABLE {self.attachment_table} ADD COLUMN uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
-                )
-        except Exception:
-            # 이미 존재하거나 권한 이슈는 무시 (list()에서 id로 정렬 폴백)
-            pass
-
-        # 구 스키마 호환: mime_type, uploaded_by 컬럼 보강
-        try:
-            if not _col_exists(self.attachment_table, 'mime_type'):
-                cursor.execute(f"ALTER TABLE {self.attachment_table} ADD COLUMN mime_type TEXT")
-        except Exception:
-            pass
-
-        try:
-            if not _col_exists(self.attachment_table, 'uploaded_by'):
-                cursor.execute(
-                    f"ALTER TABLE {self.attachment_table} ADD COLUMN uploaded_by TEXT DEFAULT 'system'"
-                )
-        except Exception:
-            pass
+        # 호환성: 기존 테이블에 없는 컬럼 보강 (방금 만든 테이블이면 IF NOT EXISTS 로 통과)
+        existing = set(cached_column_names(self.attachment_table, self.db_path))
+        for col, definition in self._COMPAT_COLUMNS:
+            if col in existing:
+                continue
+            try:
+                cursor.execute(f"ALTER TABLE {self.attachment_table} ADD COLUMN IF NOT EXISTS {definition}")
+            except Exception:
+                # 권한 문제 등은 무시
+                pass
 
         # 인덱스 추가 (중앙화된 id_column 사용)
         cursor.execute(f"""
-            CREATE INDEX IF NOT EXISTS idx_{self.attachment_table}_{self.id_column}
+            CREATE INDEX IF NOT EXISTS {index_name}
             ON {self.attachment_table}({self.id_column})
         """)
         
@@ -651,6 +625,7 @@ class AttachmentService:
             conn.close()
         else:
             conn.commit()  # 커밋은 하지만 연결은 닫지 않음
+        refresh_schema_cache(self.db_path)
     
     def list(self, item_id: str) -> List[Dict]:
         """
@@ -672,20 +647,15 @@ class AttachmentService:
         
         cursor = conn.cursor()
         
-        # 컬럼 존재 여부 체크
-        def _has_col(col: str) -> bool:
-            try:
-                cursor.execute(
-                    "SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
-                    (self.attachment_table.lower(), col.lower())
-                )
-                return cursor.fetchone() is not None
-            except Exception:
-                return False
+        # 컬럼 존재 여부 체크 (스키마 캐시)
+        try:
+            columns = set(cached_column_names(self.attachment_table.lower(), self.db_path))
+        except Exception:
+            columns = set()
 
         # PostgreSQL native query
-        where_deleted = " AND is_deleted = 0" if _has_col('is_deleted') else ""
-        order_col = 'uploaded_at' if _has_col('uploaded_at') else 'id'
+        where_deleted = " AND is_deleted = 0" if 'is_deleted' in columns else ""
+        order_col = 'uploaded_at' if 'uploaded_at' in columns else 'id'
 
         query = f"SELECT * FROM {self.attachment_table} WHERE {self.id_column} = %s{where_deleted} ORDER BY {order_col} DESC"
         cursor.execute(query, (item_id,))
@@ -785,7 +755,7 @@ class AttachmentService:
             message = str(exc).lower()
             if any(keyword in message for keyword in ('mime_type', 'uploaded_by', 'uploaded_at', 'is_deleted')):
                 logging.warning("[%s] attachment insert failed due to schema mismatch. Re-applying ensure step.", self.board_type)
-                self._ensure_table_exists()
+                self._ensure_table_exists(force=True)
                 cursor = conn.cursor()
                 cursor.execute(sql, params)
             else:
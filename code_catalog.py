@@ -0,0 +1,151 @@
+"""
+드롭다운 코드 카탈로그 캐시
+목록/상세 화면은 드롭다운 컬럼마다 dropdown_option_codes_v2 를 새 연결로 조회했다.
+여기서는 보드 하나의 활성 코드 전체를 한 번의 쿼리로 읽어 워커 프로세스 메모리에 두고,
+보드별 버전 번호(db.versioned_cache, scope 'dropdown_codes')가 바뀔 때만 다시 읽는다.
+
+- 코드를 바꾸는 쪽(CodeService.save/delete, 변경요청 코드 API, 컬럼 JSON 동기화)은
+  커밋한 뒤 bump_code_version() 으로 버전을 올린다. 다른 워커는 버전 확인 주기
+  ([DATABASE] metadata_version_check_seconds) 안에 바뀐 버전을 보고 다시 읽는다.
+- 버전 확인은 요청마다 보드별 최대 1회, 프로세스별로 확인 주기마다 1회다. 화면 하나가
+  드롭다운을 몇 개 그리든 컬럼별 코드 조회는 없다.
+- v2 에 코드가 없는 컬럼은 레거시 dropdown_option_codes 를 본다 (CodeService.list 호환).
+- code_labels() 는 코드→라벨 매핑을 카탈로그 버전별로 한 번만 만든다 (common_mapping 에서 사용).
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from db_connection import get_db_connection
+from db.versioned_cache import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BoardCodes:
+    codes: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    legacy: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    labels: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+_CODES = VersionedCache('dropdown_codes')
+
+
+def _group_by_column(rows) -> Dict[str, List[Dict[str, Any]]]:
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        item = dict(row)
+        grouped.setdefault(item.get('column_key'), []).append(item)
+    return grouped
+
+
+def _load_board_codes(board_type, db_path=None) -> _BoardCodes:
+    conn = get_db_connection(db_path)
+    try:
+        rows = conn.execute(
+            """
+            SELECT * FROM dropdown_option_codes_v2
+            WHERE board_type = %s AND COALESCE(is_active, 1) = 1
+            ORDER BY column_key, display_order, id
+            """,
+            (board_type,),
+        ).fetchall()
+        catalog = _BoardCodes(_group_by_column(rows))
+
+        # 레거시 테이블은 보드 구분이 없고, 없는 환경도 있다
+        try:
+            legacy_rows = conn.execute(
+                """
+                SELECT * FROM dropdown_option_codes
+                WHERE is_active = 1
+                ORDER BY column_key, display_order
+                """
+            ).fetchall()
+            catalog.legacy = _group_by_column(legacy_rows)
+        except Exception as e:
+            conn.rollback()
+            logger.debug("레거시 드롭다운 코드 조회 생략: %s", e)
+    finally:
+        conn.close()
+
+    logger.debug("드롭다운 코드 적재: %s (%d개 컬럼)", board_type, len(catalog.codes))
+    return catalog
+
+
+def board_catalog(board_type, db_path=None) -> _BoardCodes:
+    """보드의 현재 버전 코드 카탈로그 (버전이 바뀌었을 때만 DB 에서 다시 읽는다)"""
+    return _CODES.get(board_type, 'catalog', lambda: _load_board_codes(board_type, db_path), db_path)
+
+
+def get_codes(board_type, column_key, db_path=None) -> List[Dict[str, Any]]:
+    """컬럼의 활성 코드 행 목록 (v2 우선, 없으면 레거시 테이블) - CodeService.list 와 같은 형태"""
+    catalog = board_catalog(board_type, db_path)
+    rows = catalog.codes.get(column_key) or catalog.legacy.get(column_key) or []
+    return [dict(row) for row in rows]
+
+
+def code_labels(board_type, db_path=None) -> Dict[str, Dict[str, Any]]:
+    """
+    컬럼별 {코드: 라벨} 매핑 (v2 우선, 없는 컬럼은 레거시 테이블)
+    카탈로그 버전마다 한 번만 만들어 같은 버전의 카탈로그에 붙여 둔다.
+    """
+    catalog = board_catalog(board_type, db_path)
+    labels = catalog.labels
+    if labels is None:
+        labels = {}
+        for source in (catalog.legacy, catalog.codes):
+            for column_key, rows in source.items():
+                labels[column_key] = {
+                    str(row.get('option_code')): row.get('option_value') for row in rows
+                }
+        catalog.labels = labels
+    return labels
+
+
+def get_dropdown_options(board_type, column_key, db_path=None) -> List[Dict[str, Any]]:
+    """화면 표시용 [{'code', 'value'}] 목록 (값 하나에 JSON 배열이 저장된 예전 형식도 펼친다)"""
+    if not board_type or not column_key:
+        return []
+
+    rows = board_catalog(board_type, db_path).codes.get(column_key) or []
+    if not rows:
+        return []
+
+    if len(rows) == 1:
+        value = rows[0].get('option_value')
+        if isinstance(value, str):
+            stripped = value.strip()
+            if stripped.startswith('[') and stripped.endswith(']'):
+                try:
+                    array = json.loads(stripped)
+                    if isinstance(array, list):
+                        return [
+                            {
+                                'code': f"{column_key.upper()}_{index + 1:03d}",
+                                'value': str(item),
+                            }
+                            for index, item in enumerate(array)
+                        ]
+                except Exception:
+                    logger.debug("드롭다운 배열 파싱 실패: %s.%s", board_type, column_key)
+
+    options = []
+    for row in rows:
+        code = row.get('option_code')
+        value = row.get('option_value')
+        if code is None and value is None:
+            continue
+        options.append({'code': code, 'value': value})
+    return options
+
+
+def bump_code_version(board_type, db_path=None) -> int:
+    """보드의 드롭다운 코드 버전을 올린다 (코드 변경을 커밋한 뒤에 부른다)"""
+    return _CODES.bump(board_type, db_path)
+
+
+def invalidate(board_type=None):
+    """이 프로세스에 캐시된 코드를 비운다 (board_type 없으면 전체)"""
+    _CODES.invalidate(board_type)
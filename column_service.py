@@ -7,7 +7,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from db_connection import get_db_connection
-from db.schema import column_exists
+from db.schema import cached_column_exists, refresh_schema_cache
+from layout_cache import cached_layout
 from list_schema_utils import (
     resolve_child_schema,
     dump_child_schema,
@@ -17,6 +18,9 @@ from list_schema_utils import (
 PROTECTED_KEYS = {"attachments", "detailed_content", "notes", "note", "created_at"}
 JSONB_ONLY_BOARDS = {"subcontract_report", "subcontract_approval"}
 
+# 이 프로세스에서 이미 생성/보강을 확인한 컬럼 설정 테이블
+_ensured_tables: set[str] = set()
+
 def _protected_for_board(board_type: str) -> set[str]:
     per_board = {
         'accident': {"accident_number"},
@@ -58,8 +62,10 @@ class ColumnConfigService:
         self.table_name = f"{board_type}_column_config"
         self.data_table = self._get_data_table_name()
         
-        # 테이블 생성 (없으면)
-        self._ensure_tables_exist()
+        # 테이블 생성 (없으면) - 프로세스당 테이블별 1회
+        if self.table_name not in _ensured_tables:
+            self._ensure_tables_exist()
+            _ensured_tables.add(self.table_name)
     
     
     def _get_data_table_name(self) -> str:
@@ -123,10 +129,12 @@ class ColumnConfigService:
         # 데이터 테이블 체크는 스킵 - 컬럼 설정에는 불필요
         # IQADB 테이블은 존재하지 않을 수 있음
         
-        # 누락 컬럼 보강 (PostgreSQL/SQLite 공용)
+        # 누락 컬럼 보강 (스키마 캐시 기준, 방금 만든 테이블이면 IF NOT EXISTS 로 통과)
+        added = []
+
         def _has_column_pg(table: str, col: str) -> bool:
             try:
-                return column_exists(conn, table, col)
+                return cached_column_exists(table, col, self.db_path)
             except Exception:
                 return False
 
@@ -135,7 +143,8 @@ class ColumnConfigService:
 
         def add_column(col: str, ddl: str):
             try:
-                cursor.execute(f"ALTER TABLE {self.table_name} ADD COLUMN {col} {ddl}")
+                cursor.execute(f"ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS {col} {ddl}")
+                added.append(col)
             except Exception:
                 # 이미 존재하거나 권한 문제 등은 조용히 무시 (다음 단계로 진행)
                 pass
@@ -172,10 +181,12 @@ class ColumnConfigService:
 
         conn.commit()
         conn.close()
+        if added:
+            refresh_schema_cache(self.db_path)
     
     def list_columns(self, active_only: bool = False) -> List[Dict[str, Any]]:
         """
-        컬럼 목록 조회
+        컬럼 목록 조회 (보드 레이아웃 캐시 사용)
         
         Args:
             active_only: True면 활성 컬럼만 조회
@@ -183,6 +194,15 @@ class ColumnConfigService:
         Returns:
             컬럼 설정 리스트
         """
+        return cached_layout(
+            self.board_type,
+            f"config_columns:{int(bool(active_only))}",
+            lambda: self._load_columns(active_only),
+            self.db_path,
+        )
+
+    def _load_columns(self, active_only: bool) -> List[Dict[str, Any]]:
+        """컬럼 설정 조회 + dropdown_options/child_schema 파싱 (list_columns 캐시 적재용)"""
         conn = get_db_connection(self.db_path)
         
         # 쿼리 구성 - is_deleted 컬럼이 이제 모든 테이블에 존재
@@ -336,6 +356,7 @@ class ColumnConfigService:
         conn = get_db_connection(self.db_path)
         cursor = conn.cursor()
         
+        data_column_added = False
         try:
             # 트랜잭션 시작
             # 보호 컬럼 키 방지
@@ -536,6 +557,7 @@ class ColumnConfigService:
     
                     alter_sql = f"ALTER TABLE {self.data_table} ADD COLUMN {column_key} {ddl_type}"
                     cursor.execute(alter_sql)
+                    data_column_added = True
                     logging.info(f"데이터 테이블 컬럼 추가: {self.data_table}.{column_key}")
     
                 except Exception as alter_error:
@@ -555,6 +577,8 @@ class ColumnConfigService:
         finally:
             conn.close()
 
+        if data_column_added:
+            refresh_schema_cache(self.db_path)
         logging.info(f"컬럼 추가됨: {column_key} ({column_data['column_name']})")
 
         return {
@@ -7,6 +7,8 @@ import os
 import logging
 from typing import Dict, List, Any
 from datetime import datetime
+from code_catalog import bump_code_version
+from layout_cache import bump_layout_version
 from db_connection import get_db_connection
 from db.upsert import safe_upsert
 from utils.sql_filters import sql_is_active_true
@@ -115,6 +117,8 @@ class ColumnSyncService:
         
         conn.commit()
         conn.close()
+        bump_layout_version(board_type, self.db_path)
+        bump_code_version(board_type, self.db_path)
         
         logging.info(f"{board_type} 보드: {count}개 컬럼 동기화 완료")
         return count
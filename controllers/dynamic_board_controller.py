@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import math
-from typing import Any, Dict, Iterable, Mapping
+from typing import Any, Dict, Iterable, Mapping, Optional
 
 from flask import jsonify, render_template
 
@@ -41,7 +41,14 @@ class DynamicBoardController(BoardController):
 
         display_columns = self._build_display_columns(dynamic_columns)
 
-        total_count, raw_items = self.repository.fetch_list(filters, (page, per_page))
+        # ?cursor= 가 있으면 COUNT 없이 keyset 방식으로 이전/다음 페이지를 찾는다.
+        cursor_token = request.args.get("cursor")
+        keyset = None
+        if cursor_token is not None and hasattr(self.repository, "fetch_list_keyset"):
+            keyset = self.repository.fetch_list_keyset(filters, per_page, cursor_token)
+            total_count, raw_items = None, keyset["items"]
+        else:
+            total_count, raw_items = self.repository.fetch_list(filters, (page, per_page))
         items = self._hydrate_items(
             raw_items,
             display_columns,
@@ -58,7 +65,10 @@ class DynamicBoardController(BoardController):
                 self.repository.db_path,
             )
 
-        pagination = self._build_pagination(page, per_page, total_count)
+        if keyset is not None:
+            pagination = self._build_keyset_pagination(per_page, keyset)
+        else:
+            pagination = self._build_pagination(page, per_page, total_count)
 
         template_args = {
             self.config.list_context_key: items,
@@ -250,7 +260,7 @@ class DynamicBoardController(BoardController):
         self,
         raw_items: Iterable[Mapping[str, Any]],
         display_columns: Iterable[Mapping[str, Any]],
-        total_count: int,
+        total_count: Optional[int],
         page: int,
         per_page: int,
     ) -> list[Dict[str, Any]]:
@@ -267,7 +277,8 @@ class DynamicBoardController(BoardController):
                 if column_key and column_key in item:
                     item[column_key] = self._clean_placeholder_values(item[column_key])
 
-            item["no"] = total_count - offset - idx
+            # keyset 모드는 전체 건수를 모르므로 번호를 비운다.
+            item["no"] = total_count - offset - idx if total_count is not None else ""
             items.append(item)
 
         return items
@@ -314,3 +325,19 @@ class DynamicBoardController(BoardController):
                 }
 
         return Pagination(page, per_page, total_count)
+
+    def _build_keyset_pagination(self, per_page: int, keyset: Mapping[str, Any]):
+        class KeysetPagination:
+            keyset = True
+            page = 1
+            pages = 1
+
+            def __init__(self, per_page: int, keyset: Mapping[str, Any]) -> None:
+                self.per_page = per_page
+                self.total_count = None
+                self.has_prev = keyset.get("has_prev", False)
+                self.has_next = keyset.get("has_next", False)
+                self.prev_cursor = keyset.get("prev_cursor")
+                self.next_cursor = keyset.get("next_cursor")
+
+        return KeysetPagination(per_page, keyset)
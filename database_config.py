@@ -8,9 +8,15 @@ from datetime import datetime, timedelta, date
 from decimal import Decimal
 import numpy as np
 import json
-import re
+import itertools
+import uuid
 from db_connection import get_db_connection, get_postgres_dsn
+from db.counting import count_rows, reconcile_total
 from db.upsert import safe_upsert
+from db.bulk_load import StagingTable, bulk_merge, copy_rows
+from db.table_swap import ShadowTable
+from sync_orchestrator import report_sync_rows
+from id_generator import allocate_numbers_for_dates, register_explicit_ids
 
 # 설정 파일 로드
 config = configparser.ConfigParser()
@@ -49,6 +55,9 @@ _COMMON_DATE_FORMATS = [
     '%Y-%m-%d %H:%M',
 ]
 
+# FollowSOP/FullProcess created_at 후보 컬럼 파싱 순서
+_CREATED_AT_FORMATS = _COMMON_DATE_FORMATS[:6]
+
 def _to_sqlite_safe(v):
     """SQLite에 안전하게 저장하기 위한 타입 변환"""
     if pd.isna(v):
@@ -99,19 +108,6 @@ def _sanitize_external_value(value):
     return value
 
 
-def _clean_row_dict(row):
-    """DataFrame row → dict 변환 시 값 정리"""
-    if hasattr(row, 'to_dict'):
-        raw = row.to_dict()
-    else:
-        raw = dict(row)
-
-    cleaned = {}
-    for key, value in raw.items():
-        cleaned[key] = _sanitize_external_value(value)
-    return cleaned
-
-
 def _safe_int(value):
     if value in (None, ''):
         return 0
@@ -140,6 +136,152 @@ def _safe_float(value):
         return None
 
 
+_NULL_SENTINELS = ('none', 'null', 'nan', 'undefined')
+
+
+def _map_object_series(series, func):
+    """값 단위 변환 (Series.map 과 달리 결과 dtype 을 추론하지 않고 object 로 유지)"""
+    return pd.Series([func(v) for v in series], index=series.index, dtype=object)
+
+
+def _datetime_series_to_text(series):
+    """datetime64 컬럼을 str(Timestamp) 와 같은 문자열로 변환 (결측은 None)"""
+    present = series.notna()
+    if getattr(series.dt, 'tz', None) is not None:
+        text = _map_object_series(series, str)
+    else:
+        text = series.dt.strftime('%Y-%m-%d %H:%M:%S').astype(object)
+        # 소수점 초가 있는 값만 str() 형식(.ffffff)으로 보정
+        fractional = present & ((series.dt.microsecond != 0) | (series.dt.nanosecond != 0))
+        if fractional.any():
+            text[fractional] = _map_object_series(series[fractional], str)
+    return text.astype(object).where(present, None)
+
+
+def _sanitize_external_series(series):
+    """_sanitize_external_value 를 컬럼 단위로 적용 (object dtype, 결측은 None)"""
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype(object)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return _datetime_series_to_text(series)
+    if pd.api.types.is_timedelta64_dtype(series):
+        return _map_object_series(series, str).where(series.notna(), None)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(object).where(series.notna(), None)
+
+    values = series.astype(object)
+    missing = values.isna()
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        # 문자열이 하나도 없는 컬럼(Decimal 등)은 값 단위로 처리
+        return _map_object_series(values, _sanitize_external_value).where(~missing, None)
+
+    is_text = stripped.notna()
+    result = values.where(~is_text, stripped)
+    result = result.where(~(is_text & stripped.str.lower().isin(_NULL_SENTINELS)), None)
+    result = result.where(~missing, None)
+
+    # 문자열/결측 이외의 값(Decimal, datetime, numpy 스칼라)만 값 단위로 정리
+    others = ~is_text & ~missing
+    if others.any():
+        result[others] = _map_object_series(values[others], _sanitize_external_value)
+    return result
+
+
+def _sanitize_external_frame(df):
+    """DataFrame 전체를 _sanitize_external_value 기준으로 컬럼 단위 정규화"""
+    if df.shape[1] == 0:
+        return df.copy()
+    frame = pd.concat(
+        [_sanitize_external_series(df.iloc[:, pos]) for pos in range(df.shape[1])],
+        axis=1,
+    )
+    frame.columns = df.columns
+    return frame
+
+
+def _frame_records(frame):
+    """object 컬럼 DataFrame → dict 레코드 목록
+
+    to_dict('records') 는 셀마다 numpy 박싱 검사를 하므로, 이미 정리된 컬럼은
+    tolist() 로 꺼내 zip 하는 편이 훨씬 빠르다.
+    """
+    columns = list(frame.columns)
+    values = [frame.iloc[:, pos].tolist() for pos in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _external_records(df):
+    """정규화된 DataFrame 을 dict 레코드 목록으로 한 번에 변환"""
+    if df.empty:
+        return []
+    return _frame_records(_sanitize_external_frame(df))
+
+
+def _coerce_numeric_series(series, integer=False):
+    """숫자 컬럼 일괄 변환 (쉼표/단위 문자 제거, 실패 값은 None)
+
+    integer=True 이면 정수부만 취하고 숫자/'-' 이외 문자를 모두 제거한다.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        numeric = series.astype('float64')
+    elif pd.api.types.is_numeric_dtype(series):
+        numeric = series.astype('float64')
+    else:
+        values = series.astype(object)
+        try:
+            stripped = values.str.strip()
+        except AttributeError:
+            stripped = pd.Series(np.nan, index=values.index, dtype=object)
+        is_text = stripped.notna()
+        numeric = pd.to_numeric(values.where(~is_text), errors='coerce').astype('float64')
+        if is_text.any():
+            text = stripped[is_text]
+            if integer:
+                text = text.str.replace(r'[^0-9-]', '', regex=True)
+            else:
+                text = text.str.replace(',', '', regex=False).str.replace(r'[^0-9+\-\.eE]', '', regex=True)
+            numeric[is_text] = pd.to_numeric(text, errors='coerce').astype('float64')
+
+    if integer:
+        numeric = numeric.where(np.isfinite(numeric))
+        return np.trunc(numeric).astype('Int64').astype(object).where(numeric.notna(), None)
+    return numeric.astype(object).where(numeric.notna(), None)
+
+
+def _first_non_empty_series(df, keys):
+    """행마다 키 순서대로 처음 나오는 truthy 값 (컬럼 단위)"""
+    result = pd.Series([None] * len(df), index=df.index, dtype=object)
+    for key in keys:
+        if key not in df.columns:
+            continue
+        pending = ~(result.notna() & result.astype(bool))
+        if not pending.any():
+            break
+        result = result.where(~pending, df[key])
+    return result.where(result.notna() & result.astype(bool), None)
+
+
+def _parse_datetime_series(series, formats=None):
+    """문자열 날짜 컬럼을 포맷 목록 순서대로 일괄 파싱 (실패는 NaT)"""
+    formats = formats or _COMMON_DATE_FORMATS
+    parsed = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+    present = series.notna()
+    if not present.any():
+        return parsed
+    text = series[present].astype(str).str.split('.').str[0]
+    remaining = text.index
+    for fmt in formats:
+        if remaining.empty:
+            break
+        attempt = pd.to_datetime(text[remaining], format=fmt, errors='coerce')
+        ok = attempt.notna()
+        parsed[attempt.index[ok]] = attempt[ok]
+        remaining = attempt.index[~ok]
+    return parsed
+
+
 SYSTEM_SECTIONS = {
     'DEFAULT', 'DATABASE', 'SECURITY', 'LOGGING', 'DASHBOARD',
     'SQL_QUERIES', 'COLUMNS', 'MASTER_DATA_QUERIES', 'LOCAL_DATA_QUERIES',
@@ -215,9 +357,9 @@ def _apply_scoring_mappings(row_dict: dict) -> dict:
     return row_dict
 
 
-def _prepare_row_custom_data(row) -> dict:
-    cleaned = _clean_row_dict(row)
-    return _apply_scoring_mappings(cleaned)
+def _prepare_record_custom_data(record: dict) -> dict:
+    """_external_records 로 이미 정리된 레코드용 (값 정리 생략)"""
+    return _apply_scoring_mappings(dict(record))
 
 
 def _row_get(row_dict: dict, key: str):
@@ -232,38 +374,15 @@ def _row_get(row_dict: dict, key: str):
     return None
 
 
-def _first_non_empty(row_dict: dict, keys):
+def _key_variants(keys):
+    """_row_get 과 같은 순서(원래 이름, 소문자, 대문자)로 컬럼 후보를 펼친다 (_first_non_empty_series 용)"""
+    variants = []
     for key in keys:
-        value = _row_get(row_dict, key)
-        if value not in (None, '', []):
-            return value
-    return None
-
-
-def _coerce_datetime_value(value):
-    if value in (None, ''):
-        return None
-    if isinstance(value, datetime):
-        return value
-    if isinstance(value, pd.Timestamp):
-        try:
-            return value.to_pydatetime()
-        except Exception:
-            pass
-    if isinstance(value, date) and not isinstance(value, datetime):
-        return datetime.combine(value, datetime.min.time())
+        for variant in (key, key.lower(), key.upper()):
+            if variant not in variants:
+                variants.append(variant)
+    return variants
 
-    text = str(value).strip()
-    if not text:
-        return None
-
-    sanitized = text.replace('T', ' ').split('.')[0]
-    for fmt in _COMMON_DATE_FORMATS:
-        try:
-            return datetime.strptime(sanitized, fmt)
-        except ValueError:
-            continue
-    return None
 
 def execute_SQL(query):
     """
@@ -287,6 +406,203 @@ def execute_SQL(query):
     finally:
         conn.close()
 
+def _external_fetch_size():
+    """외부 DB 스트리밍 조회 한 번에 가져올 행 수 ([DATABASE] external_fetch_size)"""
+    try:
+        return max(1, config.getint('DATABASE', 'external_fetch_size', fallback=5000))
+    except ValueError:
+        return 5000
+
+
+def _open_streaming_cursor(conn, chunk_size):
+    """가능하면 서버 측(named) 커서를, 아니면 arraysize 를 맞춘 일반 커서를 연다"""
+    raw = getattr(conn, 'conn', None)  # IQADBConnection 이 감싼 원본 드라이버 연결
+    if raw is not None and hasattr(raw, 'cursor'):
+        try:
+            cur = raw.cursor(name=f"iqadb_stream_{uuid.uuid4().hex}")
+            cur.itersize = chunk_size
+            return cur
+        except TypeError:
+            # named 커서를 지원하지 않는 드라이버
+            pass
+    cur = conn.cursor()
+    if hasattr(cur, 'arraysize'):
+        # Oracle 계열 드라이버는 arraysize 단위로 서버에서 나눠 가져온다
+        cur.arraysize = chunk_size
+    return cur
+
+
+def iter_SQL(query, chunk_size=None, params=None):
+    """
+    execute_SQL 의 스트리밍 버전: chunk_size 행 단위 DataFrame 을 차례로 yield 한다.
+    전체 결과를 한 번에 fetchall 하지 않으므로 큰 컨텐츠 쿼리도 청크 크기만큼만 메모리를 쓴다.
+    params 를 주면 쿼리의 %s 자리에 바인딩한다 (이때 쿼리 안의 % 는 %% 로 써야 한다).
+    """
+    if not IQADB_AVAILABLE:
+        raise Exception("IQADB_CONNECT310 모듈을 사용할 수 없습니다.")
+
+    chunk_size = chunk_size or _external_fetch_size()
+    conn = iqadb1()
+    cur = None
+    try:
+        cur = _open_streaming_cursor(conn, chunk_size)
+        if params:
+            cur.execute(query, params)
+        else:
+            cur.execute(query)
+        col_names = None
+        while True:
+            data = cur.fetchmany(chunk_size)
+            if not data:
+                break
+            if col_names is None:
+                # named 커서는 첫 fetch 이후에 description 이 채워진다
+                col_names = [desc[0] for desc in cur.description]
+            yield pd.DataFrame(data, columns=col_names)
+            if len(data) < chunk_size:
+                break
+    except Exception as e:
+        print(f"[ERROR] iter_SQL 실행 중 오류: {e}")
+        traceback.print_exc()
+        raise
+    finally:
+        if cur is not None:
+            try:
+                cur.close()
+            except Exception:
+                pass
+        conn.close()
+
+
+def _peek_chunks(chunks):
+    """첫 청크를 미리 읽어 빈 결과인지 확인한다. (첫 청크 또는 None, 전체 청크 iterator)"""
+    first = next(chunks, None)
+    if first is None:
+        return None, iter(())
+    return first, itertools.chain([first], chunks)
+
+
+def _master_sync_mode():
+    """[DATABASE] master_data_sync_mode: incremental(해시 비교, 기본), swap(새 테이블 교체) 또는 full(전량 재적재)"""
+    mode = config.get('DATABASE', 'master_data_sync_mode', fallback='incremental').strip().lower()
+    return mode if mode in ('incremental', 'swap', 'full') else 'incremental'
+
+
+def _watermark_text(value):
+    """워터마크 최댓값 → master_sync_watermarks 에 저장할 문자열 (외부 쿼리에는 바인딩 파라미터로 넘긴다)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return None
+    if isinstance(value, (int, float, Decimal, np.integer, np.floating)):
+        return str(value)
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return str(value).strip()
+
+
+def _stored_watermark(text):
+    """저장된 워터마크 문자열 → 바인딩 값 (예전 버전이 남긴 'SQL 리터럴' 형태도 풀어서 읽는다)"""
+    text = str(text).strip()
+    if len(text) >= 2 and text[0] == "'" and text[-1] == "'":
+        text = text[1:-1].replace("''", "'")
+    return text
+
+
+class _MasterDeltaPlan:
+    """
+    마스터 쿼리 1개의 증분 동기화 계획.
+    - incremental 모드에서는 행 해시로 바뀐 행만 쓰고(StagingTable.apply_delta),
+      [MASTER_DATA_QUERIES] <name>_watermark_column 이 있으면 지난 최댓값 이상인 행만 조회한다.
+    - 워터마크가 없거나 master_data_full_sync_days 가 지나면 전체 조회하여 사라진 행까지 정리한다(full=True).
+    - swap 모드에서는 <캐시>_new 테이블에 전량 적재 후 이름 교체로 바꿔 끼운다(swap=True).
+    - full 모드에서는 기존처럼 제자리에서 전량 재적재한다.
+    """
+
+    def __init__(self, name, query):
+        self.name = name
+        self.query = query
+        mode = _master_sync_mode()
+        self.incremental = mode == 'incremental'
+        self.swap = mode == 'swap'
+        self.full = True
+        self.params = None
+        self.column = None
+        self.max_value = None
+        if not self.incremental:
+            return
+
+        column = config.get('MASTER_DATA_QUERIES', f'{name}_watermark_column', fallback='').strip()
+        if not column:
+            return
+        self.column = column.lower()
+
+        conn = get_db_connection()
+        try:
+            row = conn.execute(
+                "SELECT watermark, last_full_sync FROM master_sync_watermarks WHERE name = %s",
+                (name,),
+            ).fetchone()
+        finally:
+            conn.close()
+
+        full_days = config.getint('DATABASE', 'master_data_full_sync_days', fallback=7)
+        if not row or not row[0] or not row[1]:
+            return
+        if pd.to_datetime(row[1]) < datetime.now() - timedelta(days=max(0, full_days)):
+            return
+        # 경계값과 같은 행도 다시 가져오되, 해시가 같으면 쓰지 않으므로 부담이 없다
+        # 워터마크는 바인딩하므로 원본 쿼리의 % 는 %% 로 이스케이프한다
+        source = query.strip().rstrip(';').replace('%', '%%')
+        self.query = f"SELECT * FROM ({source}) wm_src WHERE {column} >= %s"
+        self.params = (_stored_watermark(row[0]),)
+        self.full = False
+
+    def describe(self):
+        if self.swap:
+            return "새 테이블 교체"
+        if not self.incremental:
+            return "전량 재적재"
+        if self.full:
+            return "전체 비교"
+        return f"워터마크 증분({self.column})"
+
+    def observe(self, df):
+        """청크의 워터마크 컬럼 최댓값을 누적"""
+        if not self.column:
+            return
+        column = next((c for c in df.columns if str(c).strip().lower() == self.column), None)
+        if column is None:
+            return
+        try:
+            chunk_max = df[column].dropna().max()
+            if pd.isna(chunk_max):
+                return
+            if self.max_value is None or chunk_max > self.max_value:
+                self.max_value = chunk_max
+        except TypeError:
+            pass
+
+    def save(self, cursor):
+        """동기화와 같은 트랜잭션에서 워터마크/전체 비교 시각 기록"""
+        if not self.incremental:
+            return
+        cursor.execute("""
+            INSERT INTO master_sync_watermarks (name, watermark, last_full_sync, updated_at)
+            VALUES (%s, %s, CASE WHEN %s THEN CURRENT_TIMESTAMP END, CURRENT_TIMESTAMP)
+            ON CONFLICT (name) DO UPDATE SET
+                watermark = COALESCE(EXCLUDED.watermark, master_sync_watermarks.watermark),
+                last_full_sync = COALESCE(EXCLUDED.last_full_sync, master_sync_watermarks.last_full_sync),
+                updated_at = CURRENT_TIMESTAMP
+        """, (self.name, _watermark_text(self.max_value), self.full))
+
+    def summary(self, result):
+        return (f"{self.describe()}: 신규 {result.inserted}건, 변경 {result.updated}건, "
+                f"삭제 {result.deleted}건, 변경 없음 {result.unchanged}건")
+
+
 def execute_local_query(query):
     """
     전용 PostgreSQL 데이터베이스에서 조회를 실행하고 DataFrame으로 반환한다.
@@ -321,6 +637,52 @@ def execute_local_query(query):
 # config는 이미 위에서 로드되었음 - 중복 제거
 # 설정 파일 로드 성공 메시지는 이미 위에서 출력됨
 
+PARTNER_CACHE_COLUMNS = [
+    'business_number', 'company_name', 'partner_class', 'business_type_major',
+    'business_type_minor', 'hazard_work_flag', 'representative', 'address',
+    'average_age', 'annual_revenue', 'transaction_count', 'permanent_workers',
+]
+
+
+def _partner_cache_rows(df):
+    """협력사 DataFrame(청크) → partners_cache 적재용 튜플 목록 (컬럼 단위 정규화)"""
+    records = _sanitize_external_frame(df)
+    if 'business_number' in records.columns:
+        business_numbers = records['business_number'].fillna('').astype(str).str.strip()
+    else:
+        business_numbers = pd.Series('', index=records.index, dtype=object)
+    # 필수 키 누락(빈 문자열 포함) 행은 스킵하여 UNIQUE 충돌과 파이프라인 중단을 방지
+    valid = business_numbers != ''
+
+    def _text_column(*names):
+        for name in names:
+            if name in records.columns:
+                return records[name]
+        return pd.Series('', index=records.index, dtype=object)
+
+    def _numeric_column(name, integer=False):
+        if name not in df.columns:
+            return pd.Series([None] * len(df), index=df.index, dtype=object)
+        return _coerce_numeric_series(df[name], integer=integer)
+
+    # 숫자/금액/카운트 안전 변환 (벡터화)
+    prepared = pd.DataFrame({
+        'business_number': business_numbers,
+        'company_name': _text_column('company_name'),
+        'partner_class': _text_column('partner_class'),
+        'business_type_major': _text_column('business_type_major'),
+        'business_type_minor': _text_column('business_type_minor'),
+        'hazard_work_flag': _text_column('hazard_work_flag', 'hazard_work_fla'),
+        'representative': _text_column('representative'),
+        'address': _text_column('address'),
+        'average_age': _numeric_column('average_age'),
+        'annual_revenue': _numeric_column('annual_revenue'),
+        'transaction_count': _numeric_column('transaction_count', integer=True),
+        'permanent_workers': _numeric_column('permanent_workers', integer=True),
+    }, index=records.index, columns=PARTNER_CACHE_COLUMNS).astype(object)[valid]
+    return list(prepared.itertuples(index=False, name=None))
+
+
 class PartnerDataManager:
     def __init__(self):
         self.config = config
@@ -357,7 +719,9 @@ class PartnerDataManager:
             'transaction_count': 'TEXT',
             'permanent_workers': 'INTEGER',
             'synced_at': 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP',
-            'is_deleted': 'INTEGER DEFAULT 0'
+            'updated_at': 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP',
+            'is_deleted': 'INTEGER DEFAULT 0',
+            'row_hash': 'TEXT'
         }
         
         # 테이블이 없으면 생성, 있으면 부족한 컬럼만 추가
@@ -378,7 +742,9 @@ class PartnerDataManager:
                     transaction_count TEXT,
                     permanent_workers INTEGER,
                     synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_deleted INTEGER DEFAULT 0
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    is_deleted INTEGER DEFAULT 0,
+                    row_hash TEXT
                 )
             ''')
             print("[SUCCESS] partners_cache 테이블 생성 완료")
@@ -574,6 +940,21 @@ class PartnerDataManager:
             )
         ''')
         
+        # 증분 동기화용 행 해시 컬럼 (바뀐 행만 쓰기 위해 원본 행 내용의 md5 보관)
+        for cache_table in ('accidents_cache', 'departments_cache', 'buildings_cache',
+                            'contractors_cache', 'divisions_cache'):
+            cursor.execute(f"ALTER TABLE {cache_table} ADD COLUMN IF NOT EXISTS row_hash TEXT")
+
+        # 마스터 쿼리별 워터마크 / 마지막 전체 비교 시각
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS master_sync_watermarks (
+                name TEXT PRIMARY KEY,
+                watermark TEXT,
+                last_full_sync TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
         # permanent_workers 컬럼은 위에서 이미 처리됨 (중복 제거)
         
         # 마스터 테이블은 더 이상 사용하지 않음 (캐시 테이블만 사용)
@@ -583,32 +964,32 @@ class PartnerDataManager:
         conn.close()
     
     def sync_partners_from_external_db(self):
-        """외부 DB에서 협력사 마스터 데이터 동기화"""
+        """외부 DB에서 협력사 마스터 데이터 동기화 (incremental 모드에서는 바뀐 행만 반영)"""
         if not IQADB_AVAILABLE:
             logging.error("IQADB_CONNECT310 모듈을 사용할 수 없습니다.")
             return False
         
+        shadow = None
         try:
             # config.ini에서 PARTNERS_QUERY 가져오기
             query = self.config.get('MASTER_DATA_QUERIES', 'PARTNERS_QUERY')
-            print(f"[INFO] 실행할 쿼리: {query[:100]}...")
+            plan = _MasterDeltaPlan('partners', query)
+            print(f"[INFO] 실행할 쿼리({plan.describe()}): {plan.query[:100]}...")
             
-            # 외부 DB에서 데이터 조회
+            # 외부 DB에서 청크 단위로 조회 (서버 측 커서, 청크 크기만큼만 메모리 사용)
             print("[INFO] IQADB_CONNECT310을 사용하여 데이터 조회 시작...")
-            df = execute_SQL(query)
-            # 외부 DB 컬럼명이 대문자/혼합/한글일 수 있어 표준화 필요
-            df = _normalize_df(df)
-            df = df.replace({'None': None, 'null': None, 'NULL': None})
-            print(f"[INFO] 데이터 조회 완료: {len(df)} 건")
+            first_chunk, chunks = _peek_chunks(iter_SQL(plan.query, params=plan.params))
+            if first_chunk is None:
+                if not plan.full:
+                    print("[INFO] 워터마크 이후 변경된 협력사 데이터가 없습니다.")
+                    return True
+                print("[WARNING] 조회된 데이터가 없습니다.")
+                return False
             try:
-                print(f"[DEBUG] Partners DataFrame columns: {list(df.columns)}")
+                print(f"[DEBUG] Partners DataFrame columns: {list(_normalize_df(first_chunk).columns)}")
             except Exception:
                 pass
             
-            if df.empty:
-                print("[WARNING] 조회된 데이터가 없습니다.")
-                return False
-            
             # DataFrame을 SQLite에 저장
             conn = get_db_connection(self.local_db_path, timeout=30.0)
             cursor = conn.cursor()
@@ -618,172 +999,95 @@ class PartnerDataManager:
             # 트랜잭션 시작
             cursor.execute("BEGIN")
             
-            # 기존 is_deleted 보존을 위해 백업 (custom_data는 없음)
-            cursor.execute("""
-                CREATE TEMP TABLE partners_backup AS 
-                SELECT business_number, is_deleted 
-                FROM partners_cache
-            """)
-            
-            # 기존 캐시 데이터 삭제
-            cursor.execute("DELETE FROM partners_cache")
-            
-            # 배치 삽입을 위한 데이터 준비
-            rows = []
-            _skipped_missing_bn = 0
-            for _, row in df.iterrows():
-                # 필수 키 누락(빈 문자열 포함) 행은 스킵하여 UNIQUE 충돌과 파이프라인 중단을 방지
-                business_number = str(row.get('business_number') or '').strip()
-                if not business_number:
-                    _skipped_missing_bn += 1
-                    continue
-
-                # 숫자/금액/카운트 안전 변환
-                def _to_int_safe(v):
-                    try:
-                        if v is None or (hasattr(pd, 'isna') and pd.isna(v)):
-                            return None
-                        if isinstance(v, (int, np.integer)):
-                            return int(v)
-                        if isinstance(v, (float, np.floating)):
-                            return int(v)
-                        s = str(v).strip()
-                        if s == '':
-                            return None
-                        s = re.sub(r"[^0-9-]", "", s)
-                        if s in ('', '-'):
-                            return None
-                        return int(s)
-                    except Exception:
-                        return None
-
-                def _to_float_safe(v):
-                    try:
-                        if v is None or (hasattr(pd, 'isna') and pd.isna(v)):
-                            return None
-                        if isinstance(v, (int, np.integer, float, np.floating)):
-                            return float(v)
-                        s = str(v).strip()
-                        if s == '':
-                            return None
-                        s = s.replace(',', '')
-                        s = re.sub(r"[^0-9+\-\.eE]", "", s)
-                        return float(s)
-                    except Exception:
-                        return None
-
-                avg_age = _to_float_safe(row.get('average_age', None))
-                revenue = _to_float_safe(row.get('annual_revenue', None))
-                trx_cnt = _to_int_safe(row.get('transaction_count', None))
-                perm_workers = _to_int_safe(row.get('permanent_workers', None))
-                hazard_flag = row.get('hazard_work_flag', row.get('hazard_work_fla', ''))
-
-                rows.append((
-                    business_number,
-                    row.get('company_name', ''),
-                    row.get('partner_class', ''),
-                    row.get('business_type_major', ''),
-                    row.get('business_type_minor', ''),
-                    hazard_flag,
-                    row.get('representative', ''),
-                    row.get('address', ''),
-                    avg_age,
-                    revenue,
-                    trx_cnt,
-                    perm_workers
-                ))
-            
-            # 배치 삽입 (중복 키는 업서트)
-            try:
-                cursor.executemany('''
-                    INSERT INTO partners_cache (
-                        business_number, company_name, partner_class, business_type_major,
-                        business_type_minor, hazard_work_flag, representative, address,
-                        average_age, annual_revenue, transaction_count, permanent_workers,
-                        is_deleted
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 0)
-                    ON CONFLICT (business_number)
-                    DO UPDATE SET
-                        company_name = EXCLUDED.company_name,
-                        partner_class = EXCLUDED.partner_class,
-                        business_type_major = EXCLUDED.business_type_major,
-                        business_type_minor = EXCLUDED.business_type_minor,
-                        hazard_work_flag = EXCLUDED.hazard_work_flag,
-                        representative = EXCLUDED.representative,
-                        address = EXCLUDED.address,
-                        average_age = EXCLUDED.average_age,
-                        annual_revenue = EXCLUDED.annual_revenue,
-                        transaction_count = EXCLUDED.transaction_count,
-                        permanent_workers = EXCLUDED.permanent_workers,
-                        updated_at = CURRENT_TIMESTAMP
-                ''', rows)
-            except Exception as _bulk_err:
-                # Fallback: per-row insert with savepoints to skip bad rows
-                print(f"[WARN] bulk insert failed: {_bulk_err}. Fallback to per-row inserts.")
-                ok, bad = 0, 0
-                for vals in rows:
-                    try:
-                        cursor.execute("SAVEPOINT sp_row")
-                        cursor.execute('''
-                            INSERT INTO partners_cache (
-                                business_number, company_name, partner_class, business_type_major,
-                                business_type_minor, hazard_work_flag, representative, address,
-                                average_age, annual_revenue, transaction_count, permanent_workers,
-                                is_deleted
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 0)
-                            ON CONFLICT (business_number)
-                            DO UPDATE SET
-                                company_name = EXCLUDED.company_name,
-                                partner_class = EXCLUDED.partner_class,
-                                business_type_major = EXCLUDED.business_type_major,
-                                business_type_minor = EXCLUDED.business_type_minor,
-                                hazard_work_flag = EXCLUDED.hazard_work_flag,
-                                representative = EXCLUDED.representative,
-                                address = EXCLUDED.address,
-                                average_age = EXCLUDED.average_age,
-                                annual_revenue = EXCLUDED.annual_revenue,
-                                transaction_count = EXCLUDED.transaction_count,
-                                permanent_workers = EXCLUDED.permanent_workers,
-                                updated_at = CURRENT_TIMESTAMP
-                        ''', vals)
-                        cursor.execute("RELEASE SAVEPOINT sp_row")
-                        ok += 1
-                    except Exception as _row_err:
-                        try:
-                            cursor.execute("ROLLBACK TO SAVEPOINT sp_row")
-                        except Exception:
-                            pass
-                        bad += 1
-                print(f"[INFO] per-row insert: ok={ok}, skipped={bad}")
-            
-            # 기존 is_deleted 복원
-            cursor.execute("""
-                UPDATE partners_cache 
-                SET is_deleted = COALESCE(
-                    (SELECT is_deleted FROM partners_backup 
-                     WHERE partners_backup.business_number = partners_cache.business_number),
-                    0
-                )
-            """)
-            
-            # 임시 테이블 삭제
-            cursor.execute("DROP TABLE partners_backup")
+            load_table = 'partners_cache'
+            if plan.swap:
+                # 옆에 partners_cache_new 를 채운 뒤 이름만 바꿔 교체 - 조회 화면은 동기화 중에도 기존 테이블을 그대로 읽는다
+                # (is_deleted 는 교체 직전에 기존 행에서 이어받음)
+                shadow = ShadowTable(conn, 'partners_cache',
+                                     carry_key=['business_number'], carry_columns=['is_deleted'])
+                shadow.create()
+                load_table = shadow.name
+            elif not plan.incremental:
+                # 기존 is_deleted 보존을 위해 백업 (custom_data는 없음)
+                cursor.execute("""
+                    CREATE TEMP TABLE partners_backup AS 
+                    SELECT business_number, is_deleted 
+                    FROM partners_cache
+                """)
+                
+                # 기존 캐시 데이터 삭제
+                cursor.execute("DELETE FROM partners_cache")
+            
+            # 청크마다 정규화 후 스테이징에 COPY, 마지막에 단일 반영 (중복 키는 마지막 행 우선)
+            total = 0
+            with StagingTable(conn, load_table, PARTNER_CACHE_COLUMNS) as stage:
+                for df in chunks:
+                    # 외부 DB 컬럼명이 대문자/혼합/한글일 수 있어 표준화 필요
+                    df = _normalize_df(df)
+                    df = df.replace({'None': None, 'null': None, 'NULL': None})
+                    total += len(df)
+                    plan.observe(df)
+                    # 타입이 맞지 않는 행은 건너뛰고 나머지만 적재
+                    stage.load(_partner_cache_rows(df), skip_bad_rows=True)
+                if plan.incremental:
+                    # 해시가 같은 행은 건드리지 않으므로 is_deleted 등 로컬 값도 그대로 유지된다
+                    result = stage.apply_delta(
+                        ['business_number'],
+                        insert_values={'is_deleted': '0'},
+                        update_values={'updated_at': 'CURRENT_TIMESTAMP'},
+                        delete_missing=plan.full,
+                    )
+                    print(f"[INFO] 협력사 {plan.summary(result)}")
+                    written = result.changed
+                elif plan.swap:
+                    # 새 테이블은 비어 있고 인덱스도 아직 없으므로 ON CONFLICT 없이 삽입
+                    written = stage.merge(['business_number'], insert_values={'is_deleted': '0'}, on_conflict='insert')
+                else:
+                    written = stage.merge(
+                        ['business_number'],
+                        insert_values={'is_deleted': '0'},
+                        update_values={'updated_at': 'CURRENT_TIMESTAMP'},
+                    )
+                if stage.skipped_rows:
+                    print(f"[INFO] 적재 실패로 건너뛴 행: {stage.skipped_rows}건")
+            print(f"[INFO] 데이터 조회 완료: {total} 건")
+            
+            if plan.swap:
+                # 인덱스 생성 후 짧은 트랜잭션에서 이름 교체 (이 시점에 커밋됨)
+                shadow.swap()
+            elif not plan.incremental:
+                # 기존 is_deleted 복원 (신규 행은 삽입 시 0)
+                cursor.execute("""
+                    UPDATE partners_cache AS pc
+                    SET is_deleted = COALESCE(pb.is_deleted, 0)
+                    FROM partners_backup AS pb
+                    WHERE pb.business_number = pc.business_number
+                      AND pc.is_deleted IS DISTINCT FROM COALESCE(pb.is_deleted, 0)
+                """)
+                
+                # 임시 테이블 삭제
+                cursor.execute("DROP TABLE partners_backup")
             
+            plan.save(cursor)
             conn.commit()
             conn.close()
             
-            print(f"[SUCCESS] ✅ 협력사 데이터 {len(df)}건 동기화 완료")
+            report_sync_rows(read=total, written=written)
+            print(f"[SUCCESS] ✅ 협력사 데이터 {total}건 동기화 완료")
             return True
             
         except Exception as e:
             print(f"[ERROR] ❌ 데이터 동기화 실패: {e}")
             traceback.print_exc()
+            if shadow is not None:
+                # 교체 전 실패면 기존 partners_cache 는 그대로 두고 _new 만 정리
+                shadow.discard()
             return False
     
     def sync_accidents_from_external_db(self):
         """외부 DB에서 사고 데이터 동기화 (안전 업서트, 기존값 보존)
 
-        - 전량 삭제 금지, UPSERT 기반
+        - 전량 삭제 금지, UPSERT 기반 (incremental 모드에서는 해시가 바뀐 행만 갱신)
         - created_at/custom_data/is_deleted 보존 (UPDATE 시 미갱신)
         - 단일 백엔드(get_db_connection) 사용으로 운영/개발 일관성 보장
         """
@@ -793,14 +1097,15 @@ class PartnerDataManager:
 
         try:
             query = self.config.get('MASTER_DATA_QUERIES', 'ACCIDENTS_QUERY')
-            print(f"[INFO] 실행할 사고 쿼리: {query[:100]}...")
+            plan = _MasterDeltaPlan('accidents', query)
+            print(f"[INFO] 실행할 사고 쿼리({plan.describe()}): {plan.query[:100]}...")
 
             print("[INFO] IQADB_CONNECT310을 사용하여 사고 데이터 조회 시작...")
-            df = execute_SQL(query)
-            df = _normalize_df(df)
-            print(f"[INFO] 사고 데이터 조회 완료: {len(df)} 건")
-
-            if df.empty:
+            first_chunk, chunks = _peek_chunks(iter_SQL(plan.query, params=plan.params))
+            if first_chunk is None:
+                if not plan.full:
+                    print("[INFO] 워터마크 이후 변경된 사고 데이터가 없습니다.")
+                    return True
                 print("[WARNING] 조회된 사고 데이터가 없습니다.")
                 return False
 
@@ -811,50 +1116,89 @@ class PartnerDataManager:
             except Exception:
                 pass
 
-            from db.upsert import safe_upsert
             from timezone_config import get_korean_time
 
+            accident_columns = [
+                'accident_number', 'accident_name', 'workplace', 'accident_grade',
+                'major_category', 'injury_form', 'injury_type', 'accident_date',
+                'day_of_week', 'report_date', 'building', 'floor',
+                'location_category', 'location_detail', 'custom_data', 'is_deleted',
+                'created_at',
+            ]
+            update_cols = [
+                'accident_name','workplace','accident_grade','major_category',
+                'injury_form','injury_type','accident_date','day_of_week','report_date',
+                'building','floor','location_category','location_detail'
+            ]
+
+            # 청크마다 정리한 행을 스테이징에 COPY, 마지막에 단일 업서트
+            # (created_at/custom_data/is_deleted 는 INSERT 시에만)
+            fetched = 0
             processed = 0
-            for _, row in df.iterrows():
-                acc_no = str(row.get('accident_number') or '').strip()
-                if not acc_no:
-                    continue
-
-                def g(k, alt=''):
-                    return _to_sqlite_safe(row.get(k, alt))
-
-                created_val = row.get('created_at')
-                if not created_val:
-                    created_val = get_korean_time().strftime('%Y-%m-%d %H:%M:%S')
-
-                data = {
-                    'accident_number': acc_no,
-                    'accident_name': g('accident_name'),
-                    'workplace': g('workplace'),
-                    'accident_grade': g('accident_grade'),
-                    'major_category': g('major_category'),
-                    'injury_form': g('injury_form') or g('unjury_form'),
-                    'injury_type': g('injury_type'),
-                    'accident_date': g('accident_date'),
-                    'day_of_week': g('day_of_week'),
-                    'report_date': g('report_date'),
-                    'building': g('building'),
-                    'floor': g('floor'),
-                    'location_category': g('location_category'),
-                    'location_detail': g('location_detail'),
-                    'custom_data': '{}',
-                    'is_deleted': 0,
-                    'created_at': created_val
-                }
-
-                update_cols = [
-                    'accident_name','workplace','accident_grade','major_category',
-                    'injury_form','injury_type','accident_date','day_of_week','report_date',
-                    'building','floor','location_category','location_detail'
-                ]
+            fallback_created = get_korean_time().strftime('%Y-%m-%d %H:%M:%S')
+            with StagingTable(conn, 'accidents_cache', accident_columns) as stage:
+                for df in chunks:
+                    df = _normalize_df(df)
+                    fetched += len(df)
+                    plan.observe(df)
+                    rows = []
+                    # 컬럼 단위로 결측/공백/날짜를 먼저 정리한 뒤 레코드로 한 번에 변환
+                    for row in _external_records(df):
+                        acc_no = str(row.get('accident_number') or '').strip()
+                        if not acc_no:
+                            continue
 
-                safe_upsert(conn, 'accidents_cache', data, conflict_cols=['accident_number'], update_cols=update_cols)
-                processed += 1
+                        def g(k, alt=''):
+                            value = row.get(k, alt)
+                            # 날짜 컬럼은 'YYYY-MM-DD HH:MM:SS' 까지만 저장 (_to_sqlite_safe 와 동일)
+                            if k.endswith('_date') and isinstance(value, str):
+                                return value[:19]
+                            return value
+
+                        created_val = row.get('created_at') or fallback_created
+
+                        data = {
+                            'accident_number': acc_no,
+                            'accident_name': g('accident_name'),
+                            'workplace': g('workplace'),
+                            'accident_grade': g('accident_grade'),
+                            'major_category': g('major_category'),
+                            'injury_form': g('injury_form') or g('unjury_form'),
+                            'injury_type': g('injury_type'),
+                            'accident_date': g('accident_date'),
+                            'day_of_week': g('day_of_week'),
+                            'report_date': g('report_date'),
+                            'building': g('building'),
+                            'floor': g('floor'),
+                            'location_category': g('location_category'),
+                            'location_detail': g('location_detail'),
+                            'custom_data': '{}',
+                            'is_deleted': 0,
+                            'created_at': created_val
+                        }
+                        # safe_upsert 와 동일하게 빈 문자열은 NULL 로 저장
+                        rows.append(tuple(
+                            None if isinstance(data[col], str) and not data[col].strip() else data[col]
+                            for col in accident_columns
+                        ))
+
+                    processed += stage.load(rows)
+                if plan.incremental:
+                    # created_at 은 조회 시각으로 채워질 수 있어 해시는 갱신 대상 컬럼만으로 계산
+                    result = stage.apply_delta(
+                        ['accident_number'],
+                        hash_cols=['accident_number'] + update_cols,
+                        update_cols=update_cols,
+                        delete_missing=False,
+                    )
+                    print(f"[INFO] 사고 {plan.summary(result)}")
+                    written = result.changed
+                else:
+                    # 해시를 비워 다음 증분 동기화가 이 행들을 다시 비교하게 한다
+                    written = stage.merge(['accident_number'], update_cols=update_cols,
+                                          update_values={'row_hash': 'NULL'})
+            print(f"[INFO] 사고 데이터 조회 완료: {fetched} 건")
+            plan.save(cursor)
 
             try:
                 conn.commit()
@@ -862,6 +1206,7 @@ class PartnerDataManager:
                 pass
             conn.close()
 
+            report_sync_rows(read=fetched, written=written)
             print(f"[SUCCESS] ✅ 사고 데이터 {processed}건 업서트 완료 (기존값 보존)")
             return True
 
@@ -896,21 +1241,20 @@ class PartnerDataManager:
             # 기존 캐시 데이터 삭제
             cursor.execute("DELETE FROM employees_cache")
             
-            # DataFrame을 레코드 배열로 변환하여 캐시에 삽입
-            for _, row in df.iterrows():
-                cursor.execute('''
-                    INSERT INTO employees_cache (
-                        employee_id, employee_name, department_name
-                    ) VALUES (%s, %s, %s)
-                ''', (
+            # DataFrame을 레코드 배열로 변환하여 COPY 로 일괄 삽입
+            written = copy_rows(conn, 'employees_cache', ['employee_id', 'employee_name', 'department_name'], (
+                (
                     row.get('employee_id', ''),
                     row.get('employee_name', ''),
                     row.get('department_name', '')
-                ))
+                )
+                for row in _external_records(df)
+            ))
             
             conn.commit()
             conn.close()
             
+            report_sync_rows(read=len(df), written=written)
             print(f"[SUCCESS] ✅ 임직원 데이터 {len(df)}건 동기화 완료")
             return True
             
@@ -919,157 +1263,112 @@ class PartnerDataManager:
             traceback.print_exc()
             return False
     
-    def sync_departments_from_external_db(self):
-        """외부 DB에서 부서 데이터 동기화"""
+    def _sync_code_cache_from_external(self, name, option, label, table, columns, build_row):
+        """
+        부서/건물/협력사 근로자처럼 단순 코드 캐시 동기화 (columns[0] 이 키).
+        incremental 모드에서는 스테이징 후 해시가 바뀐 행만, swap 모드에서는 <캐시>_new 에 전량 COPY 후
+        이름 교체, full 모드에서는 제자리에서 비우고 전량 COPY 한다.
+        """
         if not IQADB_AVAILABLE:
             print("[ERROR] IQADB_CONNECT310 모듈을 사용할 수 없습니다.")
             return False
         
         try:
-            # config.ini에서 DEPARTMENT_EXTERNAL_QUERY 가져오기 (외부 DB용)
-            query = self.config.get('MASTER_DATA_QUERIES', 'DEPARTMENT_QUERY')
-            print(f"[INFO] 실행할 부서 쿼리: {query[:100]}...")
+            query = self.config.get('MASTER_DATA_QUERIES', option)
+            plan = _MasterDeltaPlan(name, query)
+            print(f"[INFO] 실행할 {label} 쿼리({plan.describe()}): {plan.query[:100]}...")
             
             # 외부 DB에서 데이터 조회
-            print("[INFO] IQADB_CONNECT310을 사용하여 부서 데이터 조회 시작...")
-            df = execute_SQL(query)
-            print(f"[INFO] 부서 데이터 조회 완료: {len(df)} 건")
-            
-            if df.empty:
-                print("[WARNING] 조회된 부서 데이터가 없습니다.")
+            print(f"[INFO] IQADB_CONNECT310을 사용하여 {label} 데이터 조회 시작...")
+            first_chunk, chunks = _peek_chunks(iter_SQL(plan.query, params=plan.params))
+            if first_chunk is None:
+                if not plan.full:
+                    print(f"[INFO] 워터마크 이후 변경된 {label} 데이터가 없습니다.")
+                    return True
+                print(f"[WARNING] 조회된 {label} 데이터가 없습니다.")
                 return False
             
-            # SQLite에 저장
             conn = get_db_connection(self.local_db_path)
             cursor = conn.cursor()
             
-            # 기존 캐시 데이터 삭제
-            cursor.execute("DELETE FROM departments_cache")
-            
-            # DataFrame을 레코드 배열로 변환하여 SQLite에 삽입
-            for _, row in df.iterrows():
-                cursor.execute('''
-                    INSERT INTO departments_cache (
-                        dept_code, dept_name, parent_dept_code
-                    ) VALUES (%s, %s, %s)
-                ''', (
-                    row.get('dept_code', ''),
-                    row.get('dept_name', ''),
-                    row.get('parent_dept_code', ''),
-                ))
-            
+            total = 0
+            if plan.incremental:
+                # 청크마다 스테이징에 COPY, 마지막에 해시가 바뀐 행만 반영
+                with StagingTable(conn, table, columns) as stage:
+                    for df in chunks:
+                        total += len(df)
+                        plan.observe(df)
+                        stage.load([build_row(row) for row in _external_records(df)])
+                    result = stage.apply_delta([columns[0]], delete_missing=plan.full)
+                print(f"[INFO] {label} {plan.summary(result)}")
+                written = result.changed
+            elif plan.swap:
+                # <캐시>_new 에 COPY 후 인덱스 생성, 짧은 트랜잭션에서 이름 교체
+                with ShadowTable(conn, table) as shadow:
+                    for df in chunks:
+                        total += len(df)
+                        copy_rows(conn, shadow.name, columns, [build_row(row) for row in _external_records(df)])
+                    shadow.swap()
+                written = total
+            else:
+                # 기존 캐시 데이터 삭제 후 청크마다 COPY 로 바로 삽입
+                cursor.execute(f"DELETE FROM {table}")
+                for df in chunks:
+                    total += len(df)
+                    copy_rows(conn, table, columns, [build_row(row) for row in _external_records(df)])
+                written = total
+            
+            plan.save(cursor)
             conn.commit()
             conn.close()
             
-            print(f"[SUCCESS] ✅ 부서 데이터 {len(df)}건 동기화 완료")
+            report_sync_rows(read=total, written=written)
+            print(f"[INFO] {label} 데이터 조회 완료: {total} 건")
+            print(f"[SUCCESS] ✅ {label} 데이터 {total}건 동기화 완료")
             return True
             
         except Exception as e:
-            print(f"[ERROR] ❌ 부서 데이터 동기화 실패: {e}")
+            print(f"[ERROR] ❌ {label} 데이터 동기화 실패: {e}")
             traceback.print_exc()
             return False
     
+    def sync_departments_from_external_db(self):
+        """외부 DB에서 부서 데이터 동기화"""
+        return self._sync_code_cache_from_external(
+            'department', 'DEPARTMENT_QUERY', '부서', 'departments_cache',
+            ['dept_code', 'dept_name', 'parent_dept_code'],
+            lambda row: (
+                row.get('dept_code', ''),
+                row.get('dept_name', ''),
+                row.get('parent_dept_code', ''),
+            ),
+        )
+    
     def sync_buildings_from_external_db(self):
         """외부 DB에서 건물 데이터 동기화"""
-        if not IQADB_AVAILABLE:
-            print("[ERROR] IQADB_CONNECT310 모듈을 사용할 수 없습니다.")
-            return False
-        
-        try:
-            # config.ini에서 BUILDING_EXTERNAL_QUERY 가져오기 (외부 DB용)
-            query = self.config.get('MASTER_DATA_QUERIES', 'BUILDING_QUERY')
-            print(f"[INFO] 실행할 건물 쿼리: {query[:100]}...")
-            
-            # 외부 DB에서 데이터 조회
-            print("[INFO] IQADB_CONNECT310을 사용하여 건물 데이터 조회 시작...")
-            df = execute_SQL(query)
-            print(f"[INFO] 건물 데이터 조회 완료: {len(df)} 건")
-            
-            if df.empty:
-                print("[WARNING] 조회된 건물 데이터가 없습니다.")
-                return False
-            
-            # SQLite에 저장
-            conn = get_db_connection(self.local_db_path)
-            cursor = conn.cursor()
-            
-            # 기존 캐시 데이터 삭제
-            cursor.execute("DELETE FROM buildings_cache")
-            
-            # DataFrame을 레코드 배열로 변환하여 SQLite에 삽입
-            for _, row in df.iterrows():
-                cursor.execute('''
-                    INSERT INTO buildings_cache (
-                        building_code, building_name, SITE, SITE_TYPE
-                    ) VALUES (%s, %s, %s, %s)
-                ''', (
-                    row.get('building_code', ''),
-                    row.get('building_name', ''),
-                    row.get('site', row.get('SITE', '')),  # 대소문자 모두 처리
-                    row.get('site_type', row.get('SITE_TYPE', ''))  # 대소문자 모두 처리
-                ))
-            
-            conn.commit()
-            conn.close()
-            
-            print(f"[SUCCESS] ✅ 건물 데이터 {len(df)}건 동기화 완료")
-            return True
-            
-        except Exception as e:
-            print(f"[ERROR] ❌ 건물 데이터 동기화 실패: {e}")
-            traceback.print_exc()
-            return False
+        return self._sync_code_cache_from_external(
+            'building', 'BUILDING_QUERY', '건물', 'buildings_cache',
+            ['building_code', 'building_name', 'SITE', 'SITE_TYPE'],
+            lambda row: (
+                row.get('building_code', ''),
+                row.get('building_name', ''),
+                row.get('site', row.get('SITE', '')),  # 대소문자 모두 처리
+                row.get('site_type', row.get('SITE_TYPE', '')),  # 대소문자 모두 처리
+            ),
+        )
     
     def sync_contractors_from_external_db(self):
         """외부 DB에서 협력사 근로자 데이터 동기화"""
-        if not IQADB_AVAILABLE:
-            print("[ERROR] IQADB_CONNECT310 모듈을 사용할 수 없습니다.")
-            return False
-        
-        try:
-            # config.ini에서 CONTRACTOR_EXTERNAL_QUERY 가져오기 (외부 DB용)
-            query = self.config.get('MASTER_DATA_QUERIES', 'CONTRACTOR_QUERY')
-            print(f"[INFO] 실행할 협력사 근로자 쿼리: {query[:100]}...")
-            
-            # 외부 DB에서 데이터 조회
-            print("[INFO] IQADB_CONNECT310을 사용하여 협력사 근로자 데이터 조회 시작...")
-            df = execute_SQL(query)
-            print(f"[INFO] 협력사 근로자 데이터 조회 완료: {len(df)} 건")
-            
-            if df.empty:
-                print("[WARNING] 조회된 협력사 근로자 데이터가 없습니다.")
-                return False
-            
-            # SQLite에 저장
-            conn = get_db_connection(self.local_db_path)
-            cursor = conn.cursor()
-            
-            # 기존 캐시 데이터 삭제
-            cursor.execute("DELETE FROM contractors_cache")
-            
-            # DataFrame을 레코드 배열로 변환하여 SQLite에 삽입
-            for _, row in df.iterrows():
-                cursor.execute('''
-                    INSERT INTO contractors_cache (
-                        worker_id, worker_name, company_name, business_number
-                    ) VALUES (%s, %s, %s, %s)
-                ''', (
-                    row.get('worker_id', ''),
-                    row.get('worker_name', ''),
-                    row.get('company_name', ''),
-                    row.get('business_number', '')
-                ))
-            
-            conn.commit()
-            conn.close()
-            
-            print(f"[SUCCESS] ✅ 협력사 근로자 데이터 {len(df)}건 동기화 완료")
-            return True
-            
-        except Exception as e:
-            print(f"[ERROR] ❌ 협력사 근로자 데이터 동기화 실패: {e}")
-            traceback.print_exc()
-            return False
+        return self._sync_code_cache_from_external(
+            'contractor', 'CONTRACTOR_QUERY', '협력사 근로자', 'contractors_cache',
+            ['worker_id', 'worker_name', 'company_name', 'business_number'],
+            lambda row: (
+                row.get('worker_id', ''),
+                row.get('worker_name', ''),
+                row.get('company_name', ''),
+                row.get('business_number', ''),
+            ),
+        )
 
     def sync_divisions_from_external_db(self):
         """외부 DB에서 사업부 데이터 동기화"""
@@ -1077,61 +1376,87 @@ class PartnerDataManager:
             print("[ERROR] IQADB_CONNECT310 모듈을 사용할 수 없습니다.")
             return False
 
+        shadow = None
         try:
             query = self.config.get('MASTER_DATA_QUERIES', 'DIVISION_QUERY')
-            print(f"[INFO] 실행할 사업부 쿼리: {query[:100]}...")
-
-            df = execute_SQL(query)
-            df = _normalize_df(df)
-            print(f"[INFO] 사업부 데이터 조회 완료: {len(df)} 건")
-
-            if df.empty:
+            plan = _MasterDeltaPlan('division', query)
+            print(f"[INFO] 실행할 사업부 쿼리({plan.describe()}): {plan.query[:100]}...")
+
+            first_chunk, chunks = _peek_chunks(iter_SQL(plan.query, params=plan.params))
+            if first_chunk is None:
+                if not plan.full:
+                    print("[INFO] 워터마크 이후 변경된 사업부 데이터가 없습니다.")
+                    return True
                 print("[WARNING] 조회된 사업부 데이터가 없습니다.")
                 return False
 
             conn = get_db_connection(self.local_db_path)
             cursor = conn.cursor()
 
-            cursor.execute("DELETE FROM divisions_cache")
-
-            rows = []
-            for _, row in df.iterrows():
-                code = str(row.get('division_code') or row.get('code') or '').strip()
-                name = str(row.get('division_name') or row.get('name') or '').strip()
-                if not code or not name:
-                    continue
-                parent = str(row.get('parent_division_code') or row.get('parent_code') or row.get('parent') or '').strip()
-                level = row.get('division_level', row.get('level'))
-                level_int = _safe_int(level)
-                manager = str(row.get('division_manager') or row.get('manager') or '').strip()
-                location = str(row.get('division_location') or row.get('location') or '').strip()
-
-                rows.append((code, name, parent, level_int, manager, location))
-
-            if rows:
-                cursor.executemany('''
-                    INSERT INTO divisions_cache (
-                        division_code, division_name, parent_division_code,
-                        division_level, division_manager, division_location
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (division_code)
-                    DO UPDATE SET
-                        division_name = EXCLUDED.division_name,
-                        parent_division_code = EXCLUDED.parent_division_code,
-                        division_level = EXCLUDED.division_level,
-                        division_manager = EXCLUDED.division_manager,
-                        division_location = EXCLUDED.division_location
-                ''', rows)
+            load_table = 'divisions_cache'
+            if plan.swap:
+                # divisions_cache_new 에 적재 후 이름 교체
+                shadow = ShadowTable(conn, 'divisions_cache')
+                shadow.create()
+                load_table = shadow.name
+            elif not plan.incremental:
+                cursor.execute("DELETE FROM divisions_cache")
+
+            # 청크마다 스테이징에 COPY, 마지막에 단일 업서트 (incremental 은 바뀐 행만)
+            fetched = 0
+            loaded = 0
+            written = 0
+            with StagingTable(conn, load_table, [
+                'division_code', 'division_name', 'parent_division_code',
+                'division_level', 'division_manager', 'division_location',
+            ]) as stage:
+                for df in chunks:
+                    df = _normalize_df(df)
+                    fetched += len(df)
+                    plan.observe(df)
+                    rows = []
+                    for row in _external_records(df):
+                        code = str(row.get('division_code') or row.get('code') or '').strip()
+                        name = str(row.get('division_name') or row.get('name') or '').strip()
+                        if not code or not name:
+                            continue
+                        parent = str(row.get('parent_division_code') or row.get('parent_code') or row.get('parent') or '').strip()
+                        level = row.get('division_level', row.get('level'))
+                        level_int = _safe_int(level)
+                        manager = str(row.get('division_manager') or row.get('manager') or '').strip()
+                        location = str(row.get('division_location') or row.get('location') or '').strip()
+
+                        rows.append((code, name, parent, level_int, manager, location))
+
+                    loaded += stage.load(rows)
+                if plan.incremental:
+                    # 유효한 행이 하나도 없으면 사라진 행 정리도 하지 않는다
+                    result = stage.apply_delta(['division_code'], delete_missing=plan.full and loaded > 0)
+                    print(f"[INFO] 사업부 {plan.summary(result)}")
+                    written = result.changed
+                elif loaded:
+                    written = stage.merge(['division_code'], on_conflict='insert' if plan.swap else 'update')
+            print(f"[INFO] 사업부 데이터 조회 완료: {fetched} 건")
+            if shadow is not None:
+                if loaded:
+                    shadow.swap()
+                else:
+                    # 유효한 행이 없으면 기존 캐시를 유지
+                    shadow.discard()
+            plan.save(cursor)
 
             conn.commit()
             conn.close()
 
-            print(f"[SUCCESS] ✅ 사업부 데이터 {len(rows)}건 동기화 완료")
+            report_sync_rows(read=fetched, written=written)
+            print(f"[SUCCESS] ✅ 사업부 데이터 {loaded}건 동기화 완료")
             return True
 
         except Exception as e:
             print(f"[ERROR] ❌ 사업부 데이터 동기화 실패: {e}")
             traceback.print_exc()
+            if shadow is not None:
+                shadow.discard()
             return False
     
     def sync_safety_instructions_from_external_db(self):
@@ -1147,12 +1472,10 @@ class PartnerDataManager:
                 else self.config.get('MASTER_DATA_QUERIES', 'SAFETY_INSTRUCTIONS_QUERY')
             print(f"[INFO] 실행할 안전지시서 쿼리: {query[:100]}...")
             
-            # 외부 DB에서 데이터 조회
+            # 외부 DB에서 청크 단위로 조회
             print("[INFO] IQADB_CONNECT310을 사용하여 안전지시서 데이터 조회 시작...")
-            df = execute_SQL(query)
-            print(f"[INFO] 안전지시서 데이터 조회 완료: {len(df)} 건")
-            
-            if df.empty:
+            first_chunk, chunks = _peek_chunks(iter_SQL(query))
+            if first_chunk is None:
                 print("[WARNING] 조회된 안전지시서 데이터가 없습니다.")
                 return False
             
@@ -1164,75 +1487,52 @@ class PartnerDataManager:
             # 트랜잭션 시작 (캐시 없이 직접 처리)
             cursor.execute("BEGIN")
 
-            # 배치 삽입을 위한 데이터 준비 (동적 컬럼 방식)
-            rows = []
-            for _, row in df.iterrows():
-                row_dict = _prepare_row_custom_data(row)
-
-                custom_data = json.dumps(row_dict, ensure_ascii=False, default=str)
-
-                # issue_number 추출
-                issue_number = str(
-                    row_dict.get('issue_number') or row_dict.get('발부번호') or ''
-                ).strip()
-                if not issue_number:
-                    # UNIQUE 키가 비어 있으면 스킵
-                    continue
-
-                # 외부 created_at 추출 (Full Process처럼)
-                created_at_str = (
-                    row_dict.get('created_at') or
-                    row_dict.get('CREATED_AT') or
-                    row_dict.get('발부일') or
-                    row_dict.get('작성일') or
-                    row_dict.get('issue_date') or
-                    row_dict.get('ISSUE_DATE') or
-                    row_dict.get('등록일') or
-                    row_dict.get('REG_DATE') or
-                    row_dict.get('reg_date') or
-                    ''
-                )
-
-                # 날짜 파싱
-                created_dt = None
-                if created_at_str:
-                    # 다양한 날짜 형식 파싱 시도
-                    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y/%m/%d', '%Y%m%d', '%d-%b-%y', '%d/%m/%Y']:
-                        try:
-                            created_dt = datetime.strptime(str(created_at_str).split('.')[0], fmt)
-                            break
-                        except:
+            # 청크마다 데이터 준비(동적 컬럼 방식) 후 스테이징에 COPY,
+            # 마지막에 메인 테이블로 단일 업서트
+            total = 0
+            with StagingTable(conn, 'safety_instructions',
+                              ['issue_number', 'custom_data', 'created_at', 'is_deleted']) as stage:
+                for df in chunks:
+                    total += len(df)
+                    records = _sanitize_external_frame(df)
+                    # 외부 created_at 추출 (Full Process처럼) 및 날짜 파싱은 컬럼 단위로
+                    created_at_values = _first_non_empty_series(records, [
+                        'created_at', 'CREATED_AT', '발부일', '작성일', 'issue_date', 'ISSUE_DATE',
+                        '등록일', 'REG_DATE', 'reg_date',
+                    ])
+                    parsed_dates = _parse_datetime_series(created_at_values, _CREATED_AT_FORMATS)
+
+                    rows = []
+                    for record, parsed_dt in zip(_frame_records(records), parsed_dates):
+                        row_dict = _prepare_record_custom_data(record)
+
+                        custom_data = json.dumps(row_dict, ensure_ascii=False, default=str)
+
+                        # issue_number 추출
+                        issue_number = str(
+                            row_dict.get('issue_number') or row_dict.get('발부번호') or ''
+                        ).strip()
+                        if not issue_number:
+                            # UNIQUE 키가 비어 있으면 스킵
                             continue
-                if not created_dt:
-                    created_dt = datetime.now()
-
-                # created_dt를 문자열로 변환
-                created_at_iso = created_dt.strftime('%Y-%m-%d %H:%M:%S') if created_dt else None
-
-                rows.append((
-                    issue_number,
-                    custom_data,
-                    created_at_iso,
-                    0  # is_deleted = 0
-                ))
-            
-            # 캐시 없이 직접 메인 테이블에 삽입 (PostgreSQL만 사용)
-            for issue_number, custom_data, created_at_iso, is_deleted in rows:
-                cursor.execute('''
-                    INSERT INTO safety_instructions (issue_number, custom_data, created_at, is_deleted)
-                    VALUES (%s, %s, %s::timestamp, %s)
-                    ON CONFLICT (issue_number)
-                    DO UPDATE SET
-                        custom_data = EXCLUDED.custom_data,
-                        created_at = EXCLUDED.created_at,
-                        is_deleted = EXCLUDED.is_deleted,
-                        updated_at = CURRENT_TIMESTAMP
-                ''', (issue_number, custom_data, created_at_iso, is_deleted))
+
+                        created_dt = datetime.now() if pd.isna(parsed_dt) else parsed_dt.to_pydatetime()
+                        rows.append((
+                            issue_number,
+                            custom_data,
+                            created_dt.strftime('%Y-%m-%d %H:%M:%S'),
+                            0  # is_deleted = 0
+                        ))
+                    stage.load(rows)
+
+                written = stage.merge(['issue_number'], update_values={'updated_at': 'CURRENT_TIMESTAMP'})
+            print(f"[INFO] 안전지시서 데이터 조회 완료: {total} 건")
             
             conn.commit()
             conn.close()
             
-            print(f"[SUCCESS] ✅ 안전지시서 데이터 {len(df)}건 동기화 완료")
+            report_sync_rows(read=total, written=written)
+            print(f"[SUCCESS] ✅ 안전지시서 데이터 {total}건 동기화 완료")
             return True
             
         except Exception as e:
@@ -1260,10 +1560,8 @@ class PartnerDataManager:
             
             # 외부 DB에서 데이터 조회
             print("[INFO] IQADB_CONNECT310을 사용하여 FollowSOP 데이터 조회 시작...")
-            df = execute_SQL(query)
-            print(f"[INFO] FollowSOP 데이터 조회 완료: {len(df)} 건")
-            
-            if df.empty:
+            first_chunk, chunks = _peek_chunks(iter_SQL(query))
+            if first_chunk is None:
                 print("[WARNING] 조회된 FollowSOP 데이터가 없습니다.")
                 return False
             
@@ -1275,122 +1573,65 @@ class PartnerDataManager:
             # 트랜잭션 시작 (캐시 없이 직접 처리)
             cursor.execute("BEGIN")
             
-            # 배치 삽입을 위한 데이터 준비 (동적 컬럼 방식)
-            print(f"[DEBUG] FollowSOP DataFrame 컬럼: {list(df.columns)}")
-            rows = []
-            date_counters = {}  # Track counters for each date within this batch
-            for idx, row in df.iterrows():
-                row_dict = _prepare_row_custom_data(row)
-                custom_data = json.dumps(row_dict, ensure_ascii=False, default=str)
-
-                created_at_str = (
-                    row_dict.get('created_at') or
-                    row_dict.get('CREATED_AT') or
-                    row_dict.get('작업일자') or
-                    row_dict.get('work_date') or
-                    row_dict.get('WORK_DATE') or
-                    row_dict.get('등록일') or
-                    row_dict.get('REG_DATE') or
-                    row_dict.get('reg_date') or
-                    ''
-                )
-
-                # 날짜 파싱 시도
-                created_dt = None
-                try:
-                    if created_at_str:
-                        # 다양한 날짜 형식 파싱 시도
-                        for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y/%m/%d', '%Y%m%d', '%d-%b-%y', '%d/%m/%Y']:
-                            try:
-                                created_dt = datetime.strptime(str(created_at_str).split('.')[0], fmt)
-                                break
-                            except:
-                                continue
+            # 청크마다 데이터 준비(동적 컬럼 방식) 후 스테이징에 COPY, 마지막에 집합 단위 반영
+            fetched = 0
+            with StagingTable(conn, 'follow_sop', ['work_req_no', 'custom_data', 'created_at']) as stage:
+                for df in chunks:
+                    if fetched == 0:
+                        print(f"[DEBUG] FollowSOP DataFrame 컬럼: {list(df.columns)}")
+                    prepared = []
+
+                    # 값 정리와 날짜 파싱은 컬럼 단위로 한 번에 처리
+                    records = _sanitize_external_frame(df)
+                    created_at_values = _first_non_empty_series(records, [
+                        'created_at', 'CREATED_AT', '작업일자', 'work_date', 'WORK_DATE',
+                        '등록일', 'REG_DATE', 'reg_date',
+                    ])
+                    parsed_dates = _parse_datetime_series(created_at_values, _CREATED_AT_FORMATS)
+
+                    for record, created_at_str, parsed_dt in zip(_frame_records(records), created_at_values, parsed_dates):
+                        row_dict = _prepare_record_custom_data(record)
+                        custom_data = json.dumps(row_dict, ensure_ascii=False, default=str)
+
+                        # 날짜 파싱 결과 적용
+                        if created_at_str:
+                            if pd.isna(parsed_dt):
+                                # 파싱 실패시 현재 시간 사용
+                                print(f"[WARNING] 날짜 파싱 실패: {created_at_str}, 현재 시간 사용")
+                                created_dt = datetime.now()
+                            else:
+                                created_dt = parsed_dt.to_pydatetime()
                         else:
-                            # 파싱 실패시 현재 시간 사용
-                            print(f"[WARNING] 날짜 파싱 실패: {created_at_str}, 현재 시간 사용")
+                            # 날짜 필드가 없으면 현재 시간 사용
+                            print(f"[WARNING] 날짜 필드 없음, 현재 시간 사용")
                             created_dt = datetime.now()
-                    else:
-                        # 날짜 필드가 없으면 현재 시간 사용
-                        print(f"[WARNING] 날짜 필드 없음, 현재 시간 사용")
-                        created_dt = datetime.now()
-
-                    # FS 형식 번호 생성 - PostgreSQL에서 직접 조회
-                    date_str = created_dt.strftime('%y%m%d')
-
-                    # Check if we already have a counter for this date in current batch
-                    if date_str in date_counters:
-                        # Use the next counter from our batch tracking
-                        new_counter = date_counters[date_str] + 1
-                    else:
-                        # First time seeing this date in batch, query DB for last number
-                        pattern = f'FS{date_str}%'
-                        cursor.execute('''
-                            SELECT work_req_no FROM follow_sop
-                            WHERE work_req_no LIKE %s
-                            ORDER BY work_req_no DESC
-                            LIMIT 1
-                        ''', (pattern,))
-
-                        last_result = cursor.fetchone()
-                        if last_result and len(last_result[0]) == 12:  # FS(2) + YYMMDD(6) + NNNN(4) = 12
-                            try:
-                                last_counter = int(last_result[0][8:12])  # Extract exactly 4 digits
-                                new_counter = last_counter + 1
-                            except ValueError:
-                                new_counter = 1  # Start from 1 if parsing fails
-                        else:
-                            new_counter = 1  # Start from 1 for new date
-
-                    # Update counter for this date
-                    date_counters[date_str] = new_counter
-                    work_req_no = f'FS{date_str}{new_counter:04d}'
-                except Exception as e:
-                    # 번호 생성 실패시 원본 사용 또는 새 형식으로 생성
-                    work_req_no = str(
-                        row_dict.get('work_req_no') or
-                        row_dict.get('작업요청번호') or
-                        row_dict.get('work_request_number') or
-                        ''
-                    ).strip()
-                    if not work_req_no:
-                        # 새 형식으로 fallback: FSYYMMDDNNNN
-                        # idx가 크면 모듈로 연산으로 제한
-                        created_dt = datetime.now()
-                        date_str = created_dt.strftime('%y%m%d')
-                        safe_counter = (idx % 9999) + 1  # 1-9999 범위로 제한
-                        work_req_no = f'FS{date_str}{safe_counter:04d}'
-                    else:
-                        created_dt = datetime.now()
-
-                if idx == 0:  # 첫 번째 행만 디버깅
-                    print(f"[DEBUG] work_req_no: {work_req_no}")
-                    print(f"[DEBUG] custom_data 길이: {len(custom_data)}")
-                    print(f"[DEBUG] created_dt: {created_dt}")
-
-                # created_dt를 문자열로 변환하여 저장
-                created_at_iso = created_dt.strftime('%Y-%m-%d %H:%M:%S') if created_dt else None
-                rows.append((work_req_no, custom_data, created_at_iso))
-            
-            # 캐시 없이 직접 메인 테이블에 삽입 (PostgreSQL만 사용)
-            for work_req_no, custom_data, created_at_iso in rows:
-                cursor.execute('''
-                    INSERT INTO follow_sop (work_req_no, custom_data, created_at, is_deleted)
-                    VALUES (%s, %s, %s::timestamp, 0)
-                    ON CONFLICT (work_req_no) DO NOTHING
-                ''', (work_req_no, custom_data, created_at_iso))
-            
-            # 동기화된 데이터 활성화 (삭제 상태 해제)
-            for work_req_no, _, _ in rows:
-                cursor.execute('''
-                    UPDATE follow_sop SET is_deleted = 0
-                    WHERE work_req_no = %s
-                ''', (work_req_no,))
+                        prepared.append((custom_data, created_dt))
+
+                    # FS 형식 번호 - 날짜별로 필요한 개수만큼 id_counters 에서 한 번에 발급
+                    numbers = allocate_numbers_for_dates(
+                        'FS', [created_dt for _, created_dt in prepared], self.local_db_path)
+                    rows = [
+                        (work_req_no, custom_data, created_dt.strftime('%Y-%m-%d %H:%M:%S'))
+                        for work_req_no, (custom_data, created_dt) in zip(numbers, prepared)
+                    ]
+                    if fetched == 0 and rows:  # 첫 번째 행만 디버깅
+                        print(f"[DEBUG] work_req_no: {rows[0][0]}")
+                        print(f"[DEBUG] custom_data 길이: {len(rows[0][1])}")
+                        print(f"[DEBUG] created_dt: {rows[0][2]}")
+                    fetched += len(df)
+                    stage.load(rows)
+
+                # 캐시 없이 직접 메인 테이블에 삽입
+                written = stage.merge(['work_req_no'], on_conflict='nothing', insert_values={'is_deleted': '0'})
+                # 동기화된 데이터 활성화 (삭제 상태 해제)
+                stage.update_target(['work_req_no'], {'is_deleted': '0'})
+            print(f"[INFO] FollowSOP 데이터 조회 완료: {fetched} 건")
             
             conn.commit()
             conn.close()
             
-            print(f"[SUCCESS] ✅ FollowSOP 데이터 {len(df)}건 동기화 완료")
+            report_sync_rows(read=fetched, written=written)
+            print(f"[SUCCESS] ✅ FollowSOP 데이터 {fetched}건 동기화 완료")
             return True
             
         except Exception as e:
@@ -1418,12 +1659,8 @@ class PartnerDataManager:
             
             # 외부 DB에서 데이터 조회
             print("[INFO] IQADB_CONNECT310을 사용하여 FullProcess 데이터 조회 시작...")
-            df = execute_SQL(query)
-            df = _normalize_df(df)
-            df = df.replace({'None': None, 'null': None, 'NULL': None})
-            print(f"[INFO] FullProcess 데이터 조회 완료: {len(df)} 건")
-            
-            if df.empty:
+            first_chunk, chunks = _peek_chunks(iter_SQL(query))
+            if first_chunk is None:
                 print("[WARNING] 조회된 FullProcess 데이터가 없습니다.")
                 return False
             
@@ -1435,154 +1672,70 @@ class PartnerDataManager:
             # 트랜잭션 시작 (캐시 없이 직접 처리)
             cursor.execute("BEGIN")
             
-            # 배치 삽입을 위한 데이터 준비 (동적 컬럼 방식)
-            print(f"[DEBUG] FullProcess DataFrame 컬럼: {list(df.columns)}")
-            rows = []
-            date_counters = {}  # Track counters for each date within this batch
-            for idx, row in df.iterrows():
-                row_dict = _prepare_row_custom_data(row)
-
-                custom_data = json.dumps(row_dict, ensure_ascii=False, default=str)
-
-                created_at_str = (
-                    row_dict.get('created_at') or
-                    row_dict.get('CREATED_AT') or
-                    row_dict.get('평가일자') or
-                    row_dict.get('process_date') or
-                    row_dict.get('PROCESS_DATE') or
-                    row_dict.get('등록일') or
-                    row_dict.get('REG_DATE') or
-                    row_dict.get('reg_date') or
-                    ''
-                )
+            # 청크마다 데이터 준비(동적 컬럼 방식) → 날짜별 번호 일괄 발급 → COPY 삽입
+            fetched = 0
+            written = 0
+            for df in chunks:
+                df = _normalize_df(df)
+                df = df.replace({'None': None, 'null': None, 'NULL': None})
+                if fetched == 0:
+                    print(f"[DEBUG] FullProcess DataFrame 컬럼: {list(df.columns)}")
+                prepared = []
+
+                # 값 정리와 날짜 파싱은 컬럼 단위로 한 번에 처리
+                records = _sanitize_external_frame(df)
+                created_at_values = _first_non_empty_series(records, [
+                    'created_at', 'CREATED_AT', '평가일자', 'process_date', 'PROCESS_DATE',
+                    '등록일', 'REG_DATE', 'reg_date',
+                ])
+                parsed_dates = _parse_datetime_series(created_at_values, _CREATED_AT_FORMATS)
+
+                for record, created_at_str, parsed_dt in zip(_frame_records(records), created_at_values, parsed_dates):
+                    row_dict = _prepare_record_custom_data(record)
 
-                # 날짜 파싱 시도
-                try:
+                    custom_data = json.dumps(row_dict, ensure_ascii=False, default=str)
+
+                    # 날짜 파싱 결과 적용
                     if created_at_str:
-                        # 다양한 날짜 형식 파싱 시도
-                        for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y/%m/%d', '%Y%m%d', '%d-%b-%y', '%d/%m/%Y']:
-                            try:
-                                created_dt = datetime.strptime(str(created_at_str).split('.')[0], fmt)
-                                break
-                            except:
-                                continue
-                        else:
+                        if pd.isna(parsed_dt):
                             # 파싱 실패시 현재 시간 사용
                             print(f"[WARNING] 날짜 파싱 실패: {created_at_str}, 현재 시간 사용")
                             created_dt = datetime.now()
+                        else:
+                            created_dt = parsed_dt.to_pydatetime()
                     else:
                         # 날짜 필드가 없으면 현재 시간 사용
                         print(f"[WARNING] 날짜 필드 없음, 현재 시간 사용")
                         created_dt = datetime.now()
+                    prepared.append((custom_data, created_dt))
+
+                # FP 형식 번호 - 날짜별로 필요한 개수만큼 id_counters 에서 한 번에 발급
+                # (발급된 번호는 다른 등록/동기화와 겹치지 않으므로 별도 중복 확인이 필요 없다)
+                numbers = allocate_numbers_for_dates(
+                    'FP', [created_dt for _, created_dt in prepared], self.local_db_path)
+                rows = [
+                    (fullprocess_number, custom_data, created_dt.strftime('%Y-%m-%d %H:%M:%S'))
+                    for fullprocess_number, (custom_data, created_dt) in zip(numbers, prepared)
+                ]
+                if fetched == 0 and rows:  # 첫 번째 행만 디버깅
+                    print(f"[DEBUG] fullprocess_number: {rows[0][0]}")
+                    print(f"[DEBUG] custom_data 길이: {len(rows[0][1])}")
+
+                # INSERT - COPY 로 일괄 삽입, 신규 행이므로 is_deleted = 0
+                written += copy_rows(
+                    conn, 'full_process',
+                    ['fullprocess_number', 'custom_data', 'created_at', 'is_deleted'],
+                    (row + (0,) for row in rows),
+                )
+                fetched += len(df)
 
-                    # FP 형식 번호 생성 - PostgreSQL에서 직접 조회
-                    date_str = created_dt.strftime('%y%m%d')
-
-                    # Check if we already have a counter for this date in current batch
-                    if date_str in date_counters:
-                        # Use the next counter from our batch tracking
-                        new_counter = date_counters[date_str] + 1
-                    else:
-                        # First time seeing this date in batch, query DB for last number
-                        pattern = f'FP{date_str}%'
-                        cursor.execute('''
-                            SELECT fullprocess_number FROM full_process
-                            WHERE fullprocess_number LIKE %s
-                            ORDER BY fullprocess_number DESC
-                            LIMIT 1
-                        ''', (pattern,))
-
-                        last_result = cursor.fetchone()
-                        if last_result and len(last_result[0]) == 13:  # FP(2) + YYMMDD(6) + NNNNN(5) = 13
-                            try:
-                                last_counter = int(last_result[0][8:13])  # Extract exactly 5 digits
-                                new_counter = last_counter + 1
-                            except ValueError:
-                                new_counter = 1  # Start from 1 if parsing fails
-                        else:
-                            new_counter = 1  # Start from 1 for new date
-
-                    # Update counter for this date
-                    date_counters[date_str] = new_counter
-                    fullprocess_number = f'FP{date_str}{new_counter:05d}'
-                except Exception as e:
-                    # 번호 생성 실패시 원본 사용 또는 새 형식으로 생성
-                    fullprocess_number = str(
-                        row_dict.get('fullprocess_number') or
-                        row_dict.get('프로세스번호') or
-                        row_dict.get('process_number') or
-                        ''
-                    ).strip()
-                    if not fullprocess_number:
-                        # 새 형식으로 fallback: FPYYMMDDNNNNN
-                        # idx가 크면 모듈로 연산으로 제한
-                        created_dt = datetime.now()
-                        date_str = created_dt.strftime('%y%m%d')
-                        safe_counter = (idx % 99999) + 1  # 1-99999 범위로 제한
-                        fullprocess_number = f'FP{date_str}{safe_counter:05d}'
-                
-                if idx == 0:  # 첫 번째 행만 디버깅
-                    print(f"[DEBUG] fullprocess_number: {fullprocess_number}")
-                    print(f"[DEBUG] custom_data 길이: {len(custom_data)}")
-                
-                # created_dt를 문자열로 변환하여 저장
-                created_at_iso = created_dt.strftime('%Y-%m-%d %H:%M:%S') if created_dt else None
-                rows.append((fullprocess_number, custom_data, created_at_iso))
-            
-            # 캐시 없이 직접 메인 테이블에 삽입 (PostgreSQL만 사용)
-            for idx, (fullprocess_number, custom_data, created_at_iso) in enumerate(rows):
-                # 중복 체크: 이미 존재하는 번호면 새로 생성
-                cursor.execute('''
-                    SELECT 1 FROM full_process WHERE fullprocess_number = %s
-                ''', (fullprocess_number,))
-
-                if cursor.fetchone():
-                    # 중복이면 새 번호 생성 (날짜 + 인덱스 기반)
-                    from id_generator import generate_fullprocess_number
-                    if created_at_iso:
-                        created_dt = datetime.strptime(created_at_iso, '%Y-%m-%d %H:%M:%S')
-                    else:
-                        created_dt = datetime.now()
-
-                    # PostgreSQL에서 마지막 번호 조회
-                    date_str = created_dt.strftime('%y%m%d')
-                    pattern = f'FP{date_str}%'
-                    cursor.execute('''
-                        SELECT fullprocess_number FROM full_process
-                        WHERE fullprocess_number LIKE %s
-                        ORDER BY fullprocess_number DESC
-                        LIMIT 1
-                    ''', (pattern,))
-
-                    last_result = cursor.fetchone()
-                    if last_result and len(last_result[0]) >= 13:  # FPYYMMDDNNNNN 최소 13자리
-                        try:
-                            last_counter = int(last_result[0][8:13])  # FP(2) + YYMMDD(6) 이후 5자리만
-                            new_counter = last_counter + 1
-                        except ValueError:
-                            new_counter = 1
-                    else:
-                        new_counter = 1
-
-                    fullprocess_number = f'FP{date_str}{new_counter:05d}'
-
-                # INSERT (중복 체크 완료)
-                cursor.execute('''
-                    INSERT INTO full_process (fullprocess_number, custom_data, created_at, is_deleted)
-                    VALUES (%s, %s, %s::timestamp, 0)
-                ''', (fullprocess_number, custom_data, created_at_iso))
-            
-            # 동기화된 데이터 활성화 (삭제 상태 해제)
-            for fullprocess_number, _, _ in rows:
-                cursor.execute('''
-                    UPDATE full_process SET is_deleted = 0
-                    WHERE fullprocess_number = %s
-                ''', (fullprocess_number,))
+            print(f"[INFO] FullProcess 데이터 조회 완료: {fetched} 건")
             
             conn.commit()
             conn.close()
             
-            print(f"[SUCCESS] ✅ FullProcess 데이터 {len(df)}건 동기화 완료")
+            report_sync_rows(read=fetched, written=written)
+            print(f"[SUCCESS] ✅ FullProcess 데이터 {fetched}건 동기화 완료")
             return True
 
         except Exception as e:
@@ -1590,7 +1743,7 @@ class PartnerDataManager:
             traceback.print_exc()
             return False
 
-    def _sync_subcontract_board_from_external(self, query_keys, table_name, id_column, date_candidates, generator_import_path, board_name):
+    def _sync_subcontract_board_from_external(self, query_keys, table_name, id_column, date_candidates, id_prefix, board_name):
         if not IQADB_AVAILABLE:
             print(f"[ERROR] IQADB_CONNECT310 모듈을 사용할 수 없습니다. ({board_name})")
             return False
@@ -1609,54 +1762,68 @@ class PartnerDataManager:
             return False
 
         print(f"[INFO] 실행할 {board_name} 쿼리: {query[:100]}...")
-        df = execute_SQL(query)
-        df = _normalize_df(df)
-        print(f"[INFO] {board_name} 데이터 조회 완료: {len(df)} 건")
-
-        if df.empty:
+        first_chunk, chunks = _peek_chunks(iter_SQL(query))
+        if first_chunk is None:
             print(f"[WARNING] 조회된 {board_name} 데이터가 없습니다.")
             return False
 
-        module_name, func_name = generator_import_path.rsplit('.', 1)
-        generator_func = getattr(__import__(module_name, fromlist=[func_name]), func_name)
-
         conn = get_db_connection(self.local_db_path, timeout=30.0)
         cursor = conn.cursor()
         try:
             cursor.execute("BEGIN")
             processed = 0
-            for _, row in df.iterrows():
-                row_dict = _prepare_row_custom_data(row)
-
-                created_value = _first_non_empty(row_dict, date_candidates)
-                created_dt = _coerce_datetime_value(created_value) or datetime.now()
-                created_at_iso = created_dt.strftime('%Y-%m-%d %H:%M:%S')
-
-                identifier = _first_non_empty(row_dict, [id_column])
-                identifier = (str(identifier).strip() if identifier else '')
-                if not identifier:
-                    identifier = generator_func(self.local_db_path, created_dt)
-
-                row_dict[id_column] = identifier
-                if not _row_get(row_dict, 'created_at'):
-                    row_dict['created_at'] = created_at_iso
-
-                custom_json = json.dumps(row_dict, ensure_ascii=False, default=str)
-
-                cursor.execute(
-                    f"""
-                    INSERT INTO {table_name} ({id_column}, custom_data, created_at, is_deleted, updated_at)
-                    VALUES (%s, %s, %s::timestamp, 0, %s::timestamp)
-                    ON CONFLICT ({id_column}) DO UPDATE
-                    SET custom_data = EXCLUDED.custom_data,
-                        updated_at = EXCLUDED.updated_at,
-                        is_deleted = 0
-                    """,
-                    (identifier, custom_json, created_at_iso, created_at_iso),
+            source_ids = []
+            # 청크마다 COPY → 스테이징, 마지막에 단일 업서트 (중복 식별자는 마지막 행 우선)
+            with StagingTable(conn, table_name, [id_column, 'custom_data', 'created_at', 'updated_at']) as stage:
+                for df in chunks:
+                    # 값 정리, 날짜 파싱, 식별자 추출은 컬럼 단위로 한 번에 처리
+                    records = _sanitize_external_frame(_normalize_df(df))
+                    created_values = _first_non_empty_series(records, _key_variants(date_candidates))
+                    present = created_values.notna()
+                    created_values[present] = created_values[present].astype(str).str.replace('T', ' ', regex=False)
+                    parsed_dates = _parse_datetime_series(created_values)
+                    identifiers = _first_non_empty_series(records, _key_variants([id_column]))
+                    identifiers = identifiers.where(identifiers.isna(), identifiers.astype(str).str.strip())
+
+                    prepared = []
+                    for record, parsed_dt, identifier in zip(_frame_records(records), parsed_dates, identifiers):
+                        created_dt = datetime.now() if pd.isna(parsed_dt) else parsed_dt.to_pydatetime()
+                        prepared.append((_prepare_record_custom_data(record), created_dt, identifier or ''))
+
+                    source_ids.extend(identifier for _, _, identifier in prepared if identifier)
+                    # 식별자가 없는 행은 날짜별로 필요한 개수만큼 번호를 한 번에 발급
+                    missing = [index for index, (_, _, identifier) in enumerate(prepared) if not identifier]
+                    if missing:
+                        numbers = allocate_numbers_for_dates(
+                            id_prefix, [prepared[index][1] for index in missing], self.local_db_path)
+                        for index, number in zip(missing, numbers):
+                            row_dict, created_dt, _ = prepared[index]
+                            prepared[index] = (row_dict, created_dt, number)
+
+                    rows = []
+                    for row_dict, created_dt, identifier in prepared:
+                        created_at_iso = created_dt.strftime('%Y-%m-%d %H:%M:%S')
+                        row_dict[id_column] = identifier
+                        if not _row_get(row_dict, 'created_at'):
+                            row_dict['created_at'] = created_at_iso
+
+                        custom_json = json.dumps(row_dict, ensure_ascii=False, default=str)
+                        rows.append((identifier, custom_json, created_at_iso, created_at_iso))
+                    stage.load(rows)
+                    processed += len(rows)
+
+                written = stage.merge(
+                    [id_column],
+                    update_cols=['custom_data', 'updated_at'],
+                    insert_values={'is_deleted': '0'},
+                    update_values={'is_deleted': '0'},
                 )
-                processed += 1
+            print(f"[INFO] {board_name} 데이터 조회 완료: {processed} 건")
 
+            # 원본 SA/SR 번호가 이후 자동 발급 번호와 겹치지 않도록 카운터에 반영
+            register_explicit_ids(conn, source_ids)
             conn.commit()
+            report_sync_rows(read=processed, written=written)
             print(f"[SUCCESS] ✅ {board_name} 데이터 {processed}건 동기화 완료")
             return True
         except Exception as e:
@@ -1683,7 +1850,7 @@ class PartnerDataManager:
                 'approval_end_date',
                 'ehs_evaluation_date',
             ],
-            generator_import_path='id_generator.generate_subcontract_approval_number',
+            id_prefix='SA',
             board_name='Subcontract Approval',
         )
 
@@ -1699,7 +1866,7 @@ class PartnerDataManager:
                 'subcontract_start_date',
                 'subcontract_end_date',
             ],
-            generator_import_path='id_generator.generate_subcontract_report_number',
+            id_prefix='SR',
             board_name='Subcontract Report',
         )
 
@@ -2006,7 +2173,34 @@ class PartnerDataManager:
                     cursor = conn.cursor()
                     print("[DEBUG-13] 트랜잭션 재시작")
 
-                for row_idx, row_data in enumerate(rows):
+                # 일괄 업서트 (COPY → 스테이징 → 단일 INSERT ... ON CONFLICT)
+                # 실패하면 아래 행 단위 삽입으로 재시도해 문제 행만 건너뛴다.
+                pending_rows = rows
+                cursor.execute("SAVEPOINT sp_bulk")
+                try:
+                    bulk_merge(
+                        conn, 'partner_change_requests',
+                        [
+                            'request_number', 'requester_name', 'requester_department',
+                            'company_name', 'business_number', 'change_type',
+                            'current_value', 'new_value', 'change_reason',
+                            'status', 'other_info', 'final_check_date', 'custom_data',
+                            'created_at',
+                        ],
+                        rows,
+                        key_cols=['request_number'],
+                        insert_values={'is_deleted': '0'},
+                        update_values={'is_deleted': '0', 'updated_at': 'CURRENT_TIMESTAMP'},
+                    )
+                    cursor.execute("RELEASE SAVEPOINT sp_bulk")
+                    success_count = len(rows)
+                    pending_rows = []
+                    print(f"[DEBUG-14] 일괄 업서트 성공: {success_count}개")
+                except Exception as bulk_error:
+                    print(f"[WARN] 일괄 업서트 실패: {bulk_error}. 행 단위 삽입으로 재시도")
+                    cursor.execute("ROLLBACK TO SAVEPOINT sp_bulk")
+
+                for row_idx, row_data in enumerate(pending_rows):
                     if row_idx == 0:
                         print(f"\n[DEBUG-14] 첫 번째 INSERT 시도:")
                         print(f"  row_data 개수: {len(row_data)}")
@@ -2214,17 +2408,18 @@ class PartnerDataManager:
                 query += " AND permanent_workers <= %s"
                 params.append(filters['workers_max'])
         
-        # 전체 개수 조회
-        count_query = query.replace("SELECT *", "SELECT COUNT(*)")
-        total_count = conn.execute(count_query, params).fetchone()[0]
+        # 전체 개수 조회 (대용량 무필터 목록은 추정치, 그 외는 짧은 TTL 캐시 - db/counting.py)
+        count = count_rows(conn, 'partners_cache', query, params, filters)
         
         # 페이징 적용 - 상시근로자 수 큰 순으로 정렬 (SQLite 호환)
+        offset = (page - 1) * per_page
         query += " ORDER BY (permanent_workers IS NULL), permanent_workers DESC, company_name LIMIT %s OFFSET %s"
-        params.extend([per_page, (page - 1) * per_page])
+        params.extend([per_page, offset])
         
         partners = conn.execute(query, params).fetchall()
         conn.close()
         
+        total_count = reconcile_total(count, offset, len(partners), per_page)
         return partners, total_count
 
 class DatabaseConfig:
@@ -2246,12 +2441,24 @@ class DatabaseConfig:
 db_config = DatabaseConfig()
 partner_manager = PartnerDataManager()
 
+# job_scheduler 실행 이력에 남는 작업 이름
+DAILY_SYNC_JOB = 'daily-sync'
+MASTER_SYNC_JOB = 'master-data-sync'
+CONTENT_SYNC_JOB = 'content-once-sync'
+
+
 def maybe_daily_sync(force=False):
     """하루에 한 번만 동기화하는 유틸리티 함수
     
+    실행과 소스별 결과는 job_scheduler 이력(DAILY_SYNC_JOB)에 남고,
+    마지막 성공 시각도 그 이력에서 읽는다 (이력이 없으면 전환 전 sync_state 행).
+
     Args:
         force: True면 무조건 동기화 실행 (최초 실행 시 사용)
     """
+    from job_scheduler import last_success_at, record_run
+    from timezone_config import get_korean_time
+
     conn = get_db_connection(db_config.local_db_path)
     cur = conn.cursor()
     
@@ -2271,116 +2478,117 @@ def maybe_daily_sync(force=False):
         force = True
     
     # 마지막 동기화 시간 확인
-    row = cur.execute("SELECT last_full_sync FROM sync_state WHERE id=1").fetchone()
+    last = last_success_at(DAILY_SYNC_JOB)
+    if last is None:
+        row = cur.execute("SELECT last_full_sync FROM sync_state WHERE id=1").fetchone()
+        last = row[0] if row and row[0] else None
     need_sync = True
     
-    if row and row[0]:
-        last = pd.to_datetime(row[0])
-        need_sync = (pd.Timestamp.now() - last) > pd.Timedelta(days=1)
-        print(f"[INFO] 마지막 동기화: {row[0]}, 동기화 필요: {need_sync}")
+    if last is not None:
+        # 실행 이력의 시각은 naive KST 이므로 현재 시각도 서버 시간대가 아닌 KST 로 비교한다
+        now = pd.Timestamp(get_korean_time().replace(tzinfo=None))
+        need_sync = (now - pd.to_datetime(last)) > pd.Timedelta(days=1)
+        print(f"[INFO] 마지막 동기화: {last}, 동기화 필요: {need_sync}")
     else:
         print("[INFO] 첫 동기화 수행 필요")
     
     if force or need_sync:
-        print("[INFO] 일일 동기화 시작...")
-        success = False
-        
-        # 협력사 데이터 동기화
-        try:
-            if partner_manager.sync_partners_from_external_db():
-                success = True
-                print("[SUCCESS] 협력사 데이터 동기화 완료")
-        except Exception as e:
-            print(f"[ERROR] 협력사 동기화 실패: {e}")
+        with record_run(DAILY_SYNC_JOB, 'manual' if force else 'boot') as run:
+            print("[INFO] 일일 동기화 시작...")
+            success = False
         
-        # 사고 데이터 동기화
-        try:
-            if partner_manager.sync_accidents_from_external_db():
-                success = True
-                print("[SUCCESS] 사고 데이터 동기화 완료")
-        except Exception as e:
-            print(f"[ERROR] 사고 동기화 실패: {e}")
+            # 협력사 데이터 동기화
+            try:
+                if run.run_source('partners', partner_manager.sync_partners_from_external_db):
+                    success = True
+                    print("[SUCCESS] 협력사 데이터 동기화 완료")
+            except Exception as e:
+                print(f"[ERROR] 협력사 동기화 실패: {e}")
         
-        # 임직원 데이터 동기화: LOCAL_DATA_QUERIES 전용, IQADB fallback 없음
-        try:
-            if partner_manager.config.has_option('LOCAL_DATA_QUERIES', 'EMPLOYEE_QUERY'):
-                if partner_manager.sync_employees_from_external_db():
+            # 사고 데이터 동기화
+            try:
+                if run.run_source('accidents', partner_manager.sync_accidents_from_external_db):
                     success = True
-                    print("[SUCCESS] 임직원 데이터 동기화 완료")
-            else:
-                print("[INFO] LOCAL_DATA_QUERIES.EMPLOYEE_QUERY not found - skip")
-        except Exception as e:
-            print(f"[ERROR] 임직원 동기화 실패: {e}")
+                    print("[SUCCESS] 사고 데이터 동기화 완료")
+            except Exception as e:
+                print(f"[ERROR] 사고 동기화 실패: {e}")
+        
+            # 임직원 데이터 동기화: LOCAL_DATA_QUERIES 전용, IQADB fallback 없음
+            try:
+                if partner_manager.config.has_option('LOCAL_DATA_QUERIES', 'EMPLOYEE_QUERY'):
+                    if run.run_source('employees', partner_manager.sync_employees_from_external_db):
+                        success = True
+                        print("[SUCCESS] 임직원 데이터 동기화 완료")
+                else:
+                    print("[INFO] LOCAL_DATA_QUERIES.EMPLOYEE_QUERY not found - skip")
+            except Exception as e:
+                print(f"[ERROR] 임직원 동기화 실패: {e}")
             
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'DEPARTMENT_QUERY'):
-                partner_manager.sync_departments_from_external_db()
-        except Exception as e:
-            print(f"[ERROR] 부서 동기화 실패: {e}")
+            try:
+                if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'DEPARTMENT_QUERY'):
+                    run.run_source('departments', partner_manager.sync_departments_from_external_db)
+            except Exception as e:
+                print(f"[ERROR] 부서 동기화 실패: {e}")
             
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'BUILDING_QUERY'):
-                partner_manager.sync_buildings_from_external_db()
-        except Exception as e:
-            print(f"[ERROR] 건물 동기화 실패: {e}")
+            try:
+                if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'BUILDING_QUERY'):
+                    run.run_source('buildings', partner_manager.sync_buildings_from_external_db)
+            except Exception as e:
+                print(f"[ERROR] 건물 동기화 실패: {e}")
             
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'CONTRACTOR_QUERY'):
-                partner_manager.sync_contractors_from_external_db()
-        except Exception as e:
-            print(f"[ERROR] 협력사 근로자 동기화 실패: {e}")
+            try:
+                if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'CONTRACTOR_QUERY'):
+                    run.run_source('contractors', partner_manager.sync_contractors_from_external_db)
+            except Exception as e:
+                print(f"[ERROR] 협력사 근로자 동기화 실패: {e}")
             
-        # 환경안전지시서는 최초 1회만 동기화 (이미 데이터가 있으면 절대 동기화 안 함)
-        try:
-            if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'SAFETY_INSTRUCTIONS_QUERY'):
-                # 동기화 이력 테이블 확인/생성
-                cur.execute('''
-                    CREATE TABLE IF NOT EXISTS safety_instructions_sync_history (
-                        id INTEGER PRIMARY KEY CHECK (id=1),
-                        first_sync_done INTEGER DEFAULT 0,
-                        sync_date TIMESTAMP,
-                        record_count INTEGER
-                    )
-                ''')
+            # 환경안전지시서는 최초 1회만 동기화 (이미 데이터가 있으면 절대 동기화 안 함)
+            try:
+                if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'SAFETY_INSTRUCTIONS_QUERY'):
+                    # 동기화 이력 테이블 확인/생성
+                    cur.execute('''
+                        CREATE TABLE IF NOT EXISTS safety_instructions_sync_history (
+                            id INTEGER PRIMARY KEY CHECK (id=1),
+                            first_sync_done INTEGER DEFAULT 0,
+                            sync_date TIMESTAMP,
+                            record_count INTEGER
+                        )
+                    ''')
                 
-                # 동기화 이력 확인
-                cur.execute("SELECT first_sync_done FROM safety_instructions_sync_history WHERE id=1")
-                sync_history = cur.fetchone()
+                    # 동기화 이력 확인
+                    cur.execute("SELECT first_sync_done FROM safety_instructions_sync_history WHERE id=1")
+                    sync_history = cur.fetchone()
                 
-                if not sync_history or sync_history[0] == 0:
-                    # 최초 1회만 실행
-                    print("[INFO] 환경안전지시서 최초 1회 동기화 실행")
-                    partner_manager.sync_safety_instructions_from_external_db()
+                    if not sync_history or sync_history[0] == 0:
+                        # 최초 1회만 실행
+                        print("[INFO] 환경안전지시서 최초 1회 동기화 실행")
+                        run.run_source('safety_instructions', partner_manager.sync_safety_instructions_from_external_db)
                     
-                    # 동기화 완료 기록
-                    cur.execute("SELECT COUNT(*) FROM safety_instructions_cache")
-                    count = cur.fetchone()[0]
-                    # safe_upsert 사용
-                    sync_data = {
-                        'id': 1,
-                        'first_sync_done': 1,
-                        'sync_date': None,  # 자동으로 처리됨
-                        'record_count': count
-                    }
-                    safe_upsert(conn, 'safety_instructions_sync_history', sync_data)
-                    conn.commit()
-                    print(f"[SUCCESS] 환경안전지시서 최초 동기화 완료: {count}건")
-                else:
-                    cur.execute("SELECT COUNT(*) FROM safety_instructions_cache")
-                    current_count = cur.fetchone()[0]
-                    print(f"[INFO] 환경안전지시서 동기화 영구 스킵 (최초 동기화 완료됨, 현재 {current_count}건)")
-        except Exception as e:
-            print(f"[ERROR] 안전지시서 동기화 실패: {e}")
+                        # 동기화 완료 기록
+                        cur.execute("SELECT COUNT(*) FROM safety_instructions_cache")
+                        count = cur.fetchone()[0]
+                        # safe_upsert 사용
+                        sync_data = {
+                            'id': 1,
+                            'first_sync_done': 1,
+                            'sync_date': None,  # 자동으로 처리됨
+                            'record_count': count
+                        }
+                        safe_upsert(conn, 'safety_instructions_sync_history', sync_data)
+                        conn.commit()
+                        print(f"[SUCCESS] 환경안전지시서 최초 동기화 완료: {count}건")
+                    else:
+                        cur.execute("SELECT COUNT(*) FROM safety_instructions_cache")
+                        current_count = cur.fetchone()[0]
+                        print(f"[INFO] 환경안전지시서 동기화 영구 스킵 (최초 동기화 완료됨, 현재 {current_count}건)")
+            except Exception as e:
+                print(f"[ERROR] 안전지시서 동기화 실패: {e}")
         
-        # 동기화 성공 시 마지막 동기화 시간 업데이트 (safe_upsert 사용)
-        if success:
-            sync_data = {
-                'id': 1,
-                'last_full_sync': pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            safe_upsert(conn, 'sync_state', sync_data)
-            conn.commit()
-            print(f"[SUCCESS] 일일 동기화 완료: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            # 성공 여부는 실행 이력에 남고, 다음 확인 때 last_success_at() 으로 읽힌다
+            if success:
+                print(f"[SUCCESS] 일일 동기화 완료: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            else:
+                run.fail("협력사/사고/임직원 동기화 모두 실패")
     else:
         print("[INFO] 동기화 스킵 (24시간 미경과)")
     
@@ -2408,120 +2616,149 @@ def _ensure_boot_sync_tables(conn):
     """)
     conn.commit()
 
-def maybe_daily_sync_master(force=False):
+def permission_sync_with_master_data():
+    """[PERMISSION] master_sync_with_master_data: 권한 마스터 동기화를 마스터 동기화 안에서(부서 이후) 실행할지"""
+    return (config.getboolean('PERMISSION', 'enabled', fallback=False)
+            and config.getboolean('PERMISSION', 'master_sync_with_master_data', fallback=False))
+
+
+def _run_permission_master_sync():
+    from importlib import import_module
+
+    import_module('scripts.sync_permission_master_data').main()
+
+
+def master_sync_sources(include_permission=None):
     """
-    마스터 데이터(협력사, 사고, 부서, 건물, 협력사근로자): 매일 1회.
-    - 공용DB 항목은 [MASTER_DATA_QUERIES] 기준으로 수행.
-    - 임직원은 보안상 [LOCAL_DATA_QUERIES] 기준으로 전용 PostgreSQL에서만 수행.
+    마스터 동기화 소스 목록 (sync_orchestrator.run_sync_sources 입력).
+    - 쿼리가 없는 소스는 enabled=False 로 넣어 결과에 skipped 로 남긴다.
+    - 권한 마스터 동기화는 permission_sync_with_master_data() 가 켜져 있으면 임직원/부서 동기화가 성공한 뒤 실행한다.
     """
-    import pandas as pd
-    conn = get_db_connection(db_config.local_db_path)
-    _ensure_boot_sync_tables(conn)
-    cur = conn.cursor()
+    from sync_orchestrator import SyncSource, get_orchestrator_settings, source_timeout
+
+    _, default_timeout = get_orchestrator_settings()
+    cfg = partner_manager.config
+    specs = [
+        ('partners', '협력사', partner_manager.sync_partners_from_external_db, 'MASTER_DATA_QUERIES', 'PARTNERS_QUERY'),
+        ('accidents', '사고', partner_manager.sync_accidents_from_external_db, 'MASTER_DATA_QUERIES', 'ACCIDENTS_QUERY'),
+        # 임직원: LOCAL_DATA_QUERIES 전용, IQADB fallback 없음
+        ('employees', '임직원', partner_manager.sync_employees_from_external_db, 'LOCAL_DATA_QUERIES', 'EMPLOYEE_QUERY'),
+        ('departments', '부서', partner_manager.sync_departments_from_external_db, 'MASTER_DATA_QUERIES', 'DEPARTMENT_QUERY'),
+        ('buildings', '건물', partner_manager.sync_buildings_from_external_db, 'MASTER_DATA_QUERIES', 'BUILDING_QUERY'),
+        ('contractors', '협력사 근로자', partner_manager.sync_contractors_from_external_db, 'MASTER_DATA_QUERIES', 'CONTRACTOR_QUERY'),
+        ('divisions', '사업부', partner_manager.sync_divisions_from_external_db, 'MASTER_DATA_QUERIES', 'DIVISION_QUERY'),
+    ]
+    sources = []
+    for name, label, runner, section, option in specs:
+        enabled = cfg.has_option(section, option)
+        sources.append(SyncSource(
+            name=name,
+            label=label,
+            runner=runner,
+            timeout=source_timeout(name, default_timeout),
+            enabled=enabled,
+            skip_reason='' if enabled else f"{section}.{option} not found",
+        ))
+
+    if include_permission is None:
+        include_permission = permission_sync_with_master_data()
+    if include_permission:
+        sources.append(SyncSource(
+            name='permission_master',
+            label='권한 마스터',
+            runner=_run_permission_master_sync,
+            depends_on=('employees', 'departments'),
+            timeout=source_timeout('permission_master', default_timeout),
+        ))
+    return sources
+
+
+def _synced_today(job_name, legacy_table, legacy_column):
+    """
+    오늘(KST) 이미 성공한 실행이 있는지 (job_scheduler 실행 이력 기준).
+    이력이 아직 없으면 전환 전 상태 행(legacy_table.legacy_column)을 본다.
+    """
+    from job_scheduler import last_success_at
+    from timezone_config import get_korean_time
 
-    need = True
-    if not force:
-        row = cur.execute("SELECT last_master_sync FROM master_sync_state WHERE id=1").fetchone()
-        if row and row[0]:
-            from timezone_config import get_korean_time
-            last = pd.to_datetime(row[0])
-            today = get_korean_time().date()
-            need = last.date() < today
+    last = last_success_at(job_name)
+    if last is None:
+        conn = get_db_connection(db_config.local_db_path)
+        try:
+            _ensure_boot_sync_tables(conn)
+            row = conn.execute(f"SELECT {legacy_column} FROM {legacy_table} WHERE id=1").fetchone()
+        finally:
+            conn.close()
+        if not row or not row[0]:
+            return False
+        last = pd.to_datetime(row[0])
+    return last.date() >= get_korean_time().date()
 
-    if not need and not force:
-        print("[INFO] Master daily sync skipped (already synced today)")
-        conn.close()
-        return
 
+def run_master_sync(run):
+    """마스터 소스 동기화를 실행하고 소스별 결과를 run(job_scheduler.JobRun)에 기록. 하나라도 성공하면 True"""
     print("[INFO] 마스터 데이터 동기화 시작...")
-    
+
     # 먼저 모든 캐시 테이블 구조 확인/생성 (init_local_tables 호출)
     partner_manager.init_local_tables()
-    
-    # sync 파트(쿼리 존재 시에만)
-    success = False
-    
-    # 협력사 데이터 동기화
-    try:
-        if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'PARTNERS_QUERY'):
-            if partner_manager.sync_partners_from_external_db():
-                success = True
-                print("[SUCCESS] 협력사 데이터 동기화 완료")
-        else:
-            print("[INFO] PARTNERS_QUERY not found - skip")
-    except Exception as e:
-        print(f"[ERROR] 협력사 동기화 실패: {e}")
 
-    # 사고 데이터 동기화
-    try:
-        if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'ACCIDENTS_QUERY'):
-            if partner_manager.sync_accidents_from_external_db():
-                success = True
-                print("[SUCCESS] 사고 데이터 동기화 완료")
-        else:
-            print("[INFO] ACCIDENTS_QUERY not found - skip")
-    except Exception as e:
-        print(f"[ERROR] 사고 동기화 실패: {e}")
-
-    # 임직원 데이터 동기화: LOCAL_DATA_QUERIES 전용, IQADB fallback 없음
-    try:
-        if partner_manager.config.has_option('LOCAL_DATA_QUERIES', 'EMPLOYEE_QUERY'):
-            if partner_manager.sync_employees_from_external_db():
-                success = True
-                print("[SUCCESS] 임직원 데이터 동기화 완료")
+    # sync 파트(쿼리 존재 시에만) - 독립 소스는 동시에, 의존 소스는 선행 소스 성공 후 실행
+    from sync_orchestrator import run_sync_sources
+    outcomes = run_sync_sources(master_sync_sources())
+    run.record_outcomes(outcomes)
+    success = False
+    for name, outcome in outcomes.items():
+        if outcome.ok:
+            success = True
+            print(f"[SUCCESS] {name} 동기화 완료 ({outcome.elapsed:.1f}s)")
+        elif outcome.status == 'skipped':
+            print(f"[INFO] {name} 동기화 건너뜀: {outcome.detail}")
         else:
-            print("[INFO] LOCAL_DATA_QUERIES.EMPLOYEE_QUERY not found - skip")
-    except Exception as e:
-        print(f"[ERROR] 임직원 동기화 실패: {e}")
-        
-    try:
-        if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'DEPARTMENT_QUERY'):
-            partner_manager.sync_departments_from_external_db()
-            print("[SUCCESS] 부서 데이터 동기화 완료")
-    except Exception as e:
-        print(f"[ERROR] 부서 동기화 실패: {e}")
-        
-    try:
-        if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'BUILDING_QUERY'):
-            partner_manager.sync_buildings_from_external_db()
-            print("[SUCCESS] 건물 데이터 동기화 완료")
-    except Exception as e:
-        print(f"[ERROR] 건물 동기화 실패: {e}")
-        
-    try:
-        if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'CONTRACTOR_QUERY'):
-            partner_manager.sync_contractors_from_external_db()
-            print("[SUCCESS] 협력사 근로자 데이터 동기화 완료")
-    except Exception as e:
-        print(f"[ERROR] 협력사 근로자 동기화 실패: {e}")
+            print(f"[ERROR] {name} 동기화 {outcome.status}: {outcome.detail}")
 
-    try:
-        if partner_manager.config.has_option('MASTER_DATA_QUERIES', 'DIVISION_QUERY'):
-            partner_manager.sync_divisions_from_external_db()
-            print("[SUCCESS] 사업부 데이터 동기화 완료")
-    except Exception as e:
-        print(f"[ERROR] 사업부 동기화 실패: {e}")
-
-    # 동기화 성공 시 마지막 동기화 시간 업데이트 (safe_upsert 사용)
-    if success or force:
-        sync_data = {
-            'id': 1,
-            'last_master_sync': None  # datetime('now') 또는 CURRENT_TIMESTAMP로 자동 처리됨
-        }
-        safe_upsert(conn, 'master_sync_state', sync_data)
-        conn.commit()
+    if success:
         print(f"[SUCCESS] 마스터 데이터 동기화 완료: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
     else:
         print("[WARNING] 모든 동기화 실패")
-    
-    conn.close()
+        run.fail("모든 마스터 동기화 소스 실패")
+    return success
 
-def maybe_one_time_sync_content(force=False):
+
+def maybe_daily_sync_master(force=False, run=None):
+    """
+    마스터 데이터(협력사, 사고, 부서, 건물, 협력사근로자): 매일 1회.
+    - 공용DB 항목은 [MASTER_DATA_QUERIES] 기준으로 수행.
+    - 임직원은 보안상 [LOCAL_DATA_QUERIES] 기준으로 전용 PostgreSQL에서만 수행.
+    - [DATABASE] master_data_sync_mode = incremental 이면 각 캐시는 바뀐 행만 반영된다(_MasterDeltaPlan).
+    - 실행은 job_scheduler 이력(MASTER_SYNC_JOB)에 남고, 오늘 성공한 실행이 있으면 건너뛴다.
+      스케줄러가 부를 때는 run 을 넘겨 같은 실행 기록에 소스별 결과를 남긴다.
+    """
+    if not force and _synced_today(MASTER_SYNC_JOB, 'master_sync_state', 'last_master_sync'):
+        print("[INFO] Master daily sync skipped (already synced today)")
+        if run is not None:
+            run.skip("already synced today")
+        return True
+
+    if run is not None:
+        return run_master_sync(run)
+
+    from job_scheduler import record_run
+    with record_run(MASTER_SYNC_JOB, 'manual' if force else 'boot') as run:
+        return run_master_sync(run)
+
+def maybe_one_time_sync_content(force=False, run=None):
     """
     컨텐츠 데이터(환경안전지시서 등): 최초 1회만. CONTENT_DATA_QUERIES 섹션 기준.
     - 안전지시서(safety_instructions_cache): 최초 1회만 채움
     - 필요 시 FOLLOWSOP/FULLPROCESS 등 확장(키 존재하면)
+    - 실행과 컨텐츠별 결과는 job_scheduler 이력(CONTENT_SYNC_JOB)에 남는다.
+      1회 완료 여부는 이력 보관 기간과 무관해야 하므로 content_sync_state 에 그대로 둔다.
     """
+    if run is None:
+        from job_scheduler import record_run
+        with record_run(CONTENT_SYNC_JOB, 'manual' if force else 'boot') as run:
+            return maybe_one_time_sync_content(force, run)
+
     conn = get_db_connection(db_config.local_db_path)
     _ensure_boot_sync_tables(conn)
     cur = conn.cursor()
@@ -2532,9 +2769,10 @@ def maybe_one_time_sync_content(force=False):
         done = (row and row[0] == 1)
         if done and not force:
             print(f"[INFO] Content '{name}' already synced (once).")
+            run.record_source(name, 'skipped', message='already synced (once)')
             return
         # 실행
-        ok = runner()
+        ok = run.run_source(name, runner)
         if ok or force:
             # safe_upsert 사용  
             sync_data = {
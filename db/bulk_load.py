@@ -0,0 +1,355 @@
+"""COPY-based bulk loading for the external sync jobs.
+
+The `sync_*_from_external_db` jobs used to send every source row through its
+own INSERT (and often a second UPDATE) round trip. `StagingTable` instead
+streams all rows with one `COPY ... FROM STDIN` into an UNLOGGED table that has
+the target's column types, then applies them with set-based statements:
+
+    with StagingTable(conn, "follow_sop", ["work_req_no", "custom_data", "created_at"]) as stage:
+        stage.load(rows)
+        stage.merge(["work_req_no"], on_conflict="nothing", insert_values={"is_deleted": "0"})
+        stage.update_target(["work_req_no"], {"is_deleted": "0"})
+
+Everything runs inside the caller's transaction: the staging table is dropped
+on exit and a rollback removes it as well. Rows that share a key are collapsed
+before the merge the same way sequential upserts behaved (last row wins for
+``update``, first row wins for ``nothing``). Cursors without COPY support
+(psycopg2) fall back to batched `executemany`.
+
+`insert_values` / `update_values` are SQL expressions, not parameters; pass
+only constants such as ``"0"`` or ``"CURRENT_TIMESTAMP"``.
+
+`StagingTable.apply_delta` is the incremental variant of `merge`: it hashes
+each staged row, writes only rows whose hash differs from the one stored in
+the target's ``row_hash`` column, and optionally deletes target rows that were
+not staged, so an unchanged nightly load touches no rows at all.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+ON_CONFLICT_MODES = ("update", "nothing", "error", "insert")
+
+DEFAULT_BATCH_SIZE = 5000
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_SEQ_COLUMN = "_load_seq"
+
+
+@dataclass(frozen=True)
+class DeltaResult:
+    staged: int
+    inserted: int
+    updated: int
+    deleted: int
+
+    @property
+    def unchanged(self) -> int:
+        return max(0, self.staged - self.inserted - self.updated)
+
+    @property
+    def changed(self) -> int:
+        return self.inserted + self.updated + self.deleted
+
+
+def _ident(name: str) -> str:
+    if not isinstance(name, str) or not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"invalid SQL identifier: {name!r}")
+    return name
+
+
+def copy_rows(
+    conn: Any,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Append `rows` to `table(columns)` with COPY; returns the row count."""
+
+    table = _ident(table)
+    column_sql = ", ".join(_ident(col) for col in columns)
+    cursor = conn.cursor()
+    if getattr(cursor, "supports_copy", False):
+        return cursor.copy_rows(f"COPY {table} ({column_sql}) FROM STDIN", rows)
+
+    placeholders = ", ".join(["%s"] * len(columns))
+    sql = f"INSERT INTO {table} ({column_sql}) VALUES ({placeholders})"
+    count = 0
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(tuple(row))
+        if len(batch) >= batch_size:
+            cursor.executemany(sql, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        cursor.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+class StagingTable:
+    """UNLOGGED scratch table holding `columns` of `target` for one load."""
+
+    def __init__(self, conn: Any, target: str, columns: Sequence[str]):
+        if not columns:
+            raise ValueError("staging table needs at least one column")
+        self.conn = conn
+        self.target = _ident(target)
+        self.columns = [_ident(col) for col in columns]
+        self.name = f"{self.target[:40]}_stage_{uuid.uuid4().hex[:12]}"
+        self.row_count = 0
+        self.skipped_rows = 0
+        self._created = False
+
+    def __enter__(self) -> "StagingTable":
+        self.create()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.drop()
+        else:
+            # The transaction is usually aborted here; the caller's rollback
+            # removes the table, so a failed DROP is not worth reporting.
+            try:
+                self.drop()
+            except Exception as exc:
+                logger.debug("staging drop skipped for %s: %s", self.name, exc)
+
+    def _execute(self, sql: str, params: Any = None):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return cursor
+
+    def create(self) -> None:
+        column_sql = ", ".join(self.columns)
+        self._execute(
+            f"CREATE UNLOGGED TABLE {self.name} AS "
+            f"SELECT {column_sql} FROM {self.target} WITH NO DATA"
+        )
+        # Load order, used to pick the surviving row among duplicate keys.
+        self._execute(f"ALTER TABLE {self.name} ADD COLUMN {_SEQ_COLUMN} BIGSERIAL")
+        self._created = True
+
+    def drop(self) -> None:
+        if self._created:
+            self._created = False
+            self._execute(f"DROP TABLE IF EXISTS {self.name}")
+
+    def load(
+        self,
+        rows: Iterable[Sequence[Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        skip_bad_rows: bool = False,
+    ) -> int:
+        """Append `rows` to the staging table; may be called once per chunk.
+
+        With `skip_bad_rows` a failed COPY is rolled back to a savepoint and
+        the rows are inserted one by one, skipping (and counting in
+        `skipped_rows`) those the column types reject.
+        """
+
+        if skip_bad_rows:
+            count = self._load_or_salvage(list(rows), batch_size)
+        else:
+            count = copy_rows(self.conn, self.name, self.columns, rows, batch_size)
+        self.row_count += count
+        return count
+
+    def _load_or_salvage(self, rows: List[Sequence[Any]], batch_size: int) -> int:
+        if not rows:
+            return 0
+        self._execute("SAVEPOINT stage_copy")
+        try:
+            count = copy_rows(self.conn, self.name, self.columns, rows, batch_size)
+            self._execute("RELEASE SAVEPOINT stage_copy")
+            return count
+        except Exception as exc:
+            logger.warning("COPY into %s failed, retrying row by row: %s", self.name, exc)
+            self._execute("ROLLBACK TO SAVEPOINT stage_copy")
+
+        placeholders = ", ".join(["%s"] * len(self.columns))
+        sql = f"INSERT INTO {self.name} ({', '.join(self.columns)}) VALUES ({placeholders})"
+        count = 0
+        for row in rows:
+            self._execute("SAVEPOINT stage_row")
+            try:
+                self._execute(sql, tuple(row))
+                self._execute("RELEASE SAVEPOINT stage_row")
+                count += 1
+            except Exception as exc:
+                self._execute("ROLLBACK TO SAVEPOINT stage_row")
+                self.skipped_rows += 1
+                logger.debug("staging row skipped for %s: %s", self.target, exc)
+        return count
+
+    def _source_sql(self, key_cols: Sequence[str], on_conflict: str) -> str:
+        column_sql = ", ".join(self.columns)
+        if not key_cols or on_conflict == "error":
+            return f"SELECT {column_sql} FROM {self.name} ORDER BY {_SEQ_COLUMN}"
+        key_sql = ", ".join(key_cols)
+        order = "ASC" if on_conflict == "nothing" else "DESC"
+        return (
+            f"SELECT DISTINCT ON ({key_sql}) {column_sql} FROM {self.name} "
+            f"ORDER BY {key_sql}, {_SEQ_COLUMN} {order}"
+        )
+
+    def merge(
+        self,
+        key_cols: Sequence[str],
+        update_cols: Optional[Sequence[str]] = None,
+        insert_values: Optional[Mapping[str, str]] = None,
+        update_values: Optional[Mapping[str, str]] = None,
+        on_conflict: str = "update",
+    ) -> int:
+        """INSERT the staged rows into the target in one statement.
+
+        `update_cols` defaults to every staged non-key column. `insert_values`
+        adds constant columns to new rows; `update_values` adds constant SET
+        clauses to updated rows. ``insert`` collapses duplicate keys like
+        ``update`` but adds no ON CONFLICT clause, for targets known to be
+        empty and not yet indexed (see `db.table_swap`). Returns the affected
+        row count.
+        """
+
+        if on_conflict not in ON_CONFLICT_MODES:
+            raise ValueError(f"on_conflict must be one of {ON_CONFLICT_MODES}")
+        keys = [_ident(col) for col in key_cols]
+        if on_conflict != "error" and not keys:
+            raise ValueError("key_cols are required for ON CONFLICT merges")
+
+        insert_values = dict(insert_values or {})
+        insert_cols = self.columns + [_ident(col) for col in insert_values]
+        select_sql = ", ".join(
+            [f"src.{col}" for col in self.columns] + list(insert_values.values())
+        )
+        sql = (
+            f"INSERT INTO {self.target} ({', '.join(insert_cols)}) "
+            f"SELECT {select_sql} FROM ({self._source_sql(keys, on_conflict)}) AS src"
+        )
+
+        if on_conflict == "update":
+            if update_cols is None:
+                update_cols = [col for col in self.columns if col not in keys]
+            assignments = [f"{_ident(col)} = EXCLUDED.{col}" for col in update_cols]
+            assignments += [f"{_ident(col)} = {expr}" for col, expr in (update_values or {}).items()]
+            if assignments:
+                sql += f" ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {', '.join(assignments)}"
+            else:
+                sql += f" ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+        elif on_conflict == "nothing":
+            sql += f" ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+
+        return self._execute(sql).rowcount
+
+    def apply_delta(
+        self,
+        key_cols: Sequence[str],
+        hash_cols: Optional[Sequence[str]] = None,
+        update_cols: Optional[Sequence[str]] = None,
+        insert_values: Optional[Mapping[str, str]] = None,
+        update_values: Optional[Mapping[str, str]] = None,
+        delete_missing: bool = True,
+        hash_column: str = "row_hash",
+    ) -> DeltaResult:
+        """Write only the staged rows that differ from the target.
+
+        The hash is ``md5`` of `hash_cols` (default: every staged column) after
+        they are cast to the target's types, and is stored in `hash_column`.
+        Existing rows whose stored hash matches are left untouched, so they get
+        no new tuple version and no index entries. With `delete_missing`, target
+        rows whose key was not staged are deleted; pass ``False`` for partial
+        (watermarked) loads.
+        """
+
+        keys = [_ident(col) for col in key_cols]
+        if not keys:
+            raise ValueError("key_cols are required for apply_delta")
+        hash_column = _ident(hash_column)
+        hash_cols = [_ident(col) for col in (hash_cols or self.columns)]
+        if update_cols is None:
+            update_cols = [col for col in self.columns if col not in keys]
+
+        deleted = 0
+        if delete_missing:
+            match_sql = " AND ".join(f"s.{key} = t.{key}" for key in keys)
+            deleted = self._execute(
+                f"DELETE FROM {self.target} AS t "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {self.name} AS s WHERE {match_sql})"
+            ).rowcount
+
+        insert_values = dict(insert_values or {})
+        insert_cols = self.columns + [_ident(col) for col in insert_values] + [hash_column]
+        hash_sql = f"md5(ROW({', '.join(f'src.{col}' for col in hash_cols)})::text)"
+        select_sql = ", ".join(
+            [f"src.{col}" for col in self.columns] + list(insert_values.values()) + [hash_sql]
+        )
+        assignments = [f"{_ident(col)} = EXCLUDED.{col}" for col in update_cols]
+        assignments += [f"{_ident(col)} = {expr}" for col, expr in (update_values or {}).items()]
+        assignments.append(f"{hash_column} = EXCLUDED.{hash_column}")
+        row = self._execute(
+            f"WITH written AS ("
+            f"INSERT INTO {self.target} AS t ({', '.join(insert_cols)}) "
+            f"SELECT {select_sql} FROM ({self._source_sql(keys, 'update')}) AS src "
+            f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {', '.join(assignments)} "
+            f"WHERE t.{hash_column} IS DISTINCT FROM EXCLUDED.{hash_column} "
+            f"RETURNING (xmax = 0) AS inserted) "
+            f"SELECT COUNT(*) FILTER (WHERE inserted) AS inserted, "
+            f"COUNT(*) FILTER (WHERE NOT inserted) AS updated FROM written"
+        ).fetchone()
+        return DeltaResult(
+            staged=self.row_count,
+            inserted=int(row[0] or 0),
+            updated=int(row[1] or 0),
+            deleted=deleted,
+        )
+
+    def update_target(self, key_cols: Sequence[str], assignments: Mapping[str, str]) -> int:
+        """`UPDATE target ... FROM staging` for every target row whose key was staged.
+
+        Expressions may refer to staged values as ``s.<column>``.
+        """
+
+        if not assignments:
+            return 0
+        keys = [_ident(col) for col in key_cols]
+        if not keys:
+            raise ValueError("key_cols are required for update_target")
+        set_sql = ", ".join(f"{_ident(col)} = {expr}" for col, expr in assignments.items())
+        where_sql = " AND ".join(f"t.{key} = s.{key}" for key in keys)
+        return self._execute(
+            f"UPDATE {self.target} AS t SET {set_sql} FROM {self.name} AS s WHERE {where_sql}"
+        ).rowcount
+
+
+def bulk_merge(
+    conn: Any,
+    target: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    key_cols: Sequence[str],
+    update_cols: Optional[Sequence[str]] = None,
+    insert_values: Optional[Mapping[str, str]] = None,
+    update_values: Optional[Mapping[str, str]] = None,
+    on_conflict: str = "update",
+) -> int:
+    """Stage `rows` and merge them into `target` (see `StagingTable.merge`)."""
+
+    with StagingTable(conn, target, columns) as stage:
+        if not stage.load(rows):
+            return 0
+        return stage.merge(
+            key_cols,
+            update_cols=update_cols,
+            insert_values=insert_values,
+            update_values=update_values,
+            on_conflict=on_conflict,
+        )
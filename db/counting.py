@@ -0,0 +1,257 @@
+"""Total-count strategies for paged list queries.
+
+List screens show "총 N건" and number rows from the total, so every page used
+to run an exact `COUNT(*)` with the same filters. `count_rows()` picks a
+cheaper source when the exact value is not worth the cost:
+
+* ``exact``    always run `SELECT COUNT(*)`.
+* ``estimate`` use the planner's row estimate (`EXPLAIN`) for unfiltered
+               lists on tables whose `pg_class.reltuples` is above
+               `[DATABASE] count_estimate_threshold`; exact otherwise.
+* ``cached``   exact counts reused for `[DATABASE] count_cache_ttl` seconds,
+               keyed by the table, the normalized SQL, its parameters and the
+               table's shared count version.
+* ``auto``     (default) ``estimate`` for large unfiltered lists, ``cached``
+               for everything else.
+
+Approximate totals are corrected with `reconcile_total()` once the page rows
+are known, so the last page still numbers down to 1.
+
+Board write paths call `invalidate_counts(table)` once their change is
+committed. It drops this process's entries and bumps the table's version in
+``metadata_versions`` (scope ``row_counts``), so every worker recounts on its
+next list request. Writes outside the app (master sync) still rely on the TTL.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Mapping, Optional, Sequence, Tuple
+
+from db.versioned_cache import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("exact", "estimate", "cached", "auto")
+
+_DEFAULT_STRATEGY = "auto"
+_DEFAULT_THRESHOLD = 100_000
+_DEFAULT_TTL = 30
+_CACHE_MAX_ENTRIES = 2048
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class RowCount:
+    value: int
+    exact: bool = True
+    source: str = "exact"
+
+
+@dataclass(frozen=True)
+class CountSettings:
+    strategy: str = _DEFAULT_STRATEGY
+    estimate_threshold: int = _DEFAULT_THRESHOLD
+    cache_ttl: float = _DEFAULT_TTL
+
+
+class CountCache:
+    """Small process-local TTL cache for exact counts."""
+
+    def __init__(self, max_entries: int = _CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: int, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if isinstance(k, tuple) and k and k[0] == table]:
+                self._entries.pop(key, None)
+
+
+count_cache = CountCache()
+
+_COUNT_VERSIONS = VersionedCache("row_counts")
+
+
+def _table_version(table: str) -> Optional[int]:
+    try:
+        return _COUNT_VERSIONS.version(table)
+    except Exception as exc:
+        logger.debug("count version check failed for %s: %s", table, exc)
+        return None
+
+
+def load_count_settings() -> CountSettings:
+    """Read the `[DATABASE] count_*` options (falls back to defaults)."""
+
+    try:
+        from db_connection import get_config
+
+        config = get_config()
+        strategy = config.get("DATABASE", "count_strategy", fallback=_DEFAULT_STRATEGY).strip().lower()
+        threshold = config.getint("DATABASE", "count_estimate_threshold", fallback=_DEFAULT_THRESHOLD)
+        ttl = config.getfloat("DATABASE", "count_cache_ttl", fallback=_DEFAULT_TTL)
+    except Exception as exc:
+        logger.debug("count settings unavailable, using defaults: %s", exc)
+        return CountSettings()
+    if strategy not in STRATEGIES:
+        strategy = _DEFAULT_STRATEGY
+    return CountSettings(strategy=strategy, estimate_threshold=max(0, threshold), cache_ttl=max(0.0, ttl))
+
+
+def _has_filters(filters: Optional[Mapping[str, Any]]) -> bool:
+    if not filters:
+        return False
+    return any(value not in (None, "") for value in filters.values())
+
+
+def _cache_key(table: str, select_sql: str, params: Sequence[Any]) -> Tuple[Any, ...]:
+    normalized_sql = _WHITESPACE_RE.sub(" ", select_sql).strip()
+    try:
+        normalized_params = json.dumps(list(params), default=str, ensure_ascii=False)
+    except (TypeError, ValueError):
+        normalized_params = repr(tuple(params))
+    return (table, normalized_sql, normalized_params)
+
+
+def _first_value(row: Any) -> Any:
+    if row is None:
+        return None
+    if isinstance(row, Mapping):
+        return next(iter(row.values()), None)
+    return row[0]
+
+
+def exact_count(conn: Any, select_sql: str, params: Sequence[Any]) -> int:
+    row = conn.execute(f"SELECT COUNT(*) AS total FROM ({select_sql}) AS counted", list(params)).fetchone()
+    return int(_first_value(row) or 0)
+
+
+def table_reltuples(conn: Any, table: str) -> Optional[int]:
+    """Return `pg_class.reltuples` for `table`, or None when never analyzed."""
+
+    row = conn.execute(
+        "SELECT reltuples::bigint AS reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+        (table,),
+    ).fetchone()
+    value = _first_value(row)
+    if value is None or int(value) < 0:
+        return None
+    return int(value)
+
+
+def planner_estimate(conn: Any, select_sql: str, params: Sequence[Any]) -> Optional[int]:
+    """Return the planner's row estimate for `select_sql` via EXPLAIN."""
+
+    row = conn.execute(f"EXPLAIN (FORMAT JSON) {select_sql}", list(params)).fetchone()
+    plan = _first_value(row)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (TypeError, KeyError, IndexError, ValueError):
+        return None
+
+
+def count_rows(
+    conn: Any,
+    table: str,
+    select_sql: str,
+    params: Sequence[Any] = (),
+    filters: Optional[Mapping[str, Any]] = None,
+    settings: Optional[CountSettings] = None,
+) -> RowCount:
+    """Count the rows `select_sql` returns using the configured strategy.
+
+    `select_sql` is the list query without ORDER BY/LIMIT. `filters` are the
+    user-supplied filters; an empty mapping marks the list as unfiltered, which
+    is the only case where planner estimates are used.
+    """
+
+    settings = settings or load_count_settings()
+    strategy = settings.strategy
+    if strategy == "exact" or not getattr(conn, "is_postgres", False):
+        return RowCount(exact_count(conn, select_sql, params))
+
+    if strategy in ("estimate", "auto") and not _has_filters(filters):
+        try:
+            size = table_reltuples(conn, table)
+            if size is not None and size >= settings.estimate_threshold:
+                estimate = planner_estimate(conn, select_sql, params)
+                if estimate is not None:
+                    return RowCount(estimate, exact=False, source="estimate")
+        except Exception as exc:
+            logger.debug("count estimate failed for %s: %s", table, exc)
+        if strategy == "estimate":
+            return RowCount(exact_count(conn, select_sql, params))
+
+    if strategy in ("cached", "auto") and settings.cache_ttl > 0:
+        version = _table_version(table)
+        key = _cache_key(table, select_sql, params) + (version,)
+        cached = count_cache.get(key) if version is not None else None
+        if cached is not None:
+            return RowCount(cached, exact=False, source="cache")
+        value = exact_count(conn, select_sql, params)
+        if version is not None:
+            count_cache.set(key, value, settings.cache_ttl)
+        return RowCount(value)
+
+    return RowCount(exact_count(conn, select_sql, params))
+
+
+def reconcile_total(count: RowCount, offset: int, fetched: int, per_page: int) -> int:
+    """Adjust an approximate total with what the fetched page proves."""
+
+    if count.exact:
+        return count.value
+    if fetched < per_page:
+        # Short page: this is the last one, so the total is known exactly.
+        if fetched or offset == 0:
+            return offset + fetched
+        return count.value
+    return max(count.value, offset + fetched)
+
+
+def invalidate_counts(table: Optional[str] = None, db_path: Optional[str] = None) -> None:
+    """Drop cached counts for `table` (or this process's counts for all tables).
+
+    Call it after the write is committed. With a table, the shared count
+    version is bumped as well so other workers stop reusing their totals.
+    """
+
+    count_cache.invalidate(table)
+    if table is None:
+        return
+    try:
+        _COUNT_VERSIONS.bump(table, db_path)
+    except Exception as exc:
+        logger.warning("count version bump failed for %s: %s", table, exc)
@@ -0,0 +1,172 @@
+"""Keyset (cursor) pagination helpers.
+
+List queries normally page with `LIMIT/OFFSET` plus a `COUNT(*)`; both cost
+grows with the page depth. In keyset mode the caller passes an opaque cursor
+taken from the previous page and the query seeks past the last row instead:
+
+    order = KeysetOrder("s.created_at", "s.id", sort_key="created_at", tie_key="id")
+    clause, clause_params, order_by = keyset_clause(order, cursor)
+    sql = f"SELECT ... WHERE {where_sql}{clause} ORDER BY {order_by} LIMIT %s"
+    rows = fetch(sql, [*params, *clause_params, per_page + 1])
+    page = keyset_page(rows, order, per_page, cursor)
+
+The ordering is `sort_expr, tie_expr` in one direction; `tie_expr` must be
+unique and non-null so every row has a stable position. Cursors carry
+their direction, so one `cursor` parameter serves both "next" and "prev".
+"""
+from __future__ import annotations
+
+import base64
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+NEXT = "next"
+PREV = "prev"
+
+
+@dataclass(frozen=True)
+class KeysetOrder:
+    sort_expr: str
+    tie_expr: str
+    sort_key: str
+    tie_key: str
+    descending: bool = True
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    direction: str
+    sort_value: Any
+    tie_value: Any
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
+def encode_cursor(direction: str, sort_value: Any, tie_value: Any) -> str:
+    payload = json.dumps(
+        [direction, _encode_value(sort_value), _encode_value(tie_value)],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[KeysetCursor]:
+    """Decode a cursor string. Empty or malformed cursors mean "first page"."""
+
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        direction, sort_value, tie_value = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in (NEXT, PREV) or tie_value is None:
+            return None
+        return KeysetCursor(direction, _decode_value(sort_value), _decode_value(tie_value))
+    except (ValueError, TypeError) as exc:
+        logger.debug("Ignoring invalid keyset cursor: %s", exc)
+        return None
+
+
+def keyset_clause(order: KeysetOrder, token: Optional[str]) -> Tuple[str, List[Any], str]:
+    """Return `(" AND <seek condition>" or "", params, ORDER BY body)` for `token`.
+
+    NULL sort values keep PostgreSQL's default placement (first for DESC, last
+    for ASC) so the ORDER BY can still walk a plain btree index, and the common
+    case (non-null cursor on a DESC order) is a single row comparison the
+    planner can use as an index condition.
+    """
+
+    cursor = decode_cursor(token)
+    forward = cursor is None or cursor.direction == NEXT
+    sort, tie = order.sort_expr, order.tie_expr
+    direction_sql = "DESC" if order.descending else "ASC"
+    reverse_sql = "ASC" if order.descending else "DESC"
+    order_by = (
+        f"{sort} {direction_sql}, {tie} {direction_sql}"
+        if forward
+        else f"{sort} {reverse_sql}, {tie} {reverse_sql}"
+    )
+
+    if cursor is None:
+        return "", [], order_by
+
+    # In the forward order NULL sort values form one block at the start (DESC)
+    # or at the end (ASC); `seek` is the comparison that moves away from the cursor.
+    nulls_first = order.descending
+    if forward:
+        seek = "<" if order.descending else ">"
+        nulls_ahead = not nulls_first
+    else:
+        seek = ">" if order.descending else "<"
+        nulls_ahead = nulls_first
+
+    if cursor.sort_value is None:
+        clause = f"({sort} IS NULL AND {tie} {seek} %s)"
+        if not nulls_ahead:
+            clause = f"({clause} OR {sort} IS NOT NULL)"
+        return f" AND {clause}", [cursor.tie_value], order_by
+
+    clause = f"({sort}, {tie}) {seek} (%s, %s)"
+    if nulls_ahead:
+        clause = f"({clause} OR {sort} IS NULL)"
+    return f" AND {clause}", [cursor.sort_value, cursor.tie_value], order_by
+
+
+def keyset_page(
+    rows: Sequence[Dict[str, Any]],
+    order: KeysetOrder,
+    limit: int,
+    token: Optional[str],
+) -> Dict[str, Any]:
+    """Trim the `limit + 1` rows fetched with `keyset_clause` into a page.
+
+    Returns a dict with `items`, `next_cursor`, `prev_cursor`, `has_next` and
+    `has_prev`; items are always in the forward order.
+    """
+
+    cursor = decode_cursor(token)
+    items = list(rows)
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    if cursor is not None and cursor.direction == PREV:
+        items.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = cursor is not None, has_more
+
+    def _cursor_for(row: Dict[str, Any], direction: str) -> str:
+        return encode_cursor(direction, row.get(order.sort_key), row.get(order.tie_key))
+
+    return {
+        "items": items,
+        "next_cursor": _cursor_for(items[-1], NEXT) if items and has_next else None,
+        "prev_cursor": _cursor_for(items[0], PREV) if items and has_prev else None,
+        "has_next": bool(items) and has_next,
+        "has_prev": bool(items) and has_prev,
+    }
@@ -0,0 +1,125 @@
+"""Cluster-wide leader election for background schedulers.
+
+Every gunicorn worker imports app.py and starts the same scheduler threads, and
+a `threading.Lock` only serializes threads inside one process. `LeaderLease`
+lets exactly one process in the cluster run a given job:
+
+    lease = LeaderLease("master-data-sync")
+    while True:
+        if lease.acquire():
+            run_job()
+        time.sleep(interval)
+
+The leader holds a session-level ``pg_try_advisory_lock`` on a dedicated,
+unpooled connection (a pooled connection would be recycled and silently drop
+the lock). PostgreSQL releases the lock when that session ends, so when the
+leader process dies or loses its connection another process's next
+`acquire()` takes over. The leader itself pings the connection on every
+`acquire()` and steps down as soon as it is gone.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# First key of the two-int advisory lock form; keeps scheduler leases out of
+# the single-bigint key space used by transaction-level locks elsewhere.
+LOCK_NAMESPACE = 0x5343  # "SC"
+
+
+def _dedicated_connection():
+    from db_connection import get_postgres_dsn
+    from db.postgres import PostgresConnection
+
+    return PostgresConnection(dsn=get_postgres_dsn(), timeout=10.0)
+
+
+class LeaderLease:
+    """Advisory-lock lease named `name`; `acquire()` is cheap to call in a poll loop."""
+
+    def __init__(
+        self,
+        name: str,
+        connect: Optional[Callable[[], Any]] = None,
+        enabled: bool = True,
+    ):
+        self.name = name
+        self.enabled = enabled
+        self._connect = connect or _dedicated_connection
+        self._conn: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        return not self.enabled or self._conn is not None
+
+    def _alive(self) -> bool:
+        try:
+            self._conn.execute("SELECT 1").fetchone()
+            self._conn.commit()
+            return True
+        except Exception as exc:
+            logger.warning("leader connection for %s lost: %s", self.name, exc)
+            return False
+
+    def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception as exc:
+                logger.debug("leader connection close failed for %s: %s", self.name, exc)
+
+    def acquire(self) -> bool:
+        """Return True if this process holds the lease (taking it if it is free)."""
+
+        if not self.enabled:
+            return True
+        with self._lock:
+            if self._conn is not None:
+                if self._alive():
+                    return True
+                # The session is gone, and the lock went with it.
+                self._close()
+
+            try:
+                conn = self._connect()
+            except Exception as exc:
+                logger.warning("leader election for %s skipped: %s", self.name, exc)
+                return False
+            try:
+                row = conn.execute(
+                    "SELECT pg_try_advisory_lock(%s, hashtext(%s))", (LOCK_NAMESPACE, self.name)
+                ).fetchone()
+                conn.commit()
+            except Exception as exc:
+                logger.warning("leader election for %s failed: %s", self.name, exc)
+                row = None
+            if row and row[0]:
+                self._conn = conn
+                logger.info("this process is now the leader for %s", self.name)
+                return True
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return False
+
+    def release(self) -> None:
+        """Give up the lease so another process can take it."""
+
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "SELECT pg_advisory_unlock(%s, hashtext(%s))", (LOCK_NAMESPACE, self.name)
+                )
+                self._conn.commit()
+            except Exception as exc:
+                logger.debug("leader unlock failed for %s: %s", self.name, exc)
+            self._close()
+            logger.info("released leadership for %s", self.name)
@@ -0,0 +1,120 @@
+"""Process-wide PostgreSQL connection pool.
+
+`db_connection.get_db_connection()` borrows from this pool when
+`[DATABASE] pool_enabled` is on. Pools are keyed by DSN and created lazily,
+so importing this module never opens a connection.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    from psycopg.rows import dict_row
+    from psycopg_pool import ConnectionPool
+except ImportError:  # pragma: no cover - psycopg_pool is optional
+    dict_row = None
+    ConnectionPool = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    min_size: int = 1
+    max_size: int = 10
+    timeout: float = 10.0
+    max_lifetime: float = 1800.0
+    max_idle: float = 300.0
+    check: bool = True
+
+
+_pools: dict[str, Any] = {}
+_pools_lock = threading.Lock()
+_unavailable_logged = False
+
+
+def pool_available() -> bool:
+    """Return whether psycopg_pool can be used in this environment."""
+
+    return ConnectionPool is not None and dict_row is not None
+
+
+def _reset_connection(conn: Any) -> None:
+    # Legacy scripts occasionally flip autocommit; hand out a clean connection.
+    if conn.autocommit:
+        conn.autocommit = False
+
+
+def get_pool(dsn: str, settings: PoolSettings) -> Any | None:
+    """Return the shared pool for `dsn`, creating it on first use.
+
+    Returns None when psycopg_pool is not installed so callers can fall back
+    to one-off connections.
+    """
+
+    global _unavailable_logged
+
+    if not pool_available():
+        if not _unavailable_logged:
+            logger.warning("psycopg_pool is not installed; using direct PostgreSQL connections")
+            _unavailable_logged = True
+        return None
+
+    pool = _pools.get(dsn)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(dsn)
+        if pool is None:
+            pool = ConnectionPool(
+                dsn,
+                min_size=settings.min_size,
+                max_size=max(settings.max_size, settings.min_size),
+                timeout=settings.timeout,
+                max_lifetime=settings.max_lifetime,
+                max_idle=settings.max_idle,
+                kwargs={
+                    "row_factory": dict_row,
+                    "client_encoding": "UTF8",
+                    "connect_timeout": int(settings.timeout),
+                },
+                check=ConnectionPool.check_connection if settings.check else None,
+                reset=_reset_connection,
+                name=f"portal-{len(_pools) + 1}",
+                open=True,
+            )
+            _pools[dsn] = pool
+            logger.info(
+                "PostgreSQL pool opened (min=%s, max=%s, max_lifetime=%ss)",
+                settings.min_size,
+                settings.max_size,
+                settings.max_lifetime,
+            )
+    return pool
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Return psycopg_pool statistics per pool, for diagnostics."""
+
+    return {pool.name: dict(pool.get_stats()) for pool in list(_pools.values())}
+
+
+def close_pools() -> None:
+    """Close every pool opened by this process."""
+
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception as exc:  # pragma: no cover - shutdown best effort
+            logger.debug("Failed to close PostgreSQL pool: %s", exc)
+
+
+atexit.register(close_pools)
@@ -85,6 +85,26 @@ class PostgresCursor:
         self._cursor.executemany(sql, [_convert_params(params) for params in params_list])
         return self
 
+    @property
+    def supports_copy(self) -> bool:
+        return PSYCOPG_VERSION == 3 and hasattr(self._cursor, "copy")
+
+    def copy_rows(self, sql: str, rows: Iterable[Any]) -> int:
+        """Stream `rows` through a `COPY ... FROM STDIN` statement.
+
+        Only available on psycopg 3 cursors; check `supports_copy` first.
+        Returns the number of rows written.
+        """
+
+        if not self.supports_copy:
+            raise NotImplementedError("COPY FROM STDIN requires psycopg 3")
+        count = 0
+        with self._cursor.copy(sql) as copy:
+            for row in rows:
+                copy.write_row(_convert_params(tuple(row)))
+                count += 1
+        return count
+
     def fetchone(self):
         return _wrap_row(self._cursor.fetchone())
 
@@ -107,12 +127,20 @@ class PostgresCursor:
 
 
 class PostgresConnection:
-    """Small PostgreSQL connection facade used by existing services."""
+    """Small PostgreSQL connection facade used by existing services.
+
+    When `pool` is given the underlying connection is borrowed from that
+    psycopg_pool pool and `close()` hands it back instead of disconnecting.
+    """
 
     is_postgres = True
 
-    def __init__(self, dsn: str, timeout: float = 10.0):
-        if psycopg is not None:
+    def __init__(self, dsn: str, timeout: float = 10.0, pool: Any = None):
+        self._pool = pool
+        self._closed = False
+        if pool is not None:
+            self._conn = pool.getconn(timeout=timeout)
+        elif psycopg is not None:
             self._conn = psycopg.connect(
                 dsn,
                 row_factory=dict_row,
@@ -131,6 +159,13 @@ class PostgresConnection:
     def cursor(self) -> PostgresCursor:
         return PostgresCursor(self._conn.cursor())
 
+    def server_cursor(self, name: str, itersize: int = 2000) -> PostgresCursor:
+        """Return a named (server-side) cursor; rows stay on the server until fetched."""
+
+        raw = self._conn.cursor(name=name)
+        raw.itersize = itersize
+        return PostgresCursor(raw)
+
     def execute(self, sql: str, params: Any = None) -> PostgresCursor:
         cursor = self.cursor()
         return cursor.execute(sql, params)
@@ -141,8 +176,24 @@ class PostgresConnection:
     def rollback(self):
         return self._conn.rollback()
 
+    @property
+    def pooled(self) -> bool:
+        return self._pool is not None
+
     def close(self):
-        return self._conn.close()
+        if self._closed:
+            return None
+        self._closed = True
+        if self._pool is None:
+            return self._conn.close()
+        # Never return a connection with an open transaction to the pool.
+        try:
+            status = self._conn.info.transaction_status
+            if not self._conn.closed and status != psycopg.pq.TransactionStatus.IDLE:
+                self._conn.rollback()
+        finally:
+            self._pool.putconn(self._conn)
+        return None
 
     def __enter__(self):
         return self
@@ -0,0 +1,136 @@
+"""Request-scoped PostgreSQL connection reuse.
+
+Inside a Flask request the first `get_db_connection()` opens (or borrows from
+the pool) one connection and stores it on `flask.g`. Later calls in the same
+request get a lightweight handle to that connection instead of a new one.
+The connection is released in `teardown_appcontext`.
+
+Handles keep the old per-call semantics: `close()` without `commit()` still
+discards the caller's work. A call made while another handle is still open
+(nested use) gets its own connection so one caller can never commit or roll
+back another caller's transaction.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - psycopg2 fallback environments
+    psycopg = None
+
+try:
+    from flask import g, has_request_context
+except ImportError:  # pragma: no cover - CLI environments without Flask
+    g = None
+
+    def has_request_context() -> bool:
+        return False
+
+logger = logging.getLogger(__name__)
+
+_G_CONN = "_db_request_conn"
+_G_IN_USE = "_db_request_conn_in_use"
+
+
+def _in_transaction(conn: Any) -> bool:
+    raw = getattr(conn, "_conn", None)
+    if raw is None or psycopg is None or getattr(raw, "closed", True):
+        return False
+    return raw.info.transaction_status != psycopg.pq.TransactionStatus.IDLE
+
+
+class RequestScopedConnection:
+    """Handle to the shared request connection with PostgresConnection's API."""
+
+    is_postgres = True
+
+    def __init__(self, conn: Any):
+        self._shared = conn
+        self._released = False
+
+    def cursor(self):
+        return self._shared.cursor()
+
+    def execute(self, sql: str, params: Any = None):
+        return self._shared.execute(sql, params)
+
+    def commit(self):
+        return self._shared.commit()
+
+    def rollback(self):
+        return self._shared.rollback()
+
+    def close(self):
+        if self._released:
+            return None
+        self._released = True
+        try:
+            # Same as closing a private connection: uncommitted work is dropped.
+            if _in_transaction(self._shared):
+                self._shared.rollback()
+        finally:
+            if g is not None and getattr(g, _G_CONN, None) is self._shared:
+                setattr(g, _G_IN_USE, False)
+        return None
+
+    def __getattr__(self, name: str):
+        return getattr(self._shared, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            self.rollback()
+        else:
+            self.commit()
+        self.close()
+
+
+def request_connection(factory: Callable[[], Any]) -> Any | None:
+    """Return a handle to the request connection, or None outside a request.
+
+    None is also returned when the shared connection is already held by an
+    open handle; the caller should then open its own connection.
+    """
+
+    if not has_request_context():
+        return None
+
+    conn = getattr(g, _G_CONN, None)
+    if conn is None:
+        conn = factory()
+        setattr(g, _G_CONN, conn)
+    elif getattr(g, _G_IN_USE, False):
+        return None
+
+    setattr(g, _G_IN_USE, True)
+    return RequestScopedConnection(conn)
+
+
+def release_request_connection(exc: BaseException | None = None) -> None:
+    """Roll back anything left open and release the request connection."""
+
+    if g is None:
+        return
+    conn = g.pop(_G_CONN, None)
+    g.pop(_G_IN_USE, None)
+    if conn is None:
+        return
+    try:
+        if _in_transaction(conn):
+            conn.rollback()
+    except Exception as rollback_exc:
+        logger.debug("Request connection rollback failed: %s", rollback_exc)
+    try:
+        conn.close()
+    except Exception as close_exc:
+        logger.debug("Request connection close failed: %s", close_exc)
+
+
+def init_app(app: Any) -> None:
+    """Register the teardown hook that releases the request connection."""
+
+    app.teardown_appcontext(release_request_connection)
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from db.versioned_cache import VersionedCache
+
 
 _IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
+_SCHEMA = VersionedCache("schema")
+
 
 @dataclass(frozen=True)
 class TableName:
@@ -101,3 +105,141 @@ def column_names(conn: Any, table_name: str) -> list[str]:
 
     return [row["column_name"] for row in get_columns(conn, table_name)]
 
+
+# ----------------------------------------------------------------------
+# Cached schema metadata
+#
+# The helpers above query information_schema on every call. Hot paths use
+# the cached_* variants instead: the whole catalog (tables, columns, index
+# names) is read with two queries into a per-process snapshot and reused
+# until the shared ``schema`` version changes. Anything that changes the
+# schema calls `refresh_schema_cache()` once its DDL is committed; the
+# migration runner and tools/RUN_SCHEMA_REPAIR.py do so when they finish.
+# Other workers pick the new version up within
+# ``[DATABASE] metadata_version_check_seconds``.
+
+SCHEMA_CACHE_KEY = "catalog"
+
+_SYSTEM_SCHEMAS = ("pg_catalog", "information_schema")
+
+
+@dataclass
+class SchemaSnapshot:
+    """Columns and index names of every user table, keyed by (schema, table)."""
+
+    columns: dict[tuple[str, str], list[dict[str, Any]]] = field(default_factory=dict)
+    indexes: set[tuple[str, str]] = field(default_factory=set)
+
+    def table_columns(self, table_name: str) -> list[dict[str, Any]] | None:
+        parsed = split_table_name(table_name)
+        return self.columns.get((parsed.schema, parsed.name))
+
+
+def load_schema_snapshot(conn: Any) -> SchemaSnapshot:
+    """Read all user tables, their columns and index names."""
+
+    snapshot = SchemaSnapshot()
+    rows = conn.execute(
+        """
+        SELECT
+            t.table_schema,
+            t.table_name,
+            c.column_name,
+            c.data_type,
+            c.is_nullable,
+            c.column_default,
+            c.ordinal_position
+        FROM information_schema.tables t
+        LEFT JOIN information_schema.columns c
+          ON c.table_schema = t.table_schema
+         AND c.table_name = t.table_name
+        WHERE t.table_schema NOT IN (%s, %s)
+        ORDER BY t.table_schema, t.table_name, c.ordinal_position
+        """,
+        _SYSTEM_SCHEMAS,
+    ).fetchall()
+    for row in rows:
+        columns = snapshot.columns.setdefault((row["table_schema"], row["table_name"]), [])
+        if row["column_name"] is not None:
+            columns.append(
+                {
+                    "column_name": row["column_name"],
+                    "data_type": row["data_type"],
+                    "is_nullable": row["is_nullable"],
+                    "column_default": row["column_default"],
+                    "ordinal_position": row["ordinal_position"],
+                }
+            )
+
+    rows = conn.execute(
+        "SELECT schemaname, indexname FROM pg_indexes WHERE schemaname NOT IN (%s, %s)",
+        _SYSTEM_SCHEMAS,
+    ).fetchall()
+    snapshot.indexes = {(row["schemaname"], row["indexname"]) for row in rows}
+    return snapshot
+
+
+def _load_snapshot(db_path: str | None) -> SchemaSnapshot:
+    from db_connection import get_db_connection
+
+    conn = get_db_connection(db_path)
+    try:
+        return load_schema_snapshot(conn)
+    finally:
+        conn.close()
+
+
+def schema_snapshot(db_path: str | None = None) -> SchemaSnapshot:
+    """Current schema snapshot, loaded once per process per schema version.
+
+    The returned object is shared; do not mutate it.
+    """
+
+    return _SCHEMA.get(SCHEMA_CACHE_KEY, "snapshot", lambda: _load_snapshot(db_path), db_path)
+
+
+def cached_table_exists(table_name: str, db_path: str | None = None) -> bool:
+    """`table_exists` answered from the schema snapshot."""
+
+    return schema_snapshot(db_path).table_columns(table_name) is not None
+
+
+def cached_get_columns(table_name: str, db_path: str | None = None) -> list[dict[str, Any]]:
+    """`get_columns` answered from the schema snapshot ([] for unknown tables)."""
+
+    columns = schema_snapshot(db_path).table_columns(table_name) or []
+    return [dict(column) for column in columns]
+
+
+def cached_column_names(table_name: str, db_path: str | None = None) -> list[str]:
+    """`column_names` answered from the schema snapshot."""
+
+    columns = schema_snapshot(db_path).table_columns(table_name) or []
+    return [column["column_name"] for column in columns]
+
+
+def cached_column_exists(table_name: str, column_name: str, db_path: str | None = None) -> bool:
+    """`column_exists` answered from the schema snapshot."""
+
+    return column_name in cached_column_names(table_name, db_path)
+
+
+def cached_index_exists(index_name: str, schema: str = "public", db_path: str | None = None) -> bool:
+    """Whether an index with this name exists, from the schema snapshot."""
+
+    return (schema, index_name) in schema_snapshot(db_path).indexes
+
+
+def refresh_schema_cache(db_path: str | None = None) -> int:
+    """Bump the shared schema version so every process reloads its snapshot.
+
+    Call it after DDL has been committed.
+    """
+
+    return _SCHEMA.bump(SCHEMA_CACHE_KEY, db_path)
+
+
+def invalidate_schema_cache() -> None:
+    """Drop this process's snapshot (e.g. after an error that suggests it is stale)."""
+
+    _SCHEMA.invalidate(SCHEMA_CACHE_KEY)
@@ -0,0 +1,80 @@
+"""Chunked row iteration over server-side cursors.
+
+`conn.execute(sql).fetchall()` materializes the whole result in the client
+before the first row is used. For exports and bulk reads the rows are only
+needed one chunk at a time:
+
+    for chunk in iter_chunks(conn, "SELECT * FROM follow_sop ORDER BY created_at DESC"):
+        ...
+
+On PostgreSQL connections the query runs through a named (server-side)
+cursor, so the server keeps the result and the client holds at most
+`chunk_size` rows. Named cursors live inside the current transaction; the
+caller must not commit until iteration is finished. Other connections fall
+back to `fetchmany()` on a regular cursor, which keeps the same API.
+"""
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import Any, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def _open_cursor(conn: Any, chunk_size: int):
+    server_cursor = getattr(conn, "server_cursor", None)
+    if callable(server_cursor):
+        return server_cursor(f"stream_{uuid.uuid4().hex}", itersize=chunk_size)
+    return conn.cursor()
+
+
+def iter_chunks(
+    conn: Any,
+    sql: str,
+    params: Any = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[Any]]:
+    """Yield the rows of `sql` in lists of at most `chunk_size` rows."""
+
+    chunk_size = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+    cursor = _open_cursor(conn, chunk_size)
+    try:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+            if len(rows) < chunk_size:
+                break
+    finally:
+        try:
+            cursor.close()
+        except Exception as exc:
+            logger.debug("stream cursor close failed: %s", exc)
+
+
+def iter_rows(
+    conn: Any,
+    sql: str,
+    params: Any = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    limit: Optional[int] = None,
+) -> Iterator[Any]:
+    """Yield the rows of `sql` one by one, stopping after `limit` rows if given."""
+
+    produced = 0
+    chunks = iter_chunks(conn, sql, params, chunk_size)
+    try:
+        for chunk in chunks:
+            for row in chunk:
+                if limit is not None and produced >= limit:
+                    return
+                produced += 1
+                yield row
+    finally:
+        # Close the server-side cursor right away instead of waiting for GC.
+        chunks.close()
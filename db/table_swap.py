@@ -0,0 +1,234 @@
+"""Rebuild a cache table off to the side and swap it in with renames.
+
+Emptying and reloading a cache table in place keeps it locked and half-filled
+for as long as the reload transaction runs. `ShadowTable` loads a copy named
+``<target>_new`` instead; readers keep using ``target`` untouched until
+`swap()` renames the tables in one short transaction:
+
+    with ShadowTable(conn, "partners_cache", carry_key=["business_number"],
+                     carry_columns=["is_deleted"]) as shadow:
+        copy_rows(conn, shadow.name, columns, rows)
+        shadow.swap()
+
+The shadow table copies the target's columns, defaults and CHECK constraints,
+but its indexes (including primary key and unique constraints) are created
+only after loading, right before the swap. `carry_columns` are locally owned
+values that the load does not provide; they are copied over from the live
+rows by `carry_key`, once before the swap and once more under the swap lock
+for rows edited in the meantime. Sequences owned by the target's columns are
+handed to the new table. Privileges are not copied.
+
+`swap()` commits the caller's transaction. Leaving the block without calling
+`swap()` (or with an exception) rolls back and drops the shadow table.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+
+from db.bulk_load import _ident
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT = "5s"
+DEFAULT_SWAP_RETRIES = 3
+
+_LOCK_NOT_AVAILABLE = "55P03"
+_INDEX_DEF_RE = re.compile(
+    r"^(CREATE (?:UNIQUE )?INDEX )(\S+)( ON (?:ONLY )?)(\S+)( .*)$", re.IGNORECASE | re.DOTALL
+)
+_CONSTRAINT_TYPES = {"p": "PRIMARY KEY", "u": "UNIQUE"}
+
+
+def _suffixed(name: str, suffix: str) -> str:
+    # PostgreSQL truncates identifiers at 63 bytes; keep the suffix intact.
+    return f"{name[:63 - len(suffix)]}{suffix}"
+
+
+def _is_lock_timeout(exc: Exception) -> bool:
+    code = getattr(exc, "sqlstate", None) or getattr(exc, "pgcode", None)
+    return code == _LOCK_NOT_AVAILABLE
+
+
+class ShadowTable:
+    """``<target>_new`` built beside `target` and swapped in by `swap()`."""
+
+    def __init__(
+        self,
+        conn: Any,
+        target: str,
+        carry_key: Optional[Sequence[str]] = None,
+        carry_columns: Sequence[str] = (),
+        lock_timeout: str = DEFAULT_LOCK_TIMEOUT,
+        retries: int = DEFAULT_SWAP_RETRIES,
+    ):
+        self.conn = conn
+        self.target = _ident(target)
+        self.name = _suffixed(self.target, "_new")
+        self.old_name = _suffixed(self.target, "_old")
+        self.carry_key = [_ident(col) for col in (carry_key or [])]
+        self.carry_columns = [_ident(col) for col in carry_columns]
+        if self.carry_columns and not self.carry_key:
+            raise ValueError("carry_columns need a carry_key")
+        if not re.match(r"^\d+(ms|s|min)?$", lock_timeout):
+            raise ValueError(f"invalid lock_timeout: {lock_timeout!r}")
+        self.lock_timeout = lock_timeout
+        self.retries = max(1, int(retries))
+        self._indexes: List[Tuple[str, str, Optional[str], Optional[str]]] = []
+        self._created = False
+        self._swapped = False
+
+    def __enter__(self) -> "ShadowTable":
+        self.create()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self._swapped:
+            self.discard()
+
+    def _execute(self, sql: str, params: Any = None):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return cursor
+
+    def _check_dependents(self) -> None:
+        # Views and foreign keys follow the renamed (old) table, so the drop
+        # after the swap would fail; refuse up front instead.
+        row = self._execute(
+            """
+            SELECT
+              (SELECT COUNT(*) FROM pg_depend d JOIN pg_rewrite r ON r.oid = d.objid
+                WHERE d.refobjid = %s::regclass AND r.ev_class <> %s::regclass) AS views,
+              (SELECT COUNT(*) FROM pg_constraint
+                WHERE confrelid = %s::regclass AND contype = 'f') AS foreign_keys
+            """,
+            (self.target, self.target, self.target),
+        ).fetchone()
+        if row[0] or row[1]:
+            raise RuntimeError(
+                f"{self.target} has dependent views or foreign keys; swap is not supported"
+            )
+
+    def create(self) -> None:
+        self._check_dependents()
+        self._execute(f"DROP TABLE IF EXISTS {self.name}")
+        self._execute(
+            f"CREATE TABLE {self.name} (LIKE {self.target} "
+            f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS)"
+        )
+        self._created = True
+
+        constraints = {
+            row[0]: (row[1], row[2])
+            for row in self._execute(
+                "SELECT conindid::regclass::text, conname, contype FROM pg_constraint "
+                "WHERE conrelid = %s::regclass AND contype IN ('p', 'u')",
+                (self.target,),
+            ).fetchall()
+        }
+        self._indexes = []
+        for row in self._execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = %s",
+            (self.target,),
+        ).fetchall():
+            index_name, index_def = row[0], row[1]
+            constraint_name, constraint_type = constraints.get(index_name, (None, None))
+            self._indexes.append((index_name, index_def, constraint_name, constraint_type))
+
+    def _build_indexes(self) -> None:
+        for index_name, index_def, constraint_name, constraint_type in self._indexes:
+            match = _INDEX_DEF_RE.match(index_def)
+            if not match:
+                raise RuntimeError(f"cannot rebuild index {index_name}: {index_def}")
+            shadow_index = _suffixed(index_name, "_new")
+            self._execute(
+                f"{match.group(1)}{shadow_index}{match.group(3)}{self.name}{match.group(5)}"
+            )
+            if constraint_name:
+                self._execute(
+                    f"ALTER TABLE {self.name} ADD CONSTRAINT {shadow_index} "
+                    f"{_CONSTRAINT_TYPES[constraint_type]} USING INDEX {shadow_index}"
+                )
+
+    def carry_over(self, source: Optional[str] = None) -> int:
+        """Copy `carry_columns` from `source` (default: the live target) by key."""
+
+        if not self.carry_columns:
+            return 0
+        source = source or self.target
+        set_sql = ", ".join(f"{col} = o.{col}" for col in self.carry_columns)
+        match_sql = " AND ".join(f"n.{key} = o.{key}" for key in self.carry_key)
+        changed_sql = " OR ".join(f"n.{col} IS DISTINCT FROM o.{col}" for col in self.carry_columns)
+        return self._execute(
+            f"UPDATE {self.name} AS n SET {set_sql} FROM {source} AS o "
+            f"WHERE {match_sql} AND ({changed_sql})"
+        ).rowcount
+
+    def _owned_sequences(self) -> List[Tuple[str, str]]:
+        rows = self._execute(
+            "SELECT a.attname, pg_get_serial_sequence(%s, a.attname) FROM pg_attribute a "
+            "WHERE a.attrelid = %s::regclass AND a.attnum > 0 AND NOT a.attisdropped",
+            (self.target, self.target),
+        ).fetchall()
+        return [(row[0], row[1]) for row in rows if row[1]]
+
+    def _rename_into_place(self) -> None:
+        self._execute(f"SET LOCAL lock_timeout = '{self.lock_timeout}'")
+        self._execute(f"LOCK TABLE {self.target} IN ACCESS EXCLUSIVE MODE")
+        # Rows edited while the shadow table was loading.
+        self.carry_over()
+        sequences = self._owned_sequences()
+        self._execute(f"ALTER TABLE {self.target} RENAME TO {self.old_name}")
+        self._execute(f"ALTER TABLE {self.name} RENAME TO {self.target}")
+        for column, sequence in sequences:
+            self._execute(f"ALTER SEQUENCE {sequence} OWNED BY {self.target}.{column}")
+        self._execute(f"DROP TABLE {self.old_name}")
+        for index_name, _, constraint_name, _ in self._indexes:
+            shadow_index = _suffixed(index_name, "_new")
+            if constraint_name:
+                self._execute(
+                    f"ALTER TABLE {self.target} RENAME CONSTRAINT {shadow_index} TO {constraint_name}"
+                )
+            else:
+                self._execute(f"ALTER INDEX {shadow_index} RENAME TO {index_name}")
+
+    def swap(self) -> None:
+        """Index the shadow table, then replace `target` with it and commit."""
+
+        if not self._created:
+            raise RuntimeError("shadow table was not created")
+        self._build_indexes()
+        self._execute(f"ANALYZE {self.name}")
+        self.carry_over()
+        self.conn.commit()
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                self._rename_into_place()
+                self.conn.commit()
+                break
+            except Exception as exc:
+                self.conn.rollback()
+                if not _is_lock_timeout(exc) or attempt == self.retries:
+                    raise
+                logger.warning(
+                    "swap of %s waited longer than %s for readers (attempt %d/%d)",
+                    self.target, self.lock_timeout, attempt, self.retries,
+                )
+                time.sleep(attempt)
+        self._swapped = True
+        self._created = False
+
+    def discard(self) -> None:
+        if not self._created:
+            return
+        self._created = False
+        try:
+            self.conn.rollback()
+            self._execute(f"DROP TABLE IF EXISTS {self.name}")
+            self.conn.commit()
+        except Exception as exc:
+            logger.debug("shadow drop skipped for %s: %s", self.name, exc)
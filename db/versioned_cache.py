@@ -0,0 +1,217 @@
+"""Per-process metadata caches invalidated through a shared version row.
+
+Board metadata (dropdown codes, column/section layout) is read on every page
+but only changes through admin endpoints. `VersionedCache` keeps values in
+worker memory per key (usually a board type). Writers call `bump()` once
+their change is committed; it increments the key's row in
+``metadata_versions`` and drops this process's entry. Other workers see the
+new version on their next check and reload.
+
+A key's version is read at most once per Flask request and at most every
+``[DATABASE] metadata_version_check_seconds`` per process, so hot paths
+normally issue no metadata queries at all. Readers in other processes may
+see the old value for up to that long after a change:
+
+    codes = CODES.get("accident", "catalog", lambda: load_codes("accident"))
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from flask import g, has_request_context
+except ImportError:  # pragma: no cover - CLI environments without Flask
+    g = None
+
+    def has_request_context() -> bool:
+        return False
+
+VERSION_TABLE = "metadata_versions"
+DEFAULT_CHECK_SECONDS = 5.0
+
+_G_VERSIONS = "_metadata_versions"
+
+_table_ready = False
+_table_lock = threading.Lock()
+
+
+def ensure_version_table(cursor: Any) -> None:
+    """Create the shared version table if it does not exist."""
+
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+            scope VARCHAR(50) NOT NULL,
+            cache_key VARCHAR(100) NOT NULL,
+            version BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (scope, cache_key)
+        )
+        """
+    )
+
+
+def _ensure_table(db_path: Optional[str] = None) -> None:
+    global _table_ready
+    if _table_ready:
+        return
+    with _table_lock:
+        if _table_ready:
+            return
+        from db_connection import get_db_connection
+
+        conn = get_db_connection(db_path)
+        try:
+            ensure_version_table(conn.cursor())
+            conn.commit()
+        finally:
+            conn.close()
+        _table_ready = True
+
+
+def check_seconds() -> float:
+    """How long a process trusts a version before reading it again."""
+
+    from db_connection import get_config
+
+    try:
+        value = get_config().getfloat(
+            "DATABASE", "metadata_version_check_seconds", fallback=DEFAULT_CHECK_SECONDS
+        )
+    except ValueError:
+        value = DEFAULT_CHECK_SECONDS
+    return max(0.0, value)
+
+
+def _request_versions() -> Optional[Dict[Any, int]]:
+    if g is None or not has_request_context():
+        return None
+    versions = getattr(g, _G_VERSIONS, None)
+    if versions is None:
+        versions = {}
+        setattr(g, _G_VERSIONS, versions)
+    return versions
+
+
+@dataclass
+class _Entry:
+    version: int
+    checked_at: float
+    values: Dict[str, Any] = field(default_factory=dict)
+
+
+class VersionedCache:
+    """Named values per key, reloaded when the key's shared version changes."""
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def version(self, key: str, db_path: Optional[str] = None) -> int:
+        """Current shared version of `key` (0 if it was never bumped)."""
+
+        versions = _request_versions()
+        memo_key = (self.scope, key)
+        if versions is not None and memo_key in versions:
+            return versions[memo_key]
+
+        from db_connection import get_db_connection
+
+        _ensure_table(db_path)
+        conn = get_db_connection(db_path)
+        try:
+            row = conn.execute(
+                f"SELECT version FROM {VERSION_TABLE} WHERE scope = %s AND cache_key = %s",
+                (self.scope, key),
+            ).fetchone()
+        finally:
+            conn.close()
+        version = int(row[0]) if row and row[0] is not None else 0
+
+        if versions is not None:
+            versions[memo_key] = version
+        return version
+
+    def _entry(self, key: str, db_path: Optional[str]) -> _Entry:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and now - entry.checked_at < check_seconds():
+            return entry
+
+        # Read the version before any loader runs: data loaded after a
+        # concurrent bump is at worst stored under the older version and
+        # replaced on the next check, never the other way round.
+        version = self.version(key, db_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                entry = _Entry(version, now)
+                self._entries[key] = entry
+            else:
+                entry.checked_at = now
+        return entry
+
+    def get(self, key: str, name: str, loader: Callable[[], Any], db_path: Optional[str] = None) -> Any:
+        """Return `loader()` for (`key`, `name`), loading once per version.
+
+        Exceptions from `loader` propagate and nothing is cached. The cached
+        object itself is returned; callers that mutate it must copy it.
+        """
+
+        values = self._entry(key, db_path).values
+        try:
+            return values[name]
+        except KeyError:
+            pass
+        value = loader()
+        return values.setdefault(name, value)
+
+    def bump(self, key: str, db_path: Optional[str] = None) -> int:
+        """Increment `key`'s version and drop this process's values.
+
+        Call it after the metadata change is committed. Bumping inside the
+        writer's transaction would let a concurrent reader in this process
+        re-cache the old data under the old version and trust it for
+        `check_seconds()`.
+        """
+
+        from db_connection import get_db_connection
+
+        _ensure_table(db_path)
+        conn = get_db_connection(db_path)
+        try:
+            row = conn.execute(
+                f"""
+                INSERT INTO {VERSION_TABLE} (scope, cache_key, version)
+                VALUES (%s, %s, 1)
+                ON CONFLICT (scope, cache_key) DO UPDATE SET
+                    version = {VERSION_TABLE}.version + 1,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING version
+                """,
+                (self.scope, key),
+            ).fetchone()
+            conn.commit()
+        finally:
+            conn.close()
+        self.invalidate(key)
+        return int(row[0]) if row else 0
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Forget this process's values (and this request's version) for `key`, or all keys."""
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        versions = _request_versions()
+        if versions is not None:
+            for memo_key in list(versions):
+                if memo_key[0] == self.scope and (key is None or memo_key[1] == key):
+                    del versions[memo_key]
@@ -2,20 +2,69 @@
 
 import logging
 import configparser
+import os
+import threading
 from typing import Optional
 
+from db.pool import PoolSettings, get_pool
 from db.postgres import PostgresConnection
+from db.request_scope import init_app as _init_request_scope, request_connection
 
+_CONFIG_PATH = 'config.ini'
+_config_cache = {'mtime': None, 'config': None}
+_config_lock = threading.Lock()
 
-def _load_config() -> configparser.ConfigParser:
+
+def _read_config() -> configparser.ConfigParser:
     config = configparser.ConfigParser()
     try:
-        config.read('config.ini', encoding='utf-8')
+        config.read(_CONFIG_PATH, encoding='utf-8')
     except Exception as exc:
         logging.warning("config.ini 읽기 실패 (기본값 사용): %s", exc)
     return config
 
 
+def _load_config() -> configparser.ConfigParser:
+    """config.ini 를 읽는다. 파일 수정시각이 같으면 캐시된 객체를 재사용한다."""
+    try:
+        mtime = os.path.getmtime(_CONFIG_PATH)
+    except OSError:
+        mtime = None
+
+    cached = _config_cache['config']
+    if cached is not None and _config_cache['mtime'] == mtime:
+        return cached
+
+    with _config_lock:
+        if _config_cache['config'] is None or _config_cache['mtime'] != mtime:
+            _config_cache['config'] = _read_config()
+            _config_cache['mtime'] = mtime
+        return _config_cache['config']
+
+
+def get_config() -> configparser.ConfigParser:
+    """캐시된 config.ini 객체를 반환한다. 호출 측에서 값을 수정하지 않는다."""
+    return _load_config()
+
+
+def _pool_settings(config: configparser.ConfigParser, timeout: float) -> Optional[PoolSettings]:
+    """[DATABASE] pool_* 설정을 읽는다. 풀 비활성화 시 None."""
+    if not config.getboolean('DATABASE', 'pool_enabled', fallback=False):
+        return None
+    try:
+        return PoolSettings(
+            min_size=config.getint('DATABASE', 'pool_min_size', fallback=1),
+            max_size=config.getint('DATABASE', 'pool_max_size', fallback=10),
+            timeout=config.getfloat('DATABASE', 'pool_timeout', fallback=timeout),
+            max_lifetime=config.getfloat('DATABASE', 'pool_max_lifetime', fallback=1800.0),
+            max_idle=config.getfloat('DATABASE', 'pool_max_idle', fallback=300.0),
+            check=config.getboolean('DATABASE', 'pool_health_check', fallback=True),
+        )
+    except ValueError as exc:
+        logging.warning("DATABASE.pool_* 설정 오류 (기본값 사용): %s", exc)
+        return PoolSettings(timeout=timeout)
+
+
 def _require_postgres_backend(config: configparser.ConfigParser) -> str:
     backend = config.get('DATABASE', 'db_backend', fallback='postgres').strip().lower()
     if backend != 'postgres':
@@ -30,7 +79,11 @@ def _require_postgres_backend(config: configparser.ConfigParser) -> str:
 
 
 def get_db_connection(db_path: str = None, timeout: float = 10.0, **_legacy_options):
-    """PostgreSQL 연결을 생성한다. 실패 시 예외를 그대로 전파한다."""
+    """PostgreSQL 연결을 생성한다. 실패 시 예외를 그대로 전파한다.
+
+    Flask 요청 안에서는 요청 단위로 연결 하나를 공유한다(request_scoped_connection).
+    요청 밖(스케줄러, CLI)에서는 호출마다 연결을 새로 얻는다.
+    """
 
     config = _load_config()
 
@@ -40,12 +93,31 @@ def get_db_connection(db_path: str = None, timeout: float = 10.0, **_legacy_opti
 
     dsn = _require_postgres_backend(config)
 
+    if config.getboolean('DATABASE', 'request_scoped_connection', fallback=False):
+        shared = request_connection(lambda: _open_connection(config, dsn, timeout))
+        if shared is not None:
+            return shared
+
+    return _open_connection(config, dsn, timeout)
+
+
+def _open_connection(config: configparser.ConfigParser, dsn: str, timeout: float) -> PostgresConnection:
+    settings = _pool_settings(config, timeout)
+    pool = get_pool(dsn, settings) if settings else None
+    if pool is not None:
+        return PostgresConnection(dsn=dsn, timeout=settings.timeout, pool=pool)
+
     conn = PostgresConnection(dsn=dsn, timeout=timeout)
     logging.debug("PostgreSQL connection established: %s", dsn)
 
     return conn
 
 
+def init_app(app) -> None:
+    """요청 단위 연결을 teardown_appcontext 에서 반납하도록 등록한다."""
+    _init_request_scope(app)
+
+
 def get_postgres_dsn() -> str:
     """config.ini에서 PostgreSQL DSN을 읽어온다."""
 
@@ -0,0 +1,144 @@
+"""
+부서 계층 closure 테이블
+departments_external.dept_full_path(`|` 구분)를 부서별 상위 조직 목록으로 펼쳐
+department_ancestors(dept_id, ancestor_code, depth)에 저장한다.
+
+depth 0 은 부서 자신, 숫자가 클수록 먼 상위 조직이다. scoped_permission_check 는
+이 테이블과 dept_menu_roles 를 인덱스 조인해 가장 가까운 상위 조직 권한을 고른다.
+부서 데이터를 쓰는 곳(scripts/sync_permission_master_data.py, /api/dept-permissions/sync-external)은
+쓰기와 같은 트랜잭션에서, scripts/setup_permission_schema.py 는 테이블을 만든 직후 rebuild 한다.
+
+closure 에 행이 있는 부서 목록은 프로세스마다 캐시하고(db.versioned_cache, scope 'dept_closure'),
+rebuild 가 커밋된 뒤 버전을 올려 다른 워커도 다시 읽게 한다. 조회 쪽은 부서가 이 목록에
+없으면(closure 가 비어 있거나 rebuild 이후 추가된 부서) dept_full_path 분해 방식으로 조회한다.
+"""
+import logging
+
+from db.versioned_cache import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+CLOSURE_TABLE = 'department_ancestors'
+
+_CLOSURE = VersionedCache('dept_closure')
+
+
+def ensure_department_closure_table(cursor):
+    """closure 테이블과 조회용 인덱스를 생성한다 (이미 있으면 유지)."""
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {CLOSURE_TABLE} (
+            dept_id VARCHAR(100) NOT NULL,
+            ancestor_code VARCHAR(100) NOT NULL,
+            depth INTEGER NOT NULL,
+            PRIMARY KEY (dept_id, ancestor_code)
+        )
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{CLOSURE_TABLE}_ancestor
+        ON {CLOSURE_TABLE}(ancestor_code)
+        """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_dept_menu_roles_menu_dept_code
+        ON dept_menu_roles(menu_code, dept_code)
+        WHERE is_active = true
+        """
+    )
+
+
+def _load_closure_dept_ids(db_path=None):
+    from db_connection import get_db_connection
+
+    conn = get_db_connection(db_path)
+    try:
+        row = conn.execute("SELECT to_regclass(%s) IS NOT NULL", (CLOSURE_TABLE,)).fetchone()
+        if not (row and row[0]):
+            return frozenset()
+        rows = conn.execute(f"SELECT DISTINCT dept_id FROM {CLOSURE_TABLE}").fetchall()
+        return frozenset(str(r[0]) for r in rows)
+    finally:
+        conn.close()
+
+
+def closure_dept_ids(db_path=None):
+    """closure 행이 있는 부서 ID 집합 (rebuild 버전이 바뀔 때만 다시 읽는다)"""
+    return _CLOSURE.get('departments', 'dept_ids', lambda: _load_closure_dept_ids(db_path), db_path)
+
+
+def bump_closure_version(db_path=None):
+    """
+    rebuild 를 커밋한 뒤 불러 모든 프로세스의 부서 목록 캐시를 갱신한다.
+    실패해도 이미 커밋된 rebuild 를 되돌릴 수 없으므로 경고만 남긴다.
+    """
+    try:
+        return _CLOSURE.bump('departments', db_path)
+    except Exception as exc:
+        _CLOSURE.invalidate('departments')
+        logger.warning("department closure version bump failed: %s", exc)
+        return None
+
+
+def rebuild_department_closure(conn, commit=True):
+    """
+    departments_external 기준으로 closure 테이블을 다시 만든다.
+    한 트랜잭션에서 비우고 채우므로 조회 쪽은 이전 또는 새 상태만 본다.
+
+    commit=False 면 호출한 쪽 트랜잭션에 합쳐 커밋/롤백을 맡기고,
+    커밋한 뒤 bump_closure_version() 을 불러야 한다.
+
+    Returns:
+        int: 저장된 (부서, 상위 조직) 쌍 개수
+    """
+    cursor = conn.cursor()
+    try:
+        ensure_department_closure_table(cursor)
+        cursor.execute(f"DELETE FROM {CLOSURE_TABLE}")
+        cursor.execute(
+            f"""
+            INSERT INTO {CLOSURE_TABLE} (dept_id, ancestor_code, depth)
+            SELECT dept_id, ancestor_code, MIN(depth)
+            FROM (
+                SELECT
+                    d.dept_id,
+                    btrim(p.code) AS ancestor_code,
+                    p.total - p.ord AS depth
+                FROM departments_external d
+                CROSS JOIN LATERAL (
+                    SELECT
+                        code,
+                        ord,
+                        count(*) OVER () AS total
+                    FROM unnest(
+                        string_to_array(COALESCE(d.dept_full_path, d.dept_code), '|')
+                    ) WITH ORDINALITY AS u(code, ord)
+                ) p
+                WHERE d.is_active = true
+                  AND d.dept_id IS NOT NULL
+                  AND btrim(p.code) <> ''
+                UNION ALL
+                SELECT dept_id, dept_code, 0
+                FROM departments_external
+                WHERE is_active = true
+                  AND dept_id IS NOT NULL
+                  AND dept_code IS NOT NULL
+            ) expanded
+            GROUP BY dept_id, ancestor_code
+            """
+        )
+        inserted = cursor.rowcount or 0
+        cursor.execute(f"ANALYZE {CLOSURE_TABLE}")
+        if commit:
+            conn.commit()
+            bump_closure_version()
+        logger.info("department closure rebuilt: %s rows", inserted)
+        return inserted
+    except Exception:
+        if commit:
+            conn.rollback()
+        raise
+    finally:
+        cursor.close()
@@ -9,6 +9,8 @@ from psycopg2.extras import RealDictCursor
 import os
 from datetime import datetime
 
+from dept_closure import bump_closure_version, rebuild_department_closure
+
 dept_permission_bp = Blueprint('dept_permission', __name__)
 
 # 데이터베이스 연결
@@ -310,6 +312,7 @@ def check_user_permissions():
 @dept_permission_bp.route('/api/dept-permissions/sync-external', methods=['POST'])
 def sync_external_departments():
     """외부 시스템과 부서 정보 동기화"""
+    conn = None
     try:
         # 외부 시스템에서 부서 데이터 조회 (실제 구현 시 외부 API 호출)
         # 여기서는 예시 데이터 사용
@@ -342,9 +345,11 @@ def sync_external_departments():
             ))
             sync_count += 1
 
+        # 부서 경로가 바뀌었을 수 있으므로 상위 조직 closure 도 같은 트랜잭션에서 다시 만든다
+        rebuild_department_closure(conn, commit=False)
         conn.commit()
         cur.close()
-        conn.close()
+        bump_closure_version()
 
         return jsonify({
             'success': True,
@@ -352,10 +357,15 @@ def sync_external_departments():
             'message': f'Successfully synced {sync_count} departments'
         })
     except Exception as e:
+        if conn is not None:
+            conn.rollback()
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
+    finally:
+        if conn is not None:
+            conn.close()
 
 @dept_permission_bp.route('/api/dept-permissions/batch-update', methods=['POST'])
 def batch_update_dept_permissions():
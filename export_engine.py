@@ -0,0 +1,452 @@
+"""
+게시판 내보내기 공통 엔진 (xlsx / csv / parquet)
+각 게시판 내보내기 API 는 헤더와 행 생성기(ExportSheet)만 만들고, 파일 작성/전송은 여기서 처리한다.
+
+- 행은 db.streaming 의 서버 사이드 커서로 청크 단위로 읽는다.
+- xlsx: openpyxl write_only 모드로 임시 파일에 바로 기록하므로 행 수와 관계없이 메모리 사용량이 일정하다.
+  완성된 임시 파일을 send_file 로 스트리밍하고 응답이 끝나면 삭제한다.
+- csv: 스타일 처리 없이 UTF-8 BOM(엑셀 호환) CSV 를 행을 읽는 대로 응답으로 흘려보낸다.
+- parquet: pyarrow 가 설치된 경우에만 사용 가능. 청크 단위 row group 으로 기록한다.
+
+[EXPORT] MAX_ROWS 가 0(기본값)이면 건수 제한 없이 전체를 내보낸다.
+"""
+import csv
+import io
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import quote
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - parquet 형식만 비활성
+    pa = None
+    pq = None
+
+from db_connection import get_config
+from timezone_config import KST, get_korean_time
+
+logger = logging.getLogger(__name__)
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+EXPORT_FORMATS = ('xlsx', 'csv', 'parquet')
+EXPORT_MIMETYPES = {
+    'xlsx': XLSX_MIMETYPE,
+    'csv': 'text/csv; charset=utf-8',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+DEFAULT_CHUNK_SIZE = 2000
+# write_only 모드는 이미 쓴 셀을 다시 볼 수 없으므로 앞쪽 일부 행으로 열 너비를 정한다.
+WIDTH_SAMPLE_ROWS = 200
+
+HEADER_FILL_COLOR = '366092'
+
+
+class ExportFormatError(ValueError):
+    """지원하지 않거나 사용할 수 없는 내보내기 형식"""
+
+
+@dataclass
+class ExportSheet:
+    """내보낼 시트 한 장 - rows 는 헤더 순서대로 값을 담은 시퀀스를 내는 이터러블"""
+    title: str
+    headers: List[str]
+    rows: Iterable[Sequence[Any]]
+    filename_prefix: str
+    width_factor: float = 1.0
+    max_width: float = 50
+
+
+def get_export_settings() -> Dict[str, int]:
+    """[EXPORT] 설정 조회 (MAX_ROWS 0 = 제한 없음)"""
+    max_rows = 0
+    chunk_size = DEFAULT_CHUNK_SIZE
+    try:
+        config = get_config()
+        max_rows = config.getint('EXPORT', 'MAX_ROWS', fallback=0)
+        chunk_size = config.getint('EXPORT', 'CHUNK_SIZE', fallback=DEFAULT_CHUNK_SIZE)
+    except Exception as e:
+        logger.debug(f"[EXPORT] 설정을 읽지 못해 기본값 사용: {e}")
+    return {
+        'max_rows': max(0, max_rows),
+        'chunk_size': chunk_size if chunk_size > 0 else DEFAULT_CHUNK_SIZE,
+    }
+
+
+def apply_row_limit(sql: str, params: List[Any], max_rows: int) -> str:
+    """max_rows 가 설정된 경우에만 LIMIT 을 붙인다 (params 에 값 추가)"""
+    if max_rows and max_rows > 0:
+        params.append(max_rows)
+        return f"{sql} LIMIT %s"
+    return sql
+
+
+def load_json_object(value: Any) -> Dict[str, Any]:
+    """custom_data 처럼 dict 또는 JSON 문자열로 저장된 값을 dict 로 변환"""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            parsed = json.loads(value)
+        except Exception:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    return {}
+
+
+def order_columns_by_section(sections: Sequence[Dict[str, Any]], columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """섹션 순서대로 동적 컬럼을 정렬하고, 섹션이 없는 컬럼은 뒤에 붙인다"""
+    if not sections:
+        return list(columns)
+    section_keys = [section['section_key'] for section in sections]
+    ordered = []
+    for key in section_keys:
+        ordered.extend(col for col in columns if col.get('tab') == key)
+    ordered.extend(col for col in columns if not col.get('tab') or col.get('tab') not in section_keys)
+    return ordered
+
+
+def expand_scoring_columns(columns: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """scoring 컬럼을 항목별 가상 컬럼(<column_key>__<item_id>)으로 펼친다"""
+    expanded = []
+    for col in columns:
+        if col.get('column_type') != 'scoring':
+            expanded.append(dict(col))
+            continue
+        conf = col.get('scoring_config')
+        if conf and isinstance(conf, str):
+            try:
+                conf = json.loads(conf)
+            except Exception:
+                conf = {}
+        for item in (conf or {}).get('items') or []:
+            item_id = item.get('id')
+            if not item_id:
+                continue
+            label = item.get('label') or item_id
+            expanded.append({
+                'column_key': f"{col['column_key']}__{item_id}",
+                'column_name': f"{col.get('column_name', col.get('column_key'))} - {label}",
+                'column_type': 'number',
+                '_virtual': 1,
+                '_source_scoring_key': col['column_key'],
+                '_source_item_id': item_id,
+            })
+    return expanded
+
+
+class DropdownLookup:
+    """내보내기 1회 동안 컬럼별 드롭다운 코드→표시값을 한 번만 조회해 재사용"""
+
+    def __init__(self, fetch_options: Callable[[str], Optional[List[Dict[str, Any]]]]):
+        self._fetch_options = fetch_options
+        self._maps: Dict[str, Dict[Any, Any]] = {}
+
+    def display(self, column_key: str, code: Any) -> Any:
+        """코드에 해당하는 표시값, 없으면 코드 그대로 반환"""
+        mapping = self._maps.get(column_key)
+        if mapping is None:
+            try:
+                options = self._fetch_options(column_key) or []
+            except Exception as e:
+                logger.debug(f"드롭다운 옵션 조회 실패 {column_key}: {e}")
+                options = []
+            mapping = {}
+            for opt in options:
+                mapping.setdefault(opt.get('code'), opt.get('value', opt.get('code')))
+            self._maps[column_key] = mapping
+        try:
+            return mapping.get(code, code)
+        except TypeError:
+            return code
+
+
+def _cell_value(value: Any, known_types: tuple) -> Any:
+    """openpyxl 이 받지 못하는 값(timezone 포함 datetime, dict/list 등)을 변환"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(KST).replace(tzinfo=None)
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str) if value else ''
+    if isinstance(value, known_types):
+        return value
+    return str(value)
+
+
+def _display_length(value: Any) -> int:
+    if value is None:
+        return 0
+    return len(str(value))
+
+
+def write_xlsx(sheet: ExportSheet, path: str) -> int:
+    """ExportSheet 를 write_only 워크북으로 path 에 기록하고 데이터 행 수를 반환"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE, KNOWN_TYPES
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet.title)
+
+    def _clean(value):
+        value = _cell_value(value, KNOWN_TYPES)
+        if isinstance(value, str):
+            return ILLEGAL_CHARACTERS_RE.sub('', value)
+        return value
+
+    rows = iter(sheet.rows)
+    sample = []
+    for row in rows:
+        sample.append([_clean(value) for value in row])
+        if len(sample) >= WIDTH_SAMPLE_ROWS:
+            break
+
+    widths = [_display_length(header) for header in sheet.headers]
+    for row in sample:
+        for idx, value in enumerate(row[:len(widths)]):
+            widths[idx] = max(widths[idx], _display_length(value))
+    for idx, length in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = min((length + 2) * sheet.width_factor, sheet.max_width)
+
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color=HEADER_FILL_COLOR, end_color=HEADER_FILL_COLOR, fill_type="solid")
+    header_align = Alignment(horizontal="center", vertical="center")
+    header_cells = []
+    for header in sheet.headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_align
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    written = 0
+    for row in sample:
+        ws.append(row)
+        written += 1
+    for row in rows:
+        ws.append([_clean(value) for value in row])
+        written += 1
+
+    wb.save(path)
+    return written
+
+
+def _unique_names(headers: Sequence[str]) -> List[str]:
+    """중복 헤더에 _2, _3 을 붙여 parquet 필드명을 유일하게 만든다"""
+    seen: Dict[str, int] = {}
+    names = []
+    for header in headers:
+        name = str(header)
+        count = seen.get(name, 0) + 1
+        seen[name] = count
+        names.append(name if count == 1 else f"{name}_{count}")
+    return names
+
+
+def _text_value(value: Any) -> Optional[str]:
+    """csv/parquet 용 문자열 변환 - dict/list 는 JSON, timezone 포함 datetime 은 KST 기준"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(KST).replace(tzinfo=None)
+        return value.isoformat(sep=' ')
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str) if value else ''
+    return str(value)
+
+
+def _iter_csv_chunks(sheet: ExportSheet, rows_per_chunk: int = 500):
+    """(UTF-8 BOM 으로 시작하는 CSV 바이트 조각, 포함된 데이터 행 수)를 순서대로 낸다"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    buffer.write('\ufeff')
+    writer.writerow(sheet.headers)
+    pending = 0
+    for row in sheet.rows:
+        writer.writerow(['' if value is None else value for value in map(_text_value, row)])
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue().encode('utf-8'), pending
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue().encode('utf-8'), pending
+
+
+def write_csv(sheet: ExportSheet, path: str) -> int:
+    """ExportSheet 를 UTF-8 BOM CSV 로 path 에 기록하고 데이터 행 수를 반환"""
+    written = 0
+    with open(path, 'wb') as f:
+        for chunk, count in _iter_csv_chunks(sheet):
+            f.write(chunk)
+            written += count
+    return written
+
+
+def write_parquet(sheet: ExportSheet, path: str, batch_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """ExportSheet 를 parquet 로 path 에 기록하고 데이터 행 수를 반환
+
+    게시판 동적 컬럼은 행마다 값 타입이 달라 스키마를 고정할 수 없으므로 모든 컬럼을
+    nullable 문자열로 저장한다. batch_size 행씩 row group 으로 기록해 메모리를 일정하게 유지한다.
+    """
+    if pa is None or pq is None:
+        raise ExportFormatError("parquet 내보내기에는 pyarrow 패키지가 필요합니다.")
+
+    names = _unique_names(sheet.headers)
+    schema = pa.schema([pa.field(name, pa.string()) for name in names])
+    width = len(names)
+    written = 0
+
+    def _flush(writer, batch):
+        columns = [[] for _ in range(width)]
+        for row in batch:
+            values = list(row)[:width]
+            values.extend([None] * (width - len(values)))
+            for idx, value in enumerate(values):
+                text = _text_value(value)
+                columns[idx].append(text if text != '' else None)
+        arrays = [pa.array(column, type=pa.string()) for column in columns]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    with pq.ParquetWriter(path, schema, compression='snappy') as writer:
+        batch = []
+        for row in sheet.rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                _flush(writer, batch)
+                written += len(batch)
+                batch = []
+        if batch or not written:
+            _flush(writer, batch)
+            written += len(batch)
+    return written
+
+
+def resolve_export_format(value: Optional[str]) -> str:
+    """요청 format 값 검증 (기본 xlsx) - 지원하지 않거나 사용할 수 없으면 ExportFormatError"""
+    fmt = (value or 'xlsx').strip().lower()
+    if fmt == 'excel':
+        fmt = 'xlsx'
+    if fmt not in EXPORT_FORMATS:
+        raise ExportFormatError(f"지원하지 않는 내보내기 형식입니다: {value} (xlsx, csv, parquet)")
+    if fmt == 'parquet' and pa is None:
+        raise ExportFormatError("parquet 내보내기에는 pyarrow 패키지가 필요합니다.")
+    return fmt
+
+
+def write_export(sheet: ExportSheet, path: str, fmt: str = 'xlsx') -> int:
+    """fmt 형식으로 path 에 기록하고 데이터 행 수를 반환 (백그라운드 작업에서도 사용)"""
+    if fmt == 'csv':
+        return write_csv(sheet, path)
+    if fmt == 'parquet':
+        return write_parquet(sheet, path, get_export_settings()['chunk_size'])
+    return write_xlsx(sheet, path)
+
+
+def export_filename(prefix: str, extension: str = 'xlsx') -> str:
+    return f"{prefix}_{get_korean_time().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError as e:
+        logger.warning(f"내보내기 임시 파일 삭제 실패 {path}: {e}")
+
+
+class _TemporaryExportFile(io.FileIO):
+    """전송이 끝나 close() 될 때 스스로 삭제되는 임시 파일
+
+    send_file 은 파일 응답을 direct_passthrough 로 넘기므로 response.call_on_close 가
+    호출되지 않는다. 파일 객체의 close() 에서 지워야 Windows 에서도 안전하다.
+    """
+
+    _removed = False
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            if not self._removed:
+                self._removed = True
+                _remove_quietly(self.name)
+
+
+def _send_temp_file(sheet: ExportSheet, conn: Optional[Any], fmt: str):
+    """시트를 임시 파일에 기록한 뒤 다운로드 응답으로 스트리밍 (xlsx/parquet)
+
+    conn 을 넘기면 행을 모두 읽은 직후(전송 전에) 닫는다.
+    """
+    from flask import send_file
+
+    fd, path = tempfile.mkstemp(prefix='export_', suffix=f'.{fmt}')
+    os.close(fd)
+    try:
+        try:
+            written = write_export(sheet, path, fmt)
+        finally:
+            if conn is not None:
+                conn.close()
+        logger.info(f"[EXPORT] {sheet.filename_prefix}: {written}행 작성 ({fmt})")
+        export_file = _TemporaryExportFile(path, 'rb')
+    except Exception:
+        _remove_quietly(path)
+        raise
+    try:
+        response = send_file(
+            export_file,
+            mimetype=EXPORT_MIMETYPES[fmt],
+            as_attachment=True,
+            download_name=export_filename(sheet.filename_prefix, fmt),
+        )
+        response.content_length = os.path.getsize(path)
+        return response
+    except Exception:
+        export_file.close()
+        raise
+
+
+def _send_csv_stream(sheet: ExportSheet, conn: Optional[Any]):
+    """CSV 는 임시 파일 없이 행을 읽는 대로 응답으로 흘려보낸다 (연결은 전송이 끝난 뒤 닫음)"""
+    from flask import Response, stream_with_context
+
+    def _generate():
+        written = 0
+        try:
+            for chunk, count in _iter_csv_chunks(sheet):
+                written += count
+                yield chunk
+            logger.info(f"[EXPORT] {sheet.filename_prefix}: {written}행 전송 (csv)")
+        except Exception as e:
+            logger.error(f"[EXPORT] {sheet.filename_prefix} CSV 전송 중단 ({written}행 이후): {e}", exc_info=True)
+            raise
+        finally:
+            if conn is not None:
+                conn.close()
+
+    response = Response(stream_with_context(_generate()), mimetype=EXPORT_MIMETYPES['csv'])
+    filename = export_filename(sheet.filename_prefix, 'csv')
+    response.headers['Content-Disposition'] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    return response
+
+
+def send_export(sheet: ExportSheet, conn: Optional[Any] = None, fmt: str = 'xlsx'):
+    """fmt 형식으로 시트를 다운로드 응답으로 만든다 (csv 는 스트리밍, 나머지는 임시 파일)"""
+    if fmt == 'csv':
+        return _send_csv_stream(sheet, conn)
+    return _send_temp_file(sheet, conn, fmt)
@@ -0,0 +1,382 @@
+"""
+백그라운드 내보내기 작업 큐 (xlsx / csv / parquet)
+대용량 내보내기를 요청 스레드에서 만들지 않고 export_jobs 테이블에 작업으로 넣는다.
+
+- enqueue_export_job(): 작업을 queued 로 등록하고 job id 를 바로 돌려준다.
+  사용자별 진행 중(queued+running) 작업 수는 [EXPORT] job_max_active_per_user 로 제한한다.
+- ExportJobWorker: queued 작업을 FOR UPDATE SKIP LOCKED 로 하나씩 가져와(claim) 파일을 만든다.
+  여러 프로세스/스레드가 동시에 돌아도 같은 작업을 두 번 잡지 않는다.
+  무거운 파일 생성은 웹 프로세스 밖에서 돌린다: scripts/run_export_worker.py 가 워커 전용 프로세스다.
+  [EXPORT] job_worker_enabled = true 면 작업 스케줄러의 export-jobs 작업이 1분마다
+  drain_export_jobs() 로 대기 작업을 처리한다 (기본 false).
+- 완성된 파일은 [EXPORT] job_artifact_dir 에 저장되고 job_artifact_ttl_hours 가 지나면 삭제(expired)된다.
+  만료/시간 초과 정리(cleanup_export_jobs)는 작업 스케줄러의 export-job-cleanup 작업이 한 곳에서 돌린다.
+
+게시판별 시트 구성 함수는 register_export_builder() 로 등록한다 (app.py 의 _build_*_export).
+워커는 등록된 게시판의 작업만 가져간다.
+"""
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import timedelta
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from db_connection import get_config, get_db_connection
+from export_engine import ExportSheet, get_export_settings, write_export
+from timezone_config import get_korean_time
+
+logger = logging.getLogger(__name__)
+
+JOB_TABLE = 'export_jobs'
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_EXPIRED = 'expired'
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+# 사용자별 등록 한도 확인과 INSERT 사이에 다른 요청이 끼어들지 않도록 사용자 단위 advisory lock
+_USER_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtext(%s))"
+
+_builders: Dict[str, Callable[..., ExportSheet]] = {}
+_table_ready = False
+_table_lock = threading.Lock()
+
+
+class ExportJobLimitError(Exception):
+    """사용자별 동시 내보내기 작업 한도 초과"""
+
+
+def register_export_builder(board: str, builder: Callable[..., ExportSheet]) -> None:
+    """게시판 시트 구성 함수 등록 - builder(conn, args, settings) -> ExportSheet"""
+    _builders[board] = builder
+
+
+def registered_boards():
+    return sorted(_builders)
+
+
+def get_job_settings() -> Dict[str, Any]:
+    """[EXPORT] job_* 설정 조회"""
+    config = get_config()
+    artifact_dir = config.get('EXPORT', 'job_artifact_dir', fallback='exports').strip() or 'exports'
+    if not os.path.isabs(artifact_dir):
+        artifact_dir = os.path.join(os.getcwd(), artifact_dir)
+    return {
+        'enabled': config.getboolean('EXPORT', 'job_worker_enabled', fallback=False),
+        'worker_threads': max(1, config.getint('EXPORT', 'job_worker_threads', fallback=2)),
+        'poll_seconds': max(1, config.getint('EXPORT', 'job_poll_seconds', fallback=3)),
+        'max_active_per_user': max(1, config.getint('EXPORT', 'job_max_active_per_user', fallback=2)),
+        'artifact_dir': artifact_dir,
+        'artifact_ttl_hours': max(1, config.getint('EXPORT', 'job_artifact_ttl_hours', fallback=24)),
+        'timeout_minutes': max(1, config.getint('EXPORT', 'job_timeout_minutes', fallback=60)),
+    }
+
+
+def ensure_export_jobs_table(cursor):
+    """작업 테이블과 claim/사용자 조회용 인덱스 생성 (이미 있으면 유지)"""
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {JOB_TABLE} (
+            id VARCHAR(36) PRIMARY KEY,
+            board VARCHAR(50) NOT NULL,
+            params JSONB,
+            format VARCHAR(10) NOT NULL DEFAULT 'xlsx',
+            status VARCHAR(20) NOT NULL DEFAULT 'queued',
+            requested_by VARCHAR(100) NOT NULL,
+            worker_id VARCHAR(100),
+            file_path TEXT,
+            file_name TEXT,
+            row_count INTEGER,
+            error_message TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            finished_at TIMESTAMP,
+            expires_at TIMESTAMP
+        )
+        """
+    )
+    cursor.execute(f"ALTER TABLE {JOB_TABLE} ADD COLUMN IF NOT EXISTS format VARCHAR(10) NOT NULL DEFAULT 'xlsx'")
+    cursor.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{JOB_TABLE}_queued
+        ON {JOB_TABLE}(created_at)
+        WHERE status = 'queued'
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{JOB_TABLE}_user_status
+        ON {JOB_TABLE}(requested_by, status)
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{JOB_TABLE}_expires
+        ON {JOB_TABLE}(expires_at)
+        WHERE status = 'done'
+        """
+    )
+
+
+def _ensure_table(conn):
+    global _table_ready
+    if _table_ready:
+        return
+    with _table_lock:
+        if _table_ready:
+            return
+        cursor = conn.cursor()
+        ensure_export_jobs_table(cursor)
+        conn.commit()
+        _table_ready = True
+
+
+def _now():
+    return get_korean_time().replace(tzinfo=None)
+
+
+def enqueue_export_job(board: str, params: Mapping[str, Any], requested_by: str, fmt: str = 'xlsx') -> str:
+    """내보내기 작업 등록 후 job id 반환 (한도 초과 시 ExportJobLimitError)"""
+    if board not in _builders:
+        raise ValueError(f"지원하지 않는 내보내기 대상입니다: {board}")
+    if not requested_by:
+        raise ValueError("요청 사용자 정보가 없습니다.")
+
+    settings = get_job_settings()
+    conn = get_db_connection()
+    try:
+        _ensure_table(conn)
+        conn.execute(_USER_LOCK_SQL, (f"{JOB_TABLE}:{requested_by}",))
+        row = conn.execute(
+            f"""
+            SELECT COUNT(*) AS active
+            FROM {JOB_TABLE}
+            WHERE requested_by = %s AND status IN (%s, %s)
+            """,
+            (requested_by, *ACTIVE_STATUSES),
+        ).fetchone()
+        if int(row['active'] or 0) >= settings['max_active_per_user']:
+            conn.rollback()
+            raise ExportJobLimitError(
+                f"진행 중인 내보내기가 {settings['max_active_per_user']}건 이상입니다. 완료 후 다시 요청하세요."
+            )
+
+        job_id = str(uuid.uuid4())
+        conn.execute(
+            f"""
+            INSERT INTO {JOB_TABLE} (id, board, params, format, status, requested_by, created_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """,
+            (job_id, board, dict(params or {}), fmt, STATUS_QUEUED, requested_by, _now()),
+        )
+        conn.commit()
+        return job_id
+    finally:
+        conn.close()
+
+
+def get_export_job(job_id: str) -> Optional[Dict[str, Any]]:
+    conn = get_db_connection()
+    try:
+        _ensure_table(conn)
+        row = conn.execute(f"SELECT * FROM {JOB_TABLE} WHERE id = %s", (job_id,)).fetchone()
+        return dict(row) if row else None
+    finally:
+        conn.close()
+
+
+def _claim_next_job(conn, worker_id: str) -> Optional[Dict[str, Any]]:
+    """queued 작업 하나를 running 으로 바꿔 가져온다 (다른 워커가 잡은 행은 건너뜀)"""
+    if not _builders:
+        return None
+    row = conn.execute(
+        f"""
+        UPDATE {JOB_TABLE}
+        SET status = %s, worker_id = %s, started_at = %s
+        WHERE id = (
+            SELECT id FROM {JOB_TABLE}
+            WHERE status = %s
+              AND board = ANY(string_to_array(%s, ','))
+            ORDER BY created_at
+            FOR UPDATE SKIP LOCKED
+            LIMIT 1
+        )
+        RETURNING *
+        """,
+        (STATUS_RUNNING, worker_id, _now(), STATUS_QUEUED, ','.join(_builders)),
+    ).fetchone()
+    conn.commit()
+    return dict(row) if row else None
+
+
+def _finish_job(job_id: str, **fields) -> None:
+    assignments = ', '.join(f"{key} = %s" for key in fields)
+    conn = get_db_connection()
+    try:
+        conn.execute(
+            f"UPDATE {JOB_TABLE} SET {assignments} WHERE id = %s",
+            (*fields.values(), job_id),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run_export_job(job: Mapping[str, Any], settings: Optional[Dict[str, Any]] = None) -> None:
+    """claim 한 작업 하나를 실행해 파일을 만들고 상태를 done/failed 로 기록"""
+    settings = settings or get_job_settings()
+    job_id = job['id']
+    builder = _builders.get(job['board'])
+    fmt = job.get('format') or 'xlsx'
+    os.makedirs(settings['artifact_dir'], exist_ok=True)
+    final_path = os.path.join(settings['artifact_dir'], f"{job_id}.{fmt}")
+    partial_path = f"{final_path}.part"
+
+    conn = None
+    try:
+        if builder is None:
+            raise ValueError(f"등록되지 않은 내보내기 대상: {job['board']}")
+        params = job.get('params') or {}
+        conn = get_db_connection()
+        sheet = builder(conn, params, get_export_settings())
+        row_count = write_export(sheet, partial_path, fmt)
+        conn.close()
+        conn = None
+        os.replace(partial_path, final_path)
+
+        finished = _now()
+        _finish_job(
+            job_id,
+            status=STATUS_DONE,
+            file_path=final_path,
+            file_name=f"{sheet.filename_prefix}_{finished.strftime('%Y%m%d_%H%M%S')}.{fmt}",
+            row_count=row_count,
+            finished_at=finished,
+            expires_at=finished + timedelta(hours=settings['artifact_ttl_hours']),
+        )
+        logger.info(f"[EXPORT JOB] {job_id} ({job['board']}) 완료: {row_count}행")
+    except Exception as e:
+        logger.error(f"[EXPORT JOB] {job_id} ({job.get('board')}) 실패: {e}", exc_info=True)
+        if conn is not None:
+            conn.close()
+        for path in (partial_path, final_path):
+            if os.path.exists(path):
+                _remove_file(path)
+        _finish_job(job_id, status=STATUS_FAILED, error_message=str(e)[:2000], finished_at=_now())
+
+
+def _remove_file(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"[EXPORT JOB] 파일 삭제 실패 {path}: {e}")
+
+
+def cleanup_export_jobs(settings: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """만료된 파일 삭제, 시간 초과된 running 작업을 failed 로 정리"""
+    settings = settings or get_job_settings()
+    now = _now()
+    conn = get_db_connection()
+    try:
+        _ensure_table(conn)
+        expired_rows = conn.execute(
+            f"""
+            UPDATE {JOB_TABLE}
+            SET status = %s
+            WHERE status = %s AND expires_at < %s
+            RETURNING file_path
+            """,
+            (STATUS_EXPIRED, STATUS_DONE, now),
+        ).fetchall()
+        timed_out = conn.execute(
+            f"""
+            UPDATE {JOB_TABLE}
+            SET status = %s, error_message = %s, finished_at = %s
+            WHERE status = %s AND started_at < %s
+            """,
+            (
+                STATUS_FAILED,
+                '작업 시간 초과 (워커 중단 가능성)',
+                now,
+                STATUS_RUNNING,
+                now - timedelta(minutes=settings['timeout_minutes']),
+            ),
+        ).rowcount
+        conn.commit()
+    finally:
+        conn.close()
+
+    for row in expired_rows:
+        _remove_file(row['file_path'])
+    return {'expired': len(expired_rows), 'timed_out': timed_out or 0}
+
+
+class ExportJobWorker:
+    """export_jobs 를 폴링하며 작업을 처리하는 백그라운드 스레드 묶음"""
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None):
+        self.settings = settings or get_job_settings()
+        self._threads = []
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        for index in range(self.settings['worker_threads']):
+            worker_id = f"{socket.gethostname()}:{os.getpid()}:{index}"
+            thread = threading.Thread(
+                target=self._run, args=(worker_id,), name=f"export-job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """stop() 후 진행 중인 작업이 끝날 때까지 기다린다"""
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def wait_stopped(self, timeout: Optional[float] = None) -> bool:
+        """stop() 이 불릴 때까지 기다린다 (워커 전용 프로세스의 주 스레드용)"""
+        return self._stopping.wait(timeout)
+
+    def run_once(self, worker_id: str) -> bool:
+        """작업 하나를 처리했으면 True"""
+        conn = get_db_connection()
+        try:
+            _ensure_table(conn)
+            job = _claim_next_job(conn, worker_id)
+        finally:
+            conn.close()
+        if job is None:
+            return False
+        run_export_job(job, self.settings)
+        return True
+
+    def _run(self, worker_id: str) -> None:
+        logger.info(f"[EXPORT JOB] worker {worker_id} started")
+        while not self._stopping.is_set():
+            try:
+                if self.run_once(worker_id):
+                    continue
+            except Exception as e:
+                logger.error(f"[EXPORT JOB] worker {worker_id} 오류: {e}", exc_info=True)
+            self._stopping.wait(self.settings['poll_seconds'])
+
+
+def drain_export_jobs(settings: Optional[Dict[str, Any]] = None) -> int:
+    """대기 작업을 이 스레드에서 모두 처리하고 처리 건수를 돌려준다 (작업 스케줄러, --once 용)"""
+    worker = ExportJobWorker(settings)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:drain"
+    processed = 0
+    while worker.run_once(worker_id):
+        processed += 1
+    return processed
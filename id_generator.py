@@ -1,10 +1,43 @@
+"""
+게시판 번호(FS/FP/SA/SR/SP + yyMMdd + 순번) 발급
+
+접두사/날짜별 마지막 순번을 id_counters 테이블 한 행에 두고
+UPDATE ... RETURNING (그날 첫 발급이면 INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+한 문장으로 올린다. 행 잠금이 같은 접두사/날짜의 발급을 줄 세우므로 동시에 등록해도
+같은 번호가 나오지 않고, 발급 비용은 기존 번호 수와 무관하다.
+
+- 발급은 별도 연결에서 바로 커밋한다 (시퀀스처럼 등록이 롤백되면 번호는 비어 있게 된다).
+- 그날 첫 발급 때만 기존 테이블의 마지막 번호를 한 번 읽어 이어서 센다.
+- 발급을 거치지 않고 저장되는 번호(외부 동기화 원본 번호, 사용자가 입력한 번호)는
+  register_explicit_ids() 로 카운터를 그 번호 이상으로 올려 이후 발급과 겹치지 않게 한다.
+- 대량 등록/동기화는 allocate_board_numbers() / allocate_numbers_for_dates() 로
+  날짜별 N개 번호를 한 번에 받는다.
+"""
 import logging
-from datetime import datetime
-from typing import Iterable, Optional
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from timezone_config import get_korean_time
-from db_connection import get_db_connection
-from db.schema import table_exists
+from timezone_config import get_korean_time
+from db_connection import get_db_connection
+from db.schema import table_exists
+
+COUNTER_TABLE = 'id_counters'
+
+# 접두사 → (테이블, 번호 컬럼, 순번 자릿수, 대체 테이블 후보)
+BOARD_ID_FORMATS = {
+    'FS': ('follow_sop', 'work_req_no', 4, ('follow_sop_cache', 'followsop_cache')),
+    'FP': ('full_process', 'fullprocess_number', 5, ('full_process_cache', 'fullprocess_cache')),
+    'SA': ('subcontract_approval', 'approval_number', 3, ()),
+    'SR': ('subcontract_report', 'report_number', 3, ()),
+    'SP': ('safe_workplace', 'safeplace_no', 4, ('safe_workplace_cache',)),
+}
+
+# 접두사(2자) + yyMMdd + 순번
+_ID_PATTERN = re.compile(r'^([A-Z]{2})([0-9]{6})([0-9]+)$')
+
+_counter_table_ready = False
+_counter_table_lock = threading.Lock()
 
 
 def _resolve_existing_table(conn, primary: str, candidates: Optional[Iterable[str]] = None) -> str:
@@ -20,11 +53,11 @@ def _resolve_existing_table(conn, primary: str, candidates: Optional[Iterable[st
     if not names:
         return primary
 
-    for name in names:
-        try:
-            exists = table_exists(conn, name)
-        except Exception:
-            exists = False
+    for name in names:
+        try:
+            exists = table_exists(conn, name)
+        except Exception:
+            exists = False
 
         if exists:
             return name
@@ -32,221 +65,228 @@ def _resolve_existing_table(conn, primary: str, candidates: Optional[Iterable[st
     return primary
 
 
-def generate_unique_id(prefix, db_path, table_name, id_column, base_datetime=None, counter_digits=4, table_candidates=None):
+def ensure_id_counter_table(cursor):
+    """접두사/날짜별 순번 테이블 생성 (이미 있으면 유지)"""
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {COUNTER_TABLE} (
+            prefix VARCHAR(10) NOT NULL,
+            day VARCHAR(6) NOT NULL,
+            last_value BIGINT NOT NULL,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (prefix, day)
+        )
+        """
+    )
+
+
+def _ensure_counter_table(conn):
+    global _counter_table_ready
+    if _counter_table_ready:
+        return
+    with _counter_table_lock:
+        if _counter_table_ready:
+            return
+        ensure_id_counter_table(conn.cursor())
+        conn.commit()
+        _counter_table_ready = True
+
+
+def _last_existing_counter(conn, table_name, id_column, prefix, base_id) -> int:
+    """카운터 도입 전/밖에서 들어간 번호까지 고려한 그날 마지막 순번 (첫 발급 때 한 번만 조회)"""
+    start = len(prefix) + len(base_id) + 1
+    row = conn.execute(
+        f"""
+        SELECT MAX(CAST(SUBSTRING({id_column} FROM {start}) AS BIGINT))
+        FROM {table_name}
+        WHERE {id_column} LIKE %s
+          AND SUBSTRING({id_column} FROM {start}) ~ '^[0-9]+$'
+        """,
+        (f"{prefix}{base_id}%",),
+    ).fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def allocate_unique_ids(prefix, db_path, table_name, id_column, count=1, base_datetime=None,
+                        counter_digits=4, table_candidates=None) -> List[str]:
     """
-    접두사 + yyMMdd + N자리 순번 형식의 고유 ID 생성
+    접두사 + yyMMdd + N자리 순번 형식의 고유 ID count 개를 연속으로 발급
 
     Args:
-        prefix: ID 접두사 (예: 'FS', 'FP', 'SI')
+        prefix: ID 접두사 (예: 'FS', 'FP')
         db_path: 데이터베이스 경로
-        table_name: 테이블명
+        table_name: 번호가 저장되는 테이블명 (그날 첫 발급 때 기존 마지막 번호 조회용)
         id_column: ID 컬럼명
+        count: 발급할 개수
         base_datetime: 기준 시간 (없으면 현재 한국 시간 사용)
         counter_digits: 순번 자릿수 (FS는 4자리, FP는 5자리)
 
     Returns:
-        str: 생성된 고유 ID (예: FS2412010001, FP24120100001)
+        list[str]: 발급된 ID 목록 (예: ['FS2412010001', 'FS2412010002'])
     """
-    if base_datetime:
-        # 전달받은 시간 사용 (created_at 기반)
-        korean_time = base_datetime
-    else:
-        # 기본값: 현재 한국 시간
-        korean_time = get_korean_time()
+    count = int(count)
+    if count < 1:
+        return []
 
+    korean_time = base_datetime or get_korean_time()
     base_id = korean_time.strftime('%y%m%d')  # yyMMdd (날짜만)
 
-    conn = None
-    cursor = None
-    resolved_table = table_name
-
+    conn = get_db_connection(db_path, timeout=30.0)
     try:
-        conn = get_db_connection(db_path, timeout=30.0)
-        resolved_table = _resolve_existing_table(conn, table_name, table_candidates)
-        cursor = conn.cursor()
-
-        pattern = f"{prefix}{base_id}%"
-        cursor.execute(
+        _ensure_counter_table(conn)
+        row = conn.execute(
             f"""
-            SELECT {id_column}
-            FROM {resolved_table}
-            WHERE {id_column} LIKE %s
-            ORDER BY {id_column} DESC
-            LIMIT 1
+            UPDATE {COUNTER_TABLE}
+            SET last_value = last_value + %s, updated_at = CURRENT_TIMESTAMP
+            WHERE prefix = %s AND day = %s
+            RETURNING last_value
             """,
-            (pattern,),
-        )
-
-        result = cursor.fetchone()
-
-        if result:
-            if isinstance(result, dict):
-                last_id = result.get(id_column)
-                if not last_id and result:
-                    try:
-                        last_id = next(iter(result.values()))
-                    except Exception:
-                        last_id = None
-            else:
-                try:
-                    last_id = result[0]
-                except Exception:
-                    last_id = None
-            last_counter = int(str(last_id)[len(prefix) + 6:]) if last_id else 0
-            new_counter = last_counter + 1
-        else:
-            new_counter = 1
-
-        max_counter = 10 ** counter_digits - 1
-        if new_counter > max_counter:
-            logging.warning(f"Counter overflow for {prefix}{base_id}, resetting to 1")
-            new_counter = 1
-
-        unique_id = f"{prefix}{base_id}{new_counter:0{counter_digits}d}"
-
+            (count, prefix, base_id),
+        ).fetchone()
+        if row is None:
+            # 그날 첫 발급: 기존 번호 뒤에서 시작. 동시에 첫 발급해도 ON CONFLICT 쪽이 이어서 센다
+            resolved_table = _resolve_existing_table(conn, table_name, table_candidates)
+            seed = _last_existing_counter(conn, resolved_table, id_column, prefix, base_id)
+            row = conn.execute(
+                f"""
+                INSERT INTO {COUNTER_TABLE} (prefix, day, last_value)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (prefix, day) DO UPDATE SET
+                    last_value = {COUNTER_TABLE}.last_value + %s,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING last_value
+                """,
+                (prefix, base_id, seed + count, count),
+            ).fetchone()
         conn.commit()
-        logging.info(f"고유 ID 생성: {unique_id} (table={resolved_table})")
-        return unique_id
-
     except Exception as e:
-        if conn:
-            try:
-                conn.rollback()
-            except Exception:
-                pass
-        logging.error(f"ID 생성 오류: {e}")
-        import random
-        max_random = 10 ** counter_digits - 1
-        fallback_id = f"{prefix}{base_id}{random.randint(1, max_random):0{counter_digits}d}"
-        logging.warning(f"폴백 ID 사용: {fallback_id}")
-        return fallback_id
-    finally:
         try:
-            if cursor and hasattr(cursor, 'close'):
-                cursor.close()
+            conn.rollback()
         except Exception:
             pass
-        if conn:
-            try:
-                conn.close()
-            except Exception:
-                pass
+        logging.error(f"ID 발급 오류 ({prefix}{base_id}): {e}")
+        raise
+    finally:
+        conn.close()
 
+    last_value = int(row[0])
+    first_value = last_value - count + 1
+    if last_value > 10 ** counter_digits - 1:
+        # 번호를 되돌려 쓰면 중복되므로 자릿수를 넘겨서라도 계속 발급
+        logging.warning(f"ID 순번이 {counter_digits}자리를 넘었습니다: {prefix}{base_id} (마지막 {last_value})")
 
-def generate_followsop_number(db_path, base_datetime=None):
-    """Follow SOP 점검번호 생성 (FSYYMMDDNNNN - 4자리 순번)"""
-    return generate_unique_id(
-        'FS',
-        db_path,
-        'follow_sop',
-        'work_req_no',
-        base_datetime,
-        counter_digits=4,
-        table_candidates=('follow_sop_cache', 'followsop_cache'),
-    )
+    ids = [f"{prefix}{base_id}{value:0{counter_digits}d}" for value in range(first_value, last_value + 1)]
+    logging.info(f"고유 ID 발급: {ids[0]}" + (f" ~ {ids[-1]} ({count}개)" if count > 1 else ""))
+    return ids
 
 
-def generate_fullprocess_number(db_path, base_datetime=None):
-    """Full Process 평가번호 생성 (FPYYMMDDNNNNN - 5자리 순번)"""
-    return generate_unique_id(
-        'FP',
-        db_path,
-        'full_process',
-        'fullprocess_number',
-        base_datetime,
-        counter_digits=5,
-        table_candidates=('full_process_cache', 'fullprocess_cache'),
-    )
+def register_explicit_ids(conn, ids: Iterable[str]) -> int:
+    """
+    발급을 거치지 않고 저장하는 번호를 id_counters 에 반영한다 (BOARD_ID_FORMATS 형식만).
+    접두사/날짜별로 카운터를 GREATEST(현재 값, 번호 순번) 로 올리고, 그날 카운터가 아직
+    없으면 기존 테이블의 마지막 번호와 비교해 만든다.
 
+    번호를 쓰는 쪽 연결에서 커밋 직전에 부른다. 카운터 행 잠금이 커밋까지 유지되므로
+    그동안의 발급은 기다렸다가 이 번호 뒤에서 이어진다.
 
-def generate_subcontract_approval_number(db_path, base_datetime=None):
-    """산안법 도급승인 번호 생성 (SAyyMMdd### - 3자리 순번)"""
-    return generate_unique_id(
-        'SA',
-        db_path,
-        'subcontract_approval',
-        'approval_number',
-        base_datetime,
-        counter_digits=3,
-    )
+    Returns:
+        int: 갱신한 접두사/날짜 수
+    """
+    highest: Dict[Tuple[str, str], int] = {}
+    for value in ids:
+        match = _ID_PATTERN.match(str(value or '').strip())
+        if not match or match.group(1) not in BOARD_ID_FORMATS:
+            continue
+        key = (match.group(1), match.group(2))
+        highest[key] = max(highest.get(key, 0), int(match.group(3)))
+    if not highest:
+        return 0
 
+    if not _counter_table_ready:
+        # 호출한 쪽 트랜잭션 안이므로 커밋하지 않는다 (CREATE TABLE IF NOT EXISTS 는 함께 커밋됨)
+        ensure_id_counter_table(conn.cursor())
+    for (prefix, day), value in sorted(highest.items()):
+        table_name, id_column, _, candidates = BOARD_ID_FORMATS[prefix]
+        row = conn.execute(
+            f"""
+            UPDATE {COUNTER_TABLE}
+            SET last_value = GREATEST(last_value, %s), updated_at = CURRENT_TIMESTAMP
+            WHERE prefix = %s AND day = %s
+            RETURNING last_value
+            """,
+            (value, prefix, day),
+        ).fetchone()
+        if row is None:
+            resolved_table = _resolve_existing_table(conn, table_name, candidates)
+            seed = _last_existing_counter(conn, resolved_table, id_column, prefix, day)
+            conn.execute(
+                f"""
+                INSERT INTO {COUNTER_TABLE} (prefix, day, last_value)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (prefix, day) DO UPDATE SET
+                    last_value = GREATEST({COUNTER_TABLE}.last_value, EXCLUDED.last_value),
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (prefix, day, max(seed, value)),
+            )
+    return len(highest)
 
-def generate_subcontract_report_number(db_path, base_datetime=None):
-    """화관법 도급신고 번호 생성 (SRyyMMdd### - 3자리 순번)"""
-    return generate_unique_id(
-        'SR',
-        db_path,
-        'subcontract_report',
-        'report_number',
-        base_datetime,
-        counter_digits=3,
-    )
 
-
-def generate_safeplace_number(db_path, base_datetime=None):
-    """Safe Workplace 점검번호 생성 (SPYYMMDDNNNN - 4자리 순번)
+def generate_unique_id(prefix, db_path, table_name, id_column, base_datetime=None, counter_digits=4, table_candidates=None):
+    """
+    접두사 + yyMMdd + N자리 순번 형식의 고유 ID 생성 (allocate_unique_ids 1개 발급)
 
-    기본적으로 PostgreSQL을 사용하고, 실패 시 기존 SQLite 로직으로 폴백한다.
+    Returns:
+        str: 생성된 고유 ID (예: FS2412010001, FP24120100001)
     """
-    korean_time = base_datetime or get_korean_time()
-    base_id = korean_time.strftime('%y%m%d')
-    prefix = 'SP'
+    return allocate_unique_ids(
+        prefix, db_path, table_name, id_column, 1, base_datetime, counter_digits, table_candidates,
+    )[0]
 
-    try:
-        from db_connection import get_db_connection
-        conn = get_db_connection()
-        table_name = _resolve_existing_table(conn, 'safe_workplace', ('safe_workplace_cache',))
-        cursor = conn.cursor()
 
-        pattern = f"{prefix}{base_id}%"
-        cursor.execute(
-            f"""
-            SELECT safeplace_no
-            FROM {table_name}
-            WHERE safeplace_no LIKE %s
-            ORDER BY safeplace_no DESC
-            LIMIT 1
-            """,
-            (pattern,),
-        )
+def allocate_board_numbers(prefix, count, base_datetime=None, db_path=None) -> List[str]:
+    """BOARD_ID_FORMATS 에 정의된 게시판 번호 count 개 발급 (같은 날짜 기준)"""
+    table_name, id_column, counter_digits, candidates = BOARD_ID_FORMATS[prefix]
+    return allocate_unique_ids(
+        prefix, db_path, table_name, id_column, count, base_datetime, counter_digits, candidates,
+    )
 
-        row = cursor.fetchone()
-        last_id = None
-        if row:
-            if isinstance(row, dict):
-                last_id = row.get('safeplace_no')
-                if not last_id and row:
-                    try:
-                        last_id = next(iter(row.values()))
-                    except Exception:
-                        last_id = None
-            else:
-                try:
-                    last_id = row[0]
-                except Exception:
-                    last_id = None
-
-        if last_id:
-            try:
-                last_counter = int(str(last_id)[len(prefix) + 6:])
-            except ValueError:
-                last_counter = 0
-            new_counter = last_counter + 1
-        else:
-            new_counter = 1
-
-        max_counter = 10 ** 4 - 1
-        if new_counter > max_counter:
-            logging.warning(f"Safe Workplace counter overflow for {prefix}{base_id}, resetting to 1")
-            new_counter = 1
-
-        unique_id = f"{prefix}{base_id}{new_counter:04d}"
-
-        cursor.close()
-        conn.close()
-        logging.info(f"Safe Workplace 고유 ID 생성(PostgreSQL): {unique_id} (table={table_name})")
-        return unique_id
 
-    except Exception as e:
-        logging.error(f"Safe Workplace ID 생성(PostgreSQL) 실패: {e}")
-        raise
+def allocate_numbers_for_dates(prefix, datetimes, db_path=None) -> List[str]:
+    """행마다 기준 시간을 받아 같은 순서로 번호를 돌려준다 (날짜별로 한 번씩만 발급 요청)"""
+    datetimes = list(datetimes)
+    by_day = {}
+    for index, value in enumerate(datetimes):
+        by_day.setdefault(value.strftime('%y%m%d'), []).append(index)
+
+    numbers: List[Optional[str]] = [None] * len(datetimes)
+    for indexes in by_day.values():
+        block = allocate_board_numbers(prefix, len(indexes), datetimes[indexes[0]], db_path)
+        for index, number in zip(indexes, block):
+            numbers[index] = number
+    return numbers
+
+
+def generate_followsop_number(db_path, base_datetime=None):
+    """Follow SOP 점검번호 생성 (FSYYMMDDNNNN - 4자리 순번)"""
+    return allocate_board_numbers('FS', 1, base_datetime, db_path)[0]
+
+
+def generate_fullprocess_number(db_path, base_datetime=None):
+    """Full Process 평가번호 생성 (FPYYMMDDNNNNN - 5자리 순번)"""
+    return allocate_board_numbers('FP', 1, base_datetime, db_path)[0]
+
+
+def generate_subcontract_approval_number(db_path, base_datetime=None):
+    """산안법 도급승인 번호 생성 (SAyyMMdd### - 3자리 순번)"""
+    return allocate_board_numbers('SA', 1, base_datetime, db_path)[0]
+
+
+def generate_subcontract_report_number(db_path, base_datetime=None):
+    """화관법 도급신고 번호 생성 (SRyyMMdd### - 3자리 순번)"""
+    return allocate_board_numbers('SR', 1, base_datetime, db_path)[0]
+
+
+def generate_safeplace_number(db_path, base_datetime=None):
+    """Safe Workplace 점검번호 생성 (SPYYMMDDNNNN - 4자리 순번)"""
+    return allocate_board_numbers('SP', 1, base_datetime, db_path)[0]
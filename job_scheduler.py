@@ -0,0 +1,616 @@
+"""
+통합 작업 스케줄러 (실행 이력/지표 기록)
+app.py 의 동기화 루프가 각자 잠들었다 깨어나 시각을 확인하고, 마지막 실행 시각은
+sync_state / master_sync_state 같은 작업별 상태 행에 따로 남기던 것을 하나로 모은다.
+
+- register_job(): 작업 이름, 실행 함수, cron 일정(분 시 일 월 요일, KST)을 등록한다.
+- scheduler_jobs: 작업별 일정과 다음 실행 시각(next_run_at), 마지막 상태.
+  다음 실행 시각은 DB 에 있으므로 프로세스가 재시작돼도 일정이 이어진다.
+- scheduler_job_runs: 실행 1회당 1행 (트리거, 상태, 시작/종료 시각, 소요 시간, 읽은/쓴 행 수, 메시지).
+- scheduler_job_run_sources: 실행 안의 소스(협력사, 부서 등)별 상태/소요 시간/읽은·쓴 행 수.
+  어느 소스가 느린지, 동기화 시각을 어디로 옮길지 판단하는 근거가 된다.
+- JobScheduler: [SCHEDULER] poll_seconds 마다 도래한 작업을 실행한다.
+  클러스터에서는 db.leader.LeaderLease('job-scheduler') 를 가진 프로세스 한 곳만 돌고,
+  같은 작업은 한 번에 하나만 실행된다 (앞 실행이 끝나지 않았으면 이번 회차는 건너뜀).
+
+수동/부트 실행처럼 스케줄러 밖에서 도는 작업도 record_run() 으로 감싸면 같은 이력 테이블에 남는다.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from db_connection import get_config, get_db_connection
+from sync_orchestrator import collect_sync_rows
+from timezone_config import get_korean_time
+
+logger = logging.getLogger(__name__)
+
+JOBS_TABLE = 'scheduler_jobs'
+RUNS_TABLE = 'scheduler_job_runs'
+SOURCES_TABLE = 'scheduler_job_run_sources'
+
+STATUS_RUNNING = 'running'
+STATUS_SUCCESS = 'success'
+STATUS_FAILED = 'failed'
+STATUS_ERROR = 'error'
+STATUS_SKIPPED = 'skipped'
+
+_CRON_ALIASES = {
+    '@hourly': '0 * * * *',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@weekly': '0 0 * * 0',
+    '@monthly': '0 0 1 * *',
+}
+# (최소, 최대) - 분, 시, 일, 월, 요일(0=일요일, 7 도 일요일)
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+# 불가능한 일정(예: 2월 30일)에서 무한히 돌지 않도록 찾는 범위 제한
+_CRON_SEARCH_YEARS = 5
+
+_jobs: Dict[str, 'ScheduledJob'] = {}
+_running: set = set()
+_running_lock = threading.Lock()
+_table_ready = False
+_table_lock = threading.Lock()
+
+
+class CronSchedule:
+    """5필드 cron 식 (분 시 일 월 요일). *, 목록(1,15), 범위(1-5), 간격(*/10, 0-30/5), @daily 등 지원"""
+
+    def __init__(self, expr: str):
+        self.expr = (expr or '').strip()
+        fields = _CRON_ALIASES.get(self.expr.lower(), self.expr).split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expr!r}")
+        parsed = [self._parse_field(field, low, high) for field, (low, high) in zip(fields, _CRON_FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {day % 7 for day in weekdays}
+        # 일/요일이 둘 다 지정되면 cron 관례대로 둘 중 하나만 맞아도 실행
+        self._day_or_weekday = fields[2] != '*' and fields[4] != '*'
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set:
+        values = set()
+        for item in field.split(','):
+            body, _, step_text = item.partition('/')
+            step = int(step_text) if step_text else 1
+            if step < 1:
+                raise ValueError(f"cron 간격은 1 이상이어야 합니다: {field!r}")
+            if body == '*':
+                start, end = low, high
+            elif '-' in body:
+                start_text, end_text = body.split('-', 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = int(body)
+                end = high if step_text else start
+            if start < low or end > high or start > end:
+                raise ValueError(f"cron 값 범위({low}-{high})를 벗어났습니다: {field!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._day_or_weekday:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(dt 제외) 첫 실행 시각 (분 단위)"""
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * _CRON_SEARCH_YEARS)
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                if candidate.month == 12:
+                    candidate = candidate.replace(year=candidate.year + 1, month=1, day=1, hour=0, minute=0)
+                else:
+                    candidate = candidate.replace(month=candidate.month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"{_CRON_SEARCH_YEARS}년 안에 실행 시각이 없는 cron 식입니다: {self.expr!r}")
+
+    def __repr__(self):
+        return f"CronSchedule({self.expr!r})"
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: Callable[['JobRun'], Any]
+    schedule: Optional[CronSchedule] = None
+    description: str = ''
+    enabled: Optional[Callable[[], bool]] = None
+
+    def is_enabled(self) -> bool:
+        return self.enabled is None or bool(self.enabled())
+
+
+def register_job(name: str, func: Callable[['JobRun'], Any], schedule: Optional[str] = None,
+                 description: str = '', enabled: Optional[Callable[[], bool]] = None) -> ScheduledJob:
+    """
+    작업 등록 - func(run) 은 JobRun 을 받아 실행하고, False 를 돌려주면 실패로 기록된다.
+    schedule 이 없으면 run_job() 으로만 실행되는 수동 작업이다.
+    enabled 는 매 확인 때 부르는 함수로, False 면 예약 실행을 건너뛴다.
+    """
+    job = ScheduledJob(name, func, CronSchedule(schedule) if schedule else None, description, enabled)
+    _jobs[name] = job
+    return job
+
+
+def registered_jobs() -> List[ScheduledJob]:
+    return list(_jobs.values())
+
+
+def get_scheduler_settings() -> Dict[str, Any]:
+    """[SCHEDULER] 설정 조회"""
+    config = get_config()
+    return {
+        'enabled': config.getboolean('SCHEDULER', 'enabled', fallback=True),
+        'poll_seconds': max(5, config.getint('SCHEDULER', 'poll_seconds', fallback=30)),
+        'run_history_days': max(1, config.getint('SCHEDULER', 'run_history_days', fallback=90)),
+        'run_timeout_hours': max(1, config.getint('SCHEDULER', 'run_timeout_hours', fallback=6)),
+    }
+
+
+def job_schedule(name: str, default: str) -> str:
+    """[SCHEDULER] <작업명>_schedule (작업명의 '-' 는 '_'), 비어 있으면 default"""
+    config = get_config()
+    value = config.get('SCHEDULER', f"{name.replace('-', '_')}_schedule", fallback='').strip()
+    return value or default
+
+
+def ensure_scheduler_tables(cursor):
+    """작업/실행/소스별 실행 테이블 생성 (이미 있으면 유지)"""
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {JOBS_TABLE} (
+            name VARCHAR(100) PRIMARY KEY,
+            schedule VARCHAR(100),
+            description TEXT,
+            enabled BOOLEAN NOT NULL DEFAULT TRUE,
+            next_run_at TIMESTAMP,
+            last_status VARCHAR(20),
+            last_started_at TIMESTAMP,
+            last_finished_at TIMESTAMP,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {RUNS_TABLE} (
+            id BIGSERIAL PRIMARY KEY,
+            job_name VARCHAR(100) NOT NULL,
+            trigger VARCHAR(20) NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            finished_at TIMESTAMP,
+            duration_ms BIGINT,
+            rows_read BIGINT,
+            rows_written BIGINT,
+            message TEXT,
+            host VARCHAR(255),
+            pid INTEGER
+        )
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{RUNS_TABLE}_job_started
+        ON {RUNS_TABLE}(job_name, started_at DESC)
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {SOURCES_TABLE} (
+            run_id BIGINT NOT NULL REFERENCES {RUNS_TABLE}(id) ON DELETE CASCADE,
+            source VARCHAR(100) NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            duration_ms BIGINT,
+            rows_read BIGINT,
+            rows_written BIGINT,
+            message TEXT,
+            PRIMARY KEY (run_id, source)
+        )
+        """
+    )
+
+
+def _ensure_tables(conn):
+    global _table_ready
+    if _table_ready:
+        return
+    with _table_lock:
+        if _table_ready:
+            return
+        cursor = conn.cursor()
+        ensure_scheduler_tables(cursor)
+        conn.commit()
+        _table_ready = True
+
+
+def _now():
+    return get_korean_time().replace(tzinfo=None)
+
+
+def _ms(seconds: Optional[float]) -> Optional[int]:
+    return None if seconds is None else int(seconds * 1000)
+
+
+class JobRun:
+    """실행 1회의 기록. record_run() 이 만들어 작업 함수에 넘긴다."""
+
+    def __init__(self, job_name: str, trigger: str):
+        self.id: Optional[int] = None
+        self.job_name = job_name
+        self.trigger = trigger
+        self.status = STATUS_SUCCESS
+        self.message: Optional[str] = None
+        self.rows_read = 0
+        self.rows_written = 0
+        self.started_at = _now()
+        self._started = time.monotonic()
+        self._sources: List[tuple] = []
+
+    def fail(self, message: str) -> None:
+        self.status = STATUS_FAILED
+        self.message = message
+
+    def skip(self, message: str) -> None:
+        self.status = STATUS_SKIPPED
+        self.message = message
+
+    def add_rows(self, read: Optional[int] = None, written: Optional[int] = None) -> None:
+        self.rows_read += read or 0
+        self.rows_written += written or 0
+
+    def record_source(self, source: str, status: str, elapsed: Optional[float] = None,
+                      rows_read: Optional[int] = None, rows_written: Optional[int] = None,
+                      message: Optional[str] = None) -> None:
+        """소스 하나의 결과 기록 (실행 합계 행 수에도 더해짐)"""
+        self._sources.append((source, status, _ms(elapsed), rows_read, rows_written, message or None))
+        self.add_rows(rows_read, rows_written)
+
+    def record_outcomes(self, outcomes) -> None:
+        """sync_orchestrator.run_sync_sources() 결과(소스명 → SyncOutcome)를 소스별로 기록"""
+        for outcome in outcomes.values():
+            self.record_source(outcome.name, outcome.status, outcome.elapsed,
+                               outcome.rows_read, outcome.rows_written, outcome.detail)
+
+    def run_source(self, source: str, runner: Callable[[], Any]) -> Any:
+        """runner() 를 소스 하나로 실행하고 기록 (False 반환은 failed, 예외는 error 로 남기고 다시 던짐)"""
+        started = time.monotonic()
+        with collect_sync_rows() as counts:
+            try:
+                result = runner()
+            except Exception as exc:
+                self.record_source(source, STATUS_ERROR, time.monotonic() - started,
+                                   counts.get('rows_read'), counts.get('rows_written'), str(exc))
+                raise
+        status = STATUS_FAILED if result is False else STATUS_SUCCESS
+        self.record_source(source, status, time.monotonic() - started,
+                           counts.get('rows_read'), counts.get('rows_written'))
+        return result
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def _begin(self) -> None:
+        conn = get_db_connection()
+        try:
+            _ensure_tables(conn)
+            row = conn.execute(
+                f"""
+                INSERT INTO {RUNS_TABLE} (job_name, trigger, status, started_at, host, pid)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                RETURNING id
+                """,
+                (self.job_name, self.trigger, STATUS_RUNNING, self.started_at, socket.gethostname(), os.getpid()),
+            ).fetchone()
+            self.id = row[0]
+            conn.execute(
+                f"""
+                INSERT INTO {JOBS_TABLE} (name, last_status, last_started_at)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (name) DO UPDATE SET
+                    last_status = EXCLUDED.last_status,
+                    last_started_at = EXCLUDED.last_started_at,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (self.job_name, STATUS_RUNNING, self.started_at),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _finish(self) -> None:
+        finished_at = _now()
+        conn = get_db_connection()
+        try:
+            conn.execute(
+                f"""
+                UPDATE {RUNS_TABLE}
+                SET status = %s, finished_at = %s, duration_ms = %s,
+                    rows_read = %s, rows_written = %s, message = %s
+                WHERE id = %s
+                """,
+                (self.status, finished_at, _ms(self.elapsed), self.rows_read, self.rows_written,
+                 self.message, self.id),
+            )
+            if self._sources:
+                conn.cursor().executemany(
+                    f"""
+                    INSERT INTO {SOURCES_TABLE}
+                        (run_id, source, status, duration_ms, rows_read, rows_written, message)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (run_id, source) DO UPDATE SET
+                        status = EXCLUDED.status, duration_ms = EXCLUDED.duration_ms,
+                        rows_read = EXCLUDED.rows_read, rows_written = EXCLUDED.rows_written,
+                        message = EXCLUDED.message
+                    """,
+                    [(self.id, *source) for source in self._sources],
+                )
+            conn.execute(
+                f"UPDATE {JOBS_TABLE} SET last_status = %s, last_finished_at = %s, "
+                f"updated_at = CURRENT_TIMESTAMP WHERE name = %s",
+                (self.status, finished_at, self.job_name),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+@contextmanager
+def record_run(job_name: str, trigger: str = 'manual'):
+    """
+    블록 실행을 scheduler_job_runs 에 한 건으로 기록한다. 블록에서 예외가 나면 error 로 기록하고 다시 던진다.
+    이력 기록이 실패해도(DB 장애 등) 작업 자체는 그대로 진행한다.
+    """
+    run = JobRun(job_name, trigger)
+    try:
+        run._begin()
+    except Exception as e:
+        logger.warning(f"[SCHEDULER] {job_name} 실행 기록 시작 실패: {e}")
+    try:
+        yield run
+    except Exception as e:
+        run.status = STATUS_ERROR
+        run.message = str(e)
+        raise
+    finally:
+        logger.info(f"[SCHEDULER] {job_name} ({trigger}) {run.status} - {run.elapsed:.1f}s, "
+                    f"읽음 {run.rows_read}행, 씀 {run.rows_written}행")
+        if run.id is not None:
+            try:
+                run._finish()
+            except Exception as e:
+                logger.warning(f"[SCHEDULER] {job_name} 실행 기록 저장 실패: {e}")
+
+
+def last_success_at(job_name: str) -> Optional[datetime]:
+    """마지막으로 성공한 실행의 종료 시각 (KST, 없으면 None)"""
+    conn = get_db_connection()
+    try:
+        _ensure_tables(conn)
+        row = conn.execute(
+            f"SELECT MAX(finished_at) FROM {RUNS_TABLE} WHERE job_name = %s AND status = %s",
+            (job_name, STATUS_SUCCESS),
+        ).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def recent_job_runs(job_name: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    """최근 실행 목록 (각 실행에 소스별 결과 'sources' 포함)"""
+    conn = get_db_connection()
+    try:
+        _ensure_tables(conn)
+        where = "WHERE job_name = %s" if job_name else ""
+        params = (job_name, limit) if job_name else (limit,)
+        runs = [dict(row) for row in conn.execute(
+            f"SELECT * FROM {RUNS_TABLE} {where} ORDER BY started_at DESC, id DESC LIMIT %s", params
+        ).fetchall()]
+        if runs:
+            sources: Dict[int, List[Dict[str, Any]]] = {}
+            for row in conn.execute(
+                f"SELECT * FROM {SOURCES_TABLE} WHERE run_id = ANY(%s) ORDER BY duration_ms DESC NULLS LAST",
+                ([run['id'] for run in runs],),
+            ).fetchall():
+                sources.setdefault(row['run_id'], []).append(dict(row))
+            for run in runs:
+                run['sources'] = sources.get(run['id'], [])
+        return runs
+    finally:
+        conn.close()
+
+
+def list_jobs() -> List[Dict[str, Any]]:
+    """scheduler_jobs 행 목록 (등록되지 않은 수동 작업 포함)"""
+    conn = get_db_connection()
+    try:
+        _ensure_tables(conn)
+        return [dict(row) for row in conn.execute(f"SELECT * FROM {JOBS_TABLE} ORDER BY name").fetchall()]
+    finally:
+        conn.close()
+
+
+def prune_job_runs(days: int, timeout_hours: Optional[int] = None) -> int:
+    """
+    보관 기간이 지난 실행 이력 삭제 (소스별 기록은 함께 삭제).
+    timeout_hours 보다 오래 running 인 실행은 프로세스가 죽어 끝나지 못한 것으로 보고
+    먼저 failed 로 닫는다. 그래야 이 행들도 보관 기간이 지나면 지워진다.
+    """
+    conn = get_db_connection()
+    try:
+        _ensure_tables(conn)
+        now = _now()
+        if timeout_hours:
+            abandoned = conn.execute(
+                f"""
+                UPDATE {RUNS_TABLE}
+                SET status = %s, finished_at = %s, message = COALESCE(message, %s)
+                WHERE status = %s AND started_at < %s
+                """,
+                (STATUS_FAILED, now, f"{timeout_hours}시간 넘게 끝나지 않아 중단된 실행으로 처리",
+                 STATUS_RUNNING, now - timedelta(hours=timeout_hours)),
+            ).rowcount
+            if abandoned:
+                logger.warning(f"[SCHEDULER] 끝나지 않은 실행 {abandoned}건을 failed 로 정리")
+        deleted = conn.execute(
+            f"DELETE FROM {RUNS_TABLE} WHERE started_at < %s AND status <> %s",
+            (now - timedelta(days=days), STATUS_RUNNING),
+        ).rowcount
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
+def run_job(name: str, trigger: str = 'manual') -> Optional[str]:
+    """
+    등록된 작업을 지금 실행하고 상태를 돌려준다.
+    같은 프로세스에서 이미 실행 중이면 None (겹쳐 실행하지 않음).
+    """
+    job = _jobs.get(name)
+    if job is None:
+        raise KeyError(f"등록되지 않은 작업: {name}")
+    with _running_lock:
+        if name in _running:
+            logger.info(f"[SCHEDULER] {name} 이미 실행 중 - 건너뜀")
+            return None
+        _running.add(name)
+    try:
+        with record_run(name, trigger) as run:
+            result = job.func(run)
+            if result is False and run.status == STATUS_SUCCESS:
+                run.fail("작업이 실패를 반환했습니다")
+        return run.status
+    except Exception as e:
+        logger.error(f"[SCHEDULER] {name} 실행 오류: {e}", exc_info=True)
+        return STATUS_ERROR
+    finally:
+        with _running_lock:
+            _running.discard(name)
+
+
+class JobScheduler:
+    """scheduler_jobs.next_run_at 이 도래한 작업을 작업별 스레드로 실행하는 백그라운드 스레드"""
+
+    # 실행 이력 정리 주기(초)
+    CLEANUP_INTERVAL = 3600
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None, lease=None):
+        self.settings = settings or get_scheduler_settings()
+        self.lease = lease
+        self._thread = None
+        self._stopping = threading.Event()
+        self._last_cleanup = 0.0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="job-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def _sync_job_row(self, conn, job: ScheduledJob, row, now: datetime):
+        """등록 정보(일정)를 scheduler_jobs 에 반영하고 다음 실행 시각을 돌려준다"""
+        if row is not None and row['schedule'] == job.schedule.expr and row['next_run_at'] is not None:
+            return row['next_run_at']
+        next_run_at = job.schedule.next_after(now)
+        if row is None or row['schedule'] is None:
+            # 처음 등록된 작업은 오늘 예정 시각이 이미 지났으면 바로 한 번 실행
+            # (기존 루프의 "오늘 예정 시각이 지났으면 실행" 동작 유지)
+            missed = job.schedule.next_after(now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(minutes=1))
+            if missed <= now:
+                next_run_at = missed
+        conn.execute(
+            f"""
+            INSERT INTO {JOBS_TABLE} (name, schedule, description, next_run_at)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (name) DO UPDATE SET
+                schedule = EXCLUDED.schedule,
+                description = EXCLUDED.description,
+                next_run_at = EXCLUDED.next_run_at,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (job.name, job.schedule.expr, job.description, next_run_at),
+        )
+        return next_run_at
+
+    def _claim(self, conn, job: ScheduledJob, due_at: datetime, now: datetime) -> bool:
+        """next_run_at 을 다음 회차로 넘긴다. 다른 프로세스가 먼저 넘겼으면 False"""
+        # 놓친 회차(서버 중단 등)는 몰아서 실행하지 않고 한 번만 실행
+        return conn.execute(
+            f"""
+            UPDATE {JOBS_TABLE} SET next_run_at = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE name = %s AND next_run_at = %s
+            """,
+            (job.schedule.next_after(now), job.name, due_at),
+        ).rowcount == 1
+
+    def run_once(self) -> List[str]:
+        """도래한 작업을 실행 스레드로 띄우고 그 이름 목록을 돌려준다"""
+        now = _now()
+        due = []
+        conn = get_db_connection()
+        try:
+            _ensure_tables(conn)
+            rows = {row['name']: row for row in conn.execute(f"SELECT * FROM {JOBS_TABLE}").fetchall()}
+            for job in registered_jobs():
+                if job.schedule is None:
+                    continue
+                row = rows.get(job.name)
+                next_run_at = self._sync_job_row(conn, job, row, now)
+                if row is not None and not row['enabled']:
+                    continue
+                if next_run_at > now or not job.is_enabled():
+                    continue
+                with _running_lock:
+                    if job.name in _running:
+                        # 앞 실행이 끝난 뒤 다음 확인에서 실행
+                        continue
+                if self._claim(conn, job, next_run_at, now):
+                    due.append(job.name)
+            conn.commit()
+        finally:
+            conn.close()
+
+        for name in due:
+            threading.Thread(target=run_job, args=(name, 'schedule'), name=f"job-{name}", daemon=True).start()
+        return due
+
+    def _maybe_cleanup(self) -> None:
+        if time.monotonic() - self._last_cleanup < self.CLEANUP_INTERVAL:
+            return
+        self._last_cleanup = time.monotonic()
+        deleted = prune_job_runs(self.settings['run_history_days'], self.settings['run_timeout_hours'])
+        if deleted:
+            logger.info(f"[SCHEDULER] 보관 기간이 지난 실행 이력 {deleted}건 삭제")
+
+    def _run(self) -> None:
+        logger.info("[SCHEDULER] job scheduler started")
+        while not self._stopping.is_set():
+            try:
+                # 클러스터에서 한 프로세스만 실행 (리더가 죽으면 다음 확인 때 다른 프로세스가 이어받음)
+                if self.lease is None or self.lease.acquire():
+                    self.run_once()
+                    self._maybe_cleanup()
+            except Exception as e:
+                logger.error(f"[SCHEDULER] 스케줄러 오류: {e}", exc_info=True)
+            self._stopping.wait(self.settings['poll_seconds'])
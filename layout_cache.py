@@ -0,0 +1,33 @@
+"""
+보드 레이아웃(컬럼/섹션 설정) 캐시
+목록/상세/등록 화면과 엑셀 내보내기는 요청마다 <board>_column_config / 섹션 테이블을 다시 읽고
+dropdown_options, scoring_config, child_schema 를 다시 파싱했다. 여기서는 파싱까지 끝난
+결과를 보드별로 워커 프로세스 메모리에 두고, 보드 레이아웃 버전
+(db.versioned_cache, scope 'board_layout')이 바뀔 때만 다시 읽는다.
+
+- 읽는 쪽은 cached_layout(board_type, 이름, loader) 로 기존 조회/파싱 코드를 그대로 감싼다.
+  이름은 같은 보드 안에서 결과 형태(필터/파싱 방식)를 구분한다.
+- /api/<board>/columns, *-columns, *-sections 변경 요청과 컬럼 JSON 동기화가 끝나면
+  bump_layout_version() 으로 버전을 올린다.
+- 반환값은 복사본이라 호출자가 고쳐 써도 캐시에 영향이 없다.
+"""
+import copy
+
+from db.versioned_cache import VersionedCache
+
+_LAYOUT = VersionedCache('board_layout')
+
+
+def cached_layout(board_type, name, loader, db_path=None):
+    """레이아웃 버전이 같은 동안 loader() 결과를 재사용한다 (loader 예외는 캐시하지 않고 그대로 전파)"""
+    return copy.deepcopy(_LAYOUT.get(board_type, name, loader, db_path))
+
+
+def bump_layout_version(board_type, db_path=None) -> int:
+    """보드의 레이아웃 버전을 올린다 (컬럼/섹션 변경을 커밋한 뒤에 부른다)"""
+    return _LAYOUT.bump(board_type, db_path)
+
+
+def invalidate_layout(board_type=None):
+    """이 프로세스에 캐시된 레이아웃을 비운다 (board_type 없으면 전체)"""
+    _LAYOUT.invalidate(board_type)
@@ -0,0 +1,5 @@
+-- 006_drop_dropdown_code_versions.sql
+-- 드롭다운 코드 카탈로그 버전은 metadata_versions(scope 'dropdown_codes')로 옮겼으므로
+-- 보드별 버전 테이블은 더 이상 쓰지 않는다.
+
+DROP TABLE IF EXISTS dropdown_code_versions;
@@ -18,6 +18,7 @@ if str(MIGRATIONS_DIR.parent) not in sys.path:
     sys.path.insert(0, str(MIGRATIONS_DIR.parent))
 
 from db_connection import get_db_connection
+from db.schema import refresh_schema_cache
 
 
 def list_migration_files() -> list[Path]:
@@ -62,6 +63,11 @@ def run_migrations() -> None:
                 raise
     finally:
         conn.close()
+        # Even a partial run may have changed the schema.
+        try:
+            refresh_schema_cache()
+        except Exception as exc:
+            logging.warning("[Migration] schema cache refresh failed: %s", exc)
 
 
 if __name__ == "__main__":
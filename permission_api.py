@@ -8,6 +8,7 @@
 from flask import jsonify, request, session
 from db_connection import get_db_connection
 from permission_helpers import is_super_admin, resolve_menu_code
+from permission_cache import notify_permission_change
 from config.menu import MENU_CONFIG
 from functools import wraps
 from typing import Any, List
@@ -524,6 +525,7 @@ def register_permission_routes(app):
                 )
                 affected += 1
 
+            notify_permission_change(cursor)
             conn.commit()
             return jsonify({'success': True, 'count': affected})
 
@@ -571,6 +573,7 @@ def register_permission_routes(app):
                 filtered_ids,
             )
             affected = cursor.rowcount or 0
+            notify_permission_change(cursor)
             conn.commit()
 
             logger.info(
@@ -667,6 +670,7 @@ def register_permission_routes(app):
                 )
                 affected += 1
 
+            notify_permission_change(cursor)
             conn.commit()
             return jsonify({'success': True, 'count': affected})
 
@@ -715,6 +719,7 @@ def register_permission_routes(app):
                 [session.get('user_id', 'system'), *filtered_ids],
             )
             affected = cursor.rowcount or 0
+            notify_permission_change(cursor)
             conn.commit()
 
             logger.info(
@@ -782,6 +787,7 @@ def register_permission_routes(app):
                 (user_id, menu_code, read_level, write_level, session.get('user_id', 'system')),
             )
 
+            notify_permission_change(cursor)
             conn.commit()
             logger.info(
                 "Permission updated: user=%s, menu=%s, read=%s, write=%s",
@@ -864,6 +870,7 @@ def register_permission_routes(app):
                 (dept_id, dept_code, dept_full_path, menu_code, read_level, write_level, session.get('user_id', 'system')),
             )
 
+            notify_permission_change(cursor)
             conn.commit()
             logger.info(
                 "Department permission updated: dept=%s, menu=%s, read=%s, write=%s",
@@ -903,6 +910,7 @@ def register_permission_routes(app):
             """, (session.get('user_id', 'system'), user_id))
 
             affected = cursor.rowcount
+            notify_permission_change(cursor)
             conn.commit()
             cursor.close()
             conn.close()
@@ -940,6 +948,7 @@ def register_permission_routes(app):
             """, (session.get('user_id', 'system'), dept_id))
 
             affected = cursor.rowcount
+            notify_permission_change(cursor)
             conn.commit()
             cursor.close()
             conn.close()
@@ -1170,6 +1179,7 @@ def register_permission_routes(app):
                         )
                         affected += 1
 
+            notify_permission_change(cursor)
             conn.commit()
             return jsonify({'success': True, 'affected_count': affected})
 
@@ -1579,6 +1589,7 @@ def register_permission_routes(app):
                 WHERE id = %s
             """, (reviewer_id, review_comment, request_id))
 
+            notify_permission_change(cursor)
             conn.commit()
             cursor.close()
             conn.close()
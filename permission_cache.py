@@ -0,0 +1,183 @@
+"""
+유효 권한 인메모리 캐시
+(login_id, dept_id, menu_code) 단위로 계산된 권한을 워커 프로세스 메모리에 보관하고,
+PostgreSQL LISTEN/NOTIFY 로 권한 테이블 변경을 전달받아 무효화한다.
+
+user_menu_permissions / dept_menu_roles / dept_menu_permissions 의 트리거
+(scripts/setup_permission_schema.py)가 PERMISSION_CHANNEL 로 알림을 보낸다.
+리스너가 연결되어 있지 않으면 캐시를 쓰지 않으므로 워커 간 불일치가 생기지 않는다.
+
+트리거와 notify_permission_change() 는 알림과 함께 공유 시퀀스(PERMISSION_GENERATION_SEQ)를
+올린다. 리스너는 연결 직후와 알림마다 그 값을 읽어 두고, stamp() 로 돌려준다.
+모든 워커가 같은 값을 보므로 세션에 저장한 표식을 다른 워커에서도 그대로 비교할 수 있다.
+"""
+import logging
+import os
+import threading
+import time
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - psycopg2 환경에서는 캐시 비활성
+    psycopg = None
+
+from db_connection import get_config, get_postgres_dsn
+
+logger = logging.getLogger(__name__)
+
+PERMISSION_CHANNEL = 'permission_changed'
+PERMISSION_GENERATION_SEQ = 'permission_generation'
+
+_RECONNECT_DELAY_SECONDS = 5
+_POLL_TIMEOUT_SECONDS = 5
+
+
+class PermissionMatrixCache:
+    """워커 프로세스 단위 유효 권한 캐시"""
+
+    def __init__(self, ttl_seconds=300):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self._generation = None
+        self._lock = threading.Lock()
+        self._listener_pid = None
+        self._listener_ready = threading.Event()
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # 조회/저장
+    # ------------------------------------------------------------------
+    def get(self, login_id, dept_id, menu_code):
+        if not self._ensure_listener():
+            return None
+        key = (login_id, dept_id or '', menu_code)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, permissions = entry
+            if expires_at <= time.monotonic():
+                self._entries.pop(key, None)
+                return None
+            return permissions
+
+    def set(self, login_id, dept_id, menu_code, permissions):
+        if not self._listener_ready.is_set():
+            return
+        key = (login_id, dept_id or '', menu_code)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, permissions)
+
+    def invalidate(self, login_id=None):
+        """로컬 캐시 무효화 (login_id 지정 시 해당 사용자만)"""
+        with self._lock:
+            if login_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == login_id]:
+                    self._entries.pop(key, None)
+
+    def stamp(self):
+        """
+        권한 세대 표식 (모든 워커 공통, 리스너가 연결되어 있지 않거나 시퀀스가 없으면 None).
+        권한이 바뀔 때마다 세대가 올라가므로, 세션 등에 저장해 둔 표식이
+        지금 값과 다르면 그 사이에 권한이 바뀌었을 수 있다.
+        """
+        if not self._ensure_listener():
+            return None
+        with self._lock:
+            return self._generation
+
+    def _refresh_generation(self, conn):
+        row = conn.execute(
+            "SELECT to_regclass(%s) IS NOT NULL", (PERMISSION_GENERATION_SEQ,)
+        ).fetchone()
+        generation = None
+        if row and row[0]:
+            # 시퀀스가 없으면(권한 스키마 설정 전) 트리거가 세대를 올리지 않으므로 표식을 쓰지 않는다
+            row = conn.execute(f"SELECT last_value FROM {PERMISSION_GENERATION_SEQ}").fetchone()
+            generation = int(row[0]) if row else None
+        with self._lock:
+            self._generation = generation
+
+    # ------------------------------------------------------------------
+    # LISTEN 스레드
+    # ------------------------------------------------------------------
+    def _ensure_listener(self):
+        if psycopg is None:
+            return False
+        pid = os.getpid()
+        if self._listener_pid != pid:
+            # gunicorn fork 이후에는 워커마다 리스너를 새로 띄운다.
+            with self._lock:
+                if self._listener_pid != pid:
+                    self._listener_pid = pid
+                    self._entries.clear()
+                    self._listener_ready.clear()
+                    thread = threading.Thread(
+                        target=self._listen_loop,
+                        name='permission-cache-listener',
+                        daemon=True,
+                    )
+                    thread.start()
+        return self._listener_ready.is_set()
+
+    def _listen_loop(self):
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(get_postgres_dsn(), autocommit=True) as conn:
+                    conn.execute(f"LISTEN {PERMISSION_CHANNEL}")
+                    # 연결이 끊겨 있던 동안의 알림은 받을 수 없으므로 비우고 시작
+                    self.invalidate()
+                    self._refresh_generation(conn)
+                    self._listener_ready.set()
+                    logger.info("Permission cache listener connected")
+                    while not self._stop.is_set():
+                        notified = False
+                        for notify in conn.notifies(timeout=_POLL_TIMEOUT_SECONDS):
+                            self._handle_notify(notify.payload)
+                            notified = True
+                        if notified:
+                            # notifies() 가 연결을 잡고 있는 동안에는 조회할 수 없으므로 끝난 뒤 읽는다
+                            self._refresh_generation(conn)
+            except Exception as exc:
+                logger.warning("Permission cache listener error: %s", exc)
+            finally:
+                self._listener_ready.clear()
+                self.invalidate()
+            self._stop.wait(_RECONNECT_DELAY_SECONDS)
+
+    def _handle_notify(self, payload):
+        login_id = None
+        if payload and payload.startswith('login_id:'):
+            login_id = payload.split(':', 1)[1] or None
+        logger.debug("Permission change notified: %s", payload)
+        self.invalidate(login_id)
+        with self._lock:
+            # 새 세대를 읽을 때까지는 표식을 쓰지 않는다
+            self._generation = None
+
+    def stop(self):
+        self._stop.set()
+
+
+def notify_permission_change(cursor, login_id=None):
+    """
+    권한 변경을 모든 워커에 알리고 권한 세대를 올린다.
+    호출한 트랜잭션이 커밋될 때 전달되며, 같은 트랜잭션의 중복 알림은 하나로 합쳐진다.
+    """
+    payload = f"login_id:{login_id}" if login_id else 'all'
+    cursor.execute(
+        "SELECT pg_notify(%s, %s), nextval(to_regclass(%s))",
+        (PERMISSION_CHANNEL, payload, PERMISSION_GENERATION_SEQ),
+    )
+
+
+def _load_ttl():
+    try:
+        return get_config().getint('PERMISSION', 'cache_ttl', fallback=300)
+    except Exception:
+        return 300
+
+
+permission_matrix_cache = PermissionMatrixCache(ttl_seconds=_load_ttl())
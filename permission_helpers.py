@@ -3,12 +3,14 @@
 실제 권한 체크 및 레벨별 데이터 필터링
 """
 from db_connection import get_db_connection
-from flask import session, render_template, jsonify
+from flask import g, has_request_context, session, render_template, jsonify
 import logging
 import configparser
 import copy
+import time
 
 from config.menu import MENU_CONFIG
+from permission_cache import permission_matrix_cache
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,10 @@ config.read('config.ini', encoding='utf-8')
 PERMISSION_ENABLED = config.getboolean('PERMISSION', 'enabled', fallback=True)
 SUPER_ADMIN_USERS = config.get('PERMISSION', 'super_admin_users', fallback='').split(',')
 SUPER_ADMIN_USERS = [u.strip() for u in SUPER_ADMIN_USERS if u.strip()]
+# 메뉴 권한 매트릭스를 세션에 보관하는 시간(초). 0이면 요청 단위로만 재사용한다.
+MENU_PERMISSION_TTL = config.getint('PERMISSION', 'menu_permission_ttl', fallback=60)
+
+_MENU_PERMISSION_SESSION_KEY = '_menu_permission_matrix'
 
 MENU_PERMISSION_MAP = {
     'partner-standards': 'VENDOR_MGT',
@@ -197,6 +203,80 @@ def is_super_admin():
     login_id = session.get('user_id')
     return login_id in SUPER_ADMIN_USERS
 
+def _menu_codes():
+    codes = []
+    for section in MENU_CONFIG:
+        for item in section.get('submenu', []):
+            code = resolve_menu_code(item.get('url') or '')
+            if code and code not in codes:
+                codes.append(code)
+    return codes
+
+def get_menu_permission_matrix():
+    """
+    현재 사용자의 메뉴별 권한 레벨을 한 번에 조회
+    요청 단위(g)와 세션 단위(MENU_PERMISSION_TTL 초)로 재사용한다.
+    세션 보관분은 권한 캐시 표식(permission_matrix_cache.stamp)이 같을 때만 쓴다.
+    표식은 모든 워커가 공유하는 권한 세대라 다른 워커로 간 요청도 세션 보관분을 그대로 쓰고,
+    권한이 바뀌면 세대가 올라가므로 회수된 권한이 TTL 동안 남지 않는다.
+
+    Returns:
+        dict: {menu_code: {'read_level', 'write_level', 'can_delete'}}
+    """
+    login_id = session.get('user_id')
+    dept_id = session.get('deptid')
+    owner = f"{login_id}|{dept_id or ''}"
+
+    cached = g.get('menu_permission_matrix') if has_request_context() else None
+    if cached and cached.get('owner') == owner:
+        return cached['levels']
+
+    # 계산 전에 표식을 읽는다: 계산 중에 권한이 바뀌면 저장되는 표식이 이미 낡은 값이 된다
+    stamp = permission_matrix_cache.stamp() if MENU_PERMISSION_TTL > 0 else None
+    stored = session.get(_MENU_PERMISSION_SESSION_KEY)
+    if (
+        stamp is not None
+        and isinstance(stored, dict)
+        and stored.get('owner') == owner
+        and stored.get('stamp') == stamp
+        and stored.get('expires_at', 0) > time.time()
+    ):
+        levels = stored.get('levels') or {}
+    else:
+        from scoped_permission_check import get_permission_levels
+        try:
+            levels = get_permission_levels(login_id, dept_id, _menu_codes())
+        except Exception as exc:
+            logger.debug("Bulk menu permission lookup failed, using per-menu checks: %s", exc)
+            return {
+                code: {
+                    'read_level': get_user_permission_level(code, 'read'),
+                    'write_level': get_user_permission_level(code, 'write'),
+                    'can_delete': False,
+                }
+                for code in _menu_codes()
+            }
+        if stamp is not None:
+            session[_MENU_PERMISSION_SESSION_KEY] = {
+                'owner': owner,
+                'stamp': stamp,
+                'expires_at': time.time() + MENU_PERMISSION_TTL,
+                'levels': levels,
+            }
+        else:
+            # 변경 알림을 받을 수 없으면 세션에 보관하지 않는다 (이전 보관분도 버림)
+            clear_menu_permission_matrix()
+
+    if has_request_context():
+        g.menu_permission_matrix = {'owner': owner, 'levels': levels}
+    return levels
+
+def clear_menu_permission_matrix():
+    """세션/요청에 보관된 메뉴 권한 매트릭스를 비운다 (권한 변경 직후 사용)."""
+    session.pop(_MENU_PERMISSION_SESSION_KEY, None)
+    if has_request_context():
+        g.pop('menu_permission_matrix', None)
+
 def get_user_permission_level(menu_code, permission_type='read'):
     """
     사용자의 권한 레벨 조회 (0-3)
@@ -218,6 +298,13 @@ def get_user_permission_level(menu_code, permission_type='read'):
         if not login_id:
             return 0
 
+        # 같은 요청에서 이미 메뉴 권한 매트릭스를 읽었다면 재사용
+        request_matrix = g.get('menu_permission_matrix') if has_request_context() else None
+        if request_matrix and request_matrix.get('owner') == f"{login_id}|{dept_id or ''}":
+            levels = request_matrix['levels'].get(menu_code)
+            if levels is not None:
+                return levels['read_level' if permission_type == 'read' else 'write_level']
+
         if dept_id:
             try:
                 from scoped_permission_check import get_permission_level
@@ -373,6 +460,8 @@ def get_user_accessible_menus():
         if not login_id:
             return []
 
+        matrix = get_menu_permission_matrix()
+
         menus = []
         seen_codes = set()
         for section in MENU_CONFIG:
@@ -381,8 +470,9 @@ def get_user_accessible_menus():
                 code = resolve_menu_code(slug)
                 if not code or code in seen_codes:
                     continue
-                read_level = get_user_permission_level(code, 'read')
-                write_level = get_user_permission_level(code, 'write')
+                levels = matrix.get(code) or {}
+                read_level = levels.get('read_level', 0)
+                write_level = levels.get('write_level', 0)
                 if read_level <= 0:
                     continue
                 seen_codes.add(code)
@@ -8,8 +8,7 @@ from db_connection import get_db_connection
 import logging
 
 from audit_logger import record_permission_event
-from datetime import datetime, timedelta
-import json
+from permission_cache import notify_permission_change, permission_matrix_cache
 import configparser
 
 logger = logging.getLogger(__name__)
@@ -28,7 +27,7 @@ class PermissionService:
     """권한 체크 서비스"""
 
     def __init__(self):
-        self.cache_ttl = 300  # 5분 캐시
+        self.cache = permission_matrix_cache  # 프로세스 메모리 캐시 (LISTEN/NOTIFY 무효화)
 
     def check_permission(self, menu_code, action='view'):
         """권한 체크 데코레이터"""
@@ -81,43 +80,34 @@ class PermissionService:
         return decorator
 
     def _get_user_permission(self, emp_id, menu_code, action='view'):
-        """사용자 권한 조회 (캐시 포함)"""
+        """사용자 권한 조회 (메모리 캐시 포함)"""
+        login_id = session.get('user_id') or emp_id
+        dept_id = session.get('deptid')
+
+        # 1. 메모리 캐시 확인 (DB 왕복 없음)
+        permissions = self.cache.get(login_id, dept_id, menu_code)
+        if permissions is not None:
+            return permissions if self._check_action(permissions, action) else None
+
+        # 2. 권한 계산 (개인 > 부서 > 역할 순)
         conn = get_db_connection()
         cursor = conn.cursor()
-
         try:
-            # 1. 캐시 확인
-            cursor.execute("""
-                SELECT permissions_json
-                FROM permission_cache
-                WHERE emp_id = %s AND menu_code = %s
-                AND expires_at > CURRENT_TIMESTAMP
-            """, (emp_id, menu_code))
-
-            cache_result = cursor.fetchone()
-            if cache_result and cache_result[0]:
-                permissions = json.loads(cache_result[0]) if isinstance(cache_result[0], str) else cache_result[0]
-                if self._check_action(permissions, action):
-                    return permissions
-
-            # 2. 권한 계산 (개인 > 부서 > 역할 순)
             permissions = self._calculate_permission(cursor, emp_id, menu_code)
-
-            # 3. 캐시 저장
-            if permissions:
-                self._cache_permission(cursor, emp_id, menu_code, permissions)
-                conn.commit()
-
-            # 4. 액션 체크
-            if self._check_action(permissions, action):
-                return permissions
-
-            return None
-
         finally:
             cursor.close()
             conn.close()
 
+        # 3. 캐시 저장
+        if permissions:
+            self.cache.set(login_id, dept_id, menu_code, permissions)
+
+        # 4. 액션 체크
+        if self._check_action(permissions, action):
+            return permissions
+
+        return None
+
     def _calculate_permission(self, cursor, emp_id, menu_code):
         """권한 계산 (우선순위: 개인 > 부서 > 역할)"""
 
@@ -229,24 +219,6 @@ class PermissionService:
         can_field = action_map.get(action, 'can_view')
         return permissions.get(can_field, False)
 
-    def _cache_permission(self, cursor, emp_id, menu_code, permissions):
-        """권한 캐시 저장"""
-        try:
-            expires_at = datetime.now() + timedelta(seconds=self.cache_ttl)
-            permissions_json = json.dumps(permissions)
-
-            cursor.execute("""
-                INSERT INTO permission_cache (emp_id, menu_code, permissions_json, expires_at)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (emp_id, menu_code) DO UPDATE
-                SET permissions_json = EXCLUDED.permissions_json,
-                    cached_at = CURRENT_TIMESTAMP,
-                    expires_at = EXCLUDED.expires_at
-            """, (emp_id, menu_code, permissions_json, expires_at))
-
-        except Exception as e:
-            logger.error(f"Cache save error: {e}")
-
     def _log_access(self, emp_id, action, menu_code, success, error_message=None):
         """접근 로그 기록"""
         try:
@@ -402,16 +374,14 @@ def get_user_menus():
         conn.close()
 
 def clear_user_cache(emp_id=None):
-    """사용자 권한 캐시 클리어"""
+    """사용자 권한 캐시 클리어 (모든 워커에 NOTIFY)"""
+    permission_matrix_cache.invalidate(emp_id)
+
     conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
-        if emp_id:
-            cursor.execute("DELETE FROM permission_cache WHERE emp_id = %s", (emp_id,))
-        else:
-            cursor.execute("DELETE FROM permission_cache")
-
+        notify_permission_change(cursor, emp_id)
         conn.commit()
         return True
 
@@ -11,8 +11,10 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 from flask import session
 from werkzeug.datastructures import FileStorage
 
+from code_catalog import get_dropdown_options
 from db_connection import get_db_connection
-from db.schema import column_exists
+from db.counting import count_rows, invalidate_counts, reconcile_total
+from db.schema import cached_column_exists, refresh_schema_cache
 from db.upsert import safe_upsert
 from section_service import SectionConfigService
 from utils.sql_filters import sql_is_active_true, sql_is_deleted_false
@@ -87,6 +89,7 @@ class AccidentRepository:
         if altered:
             try:
                 conn.commit()
+                refresh_schema_cache(self.db_path)
             except Exception as exc:
                 logging.debug("[ACCIDENT] scope column commit skipped: %s", exc)
 
@@ -410,6 +413,7 @@ class AccidentRepository:
                     attachment_service.add(accident_number, file_obj, meta)
 
             conn.commit()
+            invalidate_counts('accidents_cache', self.db_path)
 
             try:
                 check_row = conn.execute(
@@ -592,6 +596,7 @@ class AccidentRepository:
                 attachment_service.add(accident_number, file_obj, meta)
 
             conn.commit()
+            invalidate_counts('accidents_cache', self.db_path)
 
             try:
                 detail_row = conn.execute(
@@ -774,18 +779,7 @@ class AccidentRepository:
             query += " AND s.accident_grade LIKE %s"
             params.append(f"%{filters['accident_grade']}%")
 
-        count_query = f"SELECT COUNT(*) FROM ({query}) AS total"
-        count_row = conn.execute(count_query, params).fetchone()
-        if count_row is None:
-            total_count = 0
-        else:
-            try:
-                total_count = int(count_row[0])
-            except Exception:
-                try:
-                    total_count = int(next(iter(count_row.values())))
-                except Exception:
-                    total_count = 0
+        count = count_rows(conn, 'accidents_cache', query, params, filters)
 
         if self._table_has_column(conn, 'accidents_cache', 'created_at'):
             if getattr(conn, 'is_postgres', False):
@@ -802,11 +796,11 @@ class AccidentRepository:
         offset = (page - 1) * per_page
         data = conn.execute(query, (*params, per_page, offset)).fetchall()
         accidents = [dict(row) for row in data]
-        return total_count, accidents
+        return reconcile_total(count, offset, len(accidents), per_page), accidents
 
     def _table_has_column(self, conn, table_name: str, column_name: str) -> bool:
         try:
-            return column_exists(conn, table_name, column_name)
+            return cached_column_exists(table_name, column_name, self.db_path)
         except Exception:
             return False
 
@@ -1196,52 +1190,7 @@ class AccidentRepository:
         return section_columns
 
     def _get_dropdown_options(self, column_key: Optional[str]):
-        if not column_key:
-            return []
-
-        with self.connection() as conn:
-            cursor = conn.cursor()
-            rows = cursor.execute(
-                """
-                SELECT option_code, option_value
-                FROM dropdown_option_codes_v2
-                WHERE board_type = %s AND column_key = %s AND is_active = 1
-                ORDER BY display_order
-                """,
-                ('accident', column_key),
-            ).fetchall()
-
-        if not rows:
-            return []
-
-        if len(rows) == 1:
-            value = rows[0]['option_value']
-            if isinstance(value, str):
-                stripped = value.strip()
-                if stripped.startswith('[') and stripped.endswith(']'):
-                    try:
-                        array = json.loads(stripped)
-                        if isinstance(array, list):
-                            return [
-                                {
-                                    'code': f"{column_key.upper()}_{index + 1:03d}",
-                                    'value': str(item),
-                                }
-                                for index, item in enumerate(array)
-                            ]
-                    except Exception:
-                        logging.debug(
-                            "[ACCIDENT] dropdown array parse failed for %s",
-                            column_key,
-                        )
-
-        return [
-            {
-                'code': row['option_code'],
-                'value': row['option_value'],
-            }
-            for row in rows
-        ]
+        return get_dropdown_options('accident', column_key, self.db_path)
 
     def _build_list_payloads(
         self,
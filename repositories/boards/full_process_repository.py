@@ -10,12 +10,16 @@ import logging
 
 from werkzeug.datastructures import FileStorage
 
+from code_catalog import get_dropdown_options
 from db_connection import get_db_connection
-from db.schema import column_names, table_exists
+from layout_cache import cached_layout
+from db.counting import count_rows, invalidate_counts, reconcile_total
+from db.keyset import KeysetOrder, keyset_clause, keyset_page
+from db.schema import cached_column_names, cached_table_exists
 from db.upsert import safe_upsert
 from utils.board_layout import order_value, sort_columns, sort_sections
 from upload_utils import validate_uploaded_files
-from id_generator import generate_fullprocess_number
+from id_generator import generate_fullprocess_number, register_explicit_ids
 from timezone_config import get_korean_time
 
 
@@ -73,7 +77,7 @@ class FullProcessRepository:
 
     def _table_exists(self, conn, table_name: str) -> bool:
         try:
-            return table_exists(conn, table_name)
+            return cached_table_exists(table_name, self.db_path)
         except Exception:
             return False
 
@@ -119,7 +123,7 @@ class FullProcessRepository:
             return self._columns_cache[table_key]
 
         try:
-            columns = column_names(conn, table_key)
+            columns = cached_column_names(table_key, self.db_path)
         except Exception:
             columns = []
 
@@ -127,50 +131,7 @@ class FullProcessRepository:
         return columns
 
     def _get_dropdown_options(self, column_key: str) -> List[Dict[str, Any]]:
-        with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT option_code, option_value
-                FROM dropdown_option_codes_v2
-                WHERE board_type = %s AND column_key = %s AND is_active = 1
-                ORDER BY display_order
-                """,
-                ('full_process', column_key),
-            )
-            rows = cursor.fetchall()
-
-        if not rows:
-            return []
-
-        if len(rows) == 1:
-            value = rows[0]['option_value']
-            if isinstance(value, str):
-                stripped = value.strip()
-                if stripped.startswith('[') and stripped.endswith(']'):
-                    try:
-                        array = json.loads(stripped)
-                        if isinstance(array, list):
-                            return [
-                                {
-                                    'code': f"{column_key.upper()}_{index + 1:03d}",
-                                    'value': str(item),
-                                }
-                                for index, item in enumerate(array)
-                            ]
-                    except Exception:
-                        logging.debug(
-                            "[FULL_PROCESS] dropdown array parse failed for %s",
-                            column_key,
-                        )
-
-        return [
-            {
-                'code': row['option_code'],
-                'value': row['option_value'],
-            }
-            for row in rows
-        ]
+        return get_dropdown_options('full_process', column_key, self.db_path)
 
     def _clean_custom_values(self, payload):
         """Normalize placeholder strings like 'None' to actual None."""
@@ -327,40 +288,124 @@ class FullProcessRepository:
             conn.commit()
 
     def fetch_sections(self) -> List[Dict[str, Any]]:
-        with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT *
-                FROM full_process_sections
-                WHERE COALESCE(is_active, 1) = 1
-                  AND COALESCE(is_deleted, 0) = 0
-                ORDER BY section_order
-                """
-            )
-            sections = [dict(row) for row in cursor.fetchall()]
-        return sort_sections(sections)
+        def _load() -> List[Dict[str, Any]]:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT *
+                    FROM full_process_sections
+                    WHERE COALESCE(is_active, 1) = 1
+                      AND COALESCE(is_deleted, 0) = 0
+                    ORDER BY section_order
+                    """
+                )
+                return sort_sections([dict(row) for row in cursor.fetchall()])
+
+        return cached_layout(self.board_type, 'repo_sections', _load, self.db_path)
 
     def fetch_dynamic_columns(
         self, section_order_map: Mapping[str, float]
     ) -> List[Dict[str, Any]]:
-        with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT *
-                FROM full_process_column_config
-                WHERE COALESCE(is_active, 1) = 1
-                  AND COALESCE(is_deleted, 0) = 0
-                ORDER BY column_order
-                """
-            )
-            rows = [dict(row) for row in cursor.fetchall()]
+        def _load() -> List[Dict[str, Any]]:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT *
+                    FROM full_process_column_config
+                    WHERE COALESCE(is_active, 1) = 1
+                      AND COALESCE(is_deleted, 0) = 0
+                    ORDER BY column_order
+                    """
+                )
+                return [dict(row) for row in cursor.fetchall()]
+
+        rows = cached_layout(self.board_type, 'repo_columns', _load, self.db_path)
         return sort_columns(rows, dict(section_order_map))
 
     # ------------------------------------------------------------------
     # List queries
 
+    def _build_list_where(
+        self,
+        conn: Any,
+        table_columns: Iterable[str],
+        filters: Mapping[str, Any],
+    ) -> Tuple[str, List[Any]]:
+        is_postgres = getattr(conn, "is_postgres", False)
+
+        where_clauses = ["COALESCE(p.is_deleted, 0) = 0"]
+        params: List[Any] = []
+
+        company_name = (filters.get("company_name") or "").strip()
+        business_number = (filters.get("business_number") or "").strip()
+
+        if company_name:
+            like_value = f"%{company_name}%"
+            json_keys = ["company_name", "company_1cha"]
+            direct_columns = [
+                col
+                for col in ("company_name", "primary_company")
+                if col in table_columns
+            ]
+
+            if is_postgres:
+                company_filters = [
+                    f"(p.custom_data->>'{key}') ILIKE %s"
+                    for key in json_keys
+                ]
+                company_filters.extend(
+                    [f"COALESCE(p.{col}, '') ILIKE %s" for col in direct_columns]
+                )
+            else:
+                company_filters = [
+                    f"LOWER(COALESCE(JSON_EXTRACT(p.custom_data, '$.{key}'), '')) LIKE LOWER(%s)"
+                    for key in json_keys
+                ]
+                company_filters.extend(
+                    [f"LOWER(COALESCE(p.{col}, '')) LIKE LOWER(%s)" for col in direct_columns]
+                )
+
+            company_filters = [f for f in company_filters if f]
+            if company_filters:
+                where_clauses.append("(" + " OR ".join(company_filters) + ")")
+                params.extend([like_value] * len(company_filters))
+
+        if business_number:
+            like_value = f"%{business_number}%"
+            json_keys = ["business_number", "company_1cha_bizno"]
+            direct_columns = [
+                col
+                for col in ("business_number", "primary_business_number")
+                if col in table_columns
+            ]
+
+            if is_postgres:
+                biz_filters = [
+                    f"(p.custom_data->>'{key}') ILIKE %s"
+                    for key in json_keys
+                ]
+                biz_filters.extend(
+                    [f"COALESCE(p.{col}, '') ILIKE %s" for col in direct_columns]
+                )
+            else:
+                biz_filters = [
+                    f"LOWER(COALESCE(JSON_EXTRACT(p.custom_data, '$.{key}'), '')) LIKE LOWER(%s)"
+                    for key in json_keys
+                ]
+                biz_filters.extend(
+                    [f"LOWER(COALESCE(p.{col}, '')) LIKE LOWER(%s)" for col in direct_columns]
+                )
+
+            biz_filters = [f for f in biz_filters if f]
+            if biz_filters:
+                where_clauses.append("(" + " OR ".join(biz_filters) + ")")
+                params.extend([like_value] * len(biz_filters))
+
+        where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+        return where_sql, params
+
     def fetch_list(
         self,
         filters: Mapping[str, Any],
@@ -374,83 +419,12 @@ class FullProcessRepository:
         with self.connection() as conn:
             table = self._resolve_table_name(conn)
             table_columns = set(self._get_columns(conn, table))
-            is_postgres = getattr(conn, "is_postgres", False)
-
-            where_clauses = ["COALESCE(p.is_deleted, 0) = 0"]
-            params: List[Any] = []
-
-            company_name = (filters.get("company_name") or "").strip()
-            business_number = (filters.get("business_number") or "").strip()
-
-            if company_name:
-                like_value = f"%{company_name}%"
-                json_keys = ["company_name", "company_1cha"]
-                direct_columns = [
-                    col
-                    for col in ("company_name", "primary_company")
-                    if col in table_columns
-                ]
+            where_sql, params = self._build_list_where(conn, table_columns, filters)
 
-                if is_postgres:
-                    company_filters = [
-                        f"(p.custom_data->>'{key}') ILIKE %s"
-                        for key in json_keys
-                    ]
-                    company_filters.extend(
-                        [f"COALESCE(p.{col}, '') ILIKE %s" for col in direct_columns]
-                    )
-                else:
-                    company_filters = [
-                        f"LOWER(COALESCE(JSON_EXTRACT(p.custom_data, '$.{key}'), '')) LIKE LOWER(%s)"
-                        for key in json_keys
-                    ]
-                    company_filters.extend(
-                        [f"LOWER(COALESCE(p.{col}, '')) LIKE LOWER(%s)" for col in direct_columns]
-                    )
-
-                company_filters = [f for f in company_filters if f]
-                if company_filters:
-                    where_clauses.append("(" + " OR ".join(company_filters) + ")")
-                    params.extend([like_value] * len(company_filters))
-
-            if business_number:
-                like_value = f"%{business_number}%"
-                json_keys = ["business_number", "company_1cha_bizno"]
-                direct_columns = [
-                    col
-                    for col in ("business_number", "primary_business_number")
-                    if col in table_columns
-                ]
-
-                if is_postgres:
-                    biz_filters = [
-                        f"(p.custom_data->>'{key}') ILIKE %s"
-                        for key in json_keys
-                    ]
-                    biz_filters.extend(
-                        [f"COALESCE(p.{col}, '') ILIKE %s" for col in direct_columns]
-                    )
-                else:
-                    biz_filters = [
-                        f"LOWER(COALESCE(JSON_EXTRACT(p.custom_data, '$.{key}'), '')) LIKE LOWER(%s)"
-                        for key in json_keys
-                    ]
-                    biz_filters.extend(
-                        [f"LOWER(COALESCE(p.{col}, '')) LIKE LOWER(%s)" for col in direct_columns]
-                    )
-
-                biz_filters = [f for f in biz_filters if f]
-                if biz_filters:
-                    where_clauses.append("(" + " OR ".join(biz_filters) + ")")
-                    params.extend([like_value] * len(biz_filters))
-
-            where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+            select_sql = f"SELECT p.* FROM {table} p WHERE {where_sql}"
+            count = count_rows(conn, table, select_sql, params, filters)
 
             cursor = conn.cursor()
-            count_query = f"SELECT COUNT(*) FROM {table} p WHERE {where_sql}"
-            cursor.execute(count_query, params)
-            total_count = int(self._first_value(cursor.fetchone(), 0) or 0)
-
             query = (
                 f"SELECT p.* FROM {table} p "
                 f"WHERE {where_sql} "
@@ -459,9 +433,37 @@ class FullProcessRepository:
             )
             cursor.execute(query, [*params, per_page, offset])
             items = [dict(row) for row in cursor.fetchall()]
+            total_count = reconcile_total(count, offset, len(items), per_page)
 
         return total_count, items
 
+    def fetch_list_keyset(
+        self,
+        filters: Mapping[str, Any],
+        per_page: int,
+        cursor_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Cursor-paged list without COUNT(*); see db.keyset."""
+        with self.connection() as conn:
+            table = self._resolve_table_name(conn)
+            table_columns = set(self._get_columns(conn, table))
+            where_sql, params = self._build_list_where(conn, table_columns, filters)
+            order_pk = "fullprocess_number" if "fullprocess_number" in table_columns else "id"
+            order = KeysetOrder(
+                "p.created_at", f"p.{order_pk}", sort_key="created_at", tie_key=order_pk
+            )
+            clause, clause_params, order_by = keyset_clause(order, cursor_token)
+
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT p.* FROM {table} p WHERE {where_sql}{clause} "
+                f"ORDER BY {order_by} LIMIT %s",
+                [*params, *clause_params, per_page + 1],
+            )
+            rows = [dict(row) for row in cursor.fetchall()]
+
+        return keyset_page(rows, order, per_page, cursor_token)
+
     # ------------------------------------------------------------------
     # Placeholder detail/save operations (to be implemented in later steps)
 
@@ -723,7 +725,8 @@ class FullProcessRepository:
             return {'success': False, 'message': validation_errors[0], 'errors': validation_errors}, 400
 
         created_at_dt = get_korean_time()
-        fullprocess_number = data.get('fullprocess_number') or generate_fullprocess_number(self.db_path, created_at_dt)
+        explicit_number = data.get('fullprocess_number')
+        fullprocess_number = explicit_number or generate_fullprocess_number(self.db_path, created_at_dt)
 
         custom_data_json = json.dumps(custom_data, ensure_ascii=False)
 
@@ -790,7 +793,11 @@ class FullProcessRepository:
                 except Exception:
                     logging.error('[FULL_PROCESS] attachment save failed', exc_info=True)
 
+            if explicit_number:
+                # 입력받은 번호가 이후 자동 발급 번호와 겹치지 않도록 카운터에 반영
+                register_explicit_ids(conn, [fullprocess_number])
             conn.commit()
+            invalidate_counts(table, self.db_path)
 
             try:
                 detail_row = conn.execute(
@@ -963,6 +970,7 @@ class FullProcessRepository:
                 attachment_service.add(fullprocess_number, file_obj, meta)
 
             conn.commit()
+            invalidate_counts(table, self.db_path)
 
             try:
                 detail_row = conn.execute(
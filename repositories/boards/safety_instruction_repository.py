@@ -11,7 +11,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 from werkzeug.datastructures import FileStorage
 
 from db_connection import get_db_connection
-from db.schema import column_names
+from db.schema import cached_column_names
 from db.upsert import safe_upsert
 from upload_utils import validate_uploaded_files
 from utils.sql_filters import sql_is_active_true, sql_is_deleted_false
@@ -78,7 +78,7 @@ class SafetyInstructionRepository:
             return self._columns_cache[key]
 
         try:
-            columns = column_names(conn, key)
+            columns = cached_column_names(key, self.db_path)
         except Exception:
             columns = []
 
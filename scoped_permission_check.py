@@ -7,6 +7,7 @@
 
 from flask import session
 from db_connection import get_db_connection
+from dept_closure import CLOSURE_TABLE, closure_dept_ids
 import logging
 
 logger = logging.getLogger(__name__)
@@ -116,6 +117,78 @@ def _get_dept_permission_levels(cursor, menu_code, dept_id, dept_code, dept_path
         logger.debug(f"dept_menu_roles lookup failed for {menu_code}: {exc}")
         return None
 
+def _use_closure(dept_id):
+    """
+    이 부서를 closure 테이블로 조회할지 여부.
+    closure 가 비어 있거나(rebuild 전) 마지막 rebuild 이후 추가된 부서는 상위 조직 권한이
+    빠지므로 경로 분해 방식으로 조회한다. 부서 목록은 프로세스별 캐시에서 읽는다.
+    """
+    if not dept_id:
+        return False
+    try:
+        return str(dept_id) in closure_dept_ids()
+    except Exception as exc:
+        logger.debug(f"closure dept list load failed: {exc}")
+        return False
+
+
+_CLOSURE_DEPT_ROLE_SQL = f"""
+    SELECT DISTINCT ON (r.menu_code)
+        r.menu_code, r.read_level, r.write_level, r.can_delete
+    FROM dept_menu_roles r
+    LEFT JOIN {CLOSURE_TABLE} a
+           ON a.dept_id = %(dept_id)s
+          AND a.ancestor_code = r.dept_code
+    WHERE r.is_active = true
+      AND r.menu_code IS NOT NULL
+      {{menu_filter}}
+      AND (r.dept_id = %(dept_id)s OR a.dept_id IS NOT NULL)
+    ORDER BY
+        r.menu_code,
+        CASE WHEN r.dept_id = %(dept_id)s THEN 0 ELSE 1 END,
+        a.depth ASC NULLS LAST,
+        r.updated_at DESC
+"""
+
+
+def _get_dept_permission_levels_closure(cursor, dept_id, menu_code=None):
+    """
+    closure 테이블 조인으로 부서 권한을 조회한다 (가장 가까운 상위 조직 우선).
+    menu_code 를 주면 해당 메뉴만, 없으면 전체 메뉴를 dict 로 돌려준다.
+    """
+    if not dept_id:
+        return {}
+
+    params = {'dept_id': dept_id}
+    menu_filter = ''
+    if menu_code:
+        menu_filter = 'AND r.menu_code = %(menu_code)s'
+        params['menu_code'] = menu_code
+
+    cursor.execute(_CLOSURE_DEPT_ROLE_SQL.format(menu_filter=menu_filter), params)
+    result = {}
+    for row in cursor.fetchall():
+        result[_row_value(row, 0, 'menu_code')] = {
+            'read_level': _row_value(row, 1, 'read_level'),
+            'write_level': _row_value(row, 2, 'write_level'),
+            'can_delete': _row_value(row, 3, 'can_delete'),
+        }
+    return result
+
+
+def _resolve_dept_permission(cursor, menu_code, dept_id):
+    """부서 권한 조회 - closure 테이블에 부서가 있으면 인덱스 조인, 없으면 경로 분해 방식."""
+    if _use_closure(dept_id):
+        try:
+            return _get_dept_permission_levels_closure(cursor, dept_id, menu_code).get(menu_code)
+        except Exception as exc:
+            logger.debug(f"closure lookup failed for {menu_code}: {exc}")
+            return None
+
+    dept_code, dept_path = _get_dept_info(cursor, dept_id)
+    return _get_dept_permission_levels(cursor, menu_code, dept_id, dept_code, dept_path)
+
+
 class PermissionLevel:
     """권한 레벨 상수"""
     NONE = 0      # 권한 없음
@@ -177,8 +250,7 @@ def get_permission_level(login_id, dept_id, menu_code, action='read'):
         user_level = _row_value(user_result, 0, column) if user_result else 0
 
         # 부서 권한 레벨 (SSO deptid 기준, 상위 조직 포함)
-        dept_code, dept_path = _get_dept_info(cursor, dept_id)
-        dept_perm = _get_dept_permission_levels(cursor, menu_code, dept_id, dept_code, dept_path)
+        dept_perm = _resolve_dept_permission(cursor, menu_code, dept_id)
         dept_level = 0
         if dept_perm:
             dept_level = dept_perm.get(column) or 0
@@ -193,6 +265,110 @@ def get_permission_level(login_id, dept_id, menu_code, action='read'):
         logger.error(f"Error getting permission level: {e}")
         return PermissionLevel.NONE
 
+_BULK_DEPT_PERM_PATH_CTE = """
+    dept AS (
+        SELECT dept_code, COALESCE(dept_full_path, dept_code) AS dept_path
+        FROM departments_external
+        WHERE dept_id = %(dept_id)s AND is_active = true
+        LIMIT 1
+    ),
+    path_codes AS (
+        SELECT btrim(code) AS code
+        FROM dept, unnest(string_to_array(dept.dept_path, '|')) AS code
+        WHERE btrim(code) <> ''
+        UNION
+        SELECT dept_code FROM dept WHERE dept_code IS NOT NULL
+    ),
+    dept_perm AS (
+        SELECT DISTINCT ON (r.menu_code)
+            r.menu_code, r.read_level, r.write_level, r.can_delete
+        FROM dept_menu_roles r
+        WHERE r.is_active = true
+          AND r.menu_code = ANY(string_to_array(%(menu_codes)s, ','))
+          AND (r.dept_id = %(dept_id)s OR r.dept_code IN (SELECT code FROM path_codes))
+        ORDER BY
+            r.menu_code,
+            CASE WHEN r.dept_id = %(dept_id)s THEN 0 ELSE 1 END,
+            COALESCE(length(r.dept_full_path), 0) DESC,
+            r.updated_at DESC
+    )
+"""
+
+_BULK_DEPT_PERM_CLOSURE_CTE = f"""
+    dept_perm AS (
+        SELECT DISTINCT ON (r.menu_code)
+            r.menu_code, r.read_level, r.write_level, r.can_delete
+        FROM dept_menu_roles r
+        LEFT JOIN {CLOSURE_TABLE} a
+               ON a.dept_id = %(dept_id)s
+              AND a.ancestor_code = r.dept_code
+        WHERE r.is_active = true
+          AND r.menu_code = ANY(string_to_array(%(menu_codes)s, ','))
+          AND (r.dept_id = %(dept_id)s OR a.dept_id IS NOT NULL)
+        ORDER BY
+            r.menu_code,
+            CASE WHEN r.dept_id = %(dept_id)s THEN 0 ELSE 1 END,
+            a.depth ASC NULLS LAST,
+            r.updated_at DESC
+    )
+"""
+
+_BULK_PERMISSION_SQL = """
+    WITH {dept_perm_cte}
+    SELECT
+        m.menu_code,
+        GREATEST(COALESCE(u.read_level, 0), COALESCE(d.read_level, 0)) AS read_level,
+        GREATEST(COALESCE(u.write_level, 0), COALESCE(d.write_level, 0)) AS write_level,
+        (COALESCE(u.can_delete, false) OR COALESCE(d.can_delete, false)) AS can_delete
+    FROM unnest(string_to_array(%(menu_codes)s, ',')) AS m(menu_code)
+    LEFT JOIN user_menu_permissions u
+           ON u.menu_code = m.menu_code
+          AND u.login_id = %(login_id)s
+          AND u.is_active = true
+    LEFT JOIN dept_perm d ON d.menu_code = m.menu_code
+"""
+
+
+def get_permission_levels(login_id, dept_id, menu_codes):
+    """
+    여러 메뉴의 권한 레벨을 한 번의 쿼리로 조회
+
+    개인 권한과 부서 권한(상위 조직 포함) 중 높은 것을 메뉴별로 계산한다.
+    get_permission_level()을 메뉴마다 호출하는 것과 같은 결과를 돌려준다.
+
+    Returns:
+        dict: {menu_code: {'read_level', 'write_level', 'can_delete'}}
+    """
+    codes = [code for code in dict.fromkeys(menu_codes or []) if code]
+    empty = {code: {'read_level': 0, 'write_level': 0, 'can_delete': False} for code in codes}
+    if not login_id or not codes:
+        return empty
+
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        dept_perm_cte = (
+            _BULK_DEPT_PERM_CLOSURE_CTE if _use_closure(dept_id) else _BULK_DEPT_PERM_PATH_CTE
+        )
+        cursor.execute(
+            _BULK_PERMISSION_SQL.format(dept_perm_cte=dept_perm_cte),
+            {
+                'login_id': login_id,
+                'dept_id': dept_id or '',
+                'menu_codes': ','.join(codes),
+            },
+        )
+        for row in cursor.fetchall():
+            empty[_row_value(row, 0, 'menu_code')] = {
+                'read_level': _row_value(row, 1, 'read_level') or 0,
+                'write_level': _row_value(row, 2, 'write_level') or 0,
+                'can_delete': bool(_row_value(row, 3, 'can_delete')),
+            }
+        cursor.close()
+    finally:
+        conn.close()
+    return empty
+
 def check_data_access(login_id, dept_id, menu_code, action, data_owner=None, data_dept=None):
     """
     데이터 접근 권한 체크
@@ -252,8 +428,7 @@ def check_delete_permission(login_id, dept_id, menu_code):
         user_can_delete = _row_value(user_result, 0, 'can_delete') if user_result else False
 
         # 부서 삭제 권한 (상위 조직 포함)
-        dept_code, dept_path = _get_dept_info(cursor, dept_id)
-        dept_perm = _get_dept_permission_levels(cursor, menu_code, dept_id, dept_code, dept_path)
+        dept_perm = _resolve_dept_permission(cursor, menu_code, dept_id)
         dept_can_delete = dept_perm.get('can_delete') if dept_perm else False
 
         cursor.close()
@@ -317,9 +492,19 @@ def get_user_permission_summary(login_id, dept_id):
             }
 
         # 부서 권한 (상위 조직 포함)
-        dept_code, dept_path = _get_dept_info(cursor, dept_id)
         dept_perms = {}
-        if dept_code or dept_id:
+        use_closure = _use_closure(dept_id)
+        if use_closure:
+            for menu_code, perm in _get_dept_permission_levels_closure(cursor, dept_id).items():
+                dept_perms[menu_code] = {
+                    'read_level': perm['read_level'] or 0,
+                    'write_level': perm['write_level'] or 0,
+                    'can_delete': bool(perm['can_delete']),
+                }
+            dept_code = dept_path = None
+        else:
+            dept_code, dept_path = _get_dept_info(cursor, dept_id)
+        if not use_closure and (dept_code or dept_id):
             where_parts = []
             params = []
             if dept_id:
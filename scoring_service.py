@@ -10,6 +10,7 @@ import json
 from typing import Dict, Any, List, Tuple
 
 from db_connection import get_db_connection
+from layout_cache import cached_layout
 from utils.sql_filters import sql_is_active_true, sql_is_deleted_false
 
 
@@ -28,6 +29,10 @@ def _normalize_board(board: str) -> str:
 
 
 def _load_columns(board: str, db_path: str) -> List[Dict[str, Any]]:
+    return cached_layout(board, 'scoring_columns', lambda: _query_columns(board, db_path), db_path)
+
+
+def _query_columns(board: str, db_path: str) -> List[Dict[str, Any]]:
     conn = get_db_connection(db_path)
     table = f"{board}_column_config"
     rows = conn.execute(
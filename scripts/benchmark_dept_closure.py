@@ -0,0 +1,182 @@
+"""Benchmark department permission lookups: dept_full_path split vs closure join.
+
+Run with:
+    venv\\Scripts\\python.exe scripts\\benchmark_dept_closure.py [--departments 5000] [--lookups 2000]
+
+The benchmark builds a synthetic department tree in TEMP tables named
+departments_external / dept_menu_roles / department_ancestors. Temp tables
+shadow the real ones for this session only, and the session uses its own
+non-pooled connection, so production data is never read or modified.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+from db.postgres import PostgresConnection
+from db_connection import get_postgres_dsn
+from dept_closure import rebuild_department_closure
+import scoped_permission_check as spc
+
+MENU_CODES = (
+    'VENDOR_MGT', 'REFERENCE_CHANGE', 'ACCIDENT_MGT', 'SAFETY_INSTRUCTION',
+    'FOLLOW_SOP', 'FULL_PROCESS', 'SAFE_WORKPLACE', 'SUBCONTRACT_APPROVAL',
+    'SUBCONTRACT_REPORT', 'SAFETY_COUNCIL',
+)
+
+
+def build_tree(size: int, max_depth: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """Return (dept_code, dept_full_path) pairs for a random tree."""
+    nodes: List[Tuple[str, str, int]] = [('D00000', 'D00000', 1)]
+    for index in range(1, size):
+        parent_code, parent_path, parent_depth = rng.choice(nodes)
+        while parent_depth >= max_depth:
+            parent_code, parent_path, parent_depth = rng.choice(nodes)
+        code = f'D{index:05d}'
+        nodes.append((code, f'{parent_path}|{code}', parent_depth + 1))
+    return [(code, path) for code, path, _depth in nodes]
+
+
+def create_fixture(conn, tree: List[Tuple[str, str]], role_ratio: float, rng: random.Random) -> None:
+    cur = conn.cursor()
+    cur.execute(
+        """
+        CREATE TEMP TABLE departments_external (
+            dept_id VARCHAR(100) PRIMARY KEY,
+            dept_code VARCHAR(100),
+            dept_full_path TEXT,
+            is_active BOOLEAN DEFAULT TRUE
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE TEMP TABLE dept_menu_roles (
+            dept_id VARCHAR(100) NOT NULL,
+            dept_code VARCHAR(100),
+            dept_full_path TEXT,
+            menu_code VARCHAR(50) NOT NULL,
+            read_level INTEGER DEFAULT 0,
+            write_level INTEGER DEFAULT 0,
+            can_delete BOOLEAN DEFAULT FALSE,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active BOOLEAN DEFAULT TRUE,
+            PRIMARY KEY (dept_id, menu_code)
+        )
+        """
+    )
+    # must exist before rebuild_department_closure() so it never touches the real table
+    cur.execute(
+        """
+        CREATE TEMP TABLE department_ancestors (
+            dept_id VARCHAR(100) NOT NULL,
+            ancestor_code VARCHAR(100) NOT NULL,
+            depth INTEGER NOT NULL,
+            PRIMARY KEY (dept_id, ancestor_code)
+        )
+        """
+    )
+    cur.executemany(
+        "INSERT INTO departments_external (dept_id, dept_code, dept_full_path) VALUES (%s, %s, %s)",
+        [(f'SSO{code}', code, path) for code, path in tree],
+    )
+    roles = []
+    for code, path in tree:
+        for menu_code in MENU_CODES:
+            if rng.random() < role_ratio:
+                roles.append((f'SSO{code}', code, path, menu_code, rng.randint(1, 3), rng.randint(0, 3)))
+    cur.executemany(
+        """
+        INSERT INTO dept_menu_roles (dept_id, dept_code, dept_full_path, menu_code, read_level, write_level)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        """,
+        roles,
+    )
+    cur.execute("ANALYZE departments_external")
+    cur.execute("ANALYZE dept_menu_roles")
+    cur.close()
+    conn.commit()
+    print(f'fixture: {len(tree)} departments, {len(roles)} dept_menu_roles rows')
+
+
+def path_lookup(cursor, dept_id: str, menu_code: str):
+    dept_code, dept_path = spc._get_dept_info(cursor, dept_id)
+    return spc._get_dept_permission_levels(cursor, menu_code, dept_id, dept_code, dept_path)
+
+
+def closure_lookup(cursor, dept_id: str, menu_code: str):
+    return spc._get_dept_permission_levels_closure(cursor, dept_id, menu_code).get(menu_code)
+
+
+def measure(cursor, lookup: Callable, samples: List[Tuple[str, str]]) -> Tuple[List[float], List]:
+    timings, results = [], []
+    for dept_id, menu_code in samples:
+        started = time.perf_counter()
+        results.append(lookup(cursor, dept_id, menu_code))
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, results
+
+
+def summarize(label: str, timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    stats = {
+        'mean': statistics.fmean(ordered),
+        'p50': ordered[len(ordered) // 2],
+        'p95': ordered[int(len(ordered) * 0.95) - 1],
+        'total': sum(ordered),
+    }
+    print(
+        f"{label:<8} mean={stats['mean']:.3f}ms p50={stats['p50']:.3f}ms "
+        f"p95={stats['p95']:.3f}ms total={stats['total']:.1f}ms"
+    )
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--departments', type=int, default=5000)
+    parser.add_argument('--max-depth', type=int, default=7)
+    parser.add_argument('--role-ratio', type=float, default=0.05)
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tree = build_tree(args.departments, args.max_depth, rng)
+
+    conn = PostgresConnection(dsn=get_postgres_dsn())
+    try:
+        create_fixture(conn, tree, args.role_ratio, rng)
+        started = time.perf_counter()
+        closure_rows = rebuild_department_closure(conn)
+        print(f'closure rebuild: {closure_rows} rows in {(time.perf_counter() - started) * 1000:.1f}ms')
+
+        samples = [(f'SSO{rng.choice(tree)[0]}', rng.choice(MENU_CODES)) for _ in range(args.lookups)]
+        cursor = conn.cursor()
+        # warm-up so both variants run with cached plans and buffers
+        measure(cursor, path_lookup, samples[:50])
+        measure(cursor, closure_lookup, samples[:50])
+
+        path_timings, path_results = measure(cursor, path_lookup, samples)
+        closure_timings, closure_results = measure(cursor, closure_lookup, samples)
+        cursor.close()
+        conn.rollback()
+
+        path_stats = summarize('path', path_timings)
+        closure_stats = summarize('closure', closure_timings)
+        print(f"speedup (mean): {path_stats['mean'] / closure_stats['mean']:.2f}x")
+
+        def levels(result):
+            return None if not result else (result['read_level'], result['write_level'])
+
+        mismatches = sum(1 for a, b in zip(path_results, closure_results) if levels(a) != levels(b))
+        print(f'result mismatches: {mismatches}/{len(samples)}')
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
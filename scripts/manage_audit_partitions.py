@@ -0,0 +1,53 @@
+"""Convert access_audit_log to monthly partitions and run partition maintenance.
+
+Run with:
+    venv\\Scripts\\python.exe scripts\\manage_audit_partitions.py --convert
+    venv\\Scripts\\python.exe scripts\\manage_audit_partitions.py
+
+--convert rewrites the plain table into a partitioned table once (the old table
+is kept as access_audit_log_legacy). Without it the script creates upcoming
+partitions and applies the [AUDIT] partition_retention_* settings, which is the
+same job the app's background scheduler runs.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+
+from audit_partitions import (
+    LEGACY_TABLE,
+    convert_to_partitioned,
+    ensure_audit_partitions,
+    get_partition_settings,
+)
+from db_connection import get_db_connection
+
+logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+log = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--convert', action='store_true', help='convert the plain table to partitions')
+    args = parser.parse_args()
+
+    settings = get_partition_settings()
+    conn = get_db_connection()
+    try:
+        if args.convert:
+            copied = convert_to_partitioned(conn, months_ahead=settings['months_ahead'])
+            log.info('converted: %s rows copied (old table kept as %s)', copied, LEGACY_TABLE)
+        result = ensure_audit_partitions(
+            conn,
+            months_ahead=settings['months_ahead'],
+            retention_months=settings['retention_months'],
+            retention_action=settings['retention_action'],
+        )
+        log.info('partitions created=%s detached=%s dropped=%s',
+                 result['created'], result['detached'], result['dropped'])
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
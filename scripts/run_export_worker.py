@@ -0,0 +1,62 @@
+"""Run the background export job worker as its own process.
+
+Run with:
+    venv\\Scripts\\python.exe scripts\\run_export_worker.py
+    venv\\Scripts\\python.exe scripts\\run_export_worker.py --once
+
+Web processes only enqueue exports ([EXPORT] job_worker_enabled = false), so
+heavy xlsx/csv/parquet builds run here instead of in the gunicorn workers. The
+app module is imported only to register the board sheet builders; its
+background services (job scheduler, audit partition maintenance, in-web export
+worker) are skipped with BACKGROUND_SERVICES=false. The worker then polls
+export_jobs with [EXPORT] job_worker_threads threads until SIGINT/SIGTERM.
+Several worker processes can run side by side; each job is claimed once.
+
+--once processes the queued jobs in this thread and exits (for cron).
+Expired artifacts and timed-out jobs are cleaned up by the job scheduler's
+export-job-cleanup job, not by this process.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+
+from export_jobs import ExportJobWorker, drain_export_jobs, get_job_settings, registered_boards
+
+logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+log = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, help='override [EXPORT] job_worker_threads')
+    parser.add_argument('--once', action='store_true', help='drain the queue once and exit')
+    args = parser.parse_args()
+
+    os.environ['BACKGROUND_SERVICES'] = 'false'
+    import app  # noqa: F401  board export builders are registered when app.py is imported
+
+    settings = get_job_settings()
+    if args.threads:
+        settings['worker_threads'] = max(1, args.threads)
+    log.info('export boards: %s', ', '.join(registered_boards()))
+
+    if args.once:
+        log.info('processed %d export job(s)', drain_export_jobs(settings))
+        return
+
+    worker = ExportJobWorker(settings)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.stop())
+    worker.start()
+    log.info('export worker running (%d thread(s), poll every %d second(s))',
+             settings['worker_threads'], settings['poll_seconds'])
+    worker.wait_stopped()
+    log.info('stopping; waiting for running jobs to finish')
+    worker.join()
+
+
+if __name__ == '__main__':
+    main()
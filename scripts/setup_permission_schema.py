@@ -4,6 +4,8 @@
 - user_menu_permissions / dept_menu_roles / permission_requests / menu_names /
   permission_access_log / permission_levels 테이블을 다룹니다.
 - menu_names 에는 필수 메뉴명만 기본으로 채워 줍니다.
+- 권한 테이블 변경 시 permission_generation 시퀀스를 올리고 permission_changed 채널로 알리는 트리거를 설치합니다.
+- access_audit_log 가 없으면 월 파티션 테이블로 생성합니다.
 
 사용법: venv 활성화 후 `python scripts/setup_permission_schema.py`
 """
@@ -13,6 +15,8 @@ import logging
 from typing import Iterable, Tuple
 
 from db_connection import get_db_connection
+from audit_partitions import create_partitioned_table
+from dept_closure import ensure_department_closure_table, rebuild_department_closure
 
 CORE_MENU_NAMES = {
     "VENDOR_MGT": "협력사 기준정보",
@@ -27,6 +31,8 @@ CORE_MENU_NAMES = {
     "SAFETY_COUNCIL": "안전보건 협의체",
 }
 
+PERMISSION_NOTIFY_TABLES = ("user_menu_permissions", "dept_menu_roles", "dept_menu_permissions")
+
 
 def column_exists(cursor, table: str, column: str) -> bool:
     cursor.execute(
@@ -247,6 +253,12 @@ def ensure_table_permission_levels(cursor) -> None:
 
 
 def ensure_table_access_audit(cursor) -> None:
+    cursor.execute("SELECT to_regclass('access_audit_log')")
+    row = cursor.fetchone()
+    if not row or row[0] is None:
+        # 신규 설치는 처음부터 월 파티션 테이블로 만든다.
+        create_partitioned_table(cursor)
+
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS access_audit_log (
@@ -318,6 +330,39 @@ def ensure_table_access_log(cursor) -> None:
     )
 
 
+def ensure_permission_change_notify(cursor) -> None:
+    """권한 테이블 변경 시 permission_changed 채널로 NOTIFY 하는 트리거를 건다.
+
+    각 워커의 인메모리 권한 캐시(permission_cache.py)가 이 알림으로 무효화되고,
+    함께 올리는 permission_generation 시퀀스 값이 세션 권한 매트릭스의 표식이 된다.
+    """
+    cursor.execute("CREATE SEQUENCE IF NOT EXISTS permission_generation")
+    cursor.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_permission_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval('permission_generation');
+            PERFORM pg_notify('permission_changed', 'all');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in PERMISSION_NOTIFY_TABLES:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL AS present", (table,))
+        row = cursor.fetchone()
+        if not (row and row[0]):
+            continue
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_notify ON {table}")
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_{table}_notify
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_permission_changed()
+            """
+        )
+
+
 def main() -> None:
     conn = get_db_connection()
     conn.autocommit = False
@@ -326,13 +371,19 @@ def main() -> None:
     try:
         ensure_table_user_permissions(cursor)
         ensure_table_dept_roles(cursor)
+        ensure_department_closure_table(cursor)
         ensure_table_permission_requests(cursor)
         ensure_table_menu_names(cursor)
         ensure_table_permission_levels(cursor)
         ensure_table_access_audit(cursor)
         ensure_table_access_log(cursor)
+        ensure_permission_change_notify(cursor)
 
         conn.commit()
+
+        # closure 가 비어 있으면 상위 조직 권한이 빠지므로 만든 직후 바로 채운다
+        closure_rows = rebuild_department_closure(conn)
+        print(f"✅ 부서 closure 재구성: {closure_rows}건")
         print("✅ 권한 관련 테이블 점검 및 보정이 완료되었습니다.")
     except Exception as exc:
         conn.rollback()
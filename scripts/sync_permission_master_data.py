@@ -5,7 +5,8 @@ Run with:
 
 Employees are fetched from LOCAL_DATA_QUERIES through the local PostgreSQL helper.
 Departments are fetched from MASTER_DATA_QUERIES through the external IQADB helper.
-The results are upserted into the Postgres tables system_users / departments_external.
+The results are upserted into the Postgres tables system_users / departments_external,
+and the department_ancestors closure table is rebuilt from the new department paths.
 """
 from __future__ import annotations
 
@@ -15,6 +16,7 @@ from typing import Dict, Iterable, List, Sequence
 
 from db_connection import get_db_connection
 from database_config import execute_SQL, execute_local_query
+from dept_closure import rebuild_department_closure
 
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 log = logging.getLogger(__name__)
@@ -214,6 +216,11 @@ def main() -> None:
         )
         log.info('departments_external upserted %d rows', inserted_depts)
 
+        # department_ancestors (권한 조회용 부서 계층 closure)
+        log.info('Rebuilding department_ancestors...')
+        closure_rows = rebuild_department_closure(conn)
+        log.info('department_ancestors rebuilt with %d rows', closure_rows)
+
         log.info('Done.')
     finally:
         conn.close()
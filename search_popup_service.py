@@ -10,6 +10,7 @@ import sys
 from typing import List, Dict, Any, Optional
 import math
 from db_connection import get_db_connection
+from db.keyset import KeysetOrder, keyset_clause, keyset_page
 from db.schema import table_exists
 from utils.sql_filters import sql_is_active_true
 from datetime import datetime, timedelta
@@ -371,6 +372,7 @@ class SearchPopupService:
         limit: int = 50,
         page: int = 1,
         filters: Optional[List[Dict[str, Any]]] = None,
+        cursor_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         검색 수행
@@ -381,6 +383,8 @@ class SearchPopupService:
             search_field: 검색할 필드 (None이면 default_search_field 사용)
             limit: 페이지당 결과 제한 수
             page: 페이지 번호 (1부터 시작)
+            cursor_token: None이 아니면 keyset 페이지네이션 (order_by, id_field 기준).
+                    COUNT 없이 next_cursor/prev_cursor 를 돌려준다. 빈 문자열은 첫 페이지.
             
         Returns:
             검색 결과와 설정 정보
@@ -425,6 +429,7 @@ class SearchPopupService:
         offset = (page - 1) * limit
         query_limit = limit + 1
         has_more_flag = False
+        keyset = None
         prepared_filters: List[Dict[str, Any]] = []
         if filters:
             for filt in filters:
@@ -436,7 +441,7 @@ class SearchPopupService:
         
         try:
             # 캐시 확인 (person, department, building, contractor는 메모리 캐시 사용)
-            if search_type != 'company' and (query or use_filters):
+            if search_type != 'company' and (query or use_filters) and cursor_token is None:
                 cache_key = self._get_cache_key(search_type, query, search_field, prepared_filters, limit, page)
                 cache_entry = self._cache.get(cache_key)
                 
@@ -488,6 +493,7 @@ class SearchPopupService:
                 query_params: List[Any] = []
                 count_sql = None
                 count_params: List[Any] = []
+                filter_sql = None
 
                 if use_filters:
                     where_clauses = []
@@ -516,6 +522,7 @@ class SearchPopupService:
                         }
 
                     where_sql = ' AND '.join(where_clauses) if config.get('advanced_filter_operator', 'and').lower() == 'and' else ' OR '.join(where_clauses)
+                    filter_sql = where_sql
                     order_clause = config.get('order_by', config.get('id_field', 'id'))
 
                     query_sql = f"""
@@ -542,6 +549,7 @@ class SearchPopupService:
                         condition = f"(custom_data->>'{search_field}') ILIKE %s"
                     else:
                         condition = f"{search_field} ILIKE %s"
+                    filter_sql = condition
 
                     query_sql = f"""
                         SELECT * FROM {table_name}
@@ -577,6 +585,7 @@ class SearchPopupService:
                             base_params.append(like_param)
 
                     where_sql = ' OR '.join(where_clauses)
+                    filter_sql = where_sql
                     order_clause = config.get('order_by', config.get('id_field', 'id'))
 
                     query_sql = f"""
@@ -605,16 +614,35 @@ class SearchPopupService:
                         'total_pages': 0,
                     }
 
+                if cursor_token is not None:
+                    id_field = config.get('id_field', 'id')
+                    keyset_order = KeysetOrder(order_clause, id_field, sort_key=order_clause, tie_key=id_field, descending=False)
+                    clause, clause_params, order_by = keyset_clause(keyset_order, cursor_token)
+                    query_sql = f"""
+                        SELECT * FROM {table_name}
+                        WHERE ({filter_sql}){clause}
+                        ORDER BY {order_by}
+                        LIMIT %s
+                    """
+                    query_params = [*count_params, *clause_params, query_limit]
+
                 cursor.execute(query_sql, query_params)
                 logging.info("[search-popup] local-sql type=%s sql=%s params=%s", search_type, query_sql, query_params)
                 rows = cursor.fetchall()
-                has_more_flag = len(rows) > limit
-                rows = rows[:limit]
-                results = [dict(row) for row in rows]
 
-                cursor.execute(count_sql, count_params)
-                count_row = cursor.fetchone()
-                total_count = count_row[0] if count_row else 0
+                if cursor_token is not None:
+                    keyset = keyset_page([dict(row) for row in rows], keyset_order, limit, cursor_token)
+                    results = keyset['items']
+                    has_more_flag = keyset['has_next']
+                    total_count = None
+                else:
+                    has_more_flag = len(rows) > limit
+                    rows = rows[:limit]
+                    results = [dict(row) for row in rows]
+
+                    cursor.execute(count_sql, count_params)
+                    count_row = cursor.fetchone()
+                    total_count = count_row[0] if count_row else 0
 
                 conn.close()
             else:
@@ -760,7 +788,7 @@ class SearchPopupService:
                 if 'department_name' in result:
                     result['department'] = result['department_name']
 
-        return {
+        response = {
             'results': results,
             'config': config,
             'total': total_count,
@@ -768,6 +796,11 @@ class SearchPopupService:
             'page': page,
             'has_more': has_more_flag,
         }
+        if keyset is not None:
+            response['next_cursor'] = keyset['next_cursor']
+            response['prev_cursor'] = keyset['prev_cursor']
+            response['has_prev'] = keyset['has_prev']
+        return response
     
     def cleanup_cache(self):
         """만료된 캐시 정리"""
@@ -2,7 +2,8 @@ import json
 import logging
 from datetime import datetime
 from db_connection import get_db_connection
-from db.schema import column_exists
+from db.schema import cached_column_exists
+from layout_cache import cached_layout
 from utils.sql_filters import sql_is_active_true, sql_is_deleted_false
 
 class SectionConfigService:
@@ -28,14 +29,22 @@ class SectionConfigService:
         else:
             return 'section_config'
         
-    def get_sections(self):
-        """특정 보드 타입의 모든 활성 섹션 가져오기"""
+    def get_sections(self):
+        """특정 보드 타입의 모든 활성 섹션 가져오기 (보드 레이아웃 캐시 사용)"""
+        try:
+            return cached_layout(self.board_type, 'config_sections', self._load_sections, self.db_path)
+        except Exception as e:
+            logging.error(f"섹션 조회 오류: {e}")
+            return self._get_default_sections()
+
+    def _load_sections(self):
+        """섹션 설정 조회 (get_sections 캐시 적재용, 실패 시 예외 전파)"""
         conn = get_db_connection(self.db_path)
         cursor = conn.cursor()
 
         def _col_exists(table: str, col: str) -> bool:
             try:
-                return column_exists(conn, table, col)
+                return cached_column_exists(table, col, self.db_path)
             except Exception:
                 return False
 
@@ -69,23 +78,29 @@ class SectionConfigService:
                 sql = f"SELECT * FROM section_config WHERE {where} ORDER BY section_order"
                 cursor.execute(sql, (self.board_type,))
 
-            sections = [dict(row) for row in cursor.fetchall()]
-            return sections
-
-        except Exception as e:
-            logging.error(f"섹션 조회 오류: {e}")
-            return self._get_default_sections()
+            sections = [dict(row) for row in cursor.fetchall()]
+            return sections
         finally:
             conn.close()
     
     def get_sections_with_columns(self):
-        """섹션과 해당 컬럼들을 함께 가져오기"""
-        conn = get_db_connection(self.db_path)
-        cursor = conn.cursor()
+        """섹션과 해당 컬럼들을 함께 가져오기 (보드 레이아웃 캐시 사용)"""
+        try:
+            return cached_layout(
+                self.board_type, 'config_sections_with_columns', self._load_sections_with_columns, self.db_path
+            )
+        except Exception as e:
+            logging.error(f"섹션과 컬럼 조회 오류: {e}")
+            return self._get_default_sections()
+
+    def _load_sections_with_columns(self):
+        """섹션별 컬럼 조회 (get_sections_with_columns 캐시 적재용, 실패 시 예외 전파)"""
+        conn = get_db_connection(self.db_path)
+        cursor = conn.cursor()
         
         try:
-            # 섹션 가져오기
-            sections = self.get_sections()
+            # 섹션 가져오기 (조회 실패 시 예외 전파 - 기본 섹션을 캐시하지 않도록)
+            sections = self._load_sections()
             
             # 각 섹션에 대한 컬럼 가져오기
             table_name = f"{self.board_type}_column_config"
@@ -95,7 +110,7 @@ class SectionConfigService:
                 # column_config에 is_deleted 있는지 확인
                 def _has_col(col: str) -> bool:
                     try:
-                        return column_exists(conn, table_name, col)
+                        return cached_column_exists(table_name, col, self.db_path)
                     except Exception:
                         return False
                 if _has_col('is_deleted'):
@@ -105,10 +120,6 @@ class SectionConfigService:
                 section['columns'] = [dict(row) for row in cursor.fetchall()]
             
             return sections
-            
-        except Exception as e:
-            logging.error(f"섹션과 컬럼 조회 오류: {e}")
-            return self._get_default_sections()
         finally:
             conn.close()
     
@@ -344,7 +355,7 @@ class SectionConfigService:
             # soft delete가 불가능하면 hard delete로 폴백
             def _has_col(table: str, col: str) -> bool:
                 try:
-                    return column_exists(conn, table, col)
+                    return cached_column_exists(table, col, self.db_path)
                 except Exception:
                     return False
 
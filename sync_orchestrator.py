@@ -0,0 +1,273 @@
+"""
+마스터 동기화 병렬 실행기
+협력사/사고/임직원/부서/건물/협력사 근로자/사업부 동기화는 서로 독립적인데도 하나씩 차례로 돌아
+전체 시간이 각 외부 쿼리 시간의 합이 된다. run_sync_sources() 는 이들을 스레드 풀에서 동시에 돌려
+전체 시간을 가장 느린 소스 하나에 가깝게 줄인다.
+
+- SyncSource.depends_on: 선행 소스가 성공해야 시작한다 (예: 부서 → 권한 마스터 동기화).
+  선행 소스가 실패/시간 초과/건너뜀이면 후행 소스는 skipped 로 기록된다.
+- 동시 실행 수는 [DATABASE] master_sync_max_workers, 소스별 제한 시간은
+  master_sync_timeout_<소스명> (없으면 master_sync_timeout_seconds, 0 이면 무제한) 으로 정한다.
+- 시간 초과는 작업을 취소하지 않는다. 파이썬 스레드는 강제로 멈출 수 없으므로 timeout 으로
+  기록만 하고 기다리지 않으며, 스레드는 끝날 때까지 백그라운드에서 마저 돌며 계속 쓴다.
+  그동안 같은 소스는 다시 시작하지 않는다: 이 프로세스에서 아직 끝나지 않은 소스(모듈 수준
+  _inflight)와 다른 프로세스에서 실행 중인 소스(소스별 advisory lock)는 skipped 로 기록된다.
+  swap 모드의 <cache>_new 적재 중에 새 실행이 같은 테이블을 DROP 하는 일을 막기 위함이다.
+- 소스 실행기 안에서 report_sync_rows() 를 부르면 읽은/쓴 행 수가 SyncOutcome 에 남는다
+  (job_scheduler 실행 기록의 소스별 지표로 사용).
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from db_connection import get_config
+from db.leader import LeaderLease
+
+logger = logging.getLogger(__name__)
+
+STATUS_SUCCESS = 'success'
+STATUS_FAILED = 'failed'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TIMEOUT_SECONDS = 1800
+
+_metrics = threading.local()
+
+# 이 프로세스에서 아직 끝나지 않은 소스 실행 (시간 초과 후 계속 도는 스레드 포함)
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+class SourceBusy(Exception):
+    """같은 소스의 이전 실행이 아직 끝나지 않았다"""
+
+
+@dataclass
+class SyncSource:
+    name: str
+    runner: Callable[[], Optional[bool]]
+    label: str = ''
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    enabled: bool = True
+    skip_reason: str = ''
+
+    @property
+    def display_name(self):
+        return self.label or self.name
+
+
+@dataclass
+class SyncOutcome:
+    name: str
+    status: str
+    elapsed: float = 0.0
+    detail: str = ''
+    rows_read: Optional[int] = None
+    rows_written: Optional[int] = None
+
+    @property
+    def ok(self):
+        return self.status == STATUS_SUCCESS
+
+
+@contextmanager
+def collect_sync_rows():
+    """블록 안(같은 스레드)에서 report_sync_rows() 로 보고된 행 수를 모을 dict 를 돌려준다"""
+    previous = getattr(_metrics, 'counts', None)
+    counts = {}
+    _metrics.counts = counts
+    try:
+        yield counts
+    finally:
+        _metrics.counts = previous
+
+
+def report_sync_rows(read=None, written=None):
+    """현재 스레드에서 실행 중인 소스의 읽은/쓴 행 수 누적 (collect_sync_rows() 밖에서 부르면 무시)"""
+    counts = getattr(_metrics, 'counts', None)
+    if counts is None:
+        return
+    if read is not None:
+        counts['rows_read'] = (counts.get('rows_read') or 0) + int(read)
+    if written is not None:
+        counts['rows_written'] = (counts.get('rows_written') or 0) + int(written)
+
+
+def get_orchestrator_settings():
+    """[DATABASE] master_sync_max_workers / master_sync_timeout_seconds 조회"""
+    config = get_config()
+    try:
+        max_workers = config.getint('DATABASE', 'master_sync_max_workers', fallback=DEFAULT_MAX_WORKERS)
+    except ValueError:
+        max_workers = DEFAULT_MAX_WORKERS
+    try:
+        timeout = config.getfloat('DATABASE', 'master_sync_timeout_seconds', fallback=DEFAULT_TIMEOUT_SECONDS)
+    except ValueError:
+        timeout = DEFAULT_TIMEOUT_SECONDS
+    return max(1, max_workers), (timeout if timeout > 0 else None)
+
+
+def source_timeout(name, default):
+    """소스별 제한 시간(초): master_sync_timeout_<name>, 없으면 default. 0 이하는 무제한"""
+    config = get_config()
+    try:
+        value = config.getfloat('DATABASE', f'master_sync_timeout_{name}', fallback=None)
+    except ValueError:
+        value = None
+    if value is None:
+        return default
+    return value if value > 0 else None
+
+
+def _check_dependencies(sources: Sequence[SyncSource]) -> None:
+    names = {source.name for source in sources}
+    if len(names) != len(sources):
+        raise ValueError("동기화 소스 이름이 중복되었습니다.")
+    for source in sources:
+        unknown = [dep for dep in source.depends_on if dep not in names]
+        if unknown:
+            raise ValueError(f"{source.name}: 알 수 없는 선행 소스 {unknown}")
+
+    # 순환 의존 확인 (위상 정렬이 끝까지 진행되는지)
+    remaining = {source.name: set(source.depends_on) for source in sources}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"동기화 소스 의존 관계에 순환이 있습니다: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _run_source(source: SyncSource):
+    # 다른 프로세스(스케줄러 리더/수동 실행)에서 같은 소스가 도는 중이면 시작하지 않는다
+    lease = LeaderLease(f"master-sync:{source.name}")
+    if not lease.acquire():
+        raise SourceBusy("다른 프로세스에서 같은 소스 동기화가 실행 중 (또는 잠금 획득 실패)")
+    try:
+        started = time.monotonic()
+        with collect_sync_rows() as counts:
+            result = source.runner()
+    finally:
+        lease.release()
+    # 반환값이 없는 실행기(예외로만 실패를 알리는 스크립트)는 성공으로 본다
+    return result is None or bool(result), time.monotonic() - started, counts
+
+
+def _forget_inflight(name, future):
+    with _inflight_lock:
+        if _inflight.get(name) is future:
+            del _inflight[name]
+
+
+def _submit_source(executor, source: SyncSource) -> Optional[Future]:
+    """소스를 실행기에 넣는다. 이 프로세스에서 이전 실행이 아직 돌고 있으면 None"""
+    with _inflight_lock:
+        previous = _inflight.get(source.name)
+        if previous is not None and not previous.done():
+            return None
+        future = executor.submit(_run_source, source)
+        _inflight[source.name] = future
+    future.add_done_callback(partial(_forget_inflight, source.name))
+    return future
+
+
+def run_sync_sources(sources: Sequence[SyncSource], max_workers: Optional[int] = None,
+                     default_timeout: Optional[float] = None) -> Dict[str, SyncOutcome]:
+    """
+    소스들을 의존 순서를 지키며 동시에 실행하고 소스명 → SyncOutcome 을 돌려준다.
+    결과 dict 의 순서는 입력 순서를 따른다.
+    """
+    _check_dependencies(sources)
+    if max_workers is None:
+        max_workers, settings_timeout = get_orchestrator_settings()
+        if default_timeout is None:
+            default_timeout = settings_timeout
+    max_workers = max(1, int(max_workers))
+
+    outcomes: Dict[str, SyncOutcome] = {}
+    pending: List[SyncSource] = list(sources)
+    running = {}  # future -> (source, started, deadline)
+    # 시간 초과된 스레드가 슬롯을 계속 차지하지 않도록 풀은 소스 수만큼 두고, 동시 실행 수는 running 으로 제한
+    executor = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix='master-sync')
+    run_started = time.monotonic()
+    try:
+        while pending or running:
+            for source in list(pending):
+                if len(running) >= max_workers:
+                    break
+                deps = [outcomes.get(dep) for dep in source.depends_on]
+                if any(dep is None for dep in deps):
+                    continue
+                pending.remove(source)
+                failed = [dep.name for dep in deps if not dep.ok]
+                if not source.enabled:
+                    outcomes[source.name] = SyncOutcome(source.name, STATUS_SKIPPED, detail=source.skip_reason)
+                elif failed:
+                    outcomes[source.name] = SyncOutcome(
+                        source.name, STATUS_SKIPPED, detail=f"선행 동기화 실패: {', '.join(failed)}")
+                else:
+                    timeout = source.timeout if source.timeout is not None else default_timeout
+                    started = time.monotonic()
+                    future = _submit_source(executor, source)
+                    if future is None:
+                        outcomes[source.name] = SyncOutcome(
+                            source.name, STATUS_SKIPPED, detail="이전 실행이 아직 끝나지 않음 (시간 초과 후 계속 실행 중)")
+                        logger.warning("[MASTER SYNC] %s 이전 실행이 아직 진행 중이라 건너뜀", source.display_name)
+                        continue
+                    logger.info("[MASTER SYNC] %s 동기화 시작", source.display_name)
+                    running[future] = (source, started, started + timeout if timeout else None)
+
+            if not running:
+                # 건너뜀 처리로 새로 시작할 수 있게 된 소스가 있으면 다시 확인
+                continue
+
+            deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                source, started, _ = running.pop(future)
+                try:
+                    ok, elapsed, counts = future.result()
+                    status = STATUS_SUCCESS if ok else STATUS_FAILED
+                    outcomes[source.name] = SyncOutcome(
+                        source.name, status, elapsed,
+                        rows_read=counts.get('rows_read'), rows_written=counts.get('rows_written'))
+                except SourceBusy as exc:
+                    outcomes[source.name] = SyncOutcome(
+                        source.name, STATUS_SKIPPED, time.monotonic() - started, str(exc))
+                except Exception as exc:
+                    logger.error("[MASTER SYNC] %s 동기화 오류: %s", source.display_name, exc, exc_info=True)
+                    outcomes[source.name] = SyncOutcome(
+                        source.name, STATUS_ERROR, time.monotonic() - started, str(exc))
+                logger.info("[MASTER SYNC] %s 동기화 %s (%.1fs)", source.display_name,
+                            outcomes[source.name].status, outcomes[source.name].elapsed)
+
+            now = time.monotonic()
+            for future, (source, started, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    del running[future]
+                    future.cancel()
+                    outcomes[source.name] = SyncOutcome(
+                        source.name, STATUS_TIMEOUT, now - started,
+                        "제한 시간 초과 - 취소되지 않고 백그라운드에서 계속 실행되며, 끝날 때까지 다음 실행은 건너뜀")
+                    logger.warning("[MASTER SYNC] %s 동기화 제한 시간 초과 (%.0fs)",
+                                   source.display_name, now - started)
+    finally:
+        # 시간 초과된 스레드는 기다리지 않는다
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    logger.info("[MASTER SYNC] 전체 %d개 소스 완료 (%.1fs, 동시 %d)",
+                len(sources), time.monotonic() - run_started, max_workers)
+    return {source.name: outcomes[source.name] for source in sources}
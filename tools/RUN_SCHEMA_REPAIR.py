@@ -14,12 +14,20 @@ What it ensures (non-destructive):
 - dropdown_option_codes_v2 exists with required columns and unique index
 - attachments tables have file_name/file_path/file_size columns
 
+After a successful repair the app's schema metadata cache (db.schema) is
+refreshed so running workers reload table/column information.
+
 Usage:
   python tools/RUN_SCHEMA_REPAIR.py
 """
 import configparser
+import os
 import sys
 
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
 
 def _connect():
     cfg = configparser.ConfigParser()
@@ -497,6 +505,12 @@ def main():
 
         conn.commit()
         print("OK: schema repair completed.")
+        try:
+            from db.schema import refresh_schema_cache
+            refresh_schema_cache()
+            print("OK: schema metadata cache refreshed.")
+        except Exception as e:
+            print(f"WARN: schema metadata cache not refreshed: {e}")
     except Exception as e:
         try:
             conn.rollback()